@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Agendador de análise de partidas por prioridade
+Ordena buscas e análises pelo tempo até o início da partida e pela relevância
+da liga, permite furar a fila (jogo aberto pelo usuário) e mantém as partidas
+próximas de começar atualizadas com mais frequência que as distantes
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime, timedelta, timezone
+
+RELEVANCIA_PRIORIDADE = {'high': 1, 'medium': 2, 'low': 3}
+
+# Partidas que começam na mesma janela de 15 min são desempatadas pela relevância
+FAIXA_INICIO_SEGUNDOS = 15 * 60
+
+# Fuso dos horários 'HH:MM' exibidos (mesmo GMT-3 usado em formatar_horario)
+FUSO_HORARIO_LOCAL = timezone(timedelta(hours=-3))
+
+# Pedido do usuário: à frente de qualquer partida agendada
+PRIORIDADE_URGENTE = (-1, 0, 0, 0.0)
+
+# Intervalo de atualização por tempo até o início: (até N segundos, atualizar a cada M segundos)
+INTERVALOS_ATUALIZACAO = [
+    (60 * 60, 5 * 60),
+    (3 * 60 * 60, 15 * 60),
+    (12 * 60 * 60, 60 * 60),
+    (None, 3 * 60 * 60)
+]
+
+
+def inicio_partida(jogo, data=None):
+    """
+    Início da partida (datetime em UTC) ou None
+
+    Args:
+        jogo: Jogo processado (usa 'inicio_utc'/'start_time' ISO ou 'horario' HH:MM)
+        data: Data YYYY-MM-DD do jogo, necessária quando só há 'horario'
+    """
+    if not isinstance(jogo, dict):
+        return None
+
+    bruto = jogo.get('inicio_utc') or jogo.get('start_time')
+    try:
+        if isinstance(bruto, str) and 'T' in bruto:
+            inicio = datetime.fromisoformat(bruto.replace('Z', '+00:00'))
+            if inicio.tzinfo is None:
+                inicio = inicio.replace(tzinfo=timezone.utc)
+            return inicio.astimezone(timezone.utc)
+
+        horario = jogo.get('horario')
+        if data and horario and len(horario) == 5 and ':' in horario:
+            local = datetime.strptime(f"{data} {horario}", '%Y-%m-%d %H:%M').replace(tzinfo=FUSO_HORARIO_LOCAL)
+            return local.astimezone(timezone.utc)
+    except ValueError:
+        pass
+    return None
+
+
+def segundos_ate_inicio(jogo, agora=None, data=None):
+    """Segundos até o início (negativo se já começou) ou None se o horário é desconhecido"""
+    inicio = inicio_partida(jogo, data)
+    if inicio is None:
+        return None
+    agora = agora or datetime.now(timezone.utc)
+    return (inicio - agora).total_seconds()
+
+
+def prioridade_partida(jogo, agora=None, data=None):
+    """
+    Chave de prioridade (menor = antes)
+
+    Partidas por começar vêm primeiro, na ordem do início em faixas de 15 min e,
+    dentro da faixa, por relevância da liga; depois as já iniciadas e por último
+    as sem horário
+    """
+    relevancia = RELEVANCIA_PRIORIDADE.get(jogo.get('relevancia_liga') if isinstance(jogo, dict) else None, 4)
+    segundos = segundos_ate_inicio(jogo, agora, data)
+    if segundos is None:
+        return (3, 0, relevancia, 0.0)
+    if segundos < 0:
+        return (2, 0, relevancia, -segundos)
+    return (1, int(segundos // FAIXA_INICIO_SEGUNDOS), relevancia, segundos)
+
+
+def intervalo_atualizacao(segundos):
+    """Intervalo de atualização (s) para uma partida que começa em `segundos`"""
+    for limite, intervalo in INTERVALOS_ATUALIZACAO:
+        if limite is None or segundos <= limite:
+            return intervalo
+    return INTERVALOS_ATUALIZACAO[-1][1]
+
+
+class _Tarefa:
+    def __init__(self, chave, funcao, prioridade):
+        self.chave = chave
+        self.funcao = funcao
+        self.prioridade = prioridade
+        self.future = Future()
+        self.valida = True
+
+
+class AgendadorPartidas:
+    """
+    Fila de prioridade com workers próprios
+
+    Cada tarefa tem uma chave (ex.: ('analise', match_id)); reenviar uma chave ainda
+    na fila devolve o mesmo Future e só pode antecipá-la, nunca atrasá-la
+
+    Uso:
+        agendador = AgendadorPartidas(max_workers=10)
+        future = agendador.enviar(('analise', jogo['id']), lambda: analisar(jogo), prioridade_partida(jogo))
+        agendador.priorizar(('analise', jogo['id']))  # usuário abriu o jogo
+    """
+
+    def __init__(self, max_workers=10, nome='agendador'):
+        self.max_workers = max_workers
+        self.nome = nome
+        self._fila = []
+        self._pendentes = {}
+        self._contador = itertools.count()
+        self._condicao = threading.Condition()
+        self._threads = []
+        self._encerrado = False
+        self.estatisticas = {'executadas': 0, 'priorizadas': 0, 'reaproveitadas': 0, 'canceladas': 0}
+
+    def _iniciar_workers(self):
+        while len(self._threads) < self.max_workers:
+            thread = threading.Thread(target=self._trabalhar, name=f"{self.nome}-{len(self._threads)}", daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _empilhar(self, tarefa):
+        heapq.heappush(self._fila, (tarefa.prioridade, next(self._contador), tarefa))
+
+    def enviar(self, chave, funcao, prioridade):
+        """
+        Agenda `funcao` (sem argumentos)
+
+        Returns:
+            Future com o retorno de `funcao`
+        """
+        with self._condicao:
+            if self._encerrado:
+                raise RuntimeError(f"{self.nome} encerrado")
+
+            tarefa = self._pendentes.get(chave)
+            if tarefa is not None and tarefa.future.cancelled():
+                # Future cancelado por fora (ex.: varredura interrompida): agendar de novo
+                tarefa.valida = False
+                tarefa = None
+            if tarefa is not None:
+                self.estatisticas['reaproveitadas'] += 1
+                if prioridade < tarefa.prioridade:
+                    self._reposicionar(tarefa, prioridade)
+                return tarefa.future
+
+            tarefa = _Tarefa(chave, funcao, prioridade)
+            self._pendentes[chave] = tarefa
+            self._empilhar(tarefa)
+            self._iniciar_workers()
+            self._condicao.notify()
+            return tarefa.future
+
+    def _reposicionar(self, tarefa, prioridade):
+        # A entrada antiga fica na fila marcada como inválida (remoção preguiçosa)
+        tarefa.valida = False
+        nova = _Tarefa(tarefa.chave, tarefa.funcao, prioridade)
+        nova.future = tarefa.future
+        self._pendentes[tarefa.chave] = nova
+        self._empilhar(nova)
+        self._condicao.notify()
+
+    def priorizar(self, chave, funcao=None):
+        """
+        Coloca a chave à frente de toda a fila (ex.: jogo aberto pelo usuário)
+
+        Args:
+            chave: Chave da tarefa
+            funcao: Se a chave não estiver na fila, agenda esta função como urgente
+
+        Returns:
+            Future da tarefa ou None se não estava na fila e nenhuma função foi dada
+        """
+        with self._condicao:
+            tarefa = self._pendentes.get(chave)
+            if tarefa is not None:
+                self.estatisticas['priorizadas'] += 1
+                self._reposicionar(tarefa, PRIORIDADE_URGENTE)
+                return tarefa.future
+        if funcao is None:
+            return None
+        self.estatisticas['priorizadas'] += 1
+        return self.enviar(chave, funcao, PRIORIDADE_URGENTE)
+
+    def _proxima(self):
+        with self._condicao:
+            while True:
+                while self._fila:
+                    _, _, tarefa = heapq.heappop(self._fila)
+                    if tarefa.valida:
+                        del self._pendentes[tarefa.chave]
+                        return tarefa
+                if self._encerrado:
+                    return None
+                self._condicao.wait()
+
+    def _trabalhar(self):
+        while True:
+            tarefa = self._proxima()
+            if tarefa is None:
+                return
+            if not tarefa.future.set_running_or_notify_cancel():
+                continue
+            try:
+                tarefa.future.set_result(tarefa.funcao())
+            except BaseException as e:
+                tarefa.future.set_exception(e)
+            with self._condicao:
+                self.estatisticas['executadas'] += 1
+
+    def cancelar(self, chaves):
+        """
+        Retira da fila as tarefas ainda não iniciadas (as em execução terminam normalmente)
+
+        Returns:
+            Número de tarefas canceladas
+        """
+        canceladas = 0
+        with self._condicao:
+            for chave in chaves:
+                tarefa = self._pendentes.pop(chave, None)
+                if tarefa is None:
+                    continue
+                tarefa.valida = False
+                if tarefa.future.cancel():
+                    canceladas += 1
+            self.estatisticas['canceladas'] += canceladas
+        return canceladas
+
+    def pendentes(self):
+        """Número de tarefas aguardando na fila"""
+        with self._condicao:
+            return len(self._pendentes)
+
+    def encerrar(self, cancelar_pendentes=True):
+        """Para os workers; tarefas ainda na fila são canceladas"""
+        with self._condicao:
+            self._encerrado = True
+            if cancelar_pendentes:
+                for tarefa in self._pendentes.values():
+                    tarefa.future.cancel()
+                self._pendentes.clear()
+                self._fila.clear()
+            self._condicao.notify_all()
+
+    def resumo(self):
+        with self._condicao:
+            return (f"{self.estatisticas['executadas']} executadas, {len(self._pendentes)} na fila, "
+                    f"{self.estatisticas['priorizadas']} priorizadas, "
+                    f"{self.estatisticas['reaproveitadas']} reaproveitadas, "
+                    f"{self.estatisticas['canceladas']} canceladas")
+
+
+class AtualizacaoPeriodica:
+    """
+    Reagenda periodicamente a atualização das partidas, mais frequente para as
+    que estão perto de começar (ver INTERVALOS_ATUALIZACAO)
+    """
+
+    def __init__(self, agendador, obter_jogos, atualizar, intervalo_verificacao=30.0):
+        """
+        Args:
+            agendador: AgendadorPartidas compartilhado com a análise
+            obter_jogos: Função sem argumentos -> lista de (jogo, data YYYY-MM-DD)
+            atualizar: Função (jogo, data) executada no agendador para atualizar a partida
+            intervalo_verificacao: Segundos entre verificações
+        """
+        self.agendador = agendador
+        self.obter_jogos = obter_jogos
+        self.atualizar = atualizar
+        self.intervalo_verificacao = intervalo_verificacao
+        self._ultima = {}
+        self._parar = threading.Event()
+        self._thread = None
+
+    def iniciar(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._parar.clear()
+            self._thread = threading.Thread(target=self._executar, name='atualizacao-periodica', daemon=True)
+            self._thread.start()
+
+    def parar(self):
+        self._parar.set()
+
+    def verificar(self, agora=None):
+        """Agenda as partidas cuja atualização venceu; retorna quantas foram agendadas"""
+        agora_utc = agora or datetime.now(timezone.utc)
+        instante = time.monotonic()
+        agendadas = 0
+
+        for jogo, data in self.obter_jogos() or []:
+            jogo_id = str(jogo.get('id')) if isinstance(jogo, dict) else None
+            segundos = segundos_ate_inicio(jogo, agora_utc, data)
+            if not jogo_id or segundos is None or segundos < 0:
+                continue  # Sem horário ou já começou: nada a antecipar
+
+            ultima = self._ultima.get(jogo_id)
+            if ultima is None:
+                # Primeira vez vista: acabou de ser analisada pela varredura
+                self._ultima[jogo_id] = instante
+                continue
+            if instante - ultima < intervalo_atualizacao(segundos):
+                continue
+
+            self._ultima[jogo_id] = instante
+            try:
+                self.agendador.enviar(('atualizacao', jogo_id),
+                                      lambda jogo=jogo, data=data: self.atualizar(jogo, data),
+                                      prioridade_partida(jogo, agora_utc, data))
+                agendadas += 1
+            except RuntimeError:
+                break
+        return agendadas
+
+    def _executar(self):
+        while not self._parar.is_set():
+            try:
+                agendadas = self.verificar()
+                if agendadas:
+                    print(f"🔄 Atualização periódica: {agendadas} partidas agendadas ({self.agendador.resumo()})")
+            except Exception as e:
+                print(f"⚠️ Erro na atualização periódica: {e}")
+            self._parar.wait(self.intervalo_verificacao)
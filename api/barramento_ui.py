@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Barramento de eventos entre as threads de trabalho e a interface
+As threads publicam eventos (progresso, status, resultados, chamadas) sem
+tocar em widgets; a thread da interface drena a fila num tique fixo do
+root.after e recebe só o último progresso/status de cada chave
+"""
+
+import threading
+from collections import deque
+
+# Eventos em que só o valor mais recente de cada chave interessa
+COALESCIVEIS = ('progresso', 'status')
+
+
+class BarramentoUI:
+    """
+    Fila de eventos thread-safe com coalescência
+
+    Uso (threads de trabalho):
+        barramento.status('jogos', "🌐 Buscando jogos da API...", 'Warning.TLabel')
+        barramento.progresso('hot', 42.0, "42% - 210/500 jogos")
+        barramento.resultado('apostas_hot', apostas)
+        barramento.chamar(lambda: self.atualizar_lista_jogos())
+
+    Uso (thread da interface, a cada tique):
+        for tipo, chave, dados in barramento.drenar():
+            ...
+    """
+
+    def __init__(self):
+        self._eventos = deque()
+        self._trava = threading.Lock()
+        self.publicados = 0
+        self.entregues = 0
+        self.drenagens = 0
+
+    def publicar(self, tipo, chave=None, dados=None):
+        """
+        Enfileira um evento (qualquer thread)
+
+        Args:
+            tipo: 'progresso', 'status', 'resultado' ou 'chamar'
+            chave: Destino do evento (ex.: 'jogos', 'hot'); progresso/status coalescem por (tipo, chave)
+            dados: Conteúdo do evento
+        """
+        with self._trava:
+            self._eventos.append((tipo, chave, dados))
+            self.publicados += 1
+
+    def progresso(self, chave, valor, texto=None):
+        """Progresso 0-100 de uma barra; só o mais recente é desenhado"""
+        self.publicar('progresso', chave, (valor, texto))
+
+    def status(self, chave, texto, estilo=None):
+        """Texto de um label de status; só o mais recente é desenhado"""
+        self.publicar('status', chave, (texto, estilo))
+
+    def resultado(self, chave, itens):
+        """Itens novos (ex.: apostas hot); resultados seguidos da mesma chave chegam juntos"""
+        self.publicar('resultado', chave, list(itens))
+
+    def chamar(self, funcao):
+        """Executa `funcao` na thread da interface, depois dos eventos publicados antes dela"""
+        self.publicar('chamar', None, funcao)
+
+    def drenar(self):
+        """
+        Retira todos os eventos pendentes (thread da interface)
+
+        Progresso/status de uma chave ficam só com o último valor, na posição em
+        que ele chegou; resultados consecutivos da mesma chave são concatenados.
+        Chamadas mantêm a ordem em relação aos resultados publicados antes delas.
+
+        Returns:
+            list: [(tipo, chave, dados)] na ordem de entrega
+        """
+        with self._trava:
+            if not self._eventos:
+                return []
+            eventos, self._eventos = self._eventos, deque()
+
+        # De trás para frente: a primeira ocorrência vista de cada chave coalescível é a mais recente
+        vistos = set()
+        mantidos = []
+        for tipo, chave, dados in reversed(eventos):
+            if tipo in COALESCIVEIS:
+                if (tipo, chave) in vistos:
+                    continue
+                vistos.add((tipo, chave))
+            mantidos.append((tipo, chave, dados))
+        mantidos.reverse()
+
+        entrega = []
+        for tipo, chave, dados in mantidos:
+            if tipo == 'resultado' and entrega and entrega[-1][0] == 'resultado' and entrega[-1][1] == chave:
+                entrega[-1][2].extend(dados)
+                continue
+            entrega.append((tipo, chave, dados))
+
+        self.drenagens += 1
+        self.entregues += len(entrega)
+        return entrega
+
+    def resumo(self):
+        """Eventos publicados x entregues (redesenhos) desde o início"""
+        return (f"{self.publicados} eventos publicados, {self.entregues} entregues "
+                f"em {self.drenagens} tiques com eventos")
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Broker de dados por partida para a API Radar Esportivo
+Garante que odds (prepRadar) e estatísticas (goalRadar) de cada partida sejam
+buscadas uma única vez, mesmo com várias threads pedindo o mesmo dado
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+
+
+class BrokerPartidas:
+    """
+    Mantém resultados em andamento e concluídos por (endpoint, match_id, params)
+    Chamadores concorrentes da mesma chave aguardam o mesmo Future
+    """
+
+    def __init__(self, api, validade_segundos=900):
+        """
+        Args:
+            api: Instância de RadarEsportivoAPI usada para as buscas reais
+            validade_segundos: Tempo que um resultado concluído continua válido
+        """
+        self.api = api
+        self.validade_segundos = validade_segundos
+        self._lock = threading.Lock()
+        self._resultados = {}  # chave -> (Future, instante de conclusão ou None)
+        self.estatisticas = {
+            'buscas': {},
+            'reaproveitadas': 0
+        }
+
+    def _chave(self, endpoint, match_id, params=None):
+        """Chave canônica (endpoint, match_id, params ordenados)"""
+        params_ordenados = tuple(sorted((params or {}).items()))
+        return (endpoint, str(match_id), params_ordenados)
+
+    def obter(self, endpoint, match_id, params, buscar):
+        """
+        Retorna o resultado da chave, executando `buscar` só se ninguém o fez
+
+        Args:
+            endpoint: Nome do endpoint ('prepRadar', 'goalRadar', ...)
+            match_id: ID da partida
+            params: Parâmetros que diferenciam a requisição
+            buscar: Função sem argumentos que faz a busca real
+
+        Returns:
+            Resultado de `buscar` (None em caso de falha)
+        """
+        chave = self._chave(endpoint, match_id, params)
+        agora = time.monotonic()
+
+        with self._lock:
+            entrada = self._resultados.get(chave)
+            if entrada is not None:
+                future, concluido_em = entrada
+                expirado = (concluido_em is not None and
+                            self.validade_segundos is not None and
+                            agora - concluido_em > self.validade_segundos)
+                if not expirado:
+                    self.estatisticas['reaproveitadas'] += 1
+                    responsavel = False
+                else:
+                    entrada = None
+
+            if entrada is None:
+                future = Future()
+                self._resultados[chave] = (future, None)
+                self.estatisticas['buscas'][endpoint] = self.estatisticas['buscas'].get(endpoint, 0) + 1
+                responsavel = True
+
+        if not responsavel:
+            return future.result()
+
+        try:
+            resultado = buscar()
+        except Exception as e:
+            print(f"❌ Erro no broker ({endpoint} {match_id}): {e}")
+            resultado = None
+
+        with self._lock:
+            if resultado is None:
+                # Falhas não ficam em cache para permitir nova tentativa
+                self._resultados.pop(chave, None)
+            else:
+                self._resultados[chave] = (future, time.monotonic())
+
+        future.set_result(resultado)
+        return resultado
+
+    def buscar_odds_detalhadas(self, match_id):
+        """Odds detalhadas (prepRadar) de uma partida"""
+        return self.obter('prepRadar', match_id, None,
+                          lambda: self.api.buscar_odds_detalhadas(match_id))
+
+    def buscar_estatisticas_time(self, match_id, field='home', window='last10'):
+        """Estatísticas de um time (goalRadar) de uma partida"""
+        params = {'field': field, 'window': window}
+        return self.obter('goalRadar', match_id, params,
+                          lambda: self.api.buscar_estatisticas_time(match_id, field, window))
+
+    def buscar_estatisticas_detalhadas_time(self, match_id):
+        """
+        Estatísticas detalhadas de ambos os times, montadas a partir das
+        duas buscas goalRadar em cache (casa e visitante)
+        """
+        stats_casa = self.buscar_estatisticas_time(match_id, 'home')
+        stats_visitante = self.buscar_estatisticas_time(match_id, 'away')
+
+        if not stats_casa or not stats_visitante:
+            return None
+
+        return self.api.montar_estatisticas_detalhadas(match_id, stats_casa, stats_visitante)
+
+    def invalidar(self, match_id=None):
+        """
+        Remove resultados concluídos do cache
+
+        Args:
+            match_id: Remove apenas desta partida (padrão: todas)
+        """
+        with self._lock:
+            for chave in list(self._resultados):
+                future, concluido_em = self._resultados[chave]
+                if concluido_em is None:
+                    continue  # Busca em andamento continua valendo para quem aguarda
+                if match_id is None or chave[1] == str(match_id):
+                    del self._resultados[chave]
+
+    def resumo(self):
+        """Texto curto com o total de buscas por endpoint e reaproveitamentos"""
+        with self._lock:
+            buscas = ', '.join(f"{endpoint}: {total}" for endpoint, total in sorted(self.estatisticas['buscas'].items()))
+            return f"Buscas [{buscas or 'nenhuma'}] - {self.estatisticas['reaproveitadas']} reaproveitadas"
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cache de revalidação (GET condicional) para a API Radar Esportivo
+Guarda ETag/Last-Modified (ou um hash do conteúdo quando o servidor não envia
+validadores) junto de cada payload e informa quais partidas realmente mudaram
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+# Entradas mantidas em memória (LRU): no máximo CAPACIDADE_ENTRADAS payloads somando até
+# LIMITE_BYTES_ENTRADAS bytes recebidos; as descartadas voltam do disco quando há diretório
+CAPACIDADE_ENTRADAS = 4096
+LIMITE_BYTES_ENTRADAS = 64 * 1024 * 1024
+
+
+class EntradaCache:
+    """Payload decodificado e seus validadores"""
+
+    def __init__(self, etag=None, last_modified=None, hash_conteudo=None, dados=None, tamanho=0):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.hash_conteudo = hash_conteudo
+        self.dados = dados
+        self.tamanho = tamanho
+        self.atualizado_em = time.time()
+
+    def como_dict(self):
+        return {
+            'etag': self.etag,
+            'last_modified': self.last_modified,
+            'hash_conteudo': self.hash_conteudo,
+            'dados': self.dados,
+            'tamanho': self.tamanho,
+            'atualizado_em': self.atualizado_em
+        }
+
+    @classmethod
+    def de_dict(cls, dados):
+        entrada = cls(dados.get('etag'), dados.get('last_modified'), dados.get('hash_conteudo'),
+                      dados.get('dados'), dados.get('tamanho', 0))
+        entrada.atualizado_em = dados.get('atualizado_em', entrada.atualizado_em)
+        return entrada
+
+
+class CacheCondicional:
+    """
+    Validadores + payloads por URL, em memória (LRU limitado) e opcionalmente em disco
+
+    Cada partida tem uma versão que só muda quando algum payload dela muda;
+    etapas seguintes (probabilidades, recomendações) comparam a versão para
+    decidir se precisam recalcular
+    """
+
+    def __init__(self, diretorio=None, capacidade=CAPACIDADE_ENTRADAS, limite_bytes=LIMITE_BYTES_ENTRADAS):
+        """
+        Args:
+            diretorio: Pasta para persistir as entradas entre execuções (padrão: só memória)
+            capacidade: Máximo de entradas em memória
+            limite_bytes: Máximo de bytes de payload (tamanho recebido) em memória
+        """
+        self.diretorio = diretorio
+        if diretorio and not os.path.exists(diretorio):
+            os.makedirs(diretorio)
+        self.capacidade = capacidade
+        self.limite_bytes = limite_bytes
+        self._lock = threading.Lock()
+        self._entradas = OrderedDict()
+        self._bytes_entradas = 0
+        self._versoes = {}
+        self._alteradas = set()
+        self._consultadas = set()
+        self.estatisticas = {
+            'requisicoes': 0,
+            'nao_modificadas': 0,
+            'hash_igual': 0,
+            'alteradas': 0,
+            'bytes_recebidos': 0,
+            'bytes_economizados': 0,
+            'descartes': 0
+        }
+
+    def _chave(self, url, params=None):
+        params_ordenados = '&'.join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+        return f"{url}?{params_ordenados}"
+
+    def _arquivo(self, chave):
+        return os.path.join(self.diretorio, hashlib.sha1(chave.encode('utf-8')).hexdigest() + '.json')
+
+    def _obter_entrada(self, chave):
+        """Entrada em memória ou, na primeira consulta (ou depois de descartada), lida do disco"""
+        entrada = self._entradas.get(chave)
+        if entrada is not None:
+            self._entradas.move_to_end(chave)
+        elif self.diretorio:
+            arquivo = self._arquivo(chave)
+            if os.path.exists(arquivo):
+                try:
+                    with open(arquivo, 'r', encoding='utf-8') as f:
+                        entrada = EntradaCache.de_dict(json.load(f))
+                    self._guardar(chave, entrada)
+                except (OSError, ValueError) as e:
+                    print(f"⚠️ Entrada de cache HTTP inválida ignorada: {e}")
+        return entrada
+
+    def _guardar(self, chave, entrada):
+        """Insere/substitui a entrada e descarta as menos usadas acima dos limites (com o lock)"""
+        anterior = self._entradas.pop(chave, None)
+        if anterior is not None:
+            self._bytes_entradas -= anterior.tamanho
+        self._entradas[chave] = entrada
+        self._bytes_entradas += entrada.tamanho
+        while len(self._entradas) > 1 and (len(self._entradas) > self.capacidade
+                                           or self._bytes_entradas > self.limite_bytes):
+            _, descartada = self._entradas.popitem(last=False)
+            self._bytes_entradas -= descartada.tamanho
+            self.estatisticas['descartes'] += 1
+
+    def _tocar(self, chave):
+        """Atualiza o mtime do arquivo revalidado (limpar_cache_antigo só remove os sem uso)"""
+        if not self.diretorio:
+            return
+        try:
+            os.utime(self._arquivo(chave))
+        except OSError:
+            pass  # Arquivo ainda não gravado ou removido: nada a preservar
+
+    def _persistir(self, chave, entrada):
+        if not self.diretorio:
+            return
+        try:
+            with open(self._arquivo(chave), 'w', encoding='utf-8') as f:
+                json.dump(entrada.como_dict(), f, ensure_ascii=False)
+        except OSError as e:
+            print(f"⚠️ Erro ao salvar cache HTTP: {e}")
+
+    def cabecalhos_condicionais(self, url, params=None):
+        """Headers If-None-Match / If-Modified-Since para a URL, se houver validadores"""
+        with self._lock:
+            entrada = self._obter_entrada(self._chave(url, params))
+        cabecalhos = {}
+        if entrada is not None:
+            if entrada.etag:
+                cabecalhos['If-None-Match'] = entrada.etag
+            if entrada.last_modified:
+                cabecalhos['If-Modified-Since'] = entrada.last_modified
+        return cabecalhos
+
+    def registrar_resposta(self, match_id, url, params, response):
+        """
+        Processa a resposta de um GET condicional
+
+        Args:
+            match_id: Partida (ou data) a que o payload pertence
+            url, params: Identificam o payload
+            response: Resposta HTTP (200 ou 304)
+
+        Returns:
+            tuple: (dados decodificados, alterado); dados é None num 304 cuja entrada
+                   não existe mais (descartada só da memória): refaça o GET sem validadores
+        """
+        chave = self._chave(url, params)
+        id_partida = str(match_id)
+
+        with self._lock:
+            entrada = self._obter_entrada(chave)
+            self.estatisticas['requisicoes'] += 1
+            self._consultadas.add(id_partida)
+
+            if response.status_code == 304:
+                if entrada is None:
+                    return None, False
+                self.estatisticas['nao_modificadas'] += 1
+                self.estatisticas['bytes_economizados'] += entrada.tamanho
+                dados = entrada.dados
+        if response.status_code == 304:
+            self._tocar(chave)
+            return dados, False
+
+        conteudo = response.content
+        hash_conteudo = hashlib.sha1(conteudo).hexdigest()
+
+        with self._lock:
+            self.estatisticas['bytes_recebidos'] += len(conteudo)
+            entrada = self._obter_entrada(chave)
+            if entrada is not None and entrada.hash_conteudo == hash_conteudo:
+                # Servidor sem validadores (ou validadores novos), mas payload idêntico:
+                # evita decodificar e recalcular
+                self.estatisticas['hash_igual'] += 1
+                entrada.etag = response.headers.get('ETag') or entrada.etag
+                entrada.last_modified = response.headers.get('Last-Modified') or entrada.last_modified
+                dados = entrada.dados
+            else:
+                dados = None
+        if dados is not None:
+            self._tocar(chave)
+            return dados, False
+
+        dados = json.loads(conteudo)
+        nova = EntradaCache(response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                            hash_conteudo, dados, len(conteudo))
+
+        with self._lock:
+            self._guardar(chave, nova)
+            self._versoes[id_partida] = self._versoes.get(id_partida, 0) + 1
+            self._alteradas.add(id_partida)
+            self.estatisticas['alteradas'] += 1
+        self._persistir(chave, nova)
+
+        return dados, True
+
+    def versao_partida(self, match_id):
+        """Versão dos payloads da partida (muda apenas quando algum payload muda)"""
+        with self._lock:
+            return self._versoes.get(str(match_id), 0)
+
+    def iniciar_rodada(self):
+        """Começa uma nova rodada de revalidação (zera alteradas/consultadas)"""
+        with self._lock:
+            self._alteradas = set()
+            self._consultadas = set()
+
+    def partidas_alteradas(self):
+        """IDs cujos payloads mudaram desde iniciar_rodada()"""
+        with self._lock:
+            return set(self._alteradas)
+
+    def partidas_inalteradas(self):
+        """IDs consultados na rodada sem nenhuma mudança"""
+        with self._lock:
+            return self._consultadas - self._alteradas
+
+    def resumo(self):
+        with self._lock:
+            return dict(self.estatisticas)
+
+    def formatar_resumo(self):
+        """Texto curto para logs"""
+        r = self.resumo()
+        return (f"{r['requisicoes']} revalidações: {r['nao_modificadas']} não modificadas (304), "
+                f"{r['hash_igual']} com conteúdo igual, {r['alteradas']} alteradas - "
+                f"{r['bytes_recebidos'] / 1024:.0f} KB recebidos, {r['bytes_economizados'] / 1024:.0f} KB economizados, "
+                f"{r['descartes']} descartadas da memória")
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Arquivos de cache diário (cache/jogos_YYYY-MM-DD.json)
+Mesmo formato gravado e lido pelo BetBoosterV2
+"""
+
+import json
+import os
+import time
+from datetime import datetime
+
+
+def caminho_cache_jogos(diretorio, data):
+    """Caminho do arquivo de cache de uma data (cria a pasta se necessário)"""
+    if not os.path.exists(diretorio):
+        os.makedirs(diretorio)
+    return os.path.join(diretorio, f'jogos_{data}.json')
+
+
+def salvar_cache_jogos(diretorio, data, jogos, apostas_hot=None):
+    """
+    Grava o cache de uma data
+
+    Args:
+        diretorio: Pasta do cache
+        data: Data no formato YYYY-MM-DD
+        jogos: Lista de jogos
+        apostas_hot: Lista de apostas hot (None preserva as já gravadas para a data)
+
+    Returns:
+        dict: Conteúdo gravado
+    """
+    cache_file = caminho_cache_jogos(diretorio, data)
+
+    if apostas_hot is None:
+        anterior = carregar_cache_jogos(diretorio, data)
+        apostas_hot = anterior.get('apostas_hot', []) if anterior else []
+
+    cache_data = montar_cache_jogos(data, jogos, apostas_hot)
+    gravar_arquivo_cache(cache_file, cache_data)
+    return cache_data
+
+
+def montar_cache_jogos(data, jogos, apostas_hot):
+    """Conteúdo do cache de uma data (dicionário gravado em jogos_<data>.json)"""
+    return {
+        'data': data,
+        'timestamp': datetime.now().isoformat(),
+        'jogos': jogos,
+        'apostas_hot': apostas_hot,
+        'total_jogos': len(jogos),
+        'total_apostas_hot': len(apostas_hot)
+    }
+
+
+def gravar_arquivo_cache(cache_file, cache_data):
+    """Grava em arquivo temporário e troca, para nunca deixar um cache pela metade"""
+    temporario = cache_file + '.tmp'
+    with open(temporario, 'w', encoding='utf-8') as f:
+        json.dump(cache_data, f, ensure_ascii=False, indent=2)
+    os.replace(temporario, cache_file)
+
+
+def carregar_cache_jogos(diretorio, data):
+    """Conteúdo do cache de uma data ou None"""
+    cache_file = os.path.join(diretorio, f'jogos_{data}.json')
+    if not os.path.exists(cache_file):
+        return None
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Cache inválido para {data}: {e}")
+        return None
+
+
+def limpar_cache_antigo(diretorio, dias=7):
+    """
+    Remove caches diários de datas com mais de `dias` dias e payloads do GET
+    condicional (subpasta http/) sem revalidação no mesmo período
+
+    Returns:
+        int: Arquivos removidos
+    """
+    try:
+        if not os.path.exists(diretorio):
+            return 0
+
+        data_hoje = datetime.now()
+        arquivos_removidos = 0
+
+        for arquivo in os.listdir(diretorio):
+            if arquivo.startswith('jogos_') and arquivo.endswith('.json'):
+                # Extrair data do nome do arquivo
+                try:
+                    data_arquivo = datetime.strptime(arquivo[len('jogos_'):-len('.json')], '%Y-%m-%d')
+                except ValueError:
+                    # Nome de arquivo inválido, ignorar
+                    continue
+                if (data_hoje - data_arquivo).days > dias:
+                    os.remove(os.path.join(diretorio, arquivo))
+                    arquivos_removidos += 1
+                    print(f"🗑️ Cache antigo removido (mais de {dias} dias): {arquivo}")
+
+        # Payloads do GET condicional sem revalidação no período
+        cache_http_dir = os.path.join(diretorio, 'http')
+        if os.path.isdir(cache_http_dir):
+            limite = time.time() - dias * 24 * 3600
+            for arquivo in os.listdir(cache_http_dir):
+                arquivo_path = os.path.join(cache_http_dir, arquivo)
+                if os.path.getmtime(arquivo_path) < limite:
+                    os.remove(arquivo_path)
+                    arquivos_removidos += 1
+
+        if arquivos_removidos > 0:
+            print(f"✅ {arquivos_removidos} arquivos de cache com mais de {dias} dias removidos")
+        else:
+            print("✅ Nenhum cache antigo para remover")
+        return arquivos_removidos
+
+    except OSError as e:
+        print(f"⚠️ Erro ao limpar cache antigo: {e}")
+        return 0
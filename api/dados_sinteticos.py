@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Payloads sintéticos no formato da API Radar Esportivo
+Usados por benchmarks e pelo servidor local; determinísticos para uma mesma semente
+"""
+
+import copy
+import json
+import os
+import random
+import re
+
+REGIOES = [
+    ('Brazil', 'BR'), ('Spain', 'ES'), ('England', 'GB'), ('Italy', 'IT'), ('Germany', 'DE'),
+    ('France', 'FR'), ('Portugal', 'PT'), ('Argentina', 'AR'), ('Turkey', 'TR'), ('Saudi Arabia', 'SA'),
+    ('International', '00'), ('Japan', 'JP'), ('Mexico', 'MX'), ('China', 'CN'), ('Norway', 'NO'),
+    ('Chile', 'CL'), ('Greece', 'GR'), ('Belgium', 'BE'), ('Netherlands', 'NL'), ('Denmark', 'DK')
+]
+
+RELEVANCIAS = ['high', 'medium', 'low']
+
+ARQUIVO_EXEMPLO_PARTIDA = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'match_data_example.txt')
+
+_modelo_prep_radar = None
+
+
+def carregar_modelo_prep_radar(arquivo=ARQUIVO_EXEMPLO_PARTIDA):
+    """
+    Resposta prepRadar de exemplo (match_data_example.txt) usada como molde
+    O arquivo é uma anotação manual: ignora o cabeçalho da requisição e os comentários '#'
+    """
+    global _modelo_prep_radar
+    if _modelo_prep_radar is None:
+        with open(arquivo, 'r', encoding='utf-8') as f:
+            texto = f.read()
+        corpo = texto[texto.index('{'):]
+        corpo = re.sub(r'\s#[^\n]*', '', corpo)
+        _modelo_prep_radar = json.loads(corpo)
+    return _modelo_prep_radar
+
+
+def gerar_daily_radar(total_partidas=1500, ligas_por_regiao=4, semente=42, data='2025-08-26'):
+    """
+    Documento dailyRadar sintético
+
+    Args:
+        total_partidas: Número aproximado de partidas no dia
+        ligas_por_regiao: Temporadas (ligas) por região
+        semente: Semente do gerador (mesmo documento para a mesma semente)
+        data: Data das partidas (YYYY-MM-DD)
+
+    Returns:
+        dict: {'dailyRadar': [...]}
+    """
+    aleatorio = random.Random(semente)
+    partidas_por_liga = max(1, total_partidas // (len(REGIOES) * ligas_por_regiao))
+    match_id = 260000
+    team_id = 30000
+    regioes = []
+
+    for indice_regiao, (nome_regiao, codigo) in enumerate(REGIOES):
+        temporadas = []
+        for indice_liga in range(ligas_por_regiao):
+            relevancia = RELEVANCIAS[min(indice_liga, len(RELEVANCIAS) - 1)]
+            liga_id = 2000 + indice_regiao * 10 + indice_liga
+            partidas = []
+            for _ in range(partidas_por_liga):
+                match_id += 1
+                team_id += 2
+                hora = aleatorio.randint(0, 23)
+                minuto = aleatorio.choice([0, 15, 30, 45])
+                partidas.append({
+                    'id': match_id,
+                    'matchTime': f"{data}T{hora:02d}:{minuto:02d}:00.000Z",
+                    'status': 'not_started',
+                    'homeTeam': {'id': team_id, 'name': f"Time {team_id}",
+                                 'logoUrl': f"https://assets.example/imgs/teams/{team_id}.png"},
+                    'awayTeam': {'id': team_id + 1, 'name': f"Time {team_id + 1}",
+                                 'logoUrl': f"https://assets.example/imgs/teams/{team_id + 1}.png"},
+                    'homeScore': 0,
+                    'awayScore': 0,
+                    'updatedAt': f"{data}T00:00:00.000Z"
+                })
+            temporadas.append({
+                'league': {'id': liga_id, 'name': f"{nome_regiao} Liga {indice_liga + 1}", 'relevance': relevancia},
+                'season': {'id': liga_id * 10, 'name': f"{nome_regiao} Liga {indice_liga + 1} 2025"},
+                'matches': partidas
+            })
+        regioes.append({
+            'region': {'id': 100 + indice_regiao, 'name': nome_regiao, 'code': codigo},
+            'seasons': temporadas
+        })
+
+    return {'dailyRadar': regioes}
+
+
+def indexar_partidas(daily_radar):
+    """match_id (str) -> (partida, liga, temporada, região) a partir de um documento dailyRadar"""
+    indice = {}
+    for regiao in daily_radar.get('dailyRadar', []):
+        for temporada in regiao.get('seasons', []):
+            for partida in temporada.get('matches', []):
+                indice[str(partida['id'])] = (partida, temporada.get('league', {}),
+                                              temporada.get('season', {}), regiao.get('region', {}))
+    return indice
+
+
+def _ajustar_odd(odd, aleatorio):
+    return round(max(1.01, odd * aleatorio.uniform(0.8, 1.25)), 3)
+
+
+def gerar_prep_radar(match_id, partida=None, semente=42):
+    """
+    Resposta prepRadar sintética no formato de match_data_example.txt
+
+    Args:
+        match_id: ID da partida
+        partida: Tupla de indexar_partidas() para manter times/liga coerentes com o dailyRadar
+        semente: Semente base (a resposta depende só de semente + match_id)
+    """
+    aleatorio = random.Random(f"{semente}-prep-{match_id}")
+    resposta = copy.deepcopy(carregar_modelo_prep_radar())
+    resposta['matchId'] = int(match_id) if str(match_id).isdigit() else match_id
+
+    if partida is not None:
+        dados_partida, liga, temporada, regiao = partida
+        resposta['startTime'] = dados_partida.get('matchTime', resposta['startTime'])
+        resposta['homeTeam'].update({'id': dados_partida['homeTeam']['id'], 'name': dados_partida['homeTeam']['name']})
+        resposta['awayTeam'].update({'id': dados_partida['awayTeam']['id'], 'name': dados_partida['awayTeam']['name']})
+        resposta['league'].update({'id': liga.get('id'), 'name': liga.get('name'), 'relevance': liga.get('relevance')})
+        resposta['league']['region'] = dict(regiao)
+        resposta['season'].update({'id': temporada.get('id'), 'name': temporada.get('name')})
+
+    for mercado in resposta['marketOdds'].values():
+        if isinstance(mercado, dict):
+            for chave in mercado:
+                mercado[chave] = _ajustar_odd(mercado[chave], aleatorio)
+        elif isinstance(mercado, list):
+            for opcao in mercado:
+                opcao['odds'] = _ajustar_odd(opcao['odds'], aleatorio)
+
+    return resposta
+
+
+def gerar_goal_radar(match_id, field='home', semente=42, jogos=10):
+    """
+    Resposta goalRadar sintética (últimos `jogos` jogos de um time)
+
+    Args:
+        match_id: ID da partida
+        field: 'home' ou 'away'
+        semente: Semente base (a resposta depende só de semente + match_id + field)
+        jogos: Tamanho da janela (matchCount)
+    """
+    aleatorio = random.Random(f"{semente}-goal-{match_id}-{field}")
+    resultados = [aleatorio.choice(['Win', 'Draw', 'Loss']) for _ in range(jogos)]
+    marcados = [aleatorio.choice([0, 0, 1, 1, 1, 2, 2, 3, 4]) for _ in range(jogos)]
+    sofridos = [aleatorio.choice([0, 0, 1, 1, 1, 2, 2, 3]) for _ in range(jogos)]
+    totais = [m + s for m, s in zip(marcados, sofridos)]
+
+    return {
+        'matchId': int(match_id) if str(match_id).isdigit() else match_id,
+        'matchCount': jogos,
+        'updatedAt': '2025-08-26T00:00:00.000Z',
+        'data': {
+            'sums': {
+                'goalsScored': {'fullTime': sum(marcados)},
+                'goalsConceded': {'fullTime': sum(sofridos)}
+            },
+            'counts': {
+                'won': {'fullTime': resultados.count('Win')},
+                'drew': {'fullTime': resultados.count('Draw')},
+                'lost': {'fullTime': resultados.count('Loss')},
+                'failToScore': {'fullTime': marcados.count(0)},
+                'cleanSheet': {'fullTime': sofridos.count(0)},
+                'markets': {
+                    'matchGoals': {
+                        'over15': sum(1 for t in totais if t > 1),
+                        'over25': sum(1 for t in totais if t > 2),
+                        'btts': sum(1 for m, s in zip(marcados, sofridos) if m > 0 and s > 0)
+                    }
+                }
+            },
+            'race': resultados
+        }
+    }
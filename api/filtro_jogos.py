@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Filtro de elegibilidade pré-busca para jogos do Radar Esportivo
+Descarta jogos fora das regiões/relevâncias analisadas ANTES de qualquer
+chamada ao prepRadar/goalRadar
+"""
+
+import threading
+
+
+class FiltroElegibilidade:
+    """
+    Filtro configurável construído a partir dos campos do dailyRadar
+    (codigo_regiao e relevancia_liga de RadarEsportivoAPI.processar_jogos)
+    """
+
+    CODIGOS_REGIAO_PADRAO = ['ES', 'FR', 'SA', 'BR', 'AR', 'PT', 'IT', 'GB', 'TR', 'DE', '00', '01', '04']
+    RELEVANCIAS_PADRAO = ['high']
+
+    # Chamadas à API economizadas por jogo rejeitado na análise completa:
+    # 1 prepRadar (odds) + 2 goalRadar (estatísticas casa/visitante)
+    CHAMADAS_POR_JOGO_ANALISE = 3
+
+    def __init__(self, codigos_regiao=None, relevancias=None):
+        """
+        Args:
+            codigos_regiao: Códigos de região permitidos (padrão: CODIGOS_REGIAO_PADRAO)
+            relevancias: Relevâncias de liga permitidas (padrão: apenas 'high')
+        """
+        self.codigos_regiao = set(codigos_regiao if codigos_regiao is not None else self.CODIGOS_REGIAO_PADRAO)
+        self.relevancias = set(relevancias if relevancias is not None else self.RELEVANCIAS_PADRAO)
+        self._lock = threading.Lock()
+        self.resetar_contadores()
+
+    def resetar_contadores(self):
+        """Zera os contadores por etapa"""
+        with self._lock:
+            self.contadores = {
+                'recebidos': 0,
+                'rejeitados_regiao': 0,
+                'rejeitados_relevancia': 0,
+                'elegiveis': 0,
+                'chamadas_evitadas': 0
+            }
+
+    def motivo_rejeicao(self, jogo):
+        """
+        Verifica um jogo processado contra o filtro
+
+        Args:
+            jogo: Jogo no formato de RadarEsportivoAPI.processar_jogos
+
+        Returns:
+            str: 'regiao' ou 'relevancia' se rejeitado, None se elegível
+        """
+        if not isinstance(jogo, dict):
+            return 'regiao'
+
+        if jogo.get('codigo_regiao', '') not in self.codigos_regiao:
+            return 'regiao'
+
+        if jogo.get('relevancia_liga', '') not in self.relevancias:
+            return 'relevancia'
+
+        return None
+
+    def jogo_elegivel(self, jogo):
+        """Retorna True se o jogo passa pelo filtro (não altera contadores)"""
+        return self.motivo_rejeicao(jogo) is None
+
+    def separar(self, jogos, chamadas_por_jogo=CHAMADAS_POR_JOGO_ANALISE):
+        """
+        Separa jogos elegíveis e rejeitados, atualizando os contadores
+
+        Args:
+            jogos: Lista de jogos processados
+            chamadas_por_jogo: Chamadas à API que cada jogo rejeitado deixa de fazer
+
+        Returns:
+            tuple: (jogos_elegiveis, jogos_rejeitados)
+        """
+        elegiveis = []
+        rejeitados = []
+        rejeitados_regiao = 0
+        rejeitados_relevancia = 0
+
+        for jogo in jogos or []:
+            motivo = self.motivo_rejeicao(jogo)
+            if motivo is None:
+                elegiveis.append(jogo)
+            else:
+                rejeitados.append(jogo)
+                if motivo == 'regiao':
+                    rejeitados_regiao += 1
+                else:
+                    rejeitados_relevancia += 1
+
+        with self._lock:
+            self.contadores['recebidos'] += len(elegiveis) + len(rejeitados)
+            self.contadores['rejeitados_regiao'] += rejeitados_regiao
+            self.contadores['rejeitados_relevancia'] += rejeitados_relevancia
+            self.contadores['elegiveis'] += len(elegiveis)
+            self.contadores['chamadas_evitadas'] += len(rejeitados) * chamadas_por_jogo
+
+        return elegiveis, rejeitados
+
+    def resumo(self):
+        """Retorna uma cópia dos contadores por etapa"""
+        with self._lock:
+            return dict(self.contadores)
+
+    def formatar_resumo(self):
+        """Texto curto com os contadores para logs e barra de status"""
+        c = self.resumo()
+        return (f"{c['elegiveis']}/{c['recebidos']} jogos elegíveis "
+                f"(região: -{c['rejeitados_regiao']}, relevância: -{c['rejeitados_relevancia']}) "
+                f"- {c['chamadas_evitadas']} chamadas à API evitadas")
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gravação e reprodução de tráfego HTTP da API Radar Esportivo
+Grava cada par requisição/resposta (com tempos) em um arquivo JSON Lines
+comprimido com gzip e reproduz o arquivo depois, de forma determinística,
+na velocidade gravada, acelerada ou instantânea
+"""
+
+import base64
+import gzip
+import json
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+# Cabeçalhos de resposta preservados na gravação
+CABECALHOS_GRAVADOS = ('ETag', 'Last-Modified', 'Content-Type', 'Retry-After')
+
+VERSAO_FORMATO = 1
+
+
+def _chave(url, params=None):
+    """Caminho (sem host) + parâmetros ordenados: a gravação vale para qualquer base_url"""
+    caminho = urlsplit(url).path
+    partes = [f"{k}={v}" for k, v in sorted((params or {}).items())]
+    return caminho + ('?' + '&'.join(partes) if partes else '')
+
+
+class RespostaGravada:
+    """Resposta reproduzida com a interface usada de requests.Response"""
+
+    def __init__(self, url, status_code, headers, content):
+        self.url = url
+        self.status_code = status_code
+        self.headers = requests.structures.CaseInsensitiveDict(headers or {})
+        self.content = content
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size=65536):
+        for inicio in range(0, len(self.content), chunk_size):
+            yield self.content[inicio:inicio + chunk_size]
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} (gravação) para {self.url}", response=self)
+
+    def close(self):
+        pass
+
+
+class GravadorHTTP:
+    """Escreve os registros no arquivo .jsonl.gz à medida que as respostas chegam"""
+
+    def __init__(self, arquivo):
+        self.arquivo = arquivo
+        self._lock = threading.Lock()
+        self._inicio = time.monotonic()
+        self._saida = gzip.open(arquivo, 'wt', encoding='utf-8', compresslevel=6)
+        self.total = 0
+        self._escrever({'versao': VERSAO_FORMATO, 'gravado_em': time.time()})
+
+    def _escrever(self, registro):
+        self._saida.write(json.dumps(registro, ensure_ascii=False, separators=(',', ':')) + '\n')
+
+    def registrar(self, url, params, inicio, duracao, status, headers, content):
+        """
+        Args:
+            inicio: time.monotonic() do envio da requisição
+            duracao: Segundos até a resposta completa
+        """
+        try:
+            corpo = {'texto': content.decode('utf-8')}
+        except UnicodeDecodeError:
+            corpo = {'base64': base64.b64encode(content).decode('ascii')}
+
+        registro = {
+            'chave': _chave(url, params),
+            't': round(inicio - self._inicio, 4),
+            'duracao': round(duracao, 4),
+            'status': status,
+            'headers': {nome: headers[nome] for nome in CABECALHOS_GRAVADOS if nome in headers},
+            **corpo
+        }
+        with self._lock:
+            self._escrever(registro)
+            self.total += 1
+
+    def fechar(self):
+        with self._lock:
+            if not self._saida.closed:
+                self._saida.close()
+
+
+class ReprodutorHTTP:
+    """
+    Serve as respostas de uma gravação
+
+    Requisições iguais recebem as respostas gravadas na mesma ordem; quando as
+    gravações daquela chave acabam, a última é repetida
+    """
+
+    def __init__(self, arquivo, velocidade=None):
+        """
+        Args:
+            arquivo: Arquivo .jsonl.gz produzido pelo GravadorHTTP
+            velocidade: None = instantâneo; 1.0 = tempos gravados; 10 = 10x mais rápido
+        """
+        self.arquivo = arquivo
+        self.velocidade = velocidade
+        self._lock = threading.Lock()
+        self._registros = {}
+        self._posicoes = {}
+        self.servidas = 0
+        self.nao_gravadas = 0
+
+        with gzip.open(arquivo, 'rt', encoding='utf-8') as entrada:
+            cabecalho = json.loads(entrada.readline())
+            if cabecalho.get('versao') != VERSAO_FORMATO:
+                raise ValueError(f"Formato de gravação não suportado: {cabecalho.get('versao')}")
+            for linha in entrada:
+                registro = json.loads(linha)
+                self._registros.setdefault(registro['chave'], []).append(registro)
+
+    @property
+    def total(self):
+        return sum(len(registros) for registros in self._registros.values())
+
+    def _proximo(self, chave, condicional):
+        with self._lock:
+            registros = self._registros.get(chave)
+            if not registros:
+                self.nao_gravadas += 1
+                return None
+            posicao = self._posicoes.get(chave, 0)
+            self._posicoes[chave] = posicao + 1
+            registro = registros[min(posicao, len(registros) - 1)]
+            if registro['status'] == 304 and not condicional:
+                # Quem pede sem validadores precisa do corpo: usar a última resposta completa
+                anteriores = [r for r in registros[:posicao + 1] if r['status'] != 304]
+                registro = anteriores[-1] if anteriores else registro
+            self.servidas += 1
+            return registro
+
+    def responder(self, url, params=None, headers=None):
+        chave = _chave(url, params)
+        registro = self._proximo(chave, bool(headers and ('If-None-Match' in headers or 'If-Modified-Since' in headers)))
+        if registro is None:
+            return RespostaGravada(url, 404, {}, b'{"error": "requisicao nao gravada"}')
+
+        if self.velocidade:
+            time.sleep(registro['duracao'] / self.velocidade)
+
+        if 'base64' in registro:
+            content = base64.b64decode(registro['base64'])
+        else:
+            content = registro.get('texto', '').encode('utf-8')
+        return RespostaGravada(url, registro['status'], registro['headers'], content)
+
+
+class TransporteGravador:
+    """Envolve um TransporteHTTP e grava cada resposta"""
+
+    def __init__(self, transporte, gravador):
+        self.transporte = transporte
+        self.gravador = gravador
+        self.max_conexoes = transporte.max_conexoes
+
+    def get(self, url, params=None, timeout=10, headers=None, stream=False):
+        inicio = time.monotonic()
+        response = self.transporte.get(url, params=params, timeout=timeout, headers=headers, stream=stream)
+        # O corpo é lido por inteiro para ser gravado (o stream continua funcionando sobre ele)
+        content = response.content
+        self.gravador.registrar(url, params, inicio, time.monotonic() - inicio,
+                                response.status_code, response.headers, content)
+        return response
+
+    def formatar_resumo(self):
+        return f"{self.transporte.formatar_resumo()} - gravando {self.gravador.total} respostas em {self.gravador.arquivo}"
+
+    def fechar(self):
+        self.gravador.fechar()
+        self.transporte.fechar()
+
+
+class TransporteReprodutor:
+    """Transporte que responde a partir de uma gravação, sem rede"""
+
+    def __init__(self, reprodutor, max_conexoes=10):
+        self.reprodutor = reprodutor
+        self.max_conexoes = max_conexoes
+
+    def get(self, url, params=None, timeout=10, headers=None, stream=False):
+        return self.reprodutor.responder(url, params, headers)
+
+    def formatar_resumo(self):
+        velocidade = f"{self.reprodutor.velocidade}x" if self.reprodutor.velocidade else 'instantânea'
+        return (f"reprodução de {self.reprodutor.arquivo} ({velocidade}): {self.reprodutor.servidas} servidas, "
+                f"{self.reprodutor.nao_gravadas} não gravadas")
+
+    def fechar(self):
+        pass
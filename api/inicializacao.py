@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Inicialização do Bet Booster como grafo de dependências
+Etapas independentes (database, limpeza de cache, jogos de hoje e de amanhã)
+rodam em paralelo; o progresso é informado a cada etapa concluída, sem pausas
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from api.cache_jogos import carregar_cache_jogos
+from api.motor_analise import motivo_interrupcao
+from api.retentativas import ErroRadar
+
+
+def preparar_data(api, diretorio_cache, data):
+    """
+    Jogos e apostas hot de uma data para a abertura do app: do cache diário se
+    existir e estiver completo, senão só o dailyRadar (a análise fica para depois,
+    em segundo plano)
+
+    Args:
+        api: RadarEsportivoAPI
+        diretorio_cache: Pasta dos arquivos jogos_<data>.json
+        data: Data no formato YYYY-MM-DD
+
+    Returns:
+        dict: {'data', 'periodo', 'jogos', 'apostas_hot', 'do_cache'}
+
+    Raises:
+        ErroRadar: Sem cache e o dailyRadar falhou (um dia vazio seria confundido com um dia sem jogos)
+    """
+    periodo = datetime.strptime(data, '%Y-%m-%d').strftime('%d/%m/%Y')
+    cache = carregar_cache_jogos(diretorio_cache, data)
+    if cache and motivo_interrupcao(cache.get('jogos', [])):
+        # Gravado por uma análise interrompida: vale como ausência de cache
+        print(f"⚠️ Cache de {periodo} incompleto ({motivo_interrupcao(cache['jogos'])}), ignorado")
+        cache = None
+
+    if cache:
+        jogos = cache.get('jogos', [])
+        apostas_hot = cache.get('apostas_hot', [])
+        print(f"📁 Usando cache para {periodo}: {len(jogos)} jogos, {len(apostas_hot)} apostas hot")
+        # Campos usados pelo filtro de data e pelos cards
+        for aposta in apostas_hot:
+            aposta['data_jogo'] = data
+            aposta['periodo'] = periodo
+    else:
+        jogos = api.buscar_jogos_do_dia(data)
+        if jogos is None:
+            raise ErroRadar('dailyRadar', data, 'desconhecido', "sem resposta válida do dailyRadar")
+        apostas_hot = []
+        print(f"🌐 {len(jogos)} jogos encontrados em {periodo}")
+
+    return {'data': data, 'periodo': periodo, 'jogos': jogos, 'apostas_hot': apostas_hot, 'do_cache': bool(cache)}
+
+
+class _Etapa:
+    def __init__(self, nome, funcao, dependencias, descricao):
+        self.nome = nome
+        self.funcao = funcao
+        self.dependencias = tuple(dependencias)
+        self.descricao = descricao or nome
+        self.duracao = None
+
+
+class GrafoInicializacao:
+    """
+    Executa etapas assim que as dependências terminam
+
+    Uso:
+        grafo = GrafoInicializacao(ao_progredir=lambda pct, texto: ...)
+        grafo.adicionar('database', lambda r: carregar_database(), descricao="Carregando database de times...")
+        grafo.adicionar('hoje', lambda r: preparar_data(api, pasta, hoje), descricao="Jogos de hoje...")
+        resultados = grafo.executar()
+    """
+
+    def __init__(self, max_workers=4, ao_progredir=None):
+        """
+        Args:
+            max_workers: Etapas simultâneas
+            ao_progredir: Função (progresso 0-100, texto) chamada quando uma etapa começa ou termina
+        """
+        self.max_workers = max_workers
+        self.ao_progredir = ao_progredir
+        self.etapas = {}
+        self.resultados = {}
+        self.erros = {}
+        self.duracao_total = None
+
+    def adicionar(self, nome, funcao, dependencias=(), descricao=None):
+        """
+        Args:
+            nome: Identificador da etapa
+            funcao: Função (resultados) que recebe o dicionário de resultados das etapas já concluídas
+            dependencias: Nomes das etapas que precisam terminar antes
+            descricao: Texto exibido no progresso
+        """
+        for dependencia in dependencias:
+            if dependencia not in self.etapas:
+                raise ValueError(f"Etapa '{nome}' depende de '{dependencia}', que ainda não foi adicionada")
+        self.etapas[nome] = _Etapa(nome, funcao, dependencias, descricao)
+
+    def _progredir(self, concluidas, texto):
+        if self.ao_progredir:
+            self.ao_progredir(concluidas * 100.0 / max(1, len(self.etapas)), texto)
+
+    def _executar_etapa(self, etapa):
+        inicio = time.perf_counter()
+        try:
+            return etapa.funcao(self.resultados)
+        finally:
+            etapa.duracao = time.perf_counter() - inicio
+
+    def executar(self):
+        """
+        Roda todas as etapas; uma etapa com erro fica com resultado None (o erro vai
+        para self.erros) e as dependentes rodam mesmo assim
+
+        Returns:
+            dict: {nome da etapa: resultado}
+        """
+        inicio = time.perf_counter()
+        faltando = dict(self.etapas)
+        em_execucao = {}
+        concluidas = 0
+        terminou = threading.Condition()
+        prontas = []
+
+        def ao_terminar(nome, future):
+            with terminou:
+                prontas.append((nome, future))
+                terminou.notify()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='inicializacao') as executor:
+            while faltando or em_execucao:
+                # Disparar tudo o que já tem as dependências resolvidas
+                for nome, etapa in list(faltando.items()):
+                    if all(dependencia in self.resultados for dependencia in etapa.dependencias):
+                        del faltando[nome]
+                        self._progredir(concluidas, etapa.descricao)
+                        future = executor.submit(self._executar_etapa, etapa)
+                        em_execucao[nome] = future
+                        future.add_done_callback(lambda f, nome=nome: ao_terminar(nome, f))
+
+                if not em_execucao:
+                    raise ValueError(f"Dependências circulares entre: {', '.join(faltando)}")
+
+                with terminou:
+                    while not prontas:
+                        terminou.wait()
+                    terminadas, prontas[:] = list(prontas), []
+
+                for nome, future in terminadas:
+                    del em_execucao[nome]
+                    try:
+                        self.resultados[nome] = future.result()
+                    except Exception as e:
+                        print(f"⚠️ Erro na etapa de inicialização '{nome}': {e}")
+                        self.erros[nome] = e
+                        self.resultados[nome] = None
+                    concluidas += 1
+                    self._progredir(concluidas, f"{self.etapas[nome].descricao.rstrip('.')} - concluído")
+
+        self.duracao_total = time.perf_counter() - inicio
+        return self.resultados
+
+    def resumo(self):
+        """Tempo de cada etapa e o total (o total é menor que a soma quando há paralelismo)"""
+        partes = [f"{nome}: {etapa.duracao:.2f} s" for nome, etapa in self.etapas.items() if etapa.duracao is not None]
+        total = f"{self.duracao_total:.2f} s" if self.duracao_total is not None else '-'
+        return f"{', '.join(partes)} - total {total}"
@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Controle de vazão para a API Radar Esportivo
+Token bucket por endpoint (dailyRadar, prepRadar, goalRadar) combinado com
+controle de concorrência AIMD: reduz pela metade em 429/5xx ou picos de
+latência e aumenta aos poucos enquanto as respostas estão saudáveis.
+As taxas dos baldes seguem a mesma regra, e um teto global (o tamanho do
+pool) limita a soma das requisições em andamento de todos os endpoints
+"""
+
+import threading
+import time
+
+from api.retentativas import Prazo, ErroRadar
+
+
+class BaldeTokens:
+    """
+    Token bucket thread-safe: `taxa` tokens/s com rajada de até `capacidade`
+    A taxa se ajusta entre `taxa_minima` e `taxa_maxima` conforme ajustar()
+    """
+
+    def __init__(self, taxa, capacidade, taxa_minima=None, taxa_maxima=None,
+                 fator_reducao=0.5, intervalo_reducao=1.0):
+        """
+        Args:
+            taxa: Tokens repostos por segundo (taxa inicial)
+            capacidade: Máximo de tokens acumulados (tamanho da rajada)
+            taxa_minima: Menor taxa após reduções (padrão: a inicial, taxa fixa)
+            taxa_maxima: Maior taxa após aumentos (padrão: a inicial, taxa fixa)
+            fator_reducao: Multiplicador aplicado à taxa em caso de sobrecarga
+            intervalo_reducao: Intervalo mínimo (s) entre duas reduções seguidas
+        """
+        self.taxa = float(taxa)
+        self.capacidade = float(capacidade)
+        self.taxa_minima = float(taxa_minima if taxa_minima is not None else taxa)
+        self.taxa_maxima = float(taxa_maxima if taxa_maxima is not None else taxa)
+        self.fator_reducao = fator_reducao
+        self.intervalo_reducao = intervalo_reducao
+        # Cada resposta saudável soma 5% da taxa inicial (ex.: 20/s chega a 80/s em 60 respostas)
+        self._passo = self.taxa * 0.05
+        self._ultima_reducao = 0.0
+        self._tokens = float(capacidade)
+        self._atualizado_em = time.monotonic()
+        self._bloqueado_ate = 0.0
+        self._lock = threading.Lock()
+
+    def _reabastecer(self, agora):
+        """Repõe os tokens do período à taxa atual (com o lock)"""
+        self._tokens = min(self.capacidade, self._tokens + (agora - self._atualizado_em) * self.taxa)
+        self._atualizado_em = agora
+
+    def reservar(self):
+        """
+        Reserva um token e retorna quantos segundos esperar antes de usá-lo
+        (permite uso tanto por threads quanto por corrotinas)
+        """
+        with self._lock:
+            agora = time.monotonic()
+            self._reabastecer(agora)
+            self._tokens -= 1
+            espera = max(0.0, -self._tokens / self.taxa, self._bloqueado_ate - agora)
+            return espera
+
+    def devolver(self):
+        """Devolve um token reservado e não usado"""
+        with self._lock:
+            self._tokens = min(self.capacidade, self._tokens + 1)
+
+    def adquirir(self, prazo=None, segundos=None):
+        """
+        Bloqueia a thread até haver um token disponível
+
+        Args:
+            prazo: Prazo da chamada; cancelá-lo interrompe a espera
+            segundos: Espera máxima aceitável (None = sem limite)
+
+        Returns:
+            Segundos esperados, ou None se a espera não cabe no prazo
+            (o token é devolvido e a requisição não deve ser enviada)
+        """
+        espera = self.reservar()
+        if segundos is not None and espera > segundos:
+            self.devolver()
+            return None
+        if espera > 0:
+            if prazo is None:
+                time.sleep(espera)
+            elif not prazo.aguardar(espera):
+                self.devolver()
+                return None
+        return espera
+
+    def pausar(self, segundos):
+        """Suspende a emissão de tokens (ex.: Retry-After de um 429)"""
+        with self._lock:
+            self._bloqueado_ate = max(self._bloqueado_ate, time.monotonic() + segundos)
+
+    def ajustar(self, sobrecarga):
+        """
+        AIMD sobre a taxa: metade em sobrecarga (uma vez por janela), +passo a cada resposta saudável
+
+        Args:
+            sobrecarga: True para 429/5xx/timeout/latência alta
+        """
+        with self._lock:
+            agora = time.monotonic()
+            self._reabastecer(agora)
+            if sobrecarga:
+                if agora - self._ultima_reducao >= self.intervalo_reducao:
+                    self.taxa = max(self.taxa_minima, self.taxa * self.fator_reducao)
+                    self._ultima_reducao = agora
+            else:
+                self.taxa = min(self.taxa_maxima, self.taxa + self._passo)
+
+
+class ControleAIMD:
+    """
+    Limite de concorrência adaptativo (Additive Increase, Multiplicative Decrease)
+    """
+
+    def __init__(self, minimo=1, maximo=10, inicial=None, fator_reducao=0.5,
+                 latencia_limite=3.0, intervalo_reducao=1.0):
+        """
+        Args:
+            minimo: Menor limite de requisições simultâneas
+            maximo: Maior limite (normalmente o tamanho do pool de conexões)
+            inicial: Limite inicial (padrão: metade do máximo)
+            fator_reducao: Multiplicador aplicado ao limite em caso de sobrecarga
+            latencia_limite: Latência (s) a partir da qual a resposta conta como sobrecarga
+            intervalo_reducao: Intervalo mínimo (s) entre duas reduções seguidas
+        """
+        self.minimo = minimo
+        self.maximo = maximo
+        self.limite = float(inicial if inicial is not None else max(minimo, maximo // 2))
+        self.fator_reducao = fator_reducao
+        self.latencia_limite = latencia_limite
+        self.intervalo_reducao = intervalo_reducao
+        self.em_andamento = 0
+        self.reducoes = 0
+        self._ultima_reducao = 0.0
+        self._condicao = threading.Condition()
+
+    def adquirir(self, prazo=None, segundos=None):
+        """
+        Bloqueia até haver vaga dentro do limite atual
+
+        Args:
+            prazo: Prazo da chamada; cancelá-lo interrompe a espera
+            segundos: Espera máxima (None = sem limite)
+
+        Returns:
+            True se obteve a vaga, False se o prazo acabou antes
+        """
+        fim = None if segundos is None else time.monotonic() + segundos
+        with self._condicao:
+            while self.em_andamento >= int(self.limite):
+                if prazo is not None and prazo.cancelado():
+                    return False
+                if fim is None:
+                    # Sem prazo basta o notify_all de liberar(); com prazo, acorda em fatias
+                    self._condicao.wait(Prazo.FATIA_ESPERA if prazo is not None else None)
+                    continue
+                falta = fim - time.monotonic()
+                if falta <= 0:
+                    return False
+                self._condicao.wait(min(falta, Prazo.FATIA_ESPERA))
+            self.em_andamento += 1
+            return True
+
+    def tentar_adquirir(self):
+        """
+        Ocupa uma vaga sem bloquear (uso pelo cliente assíncrono)
+
+        Returns:
+            True se havia vaga dentro do limite atual
+        """
+        with self._condicao:
+            if self.em_andamento >= int(self.limite):
+                return False
+            self.em_andamento += 1
+            return True
+
+    def devolver(self):
+        """Libera uma vaga cuja requisição não foi enviada, sem ajustar o limite"""
+        with self._condicao:
+            self.em_andamento -= 1
+            self._condicao.notify_all()
+
+    def liberar(self, sobrecarga=False):
+        """
+        Libera a vaga e ajusta o limite
+
+        Args:
+            sobrecarga: True para 429/5xx/timeout/latência alta
+        """
+        with self._condicao:
+            self.em_andamento -= 1
+            agora = time.monotonic()
+            if sobrecarga:
+                # Uma única redução por janela: respostas ruins em rajada são o mesmo evento
+                if agora - self._ultima_reducao >= self.intervalo_reducao:
+                    self.limite = max(self.minimo, self.limite * self.fator_reducao)
+                    self._ultima_reducao = agora
+                    self.reducoes += 1
+            else:
+                # +1 vaga a cada "limite" respostas saudáveis (≈ +1 por ciclo)
+                self.limite = min(self.maximo, self.limite + 1.0 / max(self.limite, 1.0))
+            self._condicao.notify_all()
+
+
+class LimitadorRadar:
+    """
+    Limitador do cliente: um BaldeTokens e um ControleAIMD por endpoint, sob um
+    teto global de requisições em andamento (o tamanho do pool de conexões)
+    """
+
+    # endpoint -> (requisições/s, rajada) iniciais. Uma análise faz 1 dailyRadar por dia,
+    # 1 prepRadar e 2 goalRadar por partida, daí goalRadar = 2x prepRadar; dailyRadar e
+    # results só precisam de poucas chamadas. São pontos de partida conservadores: cada
+    # balde sobe até FATOR_AJUSTE_TAXA vezes a taxa inicial enquanto as respostas estão
+    # saudáveis e cai pela metade (até 1/FATOR_AJUSTE_TAXA) em 429/5xx/latência alta
+    ORCAMENTOS_PADRAO = {
+        'dailyRadar': (2, 4),
+        'prepRadar': (20, 40),
+        'goalRadar': (40, 80),
+        'results': (2, 4)
+    }
+    FATOR_AJUSTE_TAXA = 4
+
+    def __init__(self, max_concorrencia=10, orcamentos=None, latencia_limite=3.0):
+        """
+        Args:
+            max_concorrencia: Tamanho do pool: teto global e teto do AIMD de cada endpoint
+            orcamentos: Dicionário endpoint -> (taxa, rajada) que sobrescreve os padrões
+            latencia_limite: Latência considerada pico para o AIMD
+        """
+        self.orcamentos = dict(self.ORCAMENTOS_PADRAO)
+        self.orcamentos.update(orcamentos or {})
+        self.max_concorrencia = max_concorrencia
+        self.latencia_limite = latencia_limite
+        # Limite fixo (mínimo = máximo): a soma dos endpoints nunca passa do pool, então
+        # nenhuma requisição admitida fica esperando conexão livre no pool
+        self._teto_global = ControleAIMD(minimo=max_concorrencia, maximo=max_concorrencia,
+                                         inicial=max_concorrencia)
+        self._lock = threading.Lock()
+        self._baldes = {}
+        self._controles = {}
+        self.contadores = {}
+
+    def _obter(self, endpoint):
+        with self._lock:
+            if endpoint not in self._baldes:
+                taxa, rajada = self.orcamentos.get(endpoint, self.orcamentos['results'])
+                self._baldes[endpoint] = BaldeTokens(taxa, rajada,
+                                                     taxa_minima=taxa / self.FATOR_AJUSTE_TAXA,
+                                                     taxa_maxima=taxa * self.FATOR_AJUSTE_TAXA)
+                self._controles[endpoint] = ControleAIMD(maximo=self.max_concorrencia,
+                                                         latencia_limite=self.latencia_limite)
+                self.contadores[endpoint] = {'requisicoes': 0, 'sobrecargas': 0, 'espera_total': 0.0}
+            return self._baldes[endpoint], self._controles[endpoint]
+
+    def balde(self, endpoint):
+        """BaldeTokens do endpoint (uso direto pelo cliente assíncrono)"""
+        return self._obter(endpoint)[0]
+
+    def controle(self, endpoint):
+        """ControleAIMD do endpoint"""
+        return self._obter(endpoint)[1]
+
+    def tentar_adquirir(self, endpoint):
+        """
+        Ocupa uma vaga do endpoint e do teto global sem bloquear (uso pelo cliente assíncrono)
+
+        Returns:
+            True se havia vaga nos dois limites
+        """
+        controle = self._obter(endpoint)[1]
+        if not controle.tentar_adquirir():
+            return False
+        if not self._teto_global.tentar_adquirir():
+            controle.devolver()
+            return False
+        return True
+
+    def liberar(self, endpoint, enviada, sobrecarga=False):
+        """
+        Libera as vagas obtidas com tentar_adquirir()/executar() e ajusta limite e taxa
+
+        Args:
+            endpoint: Endpoint da requisição
+            enviada: False se a requisição foi abandonada na fila (não ajusta nada)
+            sobrecarga: True para 429/5xx/timeout/latência alta
+        """
+        balde, controle = self._obter(endpoint)
+        self._teto_global.devolver()
+        if enviada:
+            controle.liberar(sobrecarga=sobrecarga)
+            balde.ajustar(sobrecarga)
+        else:
+            controle.devolver()
+
+    def executar(self, endpoint, requisicao, prazo=None, segundos=None):
+        """
+        Executa `requisicao()` respeitando o orçamento e o limite AIMD do endpoint
+
+        Args:
+            endpoint: 'dailyRadar', 'prepRadar', 'goalRadar', ...
+            requisicao: Função sem argumentos que retorna a resposta HTTP
+            prazo: Prazo da chamada; cancelá-lo interrompe as esperas do limitador
+            segundos: Tempo máximo de espera na fila (normalmente o restante do prazo)
+
+        Returns:
+            A resposta de `requisicao()` (exceções são propagadas)
+
+        Raises:
+            ErroRadar: 'cancelado' ou 'prazo' quando desiste antes de enviar a requisição
+        """
+        balde, controle = self._obter(endpoint)
+        fim = None if segundos is None else time.monotonic() + segundos
+        # O token vem antes das vagas: a espera pelo orçamento não ocupa o pool
+        espera = balde.adquirir(prazo, segundos)
+        if espera is None:
+            raise self.desistencia(endpoint, prazo)
+        # Depois a vaga do endpoint e por fim a global: esperar pelo próprio endpoint
+        # não ocupa o pool que os outros endpoints poderiam estar usando
+        if not controle.adquirir(prazo, None if fim is None else fim - time.monotonic()):
+            balde.devolver()
+            raise self.desistencia(endpoint, prazo)
+        if not self._teto_global.adquirir(prazo, None if fim is None else fim - time.monotonic()):
+            controle.devolver()
+            balde.devolver()
+            raise self.desistencia(endpoint, prazo)
+        sobrecarga = True
+        try:
+            inicio = time.monotonic()
+            response = requisicao()
+            latencia = time.monotonic() - inicio
+            sobrecarga = self.registrar_resposta(endpoint, response, latencia, espera)
+            return response
+        finally:
+            self.liberar(endpoint, True, sobrecarga)
+
+    @staticmethod
+    def desistencia(endpoint, prazo):
+        """ErroRadar para uma requisição abandonada na fila do limitador"""
+        motivo = prazo.motivo_cancelamento() if prazo is not None else None
+        if motivo:
+            return ErroRadar(endpoint, None, 'cancelado', motivo, tentativas=0)
+        return ErroRadar(endpoint, None, 'prazo', 'prazo esgotado na fila do limitador', tentativas=0)
+
+    def registrar_resposta(self, endpoint, response, latencia, espera=0.0):
+        """
+        Contabiliza uma resposta e aplica Retry-After em 429
+
+        Returns:
+            bool: True se a resposta indica sobrecarga
+        """
+        balde, _ = self._obter(endpoint)
+        # requests/httpx expõem status_code; aiohttp expõe status
+        status = getattr(response, 'status_code', None) or getattr(response, 'status', 200)
+        sobrecarga = status == 429 or status >= 500 or latencia > self.latencia_limite
+
+        if status == 429:
+            retry_after = response.headers.get('Retry-After') if response is not None else None
+            try:
+                balde.pausar(float(retry_after) if retry_after else 1.0)
+            except ValueError:
+                balde.pausar(1.0)
+
+        with self._lock:
+            contadores = self.contadores[endpoint]
+            contadores['requisicoes'] += 1
+            contadores['espera_total'] += espera
+            if sobrecarga:
+                contadores['sobrecargas'] += 1
+
+        return sobrecarga
+
+    def resumo(self):
+        """Estado por endpoint: limite AIMD atual, requisições, sobrecargas e espera"""
+        with self._lock:
+            return {
+                endpoint: {
+                    'limite': int(self._controles[endpoint].limite),
+                    'taxa': round(self._baldes[endpoint].taxa, 1),
+                    'reducoes': self._controles[endpoint].reducoes,
+                    'requisicoes': c['requisicoes'],
+                    'sobrecargas': c['sobrecargas'],
+                    'espera_total': round(c['espera_total'], 2)
+                }
+                for endpoint, c in self.contadores.items()
+            }
+
+    def formatar_resumo(self):
+        """Texto curto para logs"""
+        partes = [f"{endpoint}: limite {r['limite']}, {r['taxa']:g} req/s, {r['requisicoes']} req, "
+                  f"{r['sobrecargas']} sobrecargas"
+                  for endpoint, r in sorted(self.resumo().items())]
+        return '; '.join(partes) or 'nenhuma requisição'
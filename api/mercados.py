@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Matriz de placares de uma partida e todos os mercados derivados dela
+A matriz é montada uma vez por partida (memorizada no cache de tabelas do
+processo) e reduzida uma vez para a distribuição do saldo de gols; cada
+mercado (1X2, dupla chance, empate anula, over/under em todas as linhas,
+ambos marcam, total por time, handicap asiático e placar exato) vira uma
+leitura dessas distribuições
+
+Uso:
+    matriz = matriz_placares(1.6, 1.1, vantagem_casa=0.05)
+    matriz.handicap_asiatico([-0.5, -1.0])   # (vitória, reembolso, derrota)
+    matriz.over_under_linhas()               # [(0.5, over), (1.5, over), ...]
+    apostas_mercados(matriz, prep_radar['marketOdds'])
+"""
+
+import heapq
+import re
+from math import ceil, floor
+
+try:
+    import numpy as np
+except ImportError:  # Dependência opcional: sem ela a redução é feita em Python
+    np = None
+
+from api.probabilidades import TOLERANCIA_CAUDA, calcular_probabilidades, tabelas_poisson
+
+# Chaves goalsOu05, goalsOu15, goalsOu25... do marketOdds (o total do 1º tempo, goalsOu05HT, fica de fora)
+PADRAO_LINHA_GOLS = re.compile(r'^goalsOu(\d+)$')
+
+# Linha de gols de cada chave do marketOdds e linhas de cada nome de handicap, já interpretadas
+_linhas_gols = {}
+_linhas_handicap = {}
+
+# Índice do saldo (i - j) de cada célula, por tamanho da grade (as grades se repetem entre partidas)
+_indices_saldo = {}
+
+
+def _indice_saldo(linhas, colunas):
+    """Saldo de gols i - j + (colunas - 1) de cada célula da grade achatada"""
+    chave = (linhas, colunas)
+    indices = _indices_saldo.get(chave)
+    if indices is None:
+        indices = (np.subtract.outer(np.arange(linhas), np.arange(colunas)) + (colunas - 1)).ravel()
+        _indices_saldo[chave] = indices
+    return indices
+
+
+def _metades_handicap(handicap):
+    """Linhas simples de um handicap: -0.75 ou [-0.5, -1.0] -> [-0.5, -1.0]; -1.0 -> [-1.0]"""
+    if isinstance(handicap, (list, tuple)):
+        return [float(linha) for linha in handicap]
+    handicap = float(handicap)
+    if (handicap * 4) % 2 == 1:  # Linha de quarto: metade da aposta em cada linha vizinha
+        return [handicap - 0.25, handicap + 0.25]
+    return [handicap]
+
+
+class MatrizPlacares:
+    """
+    Distribuição do placar final de uma partida com os mercados derivados
+
+    Probabilidades em fração (0-1). O 1X2 e os mercados de saldo (dupla chance,
+    empate anula, handicap) seguem o 1X2 do ResultadoProbabilidades, já com a
+    vantagem do mandante; totais de gols e placares exatos vêm da grade pura.
+    """
+
+    def __init__(self, resultado):
+        """
+        Args:
+            resultado: ResultadoProbabilidades da partida (gols esperados, placar ao vivo e vantagem)
+        """
+        self.resultado = resultado
+        self.gols_atuais_casa = resultado.gols_atuais_casa
+        self.gols_atuais_visitante = resultado.gols_atuais_visitante
+        pmf_casa, pmf_visitante = resultado.pmf_casa, resultado.pmf_visitante
+        linhas, colunas = len(pmf_casa), len(pmf_visitante)
+
+        # Matriz [i][j] = P(mais i gols do mandante e mais j do visitante) e sua redução pelo saldo i - j
+        if np is not None:
+            self.matriz = np.outer(pmf_casa, pmf_visitante)
+            saldo = np.bincount(_indice_saldo(linhas, colunas), weights=self.matriz.ravel(),
+                                minlength=linhas + colunas - 1).tolist()
+        else:
+            self.matriz = [[prob_casa * prob_visitante for prob_visitante in pmf_visitante]
+                           for prob_casa in pmf_casa]
+            saldo = [0.0] * (linhas + colunas - 1)
+            for i, linha in enumerate(self.matriz):
+                for j, prob in enumerate(linha):
+                    saldo[i - j + colunas - 1] += prob
+
+        # saldo[k] = P(saldo final = k - base)
+        self._base = colunas - 1 - (self.gols_atuais_casa - self.gols_atuais_visitante)
+        self.saldo = self._ajustar_saldo(saldo, (resultado.vitoria_casa, resultado.empate,
+                                                 resultado.vitoria_visitante))
+        self._acumulado_saldo = []
+        soma = 0.0
+        for prob in self.saldo:
+            soma += prob
+            self._acumulado_saldo.append(soma)
+
+        # Mercados já lidos: a matriz é compartilhada por todas as partidas com os mesmos gols esperados
+        self._lidos = {}
+
+    def _ler(self, chave, calcular):
+        """Valor memorizado de um mercado (corridas entre threads só repetem o cálculo)"""
+        valor = self._lidos.get(chave)
+        if valor is None:
+            valor = self._lidos[chave] = calcular()
+        return valor
+
+    def _ajustar_saldo(self, saldo, resultado_1x2):
+        """Reescala vitória/empate/derrota do saldo para o 1X2 do resultado (normalização + vantagem)"""
+        base = self._base
+        faixas = (range(max(0, base + 1), len(saldo)), range(base, base + 1) if 0 <= base < len(saldo) else (),
+                  range(0, min(base, len(saldo))))
+        ajustado = list(saldo)
+        for faixa, alvo in zip(faixas, resultado_1x2):
+            massa = sum(saldo[k] for k in faixa)
+            if massa > 0:
+                fator = alvo / massa
+                for k in faixa:
+                    ajustado[k] = saldo[k] * fator
+        return ajustado
+
+    def _massa_saldo(self, minimo=None, maximo=None):
+        """P(minimo <= saldo final <= maximo) lida da soma acumulada do saldo"""
+        inicio = 0 if minimo is None else max(0, minimo + self._base)
+        fim = len(self.saldo) - 1 if maximo is None else min(len(self.saldo) - 1, maximo + self._base)
+        if fim < inicio:
+            return 0.0
+        return self._acumulado_saldo[fim] - (self._acumulado_saldo[inicio - 1] if inicio > 0 else 0.0)
+
+    def como_dict(self):
+        """Cópia de ResultadoProbabilidades.como_dict() (em %), montado uma vez por matriz"""
+        return dict(self._ler(('dict',), self.resultado.como_dict))
+
+    # Resultado
+    def resultado_final(self):
+        """(casa, empate, visitante)"""
+        return self.resultado.vitoria_casa, self.resultado.empate, self.resultado.vitoria_visitante
+
+    def dupla_chance(self):
+        """(casa ou empate, empate ou visitante, casa ou visitante)"""
+        return self.resultado.dupla_chance()
+
+    def empate_anula(self):
+        """(casa, visitante) sem o empate"""
+        return self.resultado.empate_anula()
+
+    def handicap_asiatico(self, handicap, lado='casa'):
+        """
+        Handicap asiático (linha inteira, meia ou de quarto)
+
+        Args:
+            handicap: Linha do lado apostado (ex.: -0.5, -0.75 ou [-0.5, -1.0] para a linha dividida)
+            lado: 'casa' ou 'visitante'
+
+        Returns:
+            tuple: (vitoria, reembolso, derrota), médias das metades da aposta
+        """
+        metades = _metades_handicap(handicap)
+        return self._ler(('handicap', tuple(metades), lado), lambda: self._handicap(metades, lado))
+
+    def _handicap(self, metades, lado):
+        vitoria = reembolso = derrota = 0.0
+        for linha in metades:
+            # Mandante ganha com saldo + linha > 0; visitante com linha - saldo > 0
+            limite = -linha if lado == 'casa' else linha
+            abaixo = self._massa_saldo(maximo=ceil(limite) - 1)
+            acima = self._massa_saldo(minimo=floor(limite) + 1)
+            if limite == int(limite):
+                reembolso += self._massa_saldo(int(limite), int(limite))
+            if lado == 'casa':
+                vitoria, derrota = vitoria + acima, derrota + abaixo
+            else:
+                vitoria, derrota = vitoria + abaixo, derrota + acima
+        return vitoria / len(metades), reembolso / len(metades), derrota / len(metades)
+
+    # Gols
+    def over_under(self, linha):
+        """(over, under) do total de gols no fim"""
+        def calcular():
+            over = self.resultado.over(linha)
+            return over, 1.0 - over
+
+        return self._ler(('gols', linha), calcular)
+
+    def over_under_linhas(self, tolerancia=TOLERANCIA_CAUDA):
+        """[(linha, over)] em todas as meias linhas até o over ficar abaixo da tolerância"""
+        atuais = self.gols_atuais_casa + self.gols_atuais_visitante
+        linhas = [(k + 0.5, 1.0) for k in range(atuais)]  # Linhas já batidas pelo placar atual
+        for k, acumulada in enumerate(self.resultado.cdf_total()):
+            over = max(0.0, 1.0 - acumulada)
+            linhas.append((atuais + k + 0.5, over))
+            if over < tolerancia:
+                break
+        return linhas
+
+    def ambas_marcam(self):
+        """P(os dois times marcam)"""
+        return self.resultado.ambas_marcam()
+
+    def total_time(self, linha, lado='casa'):
+        """(over, under) dos gols de um time no fim"""
+        if lado == 'casa':
+            gols_esperados, atuais = self.resultado.gols_esperados_casa, self.gols_atuais_casa
+        else:
+            gols_esperados, atuais = self.resultado.gols_esperados_visitante, self.gols_atuais_visitante
+        limite = int(linha) - atuais
+        if limite < 0:
+            return 1.0, 0.0
+        cdf = tabelas_poisson.obter(gols_esperados, self.resultado.tolerancia)[1]
+        under = min(1.0, cdf[min(limite, len(cdf) - 1)])
+        return 1.0 - under, under
+
+    # Placar exato
+    def placar_exato(self, gols_casa, gols_visitante):
+        """P(placar final = gols_casa x gols_visitante)"""
+        return self.resultado.placar(gols_casa, gols_visitante)
+
+    def placares_mais_provaveis(self, quantidade=5):
+        """[(gols casa, gols visitante, probabilidade)] dos placares finais mais prováveis"""
+        colunas = len(self.resultado.pmf_visitante)
+        if np is not None:
+            plana = self.matriz.ravel()
+            quantidade = min(quantidade, plana.size)
+            melhores = np.argpartition(plana, -quantidade)[-quantidade:]
+            celulas = sorted(((float(plana[k]), k) for k in melhores.tolist()), reverse=True)
+        else:
+            celulas = heapq.nlargest(quantidade, ((prob, i * colunas + j) for i, linha in enumerate(self.matriz)
+                                                  for j, prob in enumerate(linha)))
+        return [(self.gols_atuais_casa + k // colunas, self.gols_atuais_visitante + k % colunas, prob)
+                for prob, k in celulas]
+
+
+def matriz_placares(gols_esperados_casa, gols_esperados_visitante, gols_atuais_casa=0, gols_atuais_visitante=0,
+                    vantagem_casa=0.0, tolerancia=TOLERANCIA_CAUDA, motor_1x2=None):
+    """
+    MatrizPlacares da partida, memorizada no cache de tabelas do processo (mesmos argumentos de
+    calcular_probabilidades; os gols esperados são quantizados como as tabelas PMF/CDF)
+    """
+    passos_casa = tabelas_poisson.quantizar(gols_esperados_casa)
+    passos_visitante = tabelas_poisson.quantizar(gols_esperados_visitante)
+    precisao = tabelas_poisson.precisao
+
+    def calcular():
+        return MatrizPlacares(calcular_probabilidades(passos_casa * precisao, passos_visitante * precisao,
+                                                      gols_atuais_casa, gols_atuais_visitante, vantagem_casa,
+                                                      tolerancia, motor_1x2))
+
+    chave = ('matriz', passos_casa, passos_visitante, gols_atuais_casa, gols_atuais_visitante, vantagem_casa,
+             tolerancia, motor_1x2)
+    return tabelas_poisson.consultar(chave, calcular)
+
+
+def _linha_gols(chave):
+    """'goalsOu25' -> 2.5; None para chaves que não são total de gols da partida"""
+    if chave not in _linhas_gols:
+        encontrado = PADRAO_LINHA_GOLS.match(chave)
+        _linhas_gols[chave] = int(encontrado.group(1)) / 10 if encontrado else None
+    return _linhas_gols[chave]
+
+
+def _linha_handicap(nome):
+    """'-0.5, -1.0' -> (-0.5, -1.0); () se o nome não for uma linha"""
+    if nome not in _linhas_handicap:
+        try:
+            linhas = tuple(float(parte) for parte in str(nome).replace(' ', '').split(',') if parte)
+        except ValueError:
+            linhas = ()
+        _linhas_handicap[nome] = linhas
+    return _linhas_handicap[nome]
+
+
+def _opcao(aceitar, mercado, aposta, valor, linha=None):
+    """
+    Odd decimal da opção, ou None se ela for ausente, nula, zerada, NaN ou não numérica
+    (odd válida > 1) ou se o filtro `aceitar` a recusar
+    """
+    odd = valor
+    if type(odd) is not float:  # Caso comum (odd já float) sem a conversão
+        try:
+            odd = float(valor)
+        except (TypeError, ValueError):
+            return None
+    if not odd > 1 or (aceitar is not None and not aceitar(mercado, aposta, odd, linha)):
+        return None
+    return odd
+
+
+def apostas_mercados(matriz, odds, time_casa='Casa', time_visitante='Visitante', aceitar=None):
+    """
+    Probabilidade de cada opção do marketOdds (prepRadar) que a matriz de placares cobre
+
+    Opções sem odd válida são ignoradas, e um mercado malformado é descartado
+    sozinho (com aviso) sem afetar os demais
+
+    Args:
+        matriz: MatrizPlacares da partida
+        odds: marketOdds (resultFt, goalsOuNN, btts, drawNoBet, asianHandicap; outras chaves são ignoradas)
+        time_casa: Nome do mandante (texto da aposta)
+        time_visitante: Nome do visitante (texto da aposta)
+        aceitar: Filtro opcional aceitar(mercado, aposta, odd, linha) aplicado antes de ler
+                 a probabilidade; mercados sem nenhuma opção aceita não são lidos da matriz
+
+    Returns:
+        list: [(mercado, aposta, probabilidade em %, odd, linha de gols ou None)]; em mercados com
+              reembolso (handicap), a probabilidade é vitória / (vitória + derrota)
+    """
+    apostas = []
+
+    resultado = odds.get('resultFt')
+    if resultado:
+        try:
+            texto_casa, texto_visitante = f'Vitória {time_casa}', f'Vitória {time_visitante}'
+            odd_casa = _opcao(aceitar, 'resultado', texto_casa, resultado.get('home'))
+            odd_empate = _opcao(aceitar, 'resultado', 'Empate', resultado.get('draw'))
+            odd_visitante = _opcao(aceitar, 'resultado', texto_visitante, resultado.get('away'))
+            if odd_casa or odd_empate or odd_visitante:
+                casa, empate, visitante = matriz.resultado_final()
+                if odd_casa:
+                    apostas.append(('resultado', texto_casa, casa * 100, odd_casa, None))
+                if odd_empate:
+                    apostas.append(('resultado', 'Empate', empate * 100, odd_empate, None))
+                if odd_visitante:
+                    apostas.append(('resultado', texto_visitante, visitante * 100, odd_visitante, None))
+        except (AttributeError, TypeError) as e:
+            print(f"⚠️ Mercado resultFt ignorado (formato inesperado): {e}")
+
+    for chave, mercado in odds.items():
+        linha = _linha_gols(chave)
+        if linha is None or not mercado:
+            continue
+        try:
+            texto_over, texto_under = f'Mais de {linha:g} gols', f'Menos de {linha:g} gols'
+            odd_over = _opcao(aceitar, 'gols', texto_over, mercado.get('over'), linha)
+            odd_under = _opcao(aceitar, 'gols', texto_under, mercado.get('under'), linha)
+            if odd_over or odd_under:
+                over, under = matriz.over_under(linha)
+                if odd_over:
+                    apostas.append(('gols', texto_over, over * 100, odd_over, linha))
+                if odd_under:
+                    apostas.append(('gols', texto_under, under * 100, odd_under, linha))
+        except (AttributeError, TypeError) as e:
+            print(f"⚠️ Mercado {chave} ignorado (formato inesperado): {e}")
+
+    ambas = odds.get('btts')
+    if ambas:
+        try:
+            odd_sim = _opcao(aceitar, 'ambas_marcam', 'Ambos marcam - Sim', ambas.get('yes'))
+            odd_nao = _opcao(aceitar, 'ambas_marcam', 'Ambos marcam - Não', ambas.get('no'))
+            if odd_sim or odd_nao:
+                sim = matriz.ambas_marcam()
+                if odd_sim:
+                    apostas.append(('ambas_marcam', 'Ambos marcam - Sim', sim * 100, odd_sim, None))
+                if odd_nao:
+                    apostas.append(('ambas_marcam', 'Ambos marcam - Não', (1 - sim) * 100, odd_nao, None))
+        except (AttributeError, TypeError) as e:
+            print(f"⚠️ Mercado btts ignorado (formato inesperado): {e}")
+
+    empate_anula = odds.get('drawNoBet')
+    if empate_anula:
+        try:
+            texto_casa, texto_visitante = f'Empate anula - {time_casa}', f'Empate anula - {time_visitante}'
+            odd_casa = _opcao(aceitar, 'empate_anula', texto_casa, empate_anula.get('home'))
+            odd_visitante = _opcao(aceitar, 'empate_anula', texto_visitante, empate_anula.get('away'))
+            if odd_casa or odd_visitante:
+                casa, visitante = matriz.empate_anula()
+                if odd_casa:
+                    apostas.append(('empate_anula', texto_casa, casa * 100, odd_casa, None))
+                if odd_visitante:
+                    apostas.append(('empate_anula', texto_visitante, visitante * 100, odd_visitante, None))
+        except (AttributeError, TypeError) as e:
+            print(f"⚠️ Mercado drawNoBet ignorado (formato inesperado): {e}")
+
+    try:
+        for opcao in odds.get('asianHandicap') or []:
+            if not isinstance(opcao, dict):
+                continue
+            linhas = _linha_handicap(opcao.get('name'))
+            if not linhas:
+                continue
+            lado = 'casa' if str(opcao.get('header')) == '1' else 'visitante'
+            aposta = f"Handicap asiático {time_casa if lado == 'casa' else time_visitante} {opcao.get('name')}"
+            odd = _opcao(aceitar, 'handicap', aposta, opcao.get('odds'))
+            if odd:
+                vitoria, _, derrota = matriz.handicap_asiatico(linhas, lado)
+                decisiva = vitoria + derrota
+                apostas.append(('handicap', aposta, (vitoria / decisiva * 100) if decisiva > 0 else 0.0, odd, None))
+    except TypeError as e:
+        print(f"⚠️ Mercado asianHandicap ignorado (formato inesperado): {e}")
+
+    return apostas
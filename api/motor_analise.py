@@ -0,0 +1,799 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Motor de análise de apostas hot sem interface gráfica
+Mesmo pipeline do BetBoosterV2 (filtro -> odds + estatísticas -> probabilidades ->
+recomendações), utilizável por cron/servidor; grava o cache lido pela interface
+
+Uso:
+    python -m api.motor_analise analisar --data 2025-08-26
+    python -m api.motor_analise analyse --date 2025-08-26 --out cache/jogos_2025-08-26.json
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import CancelledError, FIRST_COMPLETED, wait
+from datetime import datetime, timedelta
+
+from api.agendador import AgendadorPartidas, AtualizacaoPeriodica, prioridade_partida
+from api.broker_partidas import BrokerPartidas
+from api.cache_jogos import montar_cache_jogos, gravar_arquivo_cache, salvar_cache_jogos
+from api.filtro_jogos import FiltroElegibilidade
+from api.mercados import apostas_mercados, matriz_placares
+from api.probabilidades import MOTORES_1X2, definir_motor_1x2, probabilidade_over_under, tabelas_poisson
+from api.radar_esportivo_api import RadarEsportivoAPI
+from api.retentativas import ErroRadar, Prazo
+
+# Prazo total de uma varredura e de cada partida dentro dela (todas as chamadas + retentativas)
+PRAZO_VARREDURA_SEGUNDOS = 300
+PRAZO_PARTIDA_SEGUNDOS = 20
+
+# Acréscimo ao prazo padrão da varredura por jogo elegível: ~3 chamadas por jogo a
+# 20-80 prepRadar/s levam 0.05 s por jogo; a folga cobre retentativas e API lenta
+# (1.500 jogos = 300 + 375 s), para que dias grandes não terminem sempre incompletos
+PRAZO_VARREDURA_POR_JOGO_SEGUNDOS = 0.25
+
+# Intervalo máximo entre verificações de cancelamento enquanto a varredura aguarda resultados
+INTERVALO_VERIFICACAO_CANCELAMENTO = 0.2
+
+# Pasta cache/ do projeto (a mesma usada pelo BetBoosterV2)
+DIRETORIO_CACHE_PADRAO = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cache')
+
+# Acréscimo relativo na probabilidade de vitória do mandante
+VANTAGEM_CASA = 0.05
+
+# Mercados além de resultFt e goalsOu25 (outras linhas de gols, ambos marcam, empate anula,
+# handicap): só value bets com folga mínima e no máximo N por partida, as de maior value
+VALUE_MINIMO_EXTRAS = 1.10
+MAX_APOSTAS_EXTRAS_POR_PARTIDA = 1
+
+# Resultado usado quando as estatísticas não permitem o cálculo
+PROBABILIDADES_PADRAO = {
+    'vitoria_casa': 33.33,
+    'empate': 33.33,
+    'vitoria_visitante': 33.33,
+    'gols_esperados_casa': 1.25,
+    'gols_esperados_visitante': 1.25,
+    'gols_esperados_total': 2.5,
+    'over_15': 70.0,
+    'under_15': 30.0,
+    'over_25': 50.0,
+    'under_25': 50.0,
+    'over_35': 30.0,
+    'under_35': 70.0
+}
+
+
+def calcular_prob_over_under(gols_esperados, linha, tipo):
+    """Calcula probabilidade de over/under usando distribuição de Poisson"""
+    return probabilidade_over_under(gols_esperados, linha, tipo)
+
+
+def gols_esperados_partida(stats):
+    """
+    Gols esperados (casa, visitante) a partir das estatísticas - USANDO APENAS ANYFIELD
+    sameField só é usado para cadastrar dados, não para cálculos
+    """
+    gols_casa = stats['time_casa']['geral']['gols_marcados']
+    gols_sofridos_casa = stats['time_casa']['geral']['gols_sofridos']
+    gols_visitante = stats['time_visitante']['geral']['gols_marcados']
+    gols_sofridos_visitante = stats['time_visitante']['geral']['gols_sofridos']
+
+    # Fórmula de Poisson para gols esperados
+    gols_esperados_casa = (gols_casa + gols_sofridos_visitante) / 2
+    gols_esperados_visitante = (gols_visitante + gols_sofridos_casa) / 2
+    return gols_esperados_casa, gols_esperados_visitante
+
+
+def calcular_probabilidades_completas(stats, modo=None):
+    """Calcula probabilidades completas baseado nas estatísticas - USANDO APENAS ANYFIELD"""
+    try:
+        gols_esperados_casa, gols_esperados_visitante = gols_esperados_partida(stats)
+
+        # Núcleo compartilhado (o mesmo do motor em lote e das duas interfaces), com 5% para o mandante,
+        # lido da matriz de placares memorizada que analisar_apostas_recomendadas reaproveita
+        probabilidades = matriz_placares(gols_esperados_casa, gols_esperados_visitante,
+                                         vantagem_casa=VANTAGEM_CASA).como_dict()
+        probabilidades.update({'gols_esperados_casa': gols_esperados_casa,
+                               'gols_esperados_visitante': gols_esperados_visitante,
+                               'gols_esperados_total': gols_esperados_casa + gols_esperados_visitante})
+        return probabilidades
+
+    except Exception as e:
+        print(f"Erro ao calcular probabilidades: {e}")
+        return dict(PROBABILIDADES_PADRAO)
+
+
+def formatar_horario(start_time):
+    """Formata horário de UTC para local (GMT-3)"""
+    if not start_time:
+        return ""
+
+    try:
+        # Se já estiver no formato HH:MM, retorna direto
+        if isinstance(start_time, str) and len(start_time) == 5 and ':' in start_time:
+            return start_time
+
+        # Converter de ISO para datetime
+        if isinstance(start_time, str):
+            if 'T' in start_time:
+                dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
+                dt_local = dt - timedelta(hours=3)  # GMT-3
+                return dt_local.strftime('%H:%M')
+            return start_time  # Já está em formato simples
+
+        return ""
+    except Exception as e:
+        print(f"Erro ao formatar horário {start_time}: {e}")
+        return ""
+
+
+def _data_do_periodo(periodo):
+    """Data YYYY-MM-DD de um rótulo de período ('26/08/2025', 'Hoje', 'Amanhã') ou None"""
+    if periodo == 'Hoje':
+        return datetime.now().strftime('%Y-%m-%d')
+    if periodo == 'Amanhã':
+        return (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
+    try:
+        return datetime.strptime(periodo, '%d/%m/%Y').strftime('%Y-%m-%d')
+    except (TypeError, ValueError):
+        return None
+
+
+class PrazoVarredura(Prazo):
+    """Prazo padrão de uma varredura: cresce com o número de jogos elegíveis"""
+
+    def __init__(self, segundos=PRAZO_VARREDURA_SEGUNDOS, por_jogo=PRAZO_VARREDURA_POR_JOGO_SEGUNDOS):
+        """
+        Args:
+            segundos: Prazo base
+            por_jogo: Segundos acrescentados por jogo em dimensionar()
+        """
+        super().__init__(segundos)
+        self.por_jogo = por_jogo
+        self._limite_base = self.limite
+
+    def dimensionar(self, jogos):
+        """Redefine o prazo para segundos + por_jogo * jogos, contados desde a criação"""
+        self.limite = self._limite_base + self.por_jogo * jogos
+
+
+def motivo_interrupcao(jogos_com_odds):
+    """Motivo da interrupção se a análise que gerou `jogos_com_odds` foi parcial, senão None"""
+    for jogo in jogos_com_odds:
+        if isinstance(jogo, dict) and jogo.get('analise_interrompida'):
+            return jogo['analise_interrompida']
+    return None
+
+
+def _recomendacao(odds_detalhadas, aposta, tipo_recomendacao, odd, value, prob_calc, prob_impl):
+    """Dicionário de uma aposta hot (formato dos cards e do cache)"""
+    return {
+        'jogo': f"{odds_detalhadas['home_team']} vs {odds_detalhadas['away_team']}",
+        'aposta': aposta,
+        'tipo': tipo_recomendacao,
+        'odd': odd,
+        'value': value,
+        'value_percent': (value - 1) * 100,
+        'prob_calculada': prob_calc,
+        'nossa_prob': prob_calc,  # Adicionar para compatibilidade
+        'prob_implicita': prob_impl,
+        'prob_media': (prob_calc + prob_impl) / 2,  # Média de probabilidades
+        'forca_recomendacao': value * (prob_calc / 100),  # Força baseada em value e probabilidade
+        'match_id': odds_detalhadas['match_id'],
+        'liga': odds_detalhadas['league'],
+        'horario': formatar_horario(odds_detalhadas['start_time'])
+    }
+
+
+class MotorAnalise:
+    """
+    Pipeline de análise de apostas hot independente do Tk
+
+    Uso:
+        motor = MotorAnalise()
+        resultado = motor.analisar_data('2025-08-26')
+        motor.salvar(resultado)
+    """
+
+    def __init__(self, api=None, broker=None, filtro=None, modo='Geral', max_workers=None):
+        """
+        Args:
+            api: RadarEsportivoAPI compartilhada (padrão: uma nova instância)
+            broker: BrokerPartidas sobre a mesma API (padrão: um novo broker)
+            filtro: FiltroElegibilidade pré-busca (padrão: regiões/relevâncias padrão)
+            modo: Modo de análise usado na chave das recomendações reaproveitadas
+            max_workers: Threads de análise (padrão: conexões do pool da API)
+        """
+        self.api = api or RadarEsportivoAPI()
+        self.broker = broker or BrokerPartidas(self.api)
+        self.filtro_elegibilidade = filtro or FiltroElegibilidade()
+        self.modo = modo
+        self.max_workers = max_workers
+        # Recomendações por (jogo, modo) com a versão dos payloads usada no cálculo
+        self.recomendacoes_por_jogo = {}
+        # Fila por início da partida/relevância, compartilhada por varreduras e atualizações
+        self.agendador = AgendadorPartidas(max_workers or self.api.max_conexoes, nome='analise')
+        self.atualizacao = None
+        # Prazos (tokens de cancelamento) das varreduras em andamento
+        self._varreduras = set()
+        self._lock_varreduras = threading.Lock()
+        # Resumo da última varredura concluída ou interrompida
+        self.ultima_varredura = None
+
+    def priorizar(self, match_id):
+        """Passa a análise da partida para a frente da fila (jogo aberto pelo usuário)"""
+        return self.agendador.priorizar(('analise', str(match_id)))
+
+    def iniciar_atualizacao(self, obter_jogos, ao_atualizar=None, intervalo_verificacao=30.0):
+        """
+        Mantém odds/estatísticas das partidas atualizadas em segundo plano,
+        com mais frequência para as que estão perto de começar
+
+        Args:
+            obter_jogos: Função sem argumentos -> lista de (jogo, data YYYY-MM-DD)
+            ao_atualizar: Função (jogo, recomendacoes) chamada após cada atualização
+        """
+        def atualizar(jogo, data):
+            # Revalidação condicional: payload inalterado reaproveita as recomendações
+            self.broker.invalidar(jogo.get('id'))
+            recomendacoes = self.processar_jogo_para_hot(jogo)
+            if ao_atualizar:
+                ao_atualizar(jogo, recomendacoes)
+            return recomendacoes
+
+        if self.atualizacao is not None:
+            self.atualizacao.parar()
+        self.atualizacao = AtualizacaoPeriodica(self.agendador, obter_jogos, atualizar, intervalo_verificacao)
+        self.atualizacao.iniciar()
+        return self.atualizacao
+
+    def parar_atualizacao(self):
+        if self.atualizacao is not None:
+            self.atualizacao.parar()
+            self.atualizacao = None
+
+    def nova_varredura(self, segundos=None):
+        """
+        Prazo de uma varredura, para passar a analisar_jogos() e cancelar depois
+        (ex.: o usuário trocou a data antes do fim)
+
+        Args:
+            segundos: Prazo fixo; None = PRAZO_VARREDURA_SEGUNDOS mais
+                      PRAZO_VARREDURA_POR_JOGO_SEGUNDOS por jogo elegível
+        """
+        if segundos is None:
+            return PrazoVarredura()
+        return Prazo(segundos)
+
+    def cancelar_varreduras(self, motivo='cancelado'):
+        """Interrompe todas as varreduras em andamento (elas devolvem resultados parciais)"""
+        with self._lock_varreduras:
+            varreduras = list(self._varreduras)
+        for varredura in varreduras:
+            varredura.cancelar(motivo)
+        return len(varreduras)
+
+    def encerrar(self):
+        """Cancela varreduras e atualizações e libera os workers (fechamento da janela)"""
+        self.cancelar_varreduras('encerramento')
+        self.parar_atualizacao()
+        self.agendador.encerrar()
+
+    # ------------------------------------------------------------------
+    # Um jogo
+    # ------------------------------------------------------------------
+    def analisar_apostas_recomendadas(self, jogo, odds_detalhadas, probabilidades, stats):
+        """Analisa e gera recomendações de apostas"""
+        recomendacoes = []
+
+        try:
+            # Mesmo filtro aplicado antes da busca (proteção para chamadas diretas)
+            motivo_rejeicao = self.filtro_elegibilidade.motivo_rejeicao(jogo)
+            if motivo_rejeicao == 'regiao':
+                print(f"⚠️ Jogo filtrado por região não permitida: {jogo.get('codigo_regiao', '')}")
+                return []
+            elif motivo_rejeicao == 'relevancia':
+                print(f"⚠️ Jogo filtrado por relevância da liga: {jogo.get('relevancia_liga', '')}")
+                return []
+
+            odds = odds_detalhadas['odds']
+            home_team = odds_detalhadas.get('home_team', 'Casa')
+            away_team = odds_detalhadas.get('away_team', 'Visitante')
+
+            # Uma matriz de placares por partida (memorizada); todos os mercados saem dela
+            gols_esperados_casa = probabilidades.get('gols_esperados_casa', 0)
+            gols_esperados_visitante = probabilidades.get('gols_esperados_visitante', 0)
+            gols_esperados = probabilidades.get('gols_esperados_total', 0)
+            matriz = matriz_placares(gols_esperados_casa, gols_esperados_visitante, vantagem_casa=VANTAGEM_CASA)
+
+            def aceitar(mercado, aposta, odd, linha):
+                # Faixas de odd e portões de gols esperados que não dependem da probabilidade:
+                # opções (e mercados inteiros) fora deles nem são lidos da matriz
+                if mercado == 'resultado':
+                    return 1.5 <= odd < 5.5
+                # Over/under de cada linha: over só com gols esperados >= linha + 1.5 e
+                # under só com gols esperados <= linha - 0.5 (4.0 e 2.0 na linha 2.5)
+                if mercado == 'gols':
+                    if aposta.startswith('Mais') and gols_esperados < linha + 1.5:
+                        return False
+                    if aposta.startswith('Menos') and gols_esperados > linha - 0.5:
+                        return False
+                return odd <= 2.5
+
+            extras = []
+            for mercado, aposta, prob_calc, odd, linha in apostas_mercados(matriz, odds, home_team, away_team,
+                                                                              aceitar):
+                tipo_recomendacao = None
+                if mercado == 'resultado':
+                    # 1. Resultado Final (1X2): faixas de odd com Prob. Bet Booster >= 40%
+                    if (odd >= 1.5) and (odd < 2) and (prob_calc >= 40):
+                        tipo_recomendacao = "FORTE"
+                    elif (odd >= 2) and (odd < 2.5) and (prob_calc >= 40):
+                        tipo_recomendacao = "MODERADA"
+                    elif (odd >= 2.5) and (odd < 3) and (prob_calc >= 40):
+                        tipo_recomendacao = "ARRISCADA"
+                    elif (odd >= 3) and (odd < 5.5) and (prob_calc >= 40):
+                        tipo_recomendacao = "MUITO_ARRISCADA"
+                else:
+                    # 2. Mercados de dois lados (gols, ambos marcam, empate anula, handicap)
+                    if odd <= 1.8 and prob_calc >= 70:
+                        tipo_recomendacao = "FORTE"
+                    elif (odd <= 2.5 and prob_calc >= 70) or (odd <= 1.8 and prob_calc >= 65):
+                        tipo_recomendacao = "MODERADA"
+                    if prob_calc < 15:  # Mínimo de confiança na probabilidade Bet Booster
+                        tipo_recomendacao = None
+
+                if not tipo_recomendacao:
+                    continue
+
+                # Probabilidade implícita com margem de 5% e value bet
+                prob_impl = (1 / odd * (1 - 0.05)) * 100
+                value = prob_calc / prob_impl
+                if mercado == 'resultado' or (mercado == 'gols' and linha == 2.5):
+                    recomendacoes.append(_recomendacao(odds_detalhadas, aposta, tipo_recomendacao,
+                                                       odd, value, prob_calc, prob_impl))
+                elif value >= VALUE_MINIMO_EXTRAS:
+                    extras.append((value, aposta, tipo_recomendacao, odd, prob_calc, prob_impl))
+
+            extras.sort(key=lambda extra: extra[0], reverse=True)
+            for value, aposta, tipo_recomendacao, odd, prob_calc, prob_impl in extras[:MAX_APOSTAS_EXTRAS_POR_PARTIDA]:
+                recomendacoes.append(_recomendacao(odds_detalhadas, aposta, tipo_recomendacao,
+                                                   odd, value, prob_calc, prob_impl))
+
+        except Exception as e:
+            print(f"Erro ao analisar recomendações: {e}")
+
+        return recomendacoes
+
+    def processar_jogo_para_hot(self, jogo, odds_detalhadas=None, modo=None):
+        """Processa um jogo para gerar recomendações hot (odds_detalhadas já obtidas evitam nova busca)"""
+        jogo_dict = {'id': jogo} if isinstance(jogo, str) else jogo
+        try:
+            jogo_id = jogo_dict.get('id')
+            if not jogo_id:
+                return []
+
+            # Não gastar chamadas à API com jogos que seriam descartados
+            if not self.filtro_elegibilidade.jogo_elegivel(jogo_dict):
+                return []
+
+            # Buscar odds detalhadas (se ainda não foram obtidas)
+            if not odds_detalhadas:
+                odds_detalhadas = self.broker.buscar_odds_detalhadas(jogo_id)
+            if not odds_detalhadas:
+                return []
+
+            # Buscar estatísticas dos times
+            stats = self.broker.buscar_estatisticas_detalhadas_time(jogo_id)
+            if not stats:
+                return []
+
+            modo = modo or self.modo
+
+            # Payloads revalidados sem mudança: reaproveitar as recomendações já calculadas
+            versao = self.api.versao_partida(jogo_id)
+            chave_recomendacoes = (str(jogo_id), modo)
+            anterior = self.recomendacoes_por_jogo.get(chave_recomendacoes)
+            if anterior is not None and anterior[0] == versao:
+                recomendacoes = [dict(rec) for rec in anterior[1]]
+            else:
+                probabilidades = calcular_probabilidades_completas(stats, modo)
+                recomendacoes = self.analisar_apostas_recomendadas(
+                    jogo_dict, odds_detalhadas, probabilidades, stats)
+                self.recomendacoes_por_jogo[chave_recomendacoes] = (versao, [dict(rec) for rec in recomendacoes])
+
+            # Adicionar informação do período
+            for rec in recomendacoes:
+                rec['periodo'] = jogo_dict.get('periodo', 'Hoje')
+
+            return recomendacoes
+
+        except Exception as e:
+            print(f"Erro ao processar jogo {jogo_dict.get('home_team', 'Time')} vs {jogo_dict.get('away_team', 'Time')}: {e}")
+            return []
+
+    def processar_jogo_para_hot_paralelo(self, jogo, periodo):
+        """
+        Busca odds e gera as apostas hot de um jogo (executado nas threads de análise)
+
+        Returns:
+            tuple: (jogo enriquecido com odds, lista de recomendações)
+        """
+        try:
+            if isinstance(jogo, dict):
+                jogo_id = jogo.get('id', 'N/A')
+                time_casa = jogo.get('home_team', jogo.get('time_casa', 'N/A'))
+                time_visitante = jogo.get('away_team', jogo.get('time_visitante', 'N/A'))
+            else:
+                jogo_id = str(jogo)
+                time_casa = 'N/A'
+                time_visitante = 'N/A'
+
+            # Buscar odds detalhadas
+            odds_detalhadas = None
+            if jogo_id and jogo_id != 'N/A':
+                try:
+                    odds_detalhadas = self.broker.buscar_odds_detalhadas(jogo_id)
+                except Exception as e:
+                    print(f"⚠️ Erro ao buscar odds para {jogo_id}: {e}")
+
+            # Criar jogo completo sempre (com ou sem odds)
+            if odds_detalhadas:
+                jogo_completo = {**jogo, **odds_detalhadas} if isinstance(jogo, dict) else {**odds_detalhadas, 'id': jogo_id}
+                jogo_completo['periodo'] = periodo
+                print(f"✅ Jogo {time_casa} vs {time_visitante} - COM odds")
+            else:
+                jogo_completo = jogo.copy() if isinstance(jogo, dict) else {'id': jogo_id}
+                jogo_completo.update({
+                    'periodo': periodo,
+                    'odds': None,
+                    'home_team': time_casa,
+                    'away_team': time_visitante,
+                    'start_time': jogo_completo.get('start_time', ''),
+                    'league': jogo_completo.get('league', 'N/A')
+                })
+                print(f"⚠️ Jogo {time_casa} vs {time_visitante} - SEM odds (dados básicos)")
+
+            # Processar apostas hot se tiver dados válidos
+            recomendacoes = []
+            if isinstance(jogo, dict):
+                jogo['periodo'] = periodo
+                try:
+                    # Reaproveitar as odds já obtidas acima
+                    recomendacoes = self.processar_jogo_para_hot(jogo, odds_detalhadas)
+                    print(f"📊 {len(recomendacoes)} apostas hot geradas")
+                except Exception as e:
+                    print(f"⚠️ Erro ao processar apostas hot: {e}")
+
+            return jogo_completo, recomendacoes
+
+        except Exception as e:
+            print(f"❌ ERRO no processamento paralelo: {e}")
+            jogo_erro = {
+                'id': jogo.get('id') if isinstance(jogo, dict) else str(jogo),
+                'home_team': 'Erro',
+                'away_team': 'Erro',
+                'periodo': periodo,
+                'odds': None
+            }
+            return jogo_erro, []
+
+    # ------------------------------------------------------------------
+    # Lista de jogos
+    # ------------------------------------------------------------------
+    def separar_jogos_elegiveis(self, jogos, periodo, chamadas_por_jogo=FiltroElegibilidade.CHAMADAS_POR_JOGO_ANALISE):
+        """Aplica o filtro pré-busca e registra quantas chamadas à API foram evitadas"""
+        elegiveis, rejeitados = self.filtro_elegibilidade.separar(jogos, chamadas_por_jogo)
+
+        print(f"🧹 Filtro pré-busca ({periodo}): {len(elegiveis)} de {len(elegiveis) + len(rejeitados)} jogos elegíveis, "
+              f"{len(rejeitados) * chamadas_por_jogo} chamadas à API evitadas")
+        print(f"   Acumulado: {self.filtro_elegibilidade.formatar_resumo()}")
+
+        return elegiveis, rejeitados
+
+    def analisar_jogos(self, jogos, periodo, progresso=None, publicar=None, varredura=None):
+        """
+        Analisa todos os jogos elegíveis em paralelo
+
+        Args:
+            jogos: Jogos processados (dicionários de buscar_jogos_do_dia)
+            periodo: Rótulo do período (ex.: 'Hoje' ou '26/08/2025')
+            progresso: Função (concluidos, total, texto=None) chamada a cada jogo concluído
+            publicar: Função (recomendacoes) chamada assim que um jogo gera apostas hot,
+                      antes do fim do lote (exibição incremental)
+            varredura: Prazo de nova_varredura(); cancelá-lo interrompe a análise em até
+                       INTERVALO_VERIFICACAO_CANCELAMENTO segundos
+
+        Returns:
+            tuple: (apostas hot, jogos enriquecidos com odds). Se a varredura for
+            interrompida, as apostas já calculadas e os jogos não analisados
+            marcados com 'analise_interrompida'
+        """
+        apostas_analisadas = []
+        jogos_com_odds = []
+        varredura = varredura or self.nova_varredura()
+
+        # Filtro pré-busca: jogos rejeitados nunca chegam ao pool de threads
+        total_recebidos = len(jogos)
+        jogos, jogos_rejeitados = self.separar_jogos_elegiveis(jogos, periodo)
+
+        # Jogos rejeitados continuam no cache da data, apenas sem odds
+        for jogo_rejeitado in jogos_rejeitados:
+            jogo_basico = jogo_rejeitado.copy() if isinstance(jogo_rejeitado, dict) else {'id': str(jogo_rejeitado)}
+            jogo_basico['periodo'] = periodo
+            jogo_basico.setdefault('odds', None)
+            jogos_com_odds.append(jogo_basico)
+
+        if progresso and jogos_rejeitados:
+            progresso(0, len(jogos), f"{len(jogos)} de {total_recebidos} jogos elegíveis - "
+                                     f"{len(jogos_rejeitados) * FiltroElegibilidade.CHAMADAS_POR_JOGO_ANALISE} chamadas evitadas")
+
+        if isinstance(varredura, PrazoVarredura):
+            varredura.dimensionar(len(jogos))
+
+        if not jogos:
+            print(f"🎯 CONCLUÍDO: nenhum jogo elegível para análise ({periodo})")
+            self.ultima_varredura = {'periodo': periodo, 'total': 0, 'concluidos': 0, 'interrompida': None}
+            return apostas_analisadas, jogos_com_odds
+
+        print(f"🔥 Iniciando análise completa PARALELA de {len(jogos)} jogos ({periodo})")
+
+        with self._lock_varreduras:
+            self._varreduras.add(varredura)
+        try:
+            # Partidas mais próximas do início (e de ligas mais relevantes) são buscadas primeiro
+            futures = self._agendar_analises(jogos, periodo, varredura)
+            pendentes = set(futures)
+            concluidos = 0
+
+            # Coletar resultados conforme completam, verificando o prazo/cancelamento
+            while pendentes and not varredura.esgotado():
+                prontos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED,
+                                          timeout=min(INTERVALO_VERIFICACAO_CANCELAMENTO, varredura.restante()))
+                for future in prontos:
+                    jogo = futures[future]
+                    try:
+                        jogo_completo, recomendacoes = future.result()
+                        jogos_com_odds.append(jogo_completo)
+                        apostas_analisadas.extend(recomendacoes)
+                        if publicar and recomendacoes:
+                            publicar(recomendacoes)
+                    except CancelledError:
+                        # Retirado da fila pela varredura cancelada antes do laço perceber
+                        jogos_com_odds.append(self._jogo_sem_analise(
+                            jogo, periodo, varredura.motivo_cancelamento() or 'prazo esgotado'))
+                        continue
+                    except Exception as e:
+                        print(f"❌ ERRO ao processar jogo {self._id_jogo(jogo)}: {e}")
+                        jogos_com_odds.append(self._jogo_sem_analise(jogo, periodo))
+
+                    concluidos += 1
+                    if progresso:
+                        progresso(concluidos, len(jogos))
+
+            interrompida = None
+            if pendentes or concluidos < len(jogos):
+                interrompida = varredura.motivo_cancelamento() or 'prazo esgotado'
+                # Tarefas ainda na fila saem dela; as em execução têm o prazo da partida cancelado
+                varredura.cancelar(interrompida)
+                canceladas = self.agendador.cancelar([('analise', self._id_jogo(futures[f])) for f in pendentes])
+                for future in pendentes:
+                    jogos_com_odds.append(self._jogo_sem_analise(futures[future], periodo, interrompida))
+                print(f"⏹️ Varredura interrompida ({interrompida}): {concluidos} de {len(jogos)} jogos analisados, "
+                      f"{canceladas} retirados da fila ({periodo})")
+            else:
+                # Re-enfileirar apenas os jogos cujas chamadas falharam definitivamente
+                self.reprocessar_jogos_com_falha(jogos, periodo, jogos_com_odds, apostas_analisadas, publicar, varredura)
+        finally:
+            with self._lock_varreduras:
+                self._varreduras.discard(varredura)
+
+        self.ultima_varredura = {'periodo': periodo, 'total': len(jogos), 'concluidos': concluidos,
+                                 'interrompida': interrompida}
+
+        print(f"🎯 CONCLUÍDO PARALELO: {len(jogos_com_odds)} jogos processados, {len(apostas_analisadas)} apostas hot geradas ({periodo})")
+        print(f"   Broker de partidas: {self.broker.resumo()}")
+        print(f"   Agendador: {self.agendador.resumo()}")
+        print(f"   Conexões: {self.api.resumo_conexoes()}")
+        print(f"   Limitador: {self.api.resumo_limitador()}")
+        print(f"   Tabelas Poisson: {tabelas_poisson.formatar_resumo()}")
+        return apostas_analisadas, jogos_com_odds
+
+    @staticmethod
+    def _id_jogo(jogo):
+        return str(jogo.get('id') if isinstance(jogo, dict) else jogo)
+
+    def _jogo_sem_analise(self, jogo, periodo, motivo=None):
+        """Jogo com dados básicos, sem odds (erro ou varredura interrompida antes dele)"""
+        jogo_basico = jogo.copy() if isinstance(jogo, dict) else {'id': str(jogo)}
+        jogo_basico['periodo'] = periodo
+        jogo_basico['odds'] = None
+        if motivo:
+            jogo_basico['analise_interrompida'] = motivo
+        return jogo_basico
+
+    def _analisar_no_prazo(self, jogo, periodo, varredura):
+        """Análise de um jogo com prazo próprio, filho do prazo da varredura"""
+        if varredura.esgotado():
+            raise CancelledError(varredura.motivo_cancelamento() or 'prazo esgotado')
+        prazo_partida = Prazo(PRAZO_PARTIDA_SEGUNDOS, pai=varredura)
+        resultado = self.api.executar_com_prazo(prazo_partida, lambda: self.processar_jogo_para_hot_paralelo(jogo, periodo))
+        if varredura.cancelado():
+            # Chamadas cortadas no meio: o resultado degradado não deve parecer uma análise completa
+            raise CancelledError(varredura.motivo_cancelamento())
+        return resultado
+
+    def _agendar_analises(self, jogos, periodo, varredura):
+        """
+        Envia os jogos ao agendador (prioridade por início/relevância)
+
+        Returns:
+            dict: {Future: jogo}
+        """
+        data = _data_do_periodo(periodo)
+        futures = {}
+        for jogo in jogos:
+            future = self.agendador.enviar(
+                ('analise', self._id_jogo(jogo)),
+                lambda jogo=jogo: self._analisar_no_prazo(jogo, periodo, varredura),
+                prioridade_partida(jogo, data=data))
+            futures[future] = jogo
+        return futures
+
+    def reprocessar_jogos_com_falha(self, jogos, periodo, jogos_com_odds, apostas_analisadas, publicar=None,
+                                    varredura=None):
+        """
+        Reprocessa somente os jogos com falha definitiva na API (prepRadar/goalRadar),
+        substituindo o resultado degradado em jogos_com_odds. Jogos que continuam
+        falhando levam a lista de erros estruturados em 'erros_api'
+        """
+        ids_falha = self.api.erros.ids_com_falha(endpoints=('prepRadar', 'goalRadar'))
+        jogos_falha = [jogo for jogo in jogos if isinstance(jogo, dict) and str(jogo.get('id')) in ids_falha]
+        if not jogos_falha:
+            return
+
+        print(f"🔁 Re-enfileirando {len(jogos_falha)} jogos com falha na API ({periodo}): {self.api.resumo_erros()}")
+
+        varredura = varredura or self.nova_varredura()
+        futures = self._agendar_analises(jogos_falha, periodo, varredura)
+        prontos, pendentes = wait(futures, timeout=varredura.restante())
+        if pendentes:
+            self.agendador.cancelar([('analise', self._id_jogo(futures[f])) for f in pendentes])
+
+        for future in prontos:
+            try:
+                jogo_completo, recomendacoes = future.result()
+            except (Exception, CancelledError):
+                continue
+            jogo_id = str(jogo_completo.get('id'))
+            erros = self.api.erros.erros_partida(jogo_id)
+            if erros:
+                jogo_completo['erros_api'] = [erro.como_dict() for erro in erros]
+
+            jogos_com_odds[:] = [j for j in jogos_com_odds if str(j.get('id')) != jogo_id]
+            jogos_com_odds.append(jogo_completo)
+            apostas_analisadas.extend(recomendacoes)
+            if publicar and recomendacoes:
+                publicar(recomendacoes)
+
+        ids_ainda_com_falha = self.api.erros.ids_com_falha(endpoints=('prepRadar', 'goalRadar')) & ids_falha
+        print(f"   {len(jogos_falha) - len(ids_ainda_com_falha)} de {len(jogos_falha)} jogos recuperados")
+
+    # ------------------------------------------------------------------
+    # Uma data
+    # ------------------------------------------------------------------
+    def analisar_data(self, data, progresso=None, varredura=None):
+        """
+        Busca e analisa todos os jogos de uma data
+
+        Args:
+            data: Data no formato YYYY-MM-DD
+            progresso: Função (concluidos, total, texto=None), ver analisar_jogos()
+            varredura: Prazo de nova_varredura() (padrão: proporcional ao número de jogos)
+
+        Returns:
+            dict: {'data', 'jogos', 'apostas_hot', 'interrompida'} com apostas ordenadas
+            por probabilidade; 'interrompida' é o motivo se o resultado for parcial
+
+        Raises:
+            ErroRadar: O dailyRadar falhou (não é um dia sem jogos: nada deve ser gravado)
+        """
+        periodo = datetime.strptime(data, '%Y-%m-%d').strftime('%d/%m/%Y')
+        jogos = self.api.buscar_jogos_do_dia(data)
+        if jogos is None:
+            raise ErroRadar('dailyRadar', data, 'desconhecido', "sem resposta válida do dailyRadar")
+        print(f"🌐 {len(jogos)} jogos encontrados em {periodo}")
+
+        apostas_hot, jogos_com_odds = self.analisar_jogos(jogos, periodo, progresso, varredura=varredura)
+
+        # Mesmos campos que o BetBoosterV2 adiciona antes de salvar/exibir
+        for aposta in apostas_hot:
+            aposta['data_jogo'] = data
+            aposta['periodo'] = periodo
+        apostas_hot.sort(key=lambda x: -x.get('nossa_prob', 0))
+
+        return {'data': data, 'jogos': jogos_com_odds, 'apostas_hot': apostas_hot,
+                'interrompida': motivo_interrupcao(jogos_com_odds)}
+
+    def salvar(self, resultado, saida=None):
+        """
+        Grava o resultado de analisar_data() no formato do cache diário
+
+        Args:
+            resultado: Retorno de analisar_data()
+            saida: Pasta (grava jogos_<data>.json) ou arquivo .json (padrão: cache/ do projeto)
+
+        Returns:
+            str: Caminho gravado
+        """
+        saida = saida or DIRETORIO_CACHE_PADRAO
+        data = resultado['data']
+
+        if saida.endswith('.json'):
+            pasta = os.path.dirname(os.path.abspath(saida))
+            if not os.path.exists(pasta):
+                os.makedirs(pasta)
+            gravar_arquivo_cache(saida, montar_cache_jogos(data, resultado['jogos'], resultado['apostas_hot']))
+            return saida
+
+        salvar_cache_jogos(saida, data, resultado['jogos'], resultado['apostas_hot'])
+        return os.path.join(saida, f'jogos_{data}.json')
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(prog='python -m api.motor_analise',
+                                     description="Análise de apostas hot sem interface gráfica")
+    subcomandos = parser.add_subparsers(dest='comando', required=True)
+
+    analisar = subcomandos.add_parser('analisar', aliases=['analyse', 'analyze'],
+                                      help="Analisa uma data e grava o cache lido pelo BetBoosterV2")
+    analisar.add_argument('--data', '--date', dest='data', default=None,
+                          help="Data YYYY-MM-DD (padrão: hoje)")
+    analisar.add_argument('--saida', '--out', dest='saida', default=None,
+                          help="Pasta do cache ou arquivo .json (padrão: cache/ do projeto)")
+    analisar.add_argument('--workers', type=int, default=10, help="Conexões / threads de análise")
+    analisar.add_argument('--cache-http', default=os.path.join(DIRETORIO_CACHE_PADRAO, 'http'),
+                          help="Pasta dos validadores ETag/Last-Modified ('' desativa)")
+    analisar.add_argument('--prazo', type=float, default=None,
+                          help=f"Tempo máximo da análise em segundos (padrão: {PRAZO_VARREDURA_SEGUNDOS} + "
+                               f"{PRAZO_VARREDURA_POR_JOGO_SEGUNDOS:g} por jogo elegível)")
+    analisar.add_argument('--motor-1x2', choices=MOTORES_1X2, default=None,
+                          help="Cálculo do 1X2: grade de placares (padrão) ou forma fechada de Skellam")
+    args = parser.parse_args(argumentos)
+
+    data = args.data or datetime.now().strftime('%Y-%m-%d')
+    try:
+        datetime.strptime(data, '%Y-%m-%d')
+    except ValueError:
+        parser.error(f"data inválida: {data} (use YYYY-MM-DD)")
+
+    if args.motor_1x2:
+        definir_motor_1x2(args.motor_1x2)
+
+    inicio = time.perf_counter()
+    api = RadarEsportivoAPI(max_conexoes=args.workers, diretorio_cache_http=args.cache_http or None)
+    motor = MotorAnalise(api)
+    try:
+        resultado = motor.analisar_data(data, varredura=motor.nova_varredura(args.prazo))
+    except ErroRadar as e:
+        # Não sobrescrever o cache do dia com um dia vazio
+        print(f"❌ Falha ao buscar os jogos de {data}, nada foi gravado: {e}")
+        return 1
+    if resultado['interrompida']:
+        # Um cache parcial seria lido como a análise completa do dia (pelo app e por preparar_data)
+        print(f"⚠️ Análise interrompida ({resultado['interrompida']}): resultado parcial descartado, "
+              f"nada foi gravado ({time.perf_counter() - inicio:.1f} s)")
+        return 2
+    caminho = motor.salvar(resultado, args.saida)
+
+    print(f"💾 {len(resultado['jogos'])} jogos e {len(resultado['apostas_hot'])} apostas hot gravados em {caminho} "
+          f"({time.perf_counter() - inicio:.1f} s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Parser incremental do payload dailyRadar
+Lê o documento em pedaços e entrega cada partida processada assim que ela é
+decodificada, sem materializar o documento inteiro. O filtro de região e
+relevância é aplicado durante a leitura: partidas de ligas descartadas nunca
+são decodificadas
+"""
+
+import codecs
+import json
+import re
+
+# Caracteres estruturais do JSON (o restante são literais/espaços)
+_ESTRUTURAL = re.compile(r'["{}\[\]:,]')
+_ABRE_FECHA = re.compile(r'["{}\[\]]')
+_FIM_STRING = re.compile(r'(?:[^"\\]|\\.)*"', re.S)
+
+# Trechos capturados (decodificados individualmente); '*' = qualquer índice de lista
+_CAMINHO_REGIAO = ('dailyRadar', '*', 'region')
+_CAMINHO_LIGA = ('dailyRadar', '*', 'seasons', '*', 'league')
+_CAMINHO_TEMPORADA = ('dailyRadar', '*', 'seasons', '*', 'season')
+_CAMINHO_PARTIDA = ('dailyRadar', '*', 'seasons', '*', 'matches', '*')
+_CAPTURAS = {_CAMINHO_REGIAO, _CAMINHO_LIGA, _CAMINHO_TEMPORADA, _CAMINHO_PARTIDA}
+
+# Fechamentos que liberam partidas pendentes
+_CAMINHO_ITEM_TEMPORADA = ('dailyRadar', '*', 'seasons', '*')
+_CAMINHO_ITEM_REGIAO = ('dailyRadar', '*')
+
+
+class _Temporada:
+    """Metadados de uma temporada e partidas (texto bruto) aguardando decisão"""
+
+    def __init__(self):
+        self.liga = None
+        self.temporada = None
+        self.partidas = []
+        self.fechada = False
+        self.descartada = False
+
+
+class ParserDailyRadar:
+    """
+    Parser por eventos do dailyRadar
+
+    Uso:
+        parser = ParserDailyRadar(api.processar_partida_individual, filtro)
+        for pedaco in resposta.iter_content(65536):
+            for jogo in parser.alimentar(pedaco):
+                ...
+        jogos_restantes = parser.finalizar()
+    """
+
+    # Tamanho a partir do qual o trecho já lido é descartado do buffer
+    LIMITE_BUFFER = 64 * 1024
+
+    def __init__(self, processar_partida, filtro=None):
+        """
+        Args:
+            processar_partida: Função com a assinatura de RadarEsportivoAPI.processar_partida_individual
+            filtro: FiltroElegibilidade opcional aplicado durante a leitura
+        """
+        self.processar_partida = processar_partida
+        self.filtro = filtro
+        self._decodificador = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._pos = 0
+        self._pilha = []  # quadros: [tipo, caminho, chave, esperando_chave]
+        self._captura = None  # (inicio, caminho, profundidade)
+        self._regiao = None
+        self._regiao_conhecida = False
+        self._temporadas = []
+        self._saida = []
+        self.contadores = {
+            'partidas_decodificadas': 0,
+            'partidas_descartadas': 0,
+            'ligas_descartadas': 0
+        }
+
+    # ------------------------------------------------------------------
+    # Entrada
+    # ------------------------------------------------------------------
+    def alimentar(self, pedaco):
+        """
+        Processa mais um pedaço do documento (bytes ou str)
+
+        Returns:
+            list: Partidas processadas completadas por este pedaço
+        """
+        if isinstance(pedaco, bytes):
+            pedaco = self._decodificador.decode(pedaco)
+        self._buffer += pedaco
+        self._varrer()
+        self._compactar()
+        saida, self._saida = self._saida, []
+        return saida
+
+    def finalizar(self):
+        """Encerra a leitura e devolve as partidas que ainda estavam pendentes"""
+        self._buffer += self._decodificador.decode(b'', final=True)
+        self._varrer()
+        if self._pilha or self._captura:
+            raise json.JSONDecodeError("Documento dailyRadar incompleto", self._buffer, self._pos)
+        saida, self._saida = self._saida, []
+        return saida
+
+    # ------------------------------------------------------------------
+    # Varredura
+    # ------------------------------------------------------------------
+    def _compactar(self):
+        """Descarta do buffer o trecho já consumido"""
+        inicio = self._captura[0] if self._captura else self._pos
+        if inicio > self.LIMITE_BUFFER:
+            self._buffer = self._buffer[inicio:]
+            self._pos -= inicio
+            if self._captura:
+                self._captura = (0,) + self._captura[1:]
+
+    def _varrer(self):
+        buffer = self._buffer
+        while True:
+            if self._captura:
+                if not self._varrer_captura():
+                    return
+                continue
+
+            m = _ESTRUTURAL.search(buffer, self._pos)
+            if m is None:
+                self._pos = len(buffer)
+                return
+            pos = m.start()
+            c = buffer[pos]
+
+            if c == '"':
+                fim = _FIM_STRING.match(buffer, pos + 1)
+                if fim is None:
+                    self._pos = pos  # string incompleta: aguardar mais dados
+                    return
+                self._pos = fim.end()
+                quadro = self._pilha[-1] if self._pilha else None
+                if quadro is not None and quadro[0] == '{' and quadro[3]:
+                    quadro[2] = json.loads(buffer[pos:self._pos])
+                continue
+
+            self._pos = pos + 1
+            quadro = self._pilha[-1] if self._pilha else None
+
+            if c == ':':
+                quadro[3] = False
+            elif c == ',':
+                if quadro[0] == '{':
+                    quadro[2] = None
+                    quadro[3] = True
+            elif c in '{[':
+                if quadro is None:
+                    caminho = ()
+                else:
+                    caminho = quadro[1] + ((quadro[2],) if quadro[0] == '{' else ('*',))
+                if caminho in _CAPTURAS:
+                    self._captura = (pos, caminho, 1)
+                else:
+                    self._pilha.append([c, caminho, None, c == '{'])
+            else:  # '}' ou ']'
+                fechado = self._pilha.pop()
+                self._ao_fechar(fechado[1])
+
+    def _varrer_captura(self):
+        """Avança até o fim do valor capturado; retorna False se faltam dados"""
+        inicio, caminho, profundidade = self._captura
+        buffer = self._buffer
+        pos = self._pos
+        while profundidade:
+            m = _ABRE_FECHA.search(buffer, pos)
+            if m is None:
+                self._pos = len(buffer)
+                self._captura = (inicio, caminho, profundidade)
+                return False
+            pos = m.start()
+            c = buffer[pos]
+            if c == '"':
+                fim = _FIM_STRING.match(buffer, pos + 1)
+                if fim is None:
+                    self._pos = pos
+                    self._captura = (inicio, caminho, profundidade)
+                    return False
+                pos = fim.end()
+                continue
+            pos += 1
+            profundidade += 1 if c in '{[' else -1
+
+        self._pos = pos
+        self._captura = None
+        self._ao_capturar(caminho, buffer[inicio:pos])
+        return True
+
+    # ------------------------------------------------------------------
+    # Eventos
+    # ------------------------------------------------------------------
+    def _temporada_atual(self):
+        if not self._temporadas or self._temporadas[-1].fechada:
+            self._temporadas.append(_Temporada())
+        return self._temporadas[-1]
+
+    def _ao_capturar(self, caminho, texto):
+        if caminho == _CAMINHO_PARTIDA:
+            temporada = self._temporada_atual()
+            if temporada.descartada:
+                self.contadores['partidas_descartadas'] += 1
+                return
+            temporada.partidas.append(texto)
+            self._liberar(temporada)
+        elif caminho == _CAMINHO_LIGA:
+            temporada = self._temporada_atual()
+            temporada.liga = json.loads(texto)
+            self._liberar(temporada)
+        elif caminho == _CAMINHO_TEMPORADA:
+            temporada = self._temporada_atual()
+            temporada.temporada = json.loads(texto)
+            self._liberar(temporada)
+        elif caminho == _CAMINHO_REGIAO:
+            self._regiao = json.loads(texto)
+            self._regiao_conhecida = True
+            for temporada in self._temporadas:
+                self._liberar(temporada)
+
+    def _ao_fechar(self, caminho):
+        if caminho == _CAMINHO_ITEM_TEMPORADA:
+            temporada = self._temporada_atual()
+            temporada.fechada = True
+            self._liberar(temporada)
+        elif caminho == _CAMINHO_ITEM_REGIAO:
+            # Fim da região: 'region' ausente conta como desconhecida
+            self._regiao_conhecida = True
+            for temporada in self._temporadas:
+                temporada.fechada = True
+                self._liberar(temporada)
+            self._regiao = None
+            self._regiao_conhecida = False
+            self._temporadas = []
+
+    def _regiao_permitida(self):
+        if self.filtro is None:
+            return True
+        return (self._regiao or {}).get('code', 'XX') in self.filtro.codigos_regiao
+
+    def _liga_permitida(self, liga):
+        if self.filtro is None:
+            return True
+        return liga.get('relevance', 'low') in self.filtro.relevancias
+
+    def _liberar(self, temporada):
+        """Decodifica/descarta as partidas pendentes quando já é possível decidir"""
+        if not temporada.partidas or not self._regiao_conhecida:
+            return
+
+        # A liga pode vir depois das partidas no documento: decidir só com ela (ou no fechamento)
+        if temporada.liga is None and not temporada.fechada:
+            return
+
+        liga = temporada.liga or {}
+        if not liga or not self._regiao_permitida() or not self._liga_permitida(liga):
+            # Partidas seguintes desta temporada nem chegam a ser guardadas
+            self.contadores['partidas_descartadas'] += len(temporada.partidas)
+            if liga and self._regiao_permitida():
+                self.contadores['ligas_descartadas'] += 1
+            temporada.partidas = []
+            temporada.descartada = True
+            return
+
+        if temporada.temporada is None and not temporada.fechada:
+            return
+
+        regiao = self._regiao or {}
+        region_name = regiao.get('name', 'Desconhecido')
+        region_code = regiao.get('code', 'XX')
+        league_name = liga.get('name', 'Liga Desconhecida')
+        league_relevance = liga.get('relevance', 'low')
+        season_name = (temporada.temporada or {}).get('name', 'Temporada Desconhecida')
+
+        for texto in temporada.partidas:
+            match = json.loads(texto)
+            self.contadores['partidas_decodificadas'] += 1
+            if not isinstance(match, dict):
+                continue
+            jogo = self.processar_partida(match, region_name, region_code, league_name,
+                                          league_relevance, season_name)
+            if jogo:
+                self._saida.append(jogo)
+        temporada.partidas = []
+
+
+def iterar_jogos(pedacos, processar_partida, filtro=None):
+    """
+    Gera partidas processadas a partir de um iterável de pedaços do documento
+
+    Args:
+        pedacos: Iterável de bytes/str (ex.: response.iter_content(65536))
+        processar_partida: RadarEsportivoAPI.processar_partida_individual
+        filtro: FiltroElegibilidade opcional
+
+    Yields:
+        dict: Partida processada
+    """
+    parser = ParserDailyRadar(processar_partida, filtro)
+    for pedaco in pedacos:
+        for jogo in parser.alimentar(pedaco):
+            yield jogo
+    for jogo in parser.finalizar():
+        yield jogo
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Motor de Poisson em lote (NumPy)
+Recebe os gols esperados de casa/visitante de muitas partidas (um dia inteiro)
+e devolve as mesmas probabilidades de api.probabilidades como arrays, numa
+única passada e sem laços em Python por partida
+"""
+
+try:
+    import numpy as np
+except ImportError:  # Dependência opcional
+    np = None
+
+from api.probabilidades import LINHAS_OVER_UNDER, TOLERANCIA_CAUDA, chave_linha, gols_maximos
+
+NUMPY_DISPONIVEL = np is not None
+
+
+def _pmf(gols_esperados, quantidade):
+    """P(X = k), k = 0..quantidade-1, de cada lambda (uma linha por partida), pela recorrência lambda / k"""
+    razoes = np.ones((len(gols_esperados), quantidade))
+    razoes[:, 1:] = gols_esperados[:, None] / np.arange(1, quantidade)
+    return np.exp(-gols_esperados)[:, None] * np.cumprod(razoes, axis=1)
+
+
+def calcular_probabilidades_lote(gols_esperados_casa, gols_esperados_visitante, linhas=LINHAS_OVER_UNDER,
+                                 vantagem_casa=0.0, tolerancia=TOLERANCIA_CAUDA):
+    """
+    Probabilidades 1X2 e over/under de várias partidas de uma vez
+
+    Args:
+        gols_esperados_casa: Sequência/array com os gols esperados do mandante
+        gols_esperados_visitante: Sequência/array com os gols esperados do visitante
+        linhas: Linhas de over/under (ex.: 2.5 gera 'over_25' e 'under_25')
+        vantagem_casa: Acréscimo relativo na vitória do mandante (ver ResultadoProbabilidades)
+        tolerancia: Massa desprezada no fim de cada distribuição de gols
+
+    Returns:
+        dict: {chave: np.ndarray} com as chaves de ResultadoProbabilidades.como_dict()
+              (probabilidades em %)
+    """
+    if np is None:
+        raise ImportError("O motor de Poisson em lote requer o pacote 'numpy' (pip install numpy)")
+
+    casa = np.asarray(gols_esperados_casa, dtype=float).reshape(-1)
+    visitante = np.asarray(gols_esperados_visitante, dtype=float).reshape(-1)
+    total_gols = casa + visitante
+
+    # Truncamento adaptativo do núcleo: a cauda cresce com lambda, então a grade do maior vale para todos
+    maior = max(float(np.max(casa, initial=0)), float(np.max(visitante, initial=0)))
+    tamanho = gols_maximos(maior, tolerancia) + 1
+    pmf_casa = _pmf(np.maximum(casa, 0), tamanho)
+    pmf_visitante = _pmf(np.maximum(visitante, 0), tamanho)
+
+    # P(casa > visitante) = soma_i P(casa = i) * P(visitante <= i - 1), sem montar a matriz de placares
+    cdf_casa = np.cumsum(pmf_casa, axis=1)
+    cdf_visitante = np.cumsum(pmf_visitante, axis=1)
+    vitoria_casa = (pmf_casa[:, 1:] * cdf_visitante[:, :-1]).sum(axis=1)
+    vitoria_visitante = (pmf_visitante[:, 1:] * cdf_casa[:, :-1]).sum(axis=1)
+    empate = (pmf_casa * pmf_visitante).sum(axis=1)
+
+    # Normalizar a massa da grade para 100%
+    massa = vitoria_casa + empate + vitoria_visitante
+    escala = np.where(massa > 0, 100 / np.where(massa > 0, massa, 1), 1)
+    vitoria_casa = vitoria_casa * escala
+    empate = empate * escala
+    vitoria_visitante = vitoria_visitante * escala
+
+    # Vantagem do mandante e re-normalização das outras duas para fechar 100%
+    vitoria_casa = vitoria_casa * (1 + vantagem_casa)
+    outras = empate + vitoria_visitante
+    fator = np.where(outras > 0, (100 - vitoria_casa) / np.where(outras > 0, outras, 1), 1)
+    empate = empate * fator
+    vitoria_visitante = vitoria_visitante * fator
+
+    resultado = {
+        'vitoria_casa': vitoria_casa,
+        'empate': empate,
+        'vitoria_visitante': vitoria_visitante,
+        'gols_esperados_casa': casa,
+        'gols_esperados_visitante': visitante,
+        'gols_esperados_total': total_gols,
+    }
+
+    # Over/under pelo total de gols: uma única tabela de CDF até a maior linha
+    if linhas:
+        cdf_total = np.cumsum(_pmf(np.maximum(total_gols, 0), int(max(linhas)) + 1), axis=1)
+        for linha in linhas:
+            over = (1 - cdf_total[:, int(linha)]) * 100
+            resultado[f"over_{chave_linha(linha)}"] = over
+            resultado[f"under_{chave_linha(linha)}"] = 100 - over
+
+    return resultado
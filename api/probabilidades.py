@@ -0,0 +1,515 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Núcleo único de probabilidades de placar (Poisson independente para cada time)
+Usado pelo BetBoosterV2, pela CalculadoraApostasGUI e pelo motor sem interface,
+para que truncamento, normalização e mercados derivados sejam os mesmos em todo lugar
+
+Uso:
+    resultado = calcular_probabilidades(1.6, 1.1)
+    resultado.vitoria_casa, resultado.over(2.5), resultado.ambas_marcam()
+    resultado.como_dict()  # formato em % usado pelas interfaces e pelo cache
+
+    definir_motor_1x2(MOTOR_1X2_SKELLAM)  # 1X2 pela distribuição de Skellam (gols casa - visitante)
+"""
+
+import threading
+from collections import OrderedDict
+from math import exp, sqrt
+
+# Massa de probabilidade desprezada no fim de cada distribuição de gols
+TOLERANCIA_CAUDA = 1e-10
+
+# Teto de gols por time nas tabelas
+LIMITE_GOLS = 60
+
+# Maior lambda aceito: até ele o teto acima deixa fora menos que TOLERANCIA_CAUDA
+# (P(X > 60) ≈ 1.4e-13 com lambda = 20); acima disso a grade truncada perderia massa em silêncio
+GOLS_ESPERADOS_MAXIMO = 20.0
+
+# Linhas de over/under incluídas em como_dict() (chaves over_15/under_15, ...)
+LINHAS_OVER_UNDER = (1.5, 2.5, 3.5)
+
+# Tabelas PMF/CDF memorizadas: lambda arredondado a PRECISAO_LAMBDA, no máximo CAPACIDADE_TABELAS
+# (os gols esperados vêm de médias de 10 jogos, então os mesmos valores se repetem muito)
+PRECISAO_LAMBDA = 0.001
+CAPACIDADE_TABELAS = 4096
+
+# Motores do 1X2: soma sobre a grade de placares ou forma fechada da diferença de gols (Skellam)
+MOTOR_1X2_GRADE = 'grade'
+MOTOR_1X2_SKELLAM = 'skellam'
+MOTORES_1X2 = (MOTOR_1X2_GRADE, MOTOR_1X2_SKELLAM)
+
+# Motor usado quando ResultadoProbabilidades não recebe um (ver definir_motor_1x2)
+_motor_1x2_padrao = MOTOR_1X2_GRADE
+
+
+def chave_linha(linha):
+    """Sufixo da chave de uma linha de gols (2.5 -> '25')"""
+    return f"{linha:g}".replace('.', '')
+
+
+def tabela_pmf(gols_esperados, tolerancia=TOLERANCIA_CAUDA):
+    """
+    P(X = k) de uma Poisson, de k = 0 até o menor n com P(X > n) < tolerância
+
+    Os termos saem da recorrência P(k) = P(k-1) * lambda / k, sem potências nem fatoriais
+
+    Args:
+        gols_esperados: Lambda (valores negativos contam como 0)
+        tolerancia: Massa máxima deixada fora da tabela
+
+    Returns:
+        list: [P(0), P(1), ..., P(n)]
+
+    Raises:
+        ValueError: Lambda acima de GOLS_ESPERADOS_MAXIMO
+    """
+    gols_esperados = max(0.0, float(gols_esperados))
+    if gols_esperados > GOLS_ESPERADOS_MAXIMO:
+        raise ValueError(f"Gols esperados {gols_esperados:g} acima do máximo suportado "
+                         f"({GOLS_ESPERADOS_MAXIMO:g})")
+    termo = exp(-gols_esperados)
+    tabela = [termo]
+    acumulado = termo
+    k = 0
+    while 1.0 - acumulado >= tolerancia and k < LIMITE_GOLS:
+        k += 1
+        termo = termo * gols_esperados / k
+        tabela.append(termo)
+        acumulado += termo
+    return tabela
+
+
+def _acumulada(tabela):
+    """P(X <= k) para cada k da tabela"""
+    acumuladas = []
+    soma = 0.0
+    for termo in tabela:
+        soma += termo
+        acumuladas.append(soma)
+    return acumuladas
+
+
+class CacheTabelasPoisson:
+    """
+    Tabelas (PMF, CDF) por lambda quantizado, compartilhadas pelo processo, o 1X2
+    de cada par de lambdas quantizados (placar ao vivo incluso) e outras entradas
+    derivadas guardadas por consultar() (ex.: a matriz de placares de api.mercados)
+
+    LRU limitado a `capacidade` entradas; thread-safe (as análises rodam em várias
+    threads). Tabelas são tuplas, então podem ser lidas por todos sem cópia.
+    """
+
+    def __init__(self, capacidade=CAPACIDADE_TABELAS, precisao=PRECISAO_LAMBDA):
+        """
+        Args:
+            capacidade: Máximo de tabelas guardadas (a menos usada sai primeiro)
+            precisao: Passo de quantização do lambda (0.001 = tabelas a cada milésimo de gol)
+        """
+        self.capacidade = capacidade
+        self.precisao = precisao
+        self._lock = threading.Lock()
+        self._tabelas = OrderedDict()
+        self.estatisticas = {'acertos': 0, 'faltas': 0, 'descartes': 0}
+
+    def configurar(self, capacidade=None, precisao=None):
+        """Troca capacidade e/ou precisão (mudar a precisão descarta as tabelas atuais)"""
+        with self._lock:
+            if precisao is not None and precisao != self.precisao:
+                self.precisao = precisao
+                self._tabelas.clear()
+            if capacidade is not None:
+                self.capacidade = capacidade
+                while len(self._tabelas) > self.capacidade:
+                    self._tabelas.popitem(last=False)
+                    self.estatisticas['descartes'] += 1
+
+    def quantizar(self, gols_esperados):
+        """Lambda quantizado (em passos de `precisao`)"""
+        return int(round(max(0.0, float(gols_esperados)) / self.precisao))
+
+    def consultar(self, chave, calcular):
+        """Entrada `chave` do LRU, calculada por `calcular()` fora do lock quando falta"""
+        with self._lock:
+            valor = self._tabelas.get(chave)
+            if valor is not None:
+                self._tabelas.move_to_end(chave)
+                self.estatisticas['acertos'] += 1
+                return valor
+            self.estatisticas['faltas'] += 1
+
+        # Duas threads com a mesma chave só repetem um cálculo barato
+        valor = calcular()
+
+        with self._lock:
+            self._tabelas[chave] = valor
+            self._tabelas.move_to_end(chave)
+            while len(self._tabelas) > self.capacidade:
+                self._tabelas.popitem(last=False)
+                self.estatisticas['descartes'] += 1
+        return valor
+
+    def obter(self, gols_esperados, tolerancia=TOLERANCIA_CAUDA):
+        """
+        Tabelas do lambda arredondado para a precisão configurada
+
+        Returns:
+            tuple: (pmf, cdf), tuplas de P(X = k) e P(X <= k) para k = 0..n
+        """
+        passos = self.quantizar(gols_esperados)
+        precisao = self.precisao
+
+        def calcular():
+            pmf = tabela_pmf(passos * precisao, tolerancia)
+            return tuple(pmf), tuple(_acumulada(pmf))
+
+        return self.consultar(('pmf', passos, tolerancia), calcular)
+
+    def obter_1x2(self, gols_esperados_casa, gols_esperados_visitante, diferenca_atual=0,
+                  tolerancia=TOLERANCIA_CAUDA, motor=MOTOR_1X2_GRADE):
+        """
+        1X2 (sem vantagem do mandante) do par de lambdas quantizados
+
+        Args:
+            diferenca_atual: Gols atuais do mandante - gols atuais do visitante (placar ao vivo)
+            motor: MOTOR_1X2_GRADE ou MOTOR_1X2_SKELLAM
+
+        Returns:
+            tuple: (vitoria_casa, empate, vitoria_visitante) em fração
+        """
+        passos_casa = self.quantizar(gols_esperados_casa)
+        passos_visitante = self.quantizar(gols_esperados_visitante)
+        precisao = self.precisao
+
+        def calcular():
+            if motor == MOTOR_1X2_SKELLAM:
+                return resultado_1x2_skellam(passos_casa * precisao, passos_visitante * precisao,
+                                             diferenca_atual, tolerancia)
+            return _resultado_1x2(self.obter(gols_esperados_casa, tolerancia),
+                                  self.obter(gols_esperados_visitante, tolerancia), diferenca_atual)
+
+        return self.consultar(('1x2', motor, passos_casa, passos_visitante, diferenca_atual, tolerancia),
+                               calcular)
+
+    def limpar(self):
+        """Descarta as tabelas e zera as estatísticas"""
+        with self._lock:
+            self._tabelas.clear()
+            self.estatisticas = {'acertos': 0, 'faltas': 0, 'descartes': 0}
+
+    def resumo(self):
+        with self._lock:
+            resumo = dict(self.estatisticas)
+            resumo['tabelas'] = len(self._tabelas)
+        consultas = resumo['acertos'] + resumo['faltas']
+        resumo['taxa_acerto'] = resumo['acertos'] / consultas if consultas else 0.0
+        return resumo
+
+    def formatar_resumo(self):
+        """Texto curto para logs"""
+        r = self.resumo()
+        return (f"{r['acertos'] + r['faltas']} consultas, {r['taxa_acerto'] * 100:.1f}% de acerto - "
+                f"{r['tabelas']}/{self.capacidade} tabelas, {r['descartes']} descartadas")
+
+
+def _resultado_1x2(tabelas_casa, tabelas_visitante, diferenca_atual):
+    """(casa, empate, visitante) das tabelas (pmf, cdf) de cada time, normalizado pela massa truncada"""
+    pmf_casa, cdf_casa = tabelas_casa
+    pmf_visitante, acumulada_visitante = tabelas_visitante
+
+    # P(casa vence) = soma_i P(casa = i) * P(visitante < i + vantagem atual), sem montar a matriz
+    ultimo = len(pmf_visitante) - 1
+    vitoria_casa = empate = 0.0
+    for gols_casa, prob_casa in enumerate(pmf_casa):
+        limite = gols_casa + diferenca_atual - 1  # maior gol do visitante que ainda perde
+        if limite >= 0:
+            vitoria_casa += prob_casa * acumulada_visitante[min(limite, ultimo)]
+        if 0 <= limite + 1 <= ultimo:
+            empate += prob_casa * pmf_visitante[limite + 1]
+    massa = acumulada_visitante[-1] * cdf_casa[-1]
+    vitoria_visitante = max(0.0, massa - vitoria_casa - empate)
+
+    # Normalizar a massa truncada (no máximo 2 x tolerância) para fechar 100%
+    if massa > 0:
+        vitoria_casa /= massa
+        empate /= massa
+        vitoria_visitante /= massa
+    return vitoria_casa, empate, vitoria_visitante
+
+
+def resultado_1x2_grade(gols_esperados_casa, gols_esperados_visitante, diferenca_atual=0,
+                        tolerancia=TOLERANCIA_CAUDA):
+    """1X2 pela grade truncada, sem passar pelo cache (mesmos argumentos e retorno de resultado_1x2_skellam)"""
+    pmf_casa = tabela_pmf(gols_esperados_casa, tolerancia)
+    pmf_visitante = tabela_pmf(gols_esperados_visitante, tolerancia)
+    return _resultado_1x2((pmf_casa, _acumulada(pmf_casa)), (pmf_visitante, _acumulada(pmf_visitante)),
+                          diferenca_atual)
+
+
+def _skellam_positiva(maior, menor, ordem_maxima):
+    """
+    P(D = k), k = 0..ordem_maxima, e P(D = -k), k = 1..ordem_maxima, com D = X - Y,
+    X ~ Poisson(maior), Y ~ Poisson(menor), maior >= menor > 0
+
+    P(D = k) = exp(-(maior + menor)) * (maior / menor)^(k/2) * I_|k|(2 * sqrt(maior * menor)), com I a função
+    de Bessel modificada. q_k = P(D = k) / exp(-(sqrt(maior) - sqrt(menor))^2) segue a recorrência de Bessel
+    q_(k-1) = (k / maior) * q_k + (menor / maior) * q_(k+1), só com coeficientes positivos, calculada de
+    trás para frente (Miller) e normalizada pela identidade I_0(x) + 2 * soma_k I_k(x) = e^x
+    """
+    razao = menor / maior
+    inicio = ordem_maxima + 2 * int(sqrt(ordem_maxima)) + 8
+
+    valores = [0.0] * (inicio + 1)
+    proximo, atual = 0.0, 1e-200  # q_(k+1), q_k com escala arbitrária
+    for k in range(inicio, 0, -1):
+        valores[k] = atual
+        proximo, atual = atual, (k / maior) * atual + razao * proximo
+        if atual > 1e200:  # Reescalar antes de estourar
+            proximo *= 1e-200
+            atual *= 1e-200
+            valores = [valor * 1e-200 for valor in valores]
+    valores[0] = atual
+
+    # Normalização: I_k(x) e^-x = q_k * (menor / maior)^(k/2) / soma
+    raiz_razao = sqrt(razao)
+    soma = atual
+    potencia = 1.0
+    for k in range(1, inicio + 1):
+        potencia *= raiz_razao
+        soma += 2 * valores[k] * potencia
+    fator = exp(-(sqrt(maior) - sqrt(menor)) ** 2) / soma
+
+    positivos = [fator * valor for valor in valores[:ordem_maxima + 1]]
+    negativos = [0.0]
+    potencia = fator
+    for k in range(1, ordem_maxima + 1):
+        potencia *= razao
+        negativos.append(valores[k] * potencia)
+    return positivos, negativos
+
+
+def resultado_1x2_skellam(gols_esperados_casa, gols_esperados_visitante, diferenca_atual=0,
+                          tolerancia=TOLERANCIA_CAUDA):
+    """
+    1X2 pela distribuição de Skellam da diferença de gols, sem grade de placares nem re-normalização
+
+    Só são somadas as diferenças em que o time que fica atrás ainda perde; a vitória do outro sai por
+    complemento. Como D > n exige X > n, cada probabilidade erra no máximo P(Poisson > n) < tolerância
+    (n = tamanho da tabela PMF do lambda maior, sem quantização, e pelo menos 2).
+
+    Args:
+        gols_esperados_casa: Gols esperados do mandante (no tempo que falta jogar)
+        gols_esperados_visitante: Gols esperados do visitante (no tempo que falta jogar)
+        diferenca_atual: Gols atuais do mandante - gols atuais do visitante
+        tolerancia: Erro máximo aceito em cada probabilidade
+
+    Returns:
+        tuple: (vitoria_casa, empate, vitoria_visitante) em fração
+
+    Raises:
+        ValueError: Lambda acima de GOLS_ESPERADOS_MAXIMO
+    """
+    casa = max(0.0, float(gols_esperados_casa))
+    visitante = max(0.0, float(gols_esperados_visitante))
+
+    # Trabalhar sempre com o lambda maior na frente (D -> -D troca casa e visitante)
+    invertido = visitante > casa
+    if invertido:
+        casa, visitante, diferenca_atual = visitante, casa, -diferenca_atual
+    alvo = -diferenca_atual  # vitória do "mandante" se D > alvo, empate se D == alvo
+
+    if visitante == 0:
+        # D é a própria Poisson do mandante
+        positivos = tabela_pmf(casa, tolerancia)
+        negativos = [0.0]
+    else:
+        # Número de termos do lambda exato: o da tabela quantizada é 0 para lambdas abaixo da precisão
+        ordem_maxima = max(2, len(tabela_pmf(casa, tolerancia)) - 1)
+        positivos, negativos = _skellam_positiva(casa, visitante, ordem_maxima)
+
+    def prob_diferenca(k):
+        if 0 <= k < len(positivos):
+            return positivos[k]
+        if 0 < -k < len(negativos):
+            return negativos[-k]
+        return 0.0
+
+    empate = prob_diferenca(alvo)
+    if alvo >= 0:
+        derrota = sum(negativos[1:]) + sum(positivos[:alvo])
+    else:
+        derrota = sum(negativos[-alvo + 1:])
+    vitoria = max(0.0, 1.0 - empate - derrota)
+
+    if invertido:
+        return derrota, empate, vitoria
+    return vitoria, empate, derrota
+
+
+def definir_motor_1x2(motor):
+    """
+    Motor padrão do 1X2 no processo (interfaces e motor sem interface)
+
+    Args:
+        motor: MOTOR_1X2_GRADE (soma sobre a grade truncada) ou MOTOR_1X2_SKELLAM (forma fechada)
+    """
+    global _motor_1x2_padrao
+    if motor not in MOTORES_1X2:
+        raise ValueError(f"Motor de 1X2 desconhecido: {motor} (use {', '.join(MOTORES_1X2)})")
+    _motor_1x2_padrao = motor
+
+
+# Cache único do processo (interfaces, motor e motor em lote)
+tabelas_poisson = CacheTabelasPoisson()
+
+
+def gols_maximos(gols_esperados, tolerancia=TOLERANCIA_CAUDA):
+    """Truncamento adaptativo: maior número de gols considerado para o lambda"""
+    return len(tabelas_poisson.obter(gols_esperados, tolerancia)[0]) - 1
+
+
+class ResultadoProbabilidades:
+    """
+    Distribuição do placar final de uma partida e todos os mercados derivados
+
+    Probabilidades em fração (0-1); como_dict() devolve o formato em % das interfaces.
+    Com placar ao vivo, os gols esperados são os do tempo restante e os gols atuais
+    entram como deslocamento do placar final.
+    """
+
+    def __init__(self, gols_esperados_casa, gols_esperados_visitante, gols_atuais_casa=0,
+                 gols_atuais_visitante=0, vantagem_casa=0.0, tolerancia=TOLERANCIA_CAUDA, motor_1x2=None):
+        """
+        Args:
+            gols_esperados_casa: Gols esperados do mandante (no tempo que falta jogar)
+            gols_esperados_visitante: Gols esperados do visitante (no tempo que falta jogar)
+            gols_atuais_casa: Gols já marcados pelo mandante
+            gols_atuais_visitante: Gols já marcados pelo visitante
+            vantagem_casa: Acréscimo relativo na vitória do mandante (0.05 = +5%), com
+                           empate e vitória do visitante re-normalizados para fechar 100%
+            tolerancia: Massa desprezada no fim de cada distribuição (truncamento adaptativo)
+            motor_1x2: MOTOR_1X2_GRADE ou MOTOR_1X2_SKELLAM (None = padrão de definir_motor_1x2)
+        """
+        self.gols_esperados_casa = gols_esperados_casa
+        self.gols_esperados_visitante = gols_esperados_visitante
+        self.gols_esperados_total = gols_esperados_casa + gols_esperados_visitante
+        self.gols_atuais_casa = gols_atuais_casa
+        self.gols_atuais_visitante = gols_atuais_visitante
+        self.tolerancia = tolerancia
+        self.motor_1x2 = motor_1x2 or _motor_1x2_padrao
+
+        # Gols que ainda vão sair, por time (tabelas memorizadas do processo)
+        self.pmf_casa = tabelas_poisson.obter(gols_esperados_casa, tolerancia)[0]
+        self.pmf_visitante = tabelas_poisson.obter(gols_esperados_visitante, tolerancia)[0]
+        self.max_gols = max(len(self.pmf_casa), len(self.pmf_visitante)) - 1
+        self._cdf_total = None
+
+        # 1X2 do par de lambdas também memorizado (o laço sobre a grade só roda na primeira vez)
+        vitoria_casa, empate, vitoria_visitante = tabelas_poisson.obter_1x2(
+            gols_esperados_casa, gols_esperados_visitante, gols_atuais_casa - gols_atuais_visitante, tolerancia,
+            self.motor_1x2)
+
+        if vantagem_casa:
+            vitoria_casa += vitoria_casa * vantagem_casa
+            outras = empate + vitoria_visitante
+            if outras > 0:
+                fator = (1 - vitoria_casa) / outras
+                empate *= fator
+                vitoria_visitante *= fator
+
+        self.vitoria_casa = vitoria_casa
+        self.empate = empate
+        self.vitoria_visitante = vitoria_visitante
+
+    # Mercados de resultado
+    def dupla_chance(self):
+        """(casa ou empate, empate ou visitante, casa ou visitante)"""
+        return (self.vitoria_casa + self.empate, self.empate + self.vitoria_visitante,
+                self.vitoria_casa + self.vitoria_visitante)
+
+    def empate_anula(self):
+        """Empate anula a aposta: (casa, visitante) condicionados a não haver empate"""
+        decisivo = self.vitoria_casa + self.vitoria_visitante
+        if decisivo <= 0:
+            return 0.0, 0.0
+        return self.vitoria_casa / decisivo, self.vitoria_visitante / decisivo
+
+    # Mercados de gols
+    def cdf_total(self):
+        """P(gols que ainda vão sair <= k): a soma de duas Poisson é Poisson(lambda casa + lambda visitante)"""
+        if self._cdf_total is None:
+            self._cdf_total = tabelas_poisson.obter(self.gols_esperados_total, self.tolerancia)[1]
+        return self._cdf_total
+
+    def under(self, linha):
+        """P(total de gols no fim < linha)"""
+        limite = int(linha) - (self.gols_atuais_casa + self.gols_atuais_visitante)
+        if limite < 0:
+            return 0.0
+        cdf = self.cdf_total()
+        return min(1.0, cdf[min(limite, len(cdf) - 1)])
+
+    def over(self, linha):
+        """P(total de gols no fim > linha)"""
+        return 1.0 - self.under(linha)
+
+    def ambas_marcam(self):
+        """Os dois times terminam com pelo menos um gol"""
+        marca_casa = 1.0 if self.gols_atuais_casa > 0 else 1.0 - self.pmf_casa[0]
+        marca_visitante = 1.0 if self.gols_atuais_visitante > 0 else 1.0 - self.pmf_visitante[0]
+        return marca_casa * marca_visitante
+
+    # Placar exato
+    def placar(self, gols_casa, gols_visitante):
+        """P(placar final = gols_casa x gols_visitante)"""
+        i = gols_casa - self.gols_atuais_casa
+        j = gols_visitante - self.gols_atuais_visitante
+        if not (0 <= i < len(self.pmf_casa) and 0 <= j < len(self.pmf_visitante)):
+            return 0.0
+        return self.pmf_casa[i] * self.pmf_visitante[j]
+
+    def matriz(self):
+        """Matriz [i][j] = P(mais i gols do mandante e mais j do visitante)"""
+        return [[prob_casa * prob_visitante for prob_visitante in self.pmf_visitante]
+                for prob_casa in self.pmf_casa]
+
+    def placar_mais_provavel(self):
+        """(gols casa, gols visitante, probabilidade) do placar final mais provável"""
+        i = max(range(len(self.pmf_casa)), key=self.pmf_casa.__getitem__)
+        j = max(range(len(self.pmf_visitante)), key=self.pmf_visitante.__getitem__)
+        return (self.gols_atuais_casa + i, self.gols_atuais_visitante + j,
+                self.pmf_casa[i] * self.pmf_visitante[j])
+
+    def como_dict(self, linhas=LINHAS_OVER_UNDER):
+        """Probabilidades em % com as chaves de calcular_probabilidades_completas"""
+        resultado = {
+            'vitoria_casa': self.vitoria_casa * 100,
+            'empate': self.empate * 100,
+            'vitoria_visitante': self.vitoria_visitante * 100,
+            'gols_esperados_casa': self.gols_esperados_casa,
+            'gols_esperados_visitante': self.gols_esperados_visitante,
+            'gols_esperados_total': self.gols_esperados_total
+        }
+        for linha in linhas:
+            over = self.over(linha) * 100
+            resultado[f"over_{chave_linha(linha)}"] = over
+            resultado[f"under_{chave_linha(linha)}"] = 100 - over
+        return resultado
+
+
+def calcular_probabilidades(gols_esperados_casa, gols_esperados_visitante, gols_atuais_casa=0,
+                            gols_atuais_visitante=0, vantagem_casa=0.0, tolerancia=TOLERANCIA_CAUDA,
+                            motor_1x2=None):
+    """Atalho para ResultadoProbabilidades(...) (mesmos argumentos)"""
+    return ResultadoProbabilidades(gols_esperados_casa, gols_esperados_visitante, gols_atuais_casa,
+                                   gols_atuais_visitante, vantagem_casa, tolerancia, motor_1x2)
+
+
+def probabilidade_over_under(gols_esperados, linha, tipo):
+    """Over/under (%) de uma linha para um total de gols esperados (leitura da CDF memorizada)"""
+    cdf = tabelas_poisson.obter(gols_esperados)[1]
+    under = min(1.0, cdf[min(int(linha), len(cdf) - 1)])
+    if tipo == 'over':
+        return (1 - under) * 100
+    return under * 100
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Processamento (parse/normalização) das respostas da API Radar Esportivo
+Compartilhado pelos clientes síncrono e assíncrono: não faz requisições
+"""
+
+import hashlib
+from datetime import datetime
+
+
+class ProcessadorRadar:
+    """Converte os payloads dailyRadar/goalRadar nos dicionários usados pelo motor"""
+
+    def __init__(self):
+        # Estimativas por (time, relevância da liga) - determinísticas
+        self._memo_estatisticas = {}
+
+    def processar_jogos(self, daily_radar_data):
+        """
+        Processa os dados brutos da API e extrai informações relevantes
+        
+        Args:
+            daily_radar_data: Dados brutos da API
+        
+        Returns:
+            list: Lista de jogos processados
+        """
+        jogos = []
+        
+        try:
+            for region_data in daily_radar_data:
+                if not isinstance(region_data, dict) or 'seasons' not in region_data:
+                    continue
+                
+                region = region_data.get('region', {})
+                region_name = region.get('name', 'Desconhecido')
+                region_code = region.get('code', 'XX')
+                
+                for season_data in region_data['seasons']:
+                    if not isinstance(season_data, dict):
+                        continue
+                    
+                    league = season_data.get('league', {})
+                    season = season_data.get('season', {})
+                    matches = season_data.get('matches', [])
+                    
+                    if not league or not matches:
+                        continue
+                    
+                    league_name = league.get('name', 'Liga Desconhecida')
+                    league_relevance = league.get('relevance', 'low')
+                    season_name = season.get('name', 'Temporada Desconhecida')
+                    
+                    for match in matches:
+                        if not isinstance(match, dict):
+                            continue
+                        
+                        jogo_processado = self.processar_partida_individual(
+                            match, region_name, region_code, league_name, 
+                            league_relevance, season_name
+                        )
+                        
+                        if jogo_processado:
+                            jogos.append(jogo_processado)
+            
+            # Ordenar por relevância e horário
+            jogos.sort(key=lambda x: (
+                self.get_relevance_priority(x['relevancia_liga']),
+                x['horario'] if x['horario'] else '99:99'
+            ))
+            
+            return jogos
+            
+        except Exception as e:
+            print(f"❌ Erro ao processar jogos: {str(e)}")
+            return []
+
+    def processar_partida_individual(self, match, region_name, region_code, 
+                                   league_name, league_relevance, season_name):
+        """
+        Processa uma partida individual
+        
+        Args:
+            match: Dados da partida
+            region_name: Nome da região
+            region_code: Código da região
+            league_name: Nome da liga
+            league_relevance: Relevância da liga
+            season_name: Nome da temporada
+        
+        Returns:
+            dict: Dados processados da partida ou None
+        """
+        try:
+            # Extrair dados básicos
+            match_id = match.get('id', 'unknown')
+            home_team = match.get('homeTeam', {})
+            away_team = match.get('awayTeam', {})
+            
+            if not home_team or not away_team:
+                return None
+            
+            # Nomes dos times
+            home_name = home_team.get('name', 'Time Casa')
+            away_name = away_team.get('name', 'Time Visitante')
+            
+            # Horário da partida
+            match_time = match.get('matchTime', '')
+            status = match.get('status', 'scheduled')
+            
+            # Estatísticas estimadas baseadas na liga
+            stats_casa = self.estimar_estatisticas_time(home_team, league_relevance)
+            stats_visitante = self.estimar_estatisticas_time(away_team, league_relevance)
+            
+            # Placar (se jogo em andamento ou finalizado)
+            home_score = match.get('homeScore', 0)
+            away_score = match.get('awayScore', 0)
+            
+            return {
+                'id': match_id,
+                'time_casa': home_name,
+                'time_visitante': away_name,
+                'horario': self.formatar_horario(match_time),
+                'inicio_utc': match_time,
+                'status': self.traduzir_status(status),
+                'placar_casa': home_score,
+                'placar_visitante': away_score,
+                'regiao': region_name,
+                'codigo_regiao': region_code,
+                'liga': league_name,
+                'relevancia_liga': league_relevance,
+                'temporada': season_name,
+                'stats_casa': stats_casa,
+                'stats_visitante': stats_visitante,
+                'atualizado_em': match.get('updatedAt', ''),
+            }
+            
+        except Exception as e:
+            print(f"❌ Erro ao processar partida individual: {str(e)}")
+            return None
+
+    def estimar_estatisticas_time(self, team_data, league_relevance):
+        """
+        Estima estatísticas do time baseado na liga e dados disponíveis
+        
+        Args:
+            team_data: Dados do time
+            league_relevance: Relevância da liga (high, medium, low)
+        
+        Returns:
+            dict: Estatísticas estimadas
+        """
+        # Mesmo time + mesma relevância = mesma estimativa (memoizada)
+        identificador = (team_data.get('id') or team_data.get('name', '')) if isinstance(team_data, dict) else team_data
+        chave = (str(identificador), league_relevance)
+        estimativa = self._memo_estatisticas.get(chave)
+        
+        if estimativa is None:
+            # Médias base por relevância da liga
+            medias_base = {
+                'high': {'gols_marcados': 1.4, 'gols_sofridos': 1.2},
+                'medium': {'gols_marcados': 1.2, 'gols_sofridos': 1.1},
+                'low': {'gols_marcados': 1.0, 'gols_sofridos': 1.0}
+            }
+            
+            base = medias_base.get(league_relevance, medias_base['medium'])
+            
+            # Variação pequena para simular diferenças entre times, derivada do
+            # hash estável do time (não do hash() do Python, que muda por processo)
+            digest = hashlib.sha1(f"{chave[0]}|{chave[1]}".encode('utf-8')).digest()
+            variacao = 0.85 + 0.30 * (int.from_bytes(digest[:4], 'big') / 0xFFFFFFFF)
+            
+            gols_marcados = round(base['gols_marcados'] * variacao, 2)
+            gols_sofridos = round(base['gols_sofridos'] * (2 - variacao), 2)  # Inverso para defesa
+            
+            media_liga = base['gols_marcados']
+            forca_ofensiva = round(gols_marcados / media_liga, 3)
+            forca_defensiva = round(gols_sofridos / media_liga, 3)
+            
+            estimativa = {
+                'gols_marcados': gols_marcados,
+                'gols_sofridos': gols_sofridos,
+                'forca_ofensiva': forca_ofensiva,
+                'forca_defensiva': forca_defensiva,
+                'media_liga': media_liga
+            }
+            self._memo_estatisticas[chave] = estimativa
+        
+        # Cópia: o dicionário vai para o jogo e pode ser alterado por quem o recebe
+        return dict(estimativa)
+
+    def formatar_horario(self, match_time):
+        """
+        Formata o horário da partida
+        
+        Args:
+            match_time: Horário bruto da API
+        
+        Returns:
+            str: Horário formatado
+        """
+        try:
+            if not match_time:
+                return ''
+            
+            # Tentar diferentes formatos de data
+            formatos = [
+                '%Y-%m-%dT%H:%M:%S.%fZ',
+                '%Y-%m-%dT%H:%M:%SZ',
+                '%Y-%m-%dT%H:%M:%S',
+                '%H:%M'
+            ]
+            
+            for formato in formatos:
+                try:
+                    dt = datetime.strptime(match_time, formato)
+                    return dt.strftime('%H:%M')
+                except ValueError:
+                    continue
+            
+            # Se não conseguir converter, retornar original
+            return str(match_time)[:5]
+            
+        except Exception:
+            return ''
+
+    def traduzir_status(self, status):
+        """
+        Traduz o status da partida
+        
+        Args:
+            status: Status em inglês
+        
+        Returns:
+            str: Status traduzido
+        """
+        traducoes = {
+            'scheduled': 'Agendado',
+            'live': 'Ao Vivo',
+            'finished': 'Finalizado',
+            'postponed': 'Adiado',
+            'cancelled': 'Cancelado',
+            'interrupted': 'Interrompido'
+        }
+        
+        return traducoes.get(status, status.capitalize())
+
+    def processar_estatisticas_time(self, data, field, mode):
+        """
+        Processa os dados estatísticos retornados pela API
+        
+        Args:
+            data: Dados da API goalRadar
+            field: Campo do time (home/away)
+            mode: Modo da busca (anyField)
+        
+        Returns:
+            dict: Estatísticas processadas
+        """
+        try:
+            dados_api = data['data']
+            match_count = data.get('matchCount', 10)
+            
+            # Extrair somas de gols
+            gols_marcados_total = dados_api['sums']['goalsScored']['fullTime']
+            gols_sofridos_total = dados_api['sums']['goalsConceded']['fullTime']
+            
+            # Calcular médias
+            media_gols_marcados = gols_marcados_total / match_count if match_count > 0 else 0
+            media_gols_sofridos = gols_sofridos_total / match_count if match_count > 0 else 0
+            
+            # Estatísticas adicionais dos counts
+            counts = dados_api.get('counts', {})
+            
+            # Análise de desempenho
+            vitorias = counts.get('won', {}).get('fullTime', 0)
+            empates = counts.get('drew', {}).get('fullTime', 0)
+            derrotas = counts.get('lost', {}).get('fullTime', 0)
+            
+            # Percentuais
+            perc_vitorias = (vitorias / match_count * 100) if match_count > 0 else 0
+            perc_empates = (empates / match_count * 100) if match_count > 0 else 0
+            perc_derrotas = (derrotas / match_count * 100) if match_count > 0 else 0
+            
+            # Análise de gols
+            jogos_sem_marcar = counts.get('failToScore', {}).get('fullTime', 0)
+            jogos_sem_sofrer = counts.get('cleanSheet', {}).get('fullTime', 0)
+            
+            # Mercados de gols (para análise adicional)
+            markets = counts.get('markets', {}).get('matchGoals', {})
+            over15 = markets.get('over15', 0)
+            over25 = markets.get('over25', 0)
+            btts = markets.get('btts', 0)  # Both Teams To Score
+            
+            # Forma recente (últimos jogos)
+            forma = dados_api.get('race', [])
+            
+            # Calcular força ofensiva e defensiva baseada na média da liga
+            media_liga_estimada = 1.2  # Estimativa padrão
+            forca_ofensiva = media_gols_marcados / media_liga_estimada if media_liga_estimada > 0 else 1
+            forca_defensiva = media_gols_sofridos / media_liga_estimada if media_liga_estimada > 0 else 1
+            
+            estatisticas = {
+                'match_id': data.get('matchId'),
+                'field': field,
+                'mode': mode,
+                'match_count': match_count,
+                'media_gols_marcados': round(media_gols_marcados, 2),
+                'media_gols_sofridos': round(media_gols_sofridos, 2),
+                'gols_marcados_total': gols_marcados_total,
+                'gols_sofridos_total': gols_sofridos_total,
+                'forca_ofensiva': round(forca_ofensiva, 3),
+                'forca_defensiva': round(forca_defensiva, 3),
+                'vitorias': vitorias,
+                'empates': empates,
+                'derrotas': derrotas,
+                'perc_vitorias': round(perc_vitorias, 1),
+                'perc_empates': round(perc_empates, 1),
+                'perc_derrotas': round(perc_derrotas, 1),
+                'jogos_sem_marcar': jogos_sem_marcar,
+                'jogos_sem_sofrer': jogos_sem_sofrer,
+                'over15_jogos': over15,
+                'over25_jogos': over25,
+                'btts_jogos': btts,
+                'forma_recente': forma[:5],  # Últimos 5 resultados
+                'updated_at': data.get('updatedAt')
+            }
+            
+            return estatisticas
+            
+        except Exception as e:
+            print(f"❌ Erro ao processar estatísticas: {str(e)}")
+            return None
+
+    def montar_estatisticas_detalhadas(self, match_id, stats_casa_geral, stats_visitante_geral):
+        """
+        Monta o dicionário de estatísticas detalhadas a partir das
+        estatísticas gerais (anyField) de cada time
+        
+        Args:
+            match_id: ID da partida
+            stats_casa_geral: Resultado de buscar_estatisticas_time(match_id, 'home')
+            stats_visitante_geral: Resultado de buscar_estatisticas_time(match_id, 'away')
+        
+        Returns:
+            dict: Estatísticas detalhadas dos times
+        """
+        return {
+            'match_id': match_id,
+            'time_casa': {
+                'nome': stats_casa_geral.get('nome', 'Time Casa'),
+                'geral': {
+                    'gols_marcados': stats_casa_geral['media_gols_marcados'],
+                    'gols_sofridos': stats_casa_geral['media_gols_sofridos'],
+                    'vitorias': stats_casa_geral['vitorias'],
+                    'empates': stats_casa_geral['empates'],
+                    'derrotas': stats_casa_geral['derrotas'],
+                    'btts': stats_casa_geral['btts_jogos'],
+                    'over15': stats_casa_geral['over15_jogos'],
+                    'over25': stats_casa_geral['over25_jogos'],
+                    'forma': stats_casa_geral['forma_recente']
+                }
+            },
+            'time_visitante': {
+                'nome': stats_visitante_geral.get('nome', 'Time Visitante'),
+                'geral': {
+                    'gols_marcados': stats_visitante_geral['media_gols_marcados'],
+                    'gols_sofridos': stats_visitante_geral['media_gols_sofridos'],
+                    'vitorias': stats_visitante_geral['vitorias'],
+                    'empates': stats_visitante_geral['empates'],
+                    'derrotas': stats_visitante_geral['derrotas'],
+                    'btts': stats_visitante_geral['btts_jogos'],
+                    'over15': stats_visitante_geral['over15_jogos'],
+                    'over25': stats_visitante_geral['over25_jogos'],
+                    'forma': stats_visitante_geral['forma_recente']
+                }
+            },
+            'timestamp': datetime.now().isoformat()
+        }
+
+    def get_relevance_priority(self, relevance):
+        """
+        Converte relevância em prioridade numérica para ordenação
+        
+        Args:
+            relevance: Relevância da liga
+        
+        Returns:
+            int: Prioridade (menor = maior relevância)
+        """
+        priorities = {
+            'high': 1,
+            'medium': 2,
+            'low': 3
+        }
+        
+        return priorities.get(relevance, 4)
@@ -7,20 +7,192 @@ Busca jogos do dia e dados de times/partidas
 
 import requests
 import json
+import os
+import threading
 from datetime import datetime, timedelta
-import time
-
-class RadarEsportivoAPI:
-    def __init__(self):
-        self.base_url = "https://api.radaresportivo.com/public"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36',
-            'Accept': 'application/json, text/plain, */*',
-            'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Cache-Control': 'no-cache'
-        })
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from api.cache_jogos import salvar_cache_jogos
+from api.parser_daily_radar import iterar_jogos
+from api.processador_radar import ProcessadorRadar
+from api.transporte import TransporteHTTP
+from api.limitador import LimitadorRadar
+from api.cache_condicional import CacheCondicional
+from api.retentativas import PoliticaRetentativa, Prazo, ErroRadar, ExecucaoRetentativa, RegistroErros
+from api.gravacao import GravadorHTTP, ReprodutorHTTP, TransporteGravador, TransporteReprodutor
+
+BASE_URL_PADRAO = "https://api.radaresportivo.com/public"
+
+# Permite apontar o cliente (e o BetBoosterV2) para o servidor local ou uma gravação
+VARIAVEL_BASE_URL = 'RADAR_ESPORTIVO_BASE_URL'
+
+# Gravação (arquivo .jsonl.gz de saída) e reprodução (arquivo de entrada + velocidade)
+VARIAVEL_GRAVAR = 'RADAR_ESPORTIVO_GRAVAR'
+VARIAVEL_REPRODUZIR = 'RADAR_ESPORTIVO_REPRODUZIR'
+VARIAVEL_VELOCIDADE = 'RADAR_ESPORTIVO_VELOCIDADE'
+
+HEADERS_PADRAO = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36',
+    'Accept': 'application/json, text/plain, */*',
+    'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Cache-Control': 'no-cache'
+}
+
+# Retentativas por endpoint (GETs são idempotentes)
+POLITICAS_PADRAO = {
+    'dailyRadar': PoliticaRetentativa(tentativas=4, prazo=30.0),
+    'prepRadar': PoliticaRetentativa(tentativas=3, prazo=15.0),
+    'goalRadar': PoliticaRetentativa(tentativas=3, prazo=15.0),
+    'results': PoliticaRetentativa(tentativas=2, prazo=15.0)
+}
+
+# Tamanho padrão do pool = número de workers que chamam a API em paralelo
+MAX_CONEXOES_PADRAO = 10
+
+# Na reprodução os orçamentos já foram respeitados durante a gravação
+ORCAMENTOS_REPRODUCAO = {endpoint: (100000, 100000) for endpoint in POLITICAS_PADRAO}
+
+class RadarEsportivoAPI(ProcessadorRadar):
+    def __init__(self, max_conexoes=MAX_CONEXOES_PADRAO, http2=False, diretorio_cache_http=None, base_url=None):
+        """
+        Args:
+            base_url: URL base da API (padrão: $RADAR_ESPORTIVO_BASE_URL ou BASE_URL_PADRAO)
+            max_conexoes: Conexões simultâneas do pool (use o número de workers)
+            http2: Usa HTTP/2 com multiplexação se 'httpx[http2]' estiver instalado
+            diretorio_cache_http: Pasta para persistir payloads e validadores (padrão: só memória)
+        """
+        self.base_url = (base_url or os.environ.get(VARIAVEL_BASE_URL) or BASE_URL_PADRAO).rstrip('/')
+        self.max_conexoes = max_conexoes
+        # Todas as chamadas ao Radar Esportivo passam por este transporte
+        self.transporte = TransporteHTTP(HEADERS_PADRAO, max_conexoes=max_conexoes, http2=http2)
+        self.session = self.transporte.session
+        # Orçamento por endpoint + concorrência AIMD (substitui pausas fixas entre chamadas)
+        self.limitador = LimitadorRadar(max_concorrencia=max_conexoes)
+        self.politicas = dict(POLITICAS_PADRAO)
+        self.erros = RegistroErros()
+        self.prazo_lote = None
+        # Prazo da tarefa em execução em cada thread (partida sendo analisada)
+        self._prazo_thread = threading.local()
+        # Validadores (ETag/Last-Modified/hash) para GET condicional
+        self.cache_http = CacheCondicional(diretorio_cache_http)
+        # Parse/normalização das respostas (compartilhado com o cliente assíncrono)
+        super().__init__()
+
+        if os.environ.get(VARIAVEL_REPRODUZIR):
+            velocidade = os.environ.get(VARIAVEL_VELOCIDADE)
+            self.iniciar_reproducao(os.environ[VARIAVEL_REPRODUZIR], float(velocidade) if velocidade else None)
+        elif os.environ.get(VARIAVEL_GRAVAR):
+            self.iniciar_gravacao(os.environ[VARIAVEL_GRAVAR])
+
+    def iniciar_gravacao(self, arquivo):
+        """
+        Grava todas as requisições/respostas seguintes (com tempos) em `arquivo` (.jsonl.gz)
+
+        Returns:
+            GravadorHTTP em uso
+        """
+        self.parar_gravacao()
+        gravador = GravadorHTTP(arquivo)
+        self.transporte = TransporteGravador(self.transporte, gravador)
+        print(f"⏺️ Gravando tráfego do Radar Esportivo em {arquivo}")
+        return gravador
+
+    def parar_gravacao(self):
+        """Fecha o arquivo de gravação e volta ao transporte de rede"""
+        if isinstance(self.transporte, TransporteGravador):
+            self.transporte.gravador.fechar()
+            print(f"⏹️ Gravação encerrada: {self.transporte.gravador.total} respostas")
+            self.transporte = self.transporte.transporte
+
+    def iniciar_reproducao(self, arquivo, velocidade=None):
+        """
+        Passa a responder a partir de uma gravação, sem rede
+
+        Args:
+            arquivo: Arquivo gravado por iniciar_gravacao()
+            velocidade: None = instantâneo; 1.0 = tempos gravados; N = N vezes mais rápido
+        """
+        self.parar_gravacao()
+        reprodutor = ReprodutorHTTP(arquivo, velocidade)
+        self.transporte.fechar()
+        self.transporte = TransporteReprodutor(reprodutor, self.max_conexoes)
+        self.limitador = LimitadorRadar(max_concorrencia=self.max_conexoes, orcamentos=ORCAMENTOS_REPRODUCAO)
+        print(f"▶️ Reproduzindo {reprodutor.total} respostas de {arquivo}")
+        return reprodutor
+
+    def iniciar_lote(self, segundos):
+        """Define um prazo total para todas as chamadas de um lote (ex.: análise do dia)"""
+        self.prazo_lote = Prazo(segundos)
+        return self.prazo_lote
+
+    def encerrar_lote(self):
+        """Remove o prazo do lote atual"""
+        self.prazo_lote = None
+
+    def executar_com_prazo(self, prazo, funcao):
+        """
+        Executa `funcao` com todas as chamadas desta thread limitadas por `prazo`
+        (prazo por partida; cancelar o prazo interrompe as retentativas)
+        """
+        anterior = getattr(self._prazo_thread, 'prazo', None)
+        self._prazo_thread.prazo = prazo
+        try:
+            return funcao()
+        finally:
+            self._prazo_thread.prazo = anterior
+
+    def _get(self, endpoint, url, params=None, timeout=10, match_id=None, headers=None, stream=False):
+        """
+        GET pelo transporte compartilhado, limitado pelo orçamento do endpoint,
+        com retentativas (backoff exponencial + jitter) dentro do prazo da chamada/lote
+
+        Raises:
+            ErroRadar: Falha definitiva, também registrada em self.erros
+        """
+        politica = self.politicas.get(endpoint, self.politicas['results'])
+        prazo = Prazo(politica.prazo, pai=getattr(self._prazo_thread, 'prazo', None))
+        execucao = ExecucaoRetentativa(endpoint, match_id, politica, prazo, self.prazo_lote)
+
+        while True:
+            restante = execucao.proxima()
+            if restante is None:
+                break
+            try:
+                response = self.limitador.executar(
+                    endpoint, lambda: self.transporte.get(url, params=params, timeout=min(timeout, restante), headers=headers, stream=stream),
+                    prazo=prazo, segundos=restante)
+                response.raise_for_status()
+                self.erros.limpar(endpoint, match_id)
+                return response
+            except ErroRadar as e:
+                execucao.desistencia(e)
+                break
+            except requests.exceptions.RequestException as e:
+                espera = execucao.falha(e)
+                if espera is None:
+                    break
+            prazo.aguardar(espera)
+
+        self.erros.registrar(execucao.erro)
+        raise execucao.erro
+
+    def _get_json(self, endpoint, url, params=None, timeout=10, match_id=None):
+        """
+        GET condicional: revalida o payload em cache (If-None-Match/If-Modified-Since)
+        e só decodifica o JSON quando o conteúdo mudou
+
+        Returns:
+            JSON decodificado (o mesmo objeto em cache quando não houve mudança)
+        """
+        cabecalhos = self.cache_http.cabecalhos_condicionais(url, params)
+        response = self._get(endpoint, url, params=params, timeout=timeout, match_id=match_id, headers=cabecalhos)
+        dados, _ = self.cache_http.registrar_resposta(match_id, url, params, response)
+        if dados is None and response.status_code == 304:
+            # Entrada descartada da memória entre o pedido e o 304: busca o payload inteiro
+            response = self._get(endpoint, url, params=params, timeout=timeout, match_id=match_id)
+            dados, _ = self.cache_http.registrar_resposta(match_id, url, params, response)
+        return dados
     
     def buscar_jogos_do_dia(self, data=None, timezone_offset=-180):
         """
@@ -42,10 +214,7 @@ class RadarEsportivoAPI:
             
             print(f"🔍 Buscando jogos para {data}...")
             
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data_response = response.json()
+            data_response = self._get_json('dailyRadar', url, params=params, timeout=10, match_id=data)
             
             if 'dailyRadar' not in data_response:
                 print("❌ Resposta da API não contém dados esperados")
@@ -67,224 +236,67 @@ class RadarEsportivoAPI:
             print(f"❌ Erro inesperado: {str(e)}")
             return None
     
-    def processar_jogos(self, daily_radar_data):
+    def iterar_jogos_do_dia(self, data=None, timezone_offset=-180, filtro=None):
         """
-        Processa os dados brutos da API e extrai informações relevantes
+        Versão incremental de buscar_jogos_do_dia: lê o dailyRadar em pedaços e
+        entrega cada partida processada assim que é decodificada
         
         Args:
-            daily_radar_data: Dados brutos da API
+            data: Data no formato YYYY-MM-DD (padrão: hoje)
+            timezone_offset: Offset do timezone em minutos (padrão: -180 para UTC-3)
+            filtro: FiltroElegibilidade aplicado durante a leitura (ligas descartadas
+                    nunca são decodificadas)
         
-        Returns:
-            list: Lista de jogos processados
+        Yields:
+            dict: Partida no formato de processar_partida_individual (ordem do documento)
+        
+        Raises:
+            requests.exceptions.RequestException: Erro de conexão
+            json.JSONDecodeError: Documento inválido ou incompleto
         """
-        jogos = []
+        if data is None:
+            data = datetime.now().strftime('%Y-%m-%d')
         
+        url = f"{self.base_url}/dailyRadar/{data}"
+        params = {'mOffset': timezone_offset}
+        
+        # Sem GET condicional: o documento não é guardado inteiro em memória
+        response = self._get('dailyRadar', url, params=params, timeout=10, match_id=data, stream=True)
         try:
-            for region_data in daily_radar_data:
-                if not isinstance(region_data, dict) or 'seasons' not in region_data:
-                    continue
-                
-                region = region_data.get('region', {})
-                region_name = region.get('name', 'Desconhecido')
-                region_code = region.get('code', 'XX')
-                
-                for season_data in region_data['seasons']:
-                    if not isinstance(season_data, dict):
-                        continue
-                    
-                    league = season_data.get('league', {})
-                    season = season_data.get('season', {})
-                    matches = season_data.get('matches', [])
-                    
-                    if not league or not matches:
-                        continue
-                    
-                    league_name = league.get('name', 'Liga Desconhecida')
-                    league_relevance = league.get('relevance', 'low')
-                    season_name = season.get('name', 'Temporada Desconhecida')
-                    
-                    for match in matches:
-                        if not isinstance(match, dict):
-                            continue
-                        
-                        jogo_processado = self.processar_partida_individual(
-                            match, region_name, region_code, league_name, 
-                            league_relevance, season_name
-                        )
-                        
-                        if jogo_processado:
-                            jogos.append(jogo_processado)
-            
-            # Ordenar por relevância e horário
-            jogos.sort(key=lambda x: (
-                self.get_relevance_priority(x['relevancia_liga']),
-                x['horario'] if x['horario'] else '99:99'
-            ))
-            
-            return jogos
-            
-        except Exception as e:
-            print(f"❌ Erro ao processar jogos: {str(e)}")
-            return []
+            for jogo in iterar_jogos(response.iter_content(65536), self.processar_partida_individual, filtro):
+                yield jogo
+        finally:
+            response.close()
     
-    def processar_partida_individual(self, match, region_name, region_code, 
-                                   league_name, league_relevance, season_name):
+    def buscar_jogos_do_dia_stream(self, data=None, timezone_offset=-180, filtro=None):
         """
-        Processa uma partida individual
-        
-        Args:
-            match: Dados da partida
-            region_name: Nome da região
-            region_code: Código da região
-            league_name: Nome da liga
-            league_relevance: Relevância da liga
-            season_name: Nome da temporada
+        Busca jogos de uma data com o parser incremental e o filtro aplicado na leitura
         
         Returns:
-            dict: Dados processados da partida ou None
+            list: Jogos processados (mesma ordenação de processar_jogos) ou None
         """
         try:
-            # Extrair dados básicos
-            match_id = match.get('id', 'unknown')
-            home_team = match.get('homeTeam', {})
-            away_team = match.get('awayTeam', {})
+            print(f"🔍 Buscando jogos para {data or 'hoje'} (leitura incremental)...")
             
-            if not home_team or not away_team:
-                return None
+            jogos = list(self.iterar_jogos_do_dia(data, timezone_offset, filtro))
+            jogos.sort(key=lambda x: (
+                self.get_relevance_priority(x['relevancia_liga']),
+                x['horario'] if x['horario'] else '99:99'
+            ))
             
-            # Nomes dos times
-            home_name = home_team.get('name', 'Time Casa')
-            away_name = away_team.get('name', 'Time Visitante')
-            
-            # Horário da partida
-            match_time = match.get('matchTime', '')
-            status = match.get('status', 'scheduled')
-            
-            # Estatísticas estimadas baseadas na liga
-            stats_casa = self.estimar_estatisticas_time(home_team, league_relevance)
-            stats_visitante = self.estimar_estatisticas_time(away_team, league_relevance)
-            
-            # Placar (se jogo em andamento ou finalizado)
-            home_score = match.get('homeScore', 0)
-            away_score = match.get('awayScore', 0)
-            
-            return {
-                'id': match_id,
-                'time_casa': home_name,
-                'time_visitante': away_name,
-                'horario': self.formatar_horario(match_time),
-                'status': self.traduzir_status(status),
-                'placar_casa': home_score,
-                'placar_visitante': away_score,
-                'regiao': region_name,
-                'codigo_regiao': region_code,
-                'liga': league_name,
-                'relevancia_liga': league_relevance,
-                'temporada': season_name,
-                'stats_casa': stats_casa,
-                'stats_visitante': stats_visitante,
-                'atualizado_em': match.get('updatedAt', ''),
-            }
+            print(f"✅ {len(jogos)} jogos encontrados")
+            return jogos
             
+        except requests.exceptions.RequestException as e:
+            print(f"❌ Erro de conexão: {str(e)}")
+            return None
+        except json.JSONDecodeError as e:
+            print(f"❌ Erro ao decodificar JSON: {str(e)}")
+            return None
         except Exception as e:
-            print(f"❌ Erro ao processar partida individual: {str(e)}")
+            print(f"❌ Erro inesperado: {str(e)}")
             return None
     
-    def estimar_estatisticas_time(self, team_data, league_relevance):
-        """
-        Estima estatísticas do time baseado na liga e dados disponíveis
-        
-        Args:
-            team_data: Dados do time
-            league_relevance: Relevância da liga (high, medium, low)
-        
-        Returns:
-            dict: Estatísticas estimadas
-        """
-        # Médias base por relevância da liga
-        medias_base = {
-            'high': {'gols_marcados': 1.4, 'gols_sofridos': 1.2},
-            'medium': {'gols_marcados': 1.2, 'gols_sofridos': 1.1},
-            'low': {'gols_marcados': 1.0, 'gols_sofridos': 1.0}
-        }
-        
-        base = medias_base.get(league_relevance, medias_base['medium'])
-        
-        # Variação aleatória pequena para simular diferenças entre times
-        import random
-        variacao = random.uniform(0.85, 1.15)
-        
-        gols_marcados = round(base['gols_marcados'] * variacao, 2)
-        gols_sofridos = round(base['gols_sofridos'] * (2 - variacao), 2)  # Inverso para defesa
-        
-        media_liga = base['gols_marcados']
-        forca_ofensiva = round(gols_marcados / media_liga, 3)
-        forca_defensiva = round(gols_sofridos / media_liga, 3)
-        
-        return {
-            'gols_marcados': gols_marcados,
-            'gols_sofridos': gols_sofridos,
-            'forca_ofensiva': forca_ofensiva,
-            'forca_defensiva': forca_defensiva,
-            'media_liga': media_liga
-        }
-    
-    def formatar_horario(self, match_time):
-        """
-        Formata o horário da partida
-        
-        Args:
-            match_time: Horário bruto da API
-        
-        Returns:
-            str: Horário formatado
-        """
-        try:
-            if not match_time:
-                return ''
-            
-            # Tentar diferentes formatos de data
-            formatos = [
-                '%Y-%m-%dT%H:%M:%S.%fZ',
-                '%Y-%m-%dT%H:%M:%SZ',
-                '%Y-%m-%dT%H:%M:%S',
-                '%H:%M'
-            ]
-            
-            for formato in formatos:
-                try:
-                    dt = datetime.strptime(match_time, formato)
-                    return dt.strftime('%H:%M')
-                except ValueError:
-                    continue
-            
-            # Se não conseguir converter, retornar original
-            return str(match_time)[:5]
-            
-        except Exception:
-            return ''
-    
-    def traduzir_status(self, status):
-        """
-        Traduz o status da partida
-        
-        Args:
-            status: Status em inglês
-        
-        Returns:
-            str: Status traduzido
-        """
-        traducoes = {
-            'scheduled': 'Agendado',
-            'live': 'Ao Vivo',
-            'finished': 'Finalizado',
-            'postponed': 'Adiado',
-            'cancelled': 'Cancelado',
-            'interrupted': 'Interrompido'
-        }
-        
-        return traducoes.get(status, status.capitalize())
-    
     def buscar_partidas_hoje(self):
         """
         Busca partidas que estão acontecendo hoje
@@ -294,7 +306,7 @@ class RadarEsportivoAPI:
             url = f"{self.base_url}/public/results/{today}"
             print(f"📅 Buscando partidas de hoje...")
             
-            response = requests.get(url, timeout=10)
+            response = self._get('results', url, timeout=10, match_id=today)
             response.raise_for_status()
             
             data = response.json()
@@ -351,10 +363,7 @@ class RadarEsportivoAPI:
             
             print(f"🔍 Buscando estatísticas do time {field} - Match ID: {match_id} (modo: anyField)")
             
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self._get_json('goalRadar', url, params=params, timeout=10, match_id=match_id)
             
             if 'data' not in data:
                 print(f"❌ Dados não encontrados para match ID {match_id}")
@@ -374,93 +383,37 @@ class RadarEsportivoAPI:
             print(f"❌ Erro ao buscar estatísticas: {str(e)}")
             return None
     
-    def processar_estatisticas_time(self, data, field, mode):
+    def buscar_odds_detalhadas(self, match_id):
         """
-        Processa os dados estatísticos retornados pela API
-        
+        Busca odds detalhadas de uma partida (prepRadar)
+
         Args:
-            data: Dados da API goalRadar
-            field: Campo do time (home/away)
-            mode: Modo da busca (anyField)
-        
+            match_id: ID da partida
+
         Returns:
-            dict: Estatísticas processadas
+            dict: Odds e dados básicos da partida ou None
         """
         try:
-            dados_api = data['data']
-            match_count = data.get('matchCount', 10)
-            
-            # Extrair somas de gols
-            gols_marcados_total = dados_api['sums']['goalsScored']['fullTime']
-            gols_sofridos_total = dados_api['sums']['goalsConceded']['fullTime']
-            
-            # Calcular médias
-            media_gols_marcados = gols_marcados_total / match_count if match_count > 0 else 0
-            media_gols_sofridos = gols_sofridos_total / match_count if match_count > 0 else 0
-            
-            # Estatísticas adicionais dos counts
-            counts = dados_api.get('counts', {})
-            
-            # Análise de desempenho
-            vitorias = counts.get('won', {}).get('fullTime', 0)
-            empates = counts.get('drew', {}).get('fullTime', 0)
-            derrotas = counts.get('lost', {}).get('fullTime', 0)
-            
-            # Percentuais
-            perc_vitorias = (vitorias / match_count * 100) if match_count > 0 else 0
-            perc_empates = (empates / match_count * 100) if match_count > 0 else 0
-            perc_derrotas = (derrotas / match_count * 100) if match_count > 0 else 0
-            
-            # Análise de gols
-            jogos_sem_marcar = counts.get('failToScore', {}).get('fullTime', 0)
-            jogos_sem_sofrer = counts.get('cleanSheet', {}).get('fullTime', 0)
-            
-            # Mercados de gols (para análise adicional)
-            markets = counts.get('markets', {}).get('matchGoals', {})
-            over15 = markets.get('over15', 0)
-            over25 = markets.get('over25', 0)
-            btts = markets.get('btts', 0)  # Both Teams To Score
-            
-            # Forma recente (últimos jogos)
-            forma = dados_api.get('race', [])
-            
-            # Calcular força ofensiva e defensiva baseada na média da liga
-            media_liga_estimada = 1.2  # Estimativa padrão
-            forca_ofensiva = media_gols_marcados / media_liga_estimada if media_liga_estimada > 0 else 1
-            forca_defensiva = media_gols_sofridos / media_liga_estimada if media_liga_estimada > 0 else 1
-            
-            estatisticas = {
-                'match_id': data.get('matchId'),
-                'field': field,
-                'mode': mode,
-                'match_count': match_count,
-                'media_gols_marcados': round(media_gols_marcados, 2),
-                'media_gols_sofridos': round(media_gols_sofridos, 2),
-                'gols_marcados_total': gols_marcados_total,
-                'gols_sofridos_total': gols_sofridos_total,
-                'forca_ofensiva': round(forca_ofensiva, 3),
-                'forca_defensiva': round(forca_defensiva, 3),
-                'vitorias': vitorias,
-                'empates': empates,
-                'derrotas': derrotas,
-                'perc_vitorias': round(perc_vitorias, 1),
-                'perc_empates': round(perc_empates, 1),
-                'perc_derrotas': round(perc_derrotas, 1),
-                'jogos_sem_marcar': jogos_sem_marcar,
-                'jogos_sem_sofrer': jogos_sem_sofrer,
-                'over15_jogos': over15,
-                'over25_jogos': over25,
-                'btts_jogos': btts,
-                'forma_recente': forma[:5],  # Últimos 5 resultados
-                'updated_at': data.get('updatedAt')
-            }
-            
-            return estatisticas
-            
+            url = f"{self.base_url}/prepRadar/{match_id}"
+            data = self._get_json('prepRadar', url, timeout=10, match_id=match_id)
+
+            if 'marketOdds' in data:
+                return {
+                    'match_id': match_id,
+                    'start_time': data.get('startTime', ''),
+                    'odds': data['marketOdds'],
+                    'home_team': data.get('homeTeam', {}).get('name', ''),
+                    'away_team': data.get('awayTeam', {}).get('name', ''),
+                    'league': data.get('league', {}).get('name', ''),
+                    'status': data.get('status', 'not_started')
+                }
+
+            return None
+
         except Exception as e:
-            print(f"❌ Erro ao processar estatísticas: {str(e)}")
+            print(f"Erro ao buscar odds para match {match_id}: {e}")
             return None
-    
+
     def buscar_estatisticas_detalhadas_time(self, match_id):
         """
         Busca estatísticas detalhadas de ambos os times de um jogo específico
@@ -483,38 +436,9 @@ class RadarEsportivoAPI:
                 print("❌ Não foi possível obter estatísticas gerais")
                 return None
             
-            estatisticas_detalhadas = {
-                'match_id': match_id,
-                'time_casa': {
-                    'nome': stats_casa_geral.get('nome', 'Time Casa'),
-                    'geral': {
-                        'gols_marcados': stats_casa_geral['media_gols_marcados'],
-                        'gols_sofridos': stats_casa_geral['media_gols_sofridos'],
-                        'vitorias': stats_casa_geral['vitorias'],
-                        'empates': stats_casa_geral['empates'],
-                        'derrotas': stats_casa_geral['derrotas'],
-                        'btts': stats_casa_geral['btts_jogos'],
-                        'over15': stats_casa_geral['over15_jogos'],
-                        'over25': stats_casa_geral['over25_jogos'],
-                        'forma': stats_casa_geral['forma_recente']
-                    }
-                },
-                'time_visitante': {
-                    'nome': stats_visitante_geral.get('nome', 'Time Visitante'),
-                    'geral': {
-                        'gols_marcados': stats_visitante_geral['media_gols_marcados'],
-                        'gols_sofridos': stats_visitante_geral['media_gols_sofridos'],
-                        'vitorias': stats_visitante_geral['vitorias'],
-                        'empates': stats_visitante_geral['empates'],
-                        'derrotas': stats_visitante_geral['derrotas'],
-                        'btts': stats_visitante_geral['btts_jogos'],
-                        'over15': stats_visitante_geral['over15_jogos'],
-                        'over25': stats_visitante_geral['over25_jogos'],
-                        'forma': stats_visitante_geral['forma_recente']
-                    }
-                },
-                'timestamp': datetime.now().isoformat()
-            }
+            estatisticas_detalhadas = self.montar_estatisticas_detalhadas(
+                match_id, stats_casa_geral, stats_visitante_geral
+            )
             
             print(f"✅ Estatísticas detalhadas obtidas com sucesso")
             return estatisticas_detalhadas
@@ -562,54 +486,97 @@ class RadarEsportivoAPI:
             print(f"❌ Erro ao buscar estatísticas do confronto: {str(e)}")
             return None
     
-    def buscar_varias_datas(self, data_inicio, data_fim):
+    def iterar_varias_datas(self, data_inicio, data_fim, diretorio_cache=None, max_paralelo=4):
+        """
+        Busca jogos de um intervalo de datas em paralelo, entregando cada dia assim que termina
+        (a vazão real é definida pelo orçamento do dailyRadar no limitador)
+        
+        Args:
+            data_inicio: Data de início (YYYY-MM-DD)
+            data_fim: Data de fim (YYYY-MM-DD)
+            diretorio_cache: Se informado, grava cada dia em jogos_YYYY-MM-DD.json ao chegar
+            max_paralelo: Máximo de dias buscados ao mesmo tempo
+        
+        Yields:
+            tuple: (data, jogos) na ordem de conclusão; jogos é None se o dia falhou
+        """
+        inicio = datetime.strptime(data_inicio, '%Y-%m-%d')
+        fim = datetime.strptime(data_fim, '%Y-%m-%d')
+        datas = [(inicio + timedelta(days=i)).strftime('%Y-%m-%d') for i in range((fim - inicio).days + 1)]
+        if not datas:
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=max(1, min(max_paralelo, len(datas))))
+        try:
+            futures = {executor.submit(self.buscar_jogos_do_dia, data): data for data in datas}
+            for future in as_completed(futures):
+                data = futures[future]
+                try:
+                    jogos = future.result()
+                except Exception as e:
+                    print(f"❌ Erro ao buscar jogos de {data}: {str(e)}")
+                    jogos = None
+                
+                if jogos is not None and diretorio_cache:
+                    try:
+                        salvar_cache_jogos(diretorio_cache, data, jogos)
+                    except OSError as e:
+                        print(f"⚠️ Erro ao gravar cache de {data}: {str(e)}")
+                
+                yield data, jogos
+        finally:
+            # Consumidor interrompeu a iteração: não iniciar os dias restantes
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def buscar_varias_datas(self, data_inicio, data_fim, diretorio_cache=None):
         """
         Busca jogos em um intervalo de datas
         
         Args:
             data_inicio: Data de início (YYYY-MM-DD)
             data_fim: Data de fim (YYYY-MM-DD)
+            diretorio_cache: Se informado, grava cada dia no cache ao chegar
         
         Returns:
             dict: Jogos organizados por data
         """
         try:
-            inicio = datetime.strptime(data_inicio, '%Y-%m-%d')
-            fim = datetime.strptime(data_fim, '%Y-%m-%d')
-            
             jogos_por_data = {}
-            data_atual = inicio
             
-            while data_atual <= fim:
-                data_str = data_atual.strftime('%Y-%m-%d')
-                jogos = self.buscar_jogos_do_dia(data_str)
-                
+            for data_str, jogos in self.iterar_varias_datas(data_inicio, data_fim, diretorio_cache):
                 if jogos:
                     jogos_por_data[data_str] = jogos
-                
-                data_atual += timedelta(days=1)
-                time.sleep(0.5)  # Pausa entre requisições
             
-            return jogos_por_data
+            return dict(sorted(jogos_por_data.items()))
             
         except Exception as e:
             print(f"❌ Erro ao buscar várias datas: {str(e)}")
             return {}
     
-    def get_relevance_priority(self, relevance):
-        """
-        Converte relevância em prioridade numérica para ordenação
-        
-        Args:
-            relevance: Relevância da liga
-        
-        Returns:
-            int: Prioridade (menor = maior relevância)
-        """
-        priorities = {
-            'high': 1,
-            'medium': 2,
-            'low': 3
-        }
-        
-        return priorities.get(relevance, 4)
+    def resumo_conexoes(self):
+        """Texto com as estatísticas do pool de conexões (abertas/reaproveitadas/em espera)"""
+        return self.transporte.formatar_resumo()
+
+    def versao_partida(self, match_id):
+        """Versão dos payloads da partida; só muda quando odds/estatísticas mudam"""
+        return self.cache_http.versao_partida(match_id)
+
+    def iniciar_revalidacao(self):
+        """Começa uma rodada de revalidação (ex.: atualização forçada)"""
+        self.cache_http.iniciar_rodada()
+
+    def partidas_alteradas(self):
+        """IDs de partidas com payload alterado desde iniciar_revalidacao()"""
+        return self.cache_http.partidas_alteradas()
+
+    def resumo_revalidacao(self):
+        """Texto com 304s, bytes economizados e payloads alterados"""
+        return self.cache_http.formatar_resumo()
+
+    def resumo_erros(self):
+        """Falhas definitivas pendentes por endpoint/tipo"""
+        return self.erros.resumo()
+
+    def resumo_limitador(self):
+        """Texto com o limite AIMD atual e as sobrecargas por endpoint"""
+        return self.limitador.formatar_resumo()
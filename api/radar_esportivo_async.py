@@ -0,0 +1,510 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cliente assíncrono (asyncio + aiohttp) para a API Radar Esportivo
+Mesma interface de busca do RadarEsportivoAPI, com concorrência limitada por
+um semáforo por endpoint, pelo LimitadorRadar e por um limite de conexões por host
+"""
+
+import asyncio
+import contextvars
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+
+import requests
+
+try:
+    import aiohttp
+except ImportError:  # Dependência opcional
+    aiohttp = None
+
+from api.cache_condicional import CacheCondicional
+from api.cache_jogos import salvar_cache_jogos
+from api.gravacao import RespostaGravada
+from api.limitador import LimitadorRadar
+from api.processador_radar import ProcessadorRadar
+from api.radar_esportivo_api import HEADERS_PADRAO, BASE_URL_PADRAO, VARIAVEL_BASE_URL, POLITICAS_PADRAO
+from api.retentativas import Prazo, ErroRadar, ExecucaoRetentativa, RegistroErros
+
+
+async def aguardar_prazo(prazo, segundos):
+    """
+    Versão assíncrona de Prazo.aguardar: dorme até `segundos` sem bloquear o loop,
+    acordando antes se o prazo for cancelado
+
+    Returns:
+        True se o prazo continua válido ao acordar
+    """
+    fim = time.monotonic() + segundos
+    while not prazo.cancelado():
+        falta = fim - time.monotonic()
+        if falta <= 0:
+            break
+        await asyncio.sleep(min(falta, Prazo.FATIA_ESPERA))
+    return not prazo.esgotado()
+
+
+class RadarEsportivoAPIAsync:
+    """
+    Cliente assíncrono da API Radar Esportivo
+
+    Mesmas políticas de retentativa, GET condicional, registro de erros e prazos
+    do cliente síncrono (ExecucaoRetentativa, CacheCondicional, RegistroErros, Prazo)
+
+    Uso:
+        async with RadarEsportivoAPIAsync(max_concorrencia=50) as api:
+            jogos = await api.buscar_jogos_do_dia('2025-08-26')
+    """
+
+    def __init__(self, base_url=None, max_concorrencia=50, limite_por_host=20, timeout=10, limitador=None,
+                 diretorio_cache_http=None):
+        """
+        Args:
+            base_url: URL base da API (padrão: $RADAR_ESPORTIVO_BASE_URL ou BASE_URL_PADRAO)
+            max_concorrencia: Máximo de requisições simultâneas (por endpoint e no total)
+            limite_por_host: Máximo de conexões TCP abertas por host
+            timeout: Timeout total de cada requisição em segundos
+            limitador: LimitadorRadar a usar (padrão: um novo, com teto = conexões utilizáveis)
+            diretorio_cache_http: Pasta para persistir payloads e validadores (padrão: só memória)
+        """
+        if aiohttp is None:
+            raise ImportError("O cliente assíncrono requer o pacote 'aiohttp' (pip install aiohttp)")
+
+        self.max_concorrencia = max_concorrencia
+        self.limite_por_host = limite_por_host
+        self.timeout = timeout
+
+        self.base_url = (base_url or os.environ.get(VARIAVEL_BASE_URL) or BASE_URL_PADRAO).rstrip('/')
+        # Mesmo processamento (parse/normalização) do cliente síncrono, sem transporte próprio
+        self.processador = ProcessadorRadar()
+        # Mesmos orçamentos por endpoint do cliente síncrono; o teto é o número de conexões
+        # que podem estar abertas com o host (acima disso a requisição esperaria no conector)
+        self.limitador = limitador or LimitadorRadar(max_concorrencia=min(max_concorrencia, limite_por_host))
+        self.politicas = dict(POLITICAS_PADRAO)
+        self.erros = RegistroErros()
+        self.cache_http = CacheCondicional(diretorio_cache_http)
+        self.prazo_lote = None
+        # Prazo da partida em análise na tarefa atual (herdado pelas tarefas filhas do gather)
+        self._prazo_tarefa = contextvars.ContextVar('prazo_tarefa', default=None)
+
+        self._session = None
+        self._semaforos = {}
+        self._vagas = None
+
+    async def __aenter__(self):
+        await self._obter_sessao()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.fechar()
+
+    async def _obter_sessao(self):
+        """Cria a sessão aiohttp (e as primitivas asyncio) dentro do loop em execução"""
+        if self._session is None or self._session.closed:
+            conector = aiohttp.TCPConnector(limit=self.max_concorrencia, limit_per_host=self.limite_por_host)
+            self._session = aiohttp.ClientSession(
+                headers=HEADERS_PADRAO,
+                connector=conector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self._semaforos = {}
+            self._vagas = asyncio.Condition()
+        return self._session
+
+    async def fechar(self):
+        """Fecha a sessão e libera as conexões"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def iniciar_lote(self, segundos):
+        """Define um prazo total para todas as chamadas de um lote (ex.: análise do dia)"""
+        self.prazo_lote = Prazo(segundos)
+        return self.prazo_lote
+
+    def encerrar_lote(self):
+        """Remove o prazo do lote atual"""
+        self.prazo_lote = None
+
+    def resumo_erros(self):
+        """Falhas definitivas pendentes por endpoint/tipo"""
+        return self.erros.resumo()
+
+    async def executar_com_prazo(self, prazo, coro):
+        """
+        Aguarda `coro` com todas as chamadas dela (e das tarefas que criar) limitadas por `prazo`
+        (prazo por partida; cancelar o prazo interrompe esperas e retentativas)
+        """
+        token = self._prazo_tarefa.set(prazo)
+        try:
+            return await coro
+        finally:
+            self._prazo_tarefa.reset(token)
+
+    async def _adquirir_vaga(self, endpoint, prazo, fim):
+        """
+        Aguarda vaga no limitador (AIMD do endpoint + teto global) sem bloquear o loop
+
+        Raises:
+            ErroRadar: 'prazo' ou 'cancelado' se o prazo acabar na fila
+        """
+        async with self._vagas:
+            # Os limites só mudam em _liberar_vaga(), que acorda os que esperam;
+            # o tempo máximo de espera só serve para perceber o cancelamento do prazo
+            while not self.limitador.tentar_adquirir(endpoint):
+                falta = min(fim - time.monotonic(), prazo.restante())
+                if falta <= 0:
+                    raise self.limitador.desistencia(endpoint, prazo)
+                try:
+                    await asyncio.wait_for(self._vagas.wait(), min(falta, Prazo.FATIA_ESPERA))
+                except asyncio.TimeoutError:
+                    pass
+
+    async def _liberar_vaga(self, endpoint, enviada, sobrecarga):
+        """Libera a vaga, ajusta o limitador e acorda as corrotinas na fila"""
+        self.limitador.liberar(endpoint, enviada, sobrecarga)
+        async with self._vagas:
+            self._vagas.notify_all()
+
+    async def _enviar(self, endpoint, url, params, headers, prazo, segundos):
+        """
+        Uma tentativa: GET limitado pelo orçamento e pelo limite AIMD do endpoint
+        e pelo teto global do limitador
+
+        Returns:
+            RespostaGravada com status < 400 (ou 304) e o corpo já lido
+
+        Raises:
+            ErroRadar: O limitador desistiu antes de enviar (prazo/cancelamento)
+            requests.exceptions.RequestException: Timeout, conexão ou status HTTP de erro,
+                convertidos para a mesma classificação/política do cliente síncrono
+        """
+        session = await self._obter_sessao()
+        fim = time.monotonic() + segundos
+        # Como no cliente síncrono: primeiro o token (a espera não ocupa vagas), depois as vagas
+        balde = self.limitador.balde(endpoint)
+        espera = balde.reservar()
+        if espera > fim - time.monotonic() or not await aguardar_prazo(prazo, espera):
+            balde.devolver()
+            raise self.limitador.desistencia(endpoint, prazo)
+        try:
+            await self._adquirir_vaga(endpoint, prazo, fim)
+        except ErroRadar:
+            balde.devolver()
+            raise
+        sobrecarga = True
+        try:
+            inicio = time.monotonic()
+            limite = aiohttp.ClientTimeout(total=max(0.001, min(self.timeout, fim - time.monotonic())))
+            async with session.get(url, params=params, headers=headers, timeout=limite) as response:
+                resposta = RespostaGravada(str(response.url), response.status, dict(response.headers),
+                                           await response.read())
+            sobrecarga = self.limitador.registrar_resposta(endpoint, resposta, time.monotonic() - inicio, espera)
+            if resposta.status_code >= 400:
+                raise requests.exceptions.HTTPError(f"{resposta.status_code} para {resposta.url}",
+                                                    response=resposta)
+            return resposta
+        except asyncio.TimeoutError as e:
+            raise requests.exceptions.Timeout(f"timeout em {url}") from e
+        except aiohttp.ClientError as e:
+            raise requests.exceptions.ConnectionError(str(e) or type(e).__name__) from e
+        finally:
+            await self._liberar_vaga(endpoint, True, sobrecarga)
+
+    async def _get(self, endpoint, url, params=None, match_id=None, headers=None):
+        """
+        GET com retentativas (backoff exponencial + jitter) dentro do prazo da chamada/lote
+
+        Raises:
+            ErroRadar: Falha definitiva, também registrada em self.erros
+        """
+        await self._obter_sessao()
+        if endpoint not in self._semaforos:
+            self._semaforos[endpoint] = asyncio.Semaphore(self.max_concorrencia)
+        # O semáforo faz o papel dos workers do cliente síncrono: o prazo da chamada só
+        # começa quando ela é admitida, não enquanto espera atrás das outras do endpoint
+        async with self._semaforos[endpoint]:
+            politica = self.politicas.get(endpoint, self.politicas['results'])
+            prazo = Prazo(politica.prazo, pai=self._prazo_tarefa.get())
+            execucao = ExecucaoRetentativa(endpoint, match_id, politica, prazo, self.prazo_lote)
+
+            while True:
+                restante = execucao.proxima()
+                if restante is None:
+                    break
+                try:
+                    resposta = await self._enviar(endpoint, url, params, headers, prazo, restante)
+                    self.erros.limpar(endpoint, match_id)
+                    return resposta
+                except ErroRadar as e:
+                    execucao.desistencia(e)
+                    break
+                except requests.exceptions.RequestException as e:
+                    espera = execucao.falha(e)
+                    if espera is None:
+                        break
+                await aguardar_prazo(prazo, espera)
+
+        self.erros.registrar(execucao.erro)
+        raise execucao.erro
+
+    async def _get_json(self, endpoint, url, params=None, match_id=None):
+        """
+        GET condicional (mesmo CacheCondicional do cliente síncrono): só decodifica
+        o JSON quando o conteúdo mudou
+
+        Returns:
+            JSON decodificado (o mesmo objeto em cache quando não houve mudança)
+        """
+        cabecalhos = self.cache_http.cabecalhos_condicionais(url, params)
+        resposta = await self._get(endpoint, url, params=params, match_id=match_id, headers=cabecalhos)
+        dados, _ = self.cache_http.registrar_resposta(match_id, url, params, resposta)
+        if dados is None and resposta.status_code == 304:
+            # Entrada descartada da memória entre o pedido e o 304: busca o payload inteiro
+            resposta = await self._get(endpoint, url, params=params, match_id=match_id)
+            dados, _ = self.cache_http.registrar_resposta(match_id, url, params, resposta)
+        return dados
+
+    async def buscar_jogos_do_dia(self, data=None, timezone_offset=-180):
+        """
+        Busca jogos de uma data específica
+
+        Args:
+            data: Data no formato YYYY-MM-DD (padrão: hoje)
+            timezone_offset: Offset do timezone em minutos (padrão: -180 para UTC-3)
+
+        Returns:
+            list: Jogos processados, ou None se o dailyRadar falhou (falha em self.erros)
+        """
+        try:
+            if data is None:
+                data = datetime.now().strftime('%Y-%m-%d')
+
+            print(f"🔍 Buscando jogos para {data} (async)...")
+
+            data_response = await self._get_json('dailyRadar', f"{self.base_url}/dailyRadar/{data}",
+                                                 params={'mOffset': timezone_offset}, match_id=data)
+
+            if 'dailyRadar' not in data_response:
+                print("❌ Resposta da API não contém dados esperados")
+                return None
+
+            jogos_processados = self.processador.processar_jogos(data_response['dailyRadar'])
+
+            print(f"✅ {len(jogos_processados)} jogos encontrados")
+            return jogos_processados
+
+        except requests.exceptions.RequestException as e:
+            # Falha definitiva (após retentativas), também registrada em self.erros
+            print(f"❌ Erro de conexão: {str(e)}")
+            return None
+        except json.JSONDecodeError as e:
+            print(f"❌ Erro ao decodificar JSON: {str(e)}")
+            return None
+        except Exception as e:
+            print(f"❌ Erro inesperado: {str(e)}")
+            return None
+
+    async def buscar_estatisticas_time(self, match_id, field='home', window='last10'):
+        """
+        Busca estatísticas reais de um time (goalRadar)
+
+        Args:
+            match_id: ID da partida
+            field: 'home' ou 'away'
+            window: 'last10' para últimos 10 jogos
+
+        Returns:
+            dict: Estatísticas calculadas do time ou None
+        """
+        try:
+            params = {'field': field, 'window': window, 'mode': 'anyField'}
+            data = await self._get_json('goalRadar', f"{self.base_url}/goalRadar/{match_id}", params=params,
+                                        match_id=match_id)
+
+            if 'data' not in data:
+                print(f"❌ Dados não encontrados para match ID {match_id}")
+                return None
+
+            return self.processador.processar_estatisticas_time(data, field, 'anyField')
+
+        except requests.exceptions.RequestException as e:
+            print(f"❌ Erro de conexão ao buscar estatísticas ({match_id}/{field}): {str(e)}")
+            return None
+        except Exception as e:
+            print(f"❌ Erro ao buscar estatísticas: {str(e)}")
+            return None
+
+    async def buscar_estatisticas_detalhadas_time(self, match_id):
+        """
+        Busca estatísticas detalhadas de ambos os times, casa e visitante em paralelo
+
+        Args:
+            match_id: ID da partida
+
+        Returns:
+            dict: Estatísticas detalhadas dos times ou None
+        """
+        stats_casa, stats_visitante = await asyncio.gather(
+            self.buscar_estatisticas_time(match_id, 'home'),
+            self.buscar_estatisticas_time(match_id, 'away')
+        )
+
+        if not stats_casa or not stats_visitante:
+            print(f"❌ Não foi possível obter estatísticas gerais ({match_id})")
+            return None
+
+        return self.processador.montar_estatisticas_detalhadas(match_id, stats_casa, stats_visitante)
+
+    async def buscar_odds_detalhadas(self, match_id):
+        """
+        Busca odds detalhadas de uma partida (prepRadar)
+
+        Args:
+            match_id: ID da partida
+
+        Returns:
+            dict: Odds e dados básicos da partida ou None
+        """
+        try:
+            data = await self._get_json('prepRadar', f"{self.base_url}/prepRadar/{match_id}", match_id=match_id)
+
+            if 'marketOdds' in data:
+                return {
+                    'match_id': match_id,
+                    'start_time': data.get('startTime', ''),
+                    'odds': data['marketOdds'],
+                    'home_team': data.get('homeTeam', {}).get('name', ''),
+                    'away_team': data.get('awayTeam', {}).get('name', ''),
+                    'league': data.get('league', {}).get('name', ''),
+                    'status': data.get('status', 'not_started')
+                }
+
+            return None
+
+        except Exception as e:
+            print(f"Erro ao buscar odds para match {match_id}: {str(e) or type(e).__name__}")
+            return None
+
+    async def buscar_dados_partida(self, match_id):
+        """
+        Busca odds e estatísticas de uma partida (3 requisições em paralelo)
+
+        Returns:
+            tuple: (odds_detalhadas, estatisticas_detalhadas)
+        """
+        return await asyncio.gather(
+            self.buscar_odds_detalhadas(match_id),
+            self.buscar_estatisticas_detalhadas_time(match_id)
+        )
+
+    async def buscar_dados_partidas(self, match_ids):
+        """
+        Busca odds e estatísticas de várias partidas de uma vez
+
+        Args:
+            match_ids: Lista de IDs de partidas
+
+        Returns:
+            dict: match_id -> (odds_detalhadas, estatisticas_detalhadas)
+        """
+        resultados = await asyncio.gather(*(self.buscar_dados_partida(match_id) for match_id in match_ids))
+        return dict(zip(match_ids, resultados))
+
+    async def iterar_varias_datas(self, data_inicio, data_fim, diretorio_cache=None):
+        """
+        Busca um intervalo de datas concorrentemente, entregando cada dia ao concluir
+
+        Uso:
+            async for data, jogos in api.iterar_varias_datas('2025-08-01', '2025-08-31'):
+                ...
+
+        Args:
+            data_inicio: Data de início (YYYY-MM-DD)
+            data_fim: Data de fim (YYYY-MM-DD)
+            diretorio_cache: Se informado, grava cada dia em jogos_YYYY-MM-DD.json ao chegar
+
+        Yields:
+            tuple: (data, jogos) na ordem de conclusão; jogos é None se o dia falhou
+        """
+        inicio = datetime.strptime(data_inicio, '%Y-%m-%d')
+        fim = datetime.strptime(data_fim, '%Y-%m-%d')
+        datas = [(inicio + timedelta(days=i)).strftime('%Y-%m-%d') for i in range((fim - inicio).days + 1)]
+
+        async def buscar(data):
+            return data, await self.buscar_jogos_do_dia(data)
+
+        tarefas = [asyncio.ensure_future(buscar(data)) for data in datas]
+        try:
+            for proxima in asyncio.as_completed(tarefas):
+                data, jogos = await proxima
+                if jogos is not None and diretorio_cache:
+                    try:
+                        salvar_cache_jogos(diretorio_cache, data, jogos)
+                    except OSError as e:
+                        print(f"⚠️ Erro ao gravar cache de {data}: {str(e)}")
+                yield data, jogos
+        finally:
+            for tarefa in tarefas:
+                tarefa.cancel()
+
+
+class RadarEsportivoAPISincrona:
+    """
+    Fachada síncrona sobre o RadarEsportivoAPIAsync para o código Tk
+    Um único loop asyncio roda em thread própria; os métodos bloqueiam até o resultado
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Args:
+            **kwargs: Repassados para RadarEsportivoAPIAsync
+        """
+        self.cliente = RadarEsportivoAPIAsync(**kwargs)
+        self.base_url = self.cliente.base_url
+        self.erros = self.cliente.erros
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def _executar(self, coro, timeout=None):
+        """Executa a corrotina no loop da fachada e aguarda o resultado"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout)
+
+    def buscar_jogos_do_dia(self, data=None, timezone_offset=-180):
+        return self._executar(self.cliente.buscar_jogos_do_dia(data, timezone_offset))
+
+    def buscar_estatisticas_time(self, match_id, field='home', window='last10'):
+        return self._executar(self.cliente.buscar_estatisticas_time(match_id, field, window))
+
+    def buscar_estatisticas_detalhadas_time(self, match_id):
+        return self._executar(self.cliente.buscar_estatisticas_detalhadas_time(match_id))
+
+    def buscar_odds_detalhadas(self, match_id):
+        return self._executar(self.cliente.buscar_odds_detalhadas(match_id))
+
+    def buscar_dados_partidas(self, match_ids):
+        return self._executar(self.cliente.buscar_dados_partidas(match_ids))
+
+    def iniciar_lote(self, segundos):
+        return self.cliente.iniciar_lote(segundos)
+
+    def encerrar_lote(self):
+        self.cliente.encerrar_lote()
+
+    def resumo_erros(self):
+        return self.cliente.resumo_erros()
+
+    def montar_estatisticas_detalhadas(self, match_id, stats_casa_geral, stats_visitante_geral):
+        return self.cliente.processador.montar_estatisticas_detalhadas(match_id, stats_casa_geral, stats_visitante_geral)
+
+    def fechar(self):
+        """Fecha a sessão HTTP e encerra o loop da fachada"""
+        try:
+            self._executar(self.cliente.fechar(), timeout=5)
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Política de retentativas para a API Radar Esportivo
+Retentativas de GET (idempotente) com backoff exponencial e jitter, prazo
+total por chamada e por lote, e registro estruturado das falhas por partida
+"""
+
+import random
+import threading
+import time
+
+import requests
+
+
+class Prazo:
+    """
+    Prazo absoluto (deadline) compartilhável entre chamadas e threads
+
+    Também serve de sinal de cancelamento cooperativo: cancelar() esgota o prazo
+    na hora, e prazos filhos (pai=...) se esgotam junto com o pai
+    """
+
+    # Fatia máxima de espera em aguardar(), para perceber cancelamentos do pai
+    FATIA_ESPERA = 0.1
+
+    def __init__(self, segundos, pai=None):
+        """
+        Args:
+            segundos: Duração do prazo a partir de agora
+            pai: Prazo que limita este (ex.: prazo do lote para o prazo de uma partida)
+        """
+        self.segundos = segundos
+        self.limite = time.monotonic() + segundos
+        self.pai = pai
+        self.motivo = None
+        self._cancelado = threading.Event()
+
+    def cancelar(self, motivo='cancelado'):
+        """Esgota o prazo imediatamente (e o de todos os filhos)"""
+        if not self._cancelado.is_set():
+            self.motivo = motivo
+            self._cancelado.set()
+
+    def cancelado(self):
+        return self._cancelado.is_set() or (self.pai is not None and self.pai.cancelado())
+
+    def motivo_cancelamento(self):
+        """Motivo do cancelamento (próprio ou herdado do pai) ou None"""
+        if self._cancelado.is_set():
+            return self.motivo
+        return self.pai.motivo_cancelamento() if self.pai is not None else None
+
+    def restante(self):
+        """Segundos restantes (nunca negativo)"""
+        if self.cancelado():
+            return 0.0
+        restante = max(0.0, self.limite - time.monotonic())
+        if self.pai is not None:
+            restante = min(restante, self.pai.restante())
+        return restante
+
+    def esgotado(self):
+        return self.restante() <= 0
+
+    def aguardar(self, segundos):
+        """
+        Dorme até `segundos`, acordando antes se o prazo for cancelado
+
+        Returns:
+            True se o prazo continua válido ao acordar
+        """
+        fim = time.monotonic() + segundos
+        while not self.cancelado():
+            falta = fim - time.monotonic()
+            if falta <= 0:
+                break
+            self._cancelado.wait(min(falta, self.FATIA_ESPERA))
+        return not self.esgotado()
+
+
+class PoliticaRetentativa:
+    """Configuração de retentativas de um endpoint"""
+
+    STATUS_REPETIVEIS = (429, 500, 502, 503, 504)
+
+    def __init__(self, tentativas=3, espera_base=0.25, espera_maxima=4.0, prazo=20.0,
+                 status_repetiveis=STATUS_REPETIVEIS):
+        """
+        Args:
+            tentativas: Número máximo de tentativas (1 = sem retentativa)
+            espera_base: Espera antes da 2ª tentativa em segundos (dobra a cada nova falha)
+            espera_maxima: Teto da espera entre tentativas
+            prazo: Tempo total máximo da chamada, somando todas as tentativas
+            status_repetiveis: Status HTTP que justificam nova tentativa
+        """
+        self.tentativas = tentativas
+        self.espera_base = espera_base
+        self.espera_maxima = espera_maxima
+        self.prazo = prazo
+        self.status_repetiveis = tuple(status_repetiveis)
+
+    def espera(self, tentativa):
+        """Backoff exponencial com "full jitter" (evita rajadas sincronizadas)"""
+        teto = min(self.espera_maxima, self.espera_base * (2 ** (tentativa - 1)))
+        return random.uniform(0, teto)
+
+    def repetivel(self, erro):
+        """Indica se a falha é transitória"""
+        if isinstance(erro, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+            return True
+        if isinstance(erro, requests.exceptions.HTTPError) and erro.response is not None:
+            return erro.response.status_code in self.status_repetiveis
+        return False
+
+
+class ExecucaoRetentativa:
+    """
+    Estado das tentativas de uma chamada, compartilhado pelos clientes síncrono e assíncrono
+
+    O cliente envia o GET e espera entre tentativas do seu jeito (thread ou corrotina);
+    esta classe decide se tenta de novo, quanto esperar e qual ErroRadar levantar no fim
+    """
+
+    def __init__(self, endpoint, match_id, politica, prazo, prazo_lote=None):
+        """
+        Args:
+            endpoint: Endpoint chamado
+            match_id: ID da partida (ou data, no dailyRadar)
+            politica: PoliticaRetentativa do endpoint
+            prazo: Prazo da chamada (normalmente filho do prazo da partida)
+            prazo_lote: Prazo total do lote, se houver
+        """
+        self.endpoint = endpoint
+        self.match_id = match_id
+        self.politica = politica
+        self.prazo = prazo
+        self.prazo_lote = prazo_lote
+        self.tentativa = 0
+        self.erro = None
+
+    def _restante(self):
+        restante = self.prazo.restante()
+        if self.prazo_lote is not None:
+            restante = min(restante, self.prazo_lote.restante())
+        return restante
+
+    def proxima(self):
+        """
+        Começa uma nova tentativa
+
+        Returns:
+            Segundos disponíveis para ela, ou None se o prazo (da chamada ou do lote) acabou
+
+        Raises:
+            ErroRadar: 'cancelado' se o prazo foi cancelado
+        """
+        restante = self._restante()
+        if restante <= 0:
+            motivo = self.prazo.motivo_cancelamento()
+            if motivo:
+                # Cancelamento não é falha da API: não vai para o registro de erros
+                raise ErroRadar(self.endpoint, self.match_id, 'cancelado', motivo, tentativas=self.tentativa)
+            self.erro = ErroRadar(self.endpoint, self.match_id, 'prazo', 'prazo esgotado', tentativas=self.tentativa)
+            return None
+        self.tentativa += 1
+        return restante
+
+    def desistencia(self, erro):
+        """
+        O limitador desistiu antes de enviar (prazo esgotado ou cancelado na fila)
+
+        Raises:
+            ErroRadar: 'cancelado', com o endpoint/partida desta chamada
+        """
+        if erro.tipo == 'cancelado':
+            raise ErroRadar(self.endpoint, self.match_id, 'cancelado', erro.mensagem, tentativas=self.tentativa - 1)
+        self.erro = ErroRadar(self.endpoint, self.match_id, 'prazo', erro.mensagem, tentativas=self.tentativa - 1)
+
+    def falha(self, erro):
+        """
+        Registra a exceção (do requests) da tentativa atual
+
+        Returns:
+            Segundos a esperar antes da próxima tentativa, ou None para desistir
+        """
+        self.erro = ErroRadar.de_excecao(self.endpoint, self.match_id, erro, self.tentativa)
+        if self.tentativa >= self.politica.tentativas or not self.politica.repetivel(erro):
+            return None
+        espera = self.politica.espera(self.tentativa)
+        if espera >= self._restante():
+            return None
+        return espera
+
+
+class ErroRadar(requests.exceptions.RequestException):
+    """
+    Falha definitiva de uma chamada (após retentativas)
+    Subclasse de RequestException para continuar compatível com os tratamentos existentes
+    """
+
+    def __init__(self, endpoint, match_id, tipo, mensagem, status=None, tentativas=1):
+        """
+        Args:
+            endpoint: Endpoint chamado ('prepRadar', 'goalRadar', ...)
+            match_id: ID da partida (ou data, no dailyRadar)
+            tipo: 'timeout', 'conexao', 'http', 'prazo', 'cancelado' ou 'desconhecido'
+            mensagem: Descrição do último erro
+            status: Status HTTP da última resposta, se houver
+            tentativas: Tentativas realizadas
+        """
+        super().__init__(f"{endpoint} {match_id}: {tipo} após {tentativas} tentativa(s) - {mensagem}")
+        self.endpoint = endpoint
+        self.match_id = match_id
+        self.tipo = tipo
+        self.mensagem = mensagem
+        self.status = status
+        self.tentativas = tentativas
+        self.ocorrido_em = time.time()
+
+    @classmethod
+    def de_excecao(cls, endpoint, match_id, erro, tentativas):
+        """Classifica uma exceção do requests em um ErroRadar"""
+        status = None
+        if isinstance(erro, requests.exceptions.Timeout):
+            tipo = 'timeout'
+        elif isinstance(erro, requests.exceptions.ConnectionError):
+            tipo = 'conexao'
+        elif isinstance(erro, requests.exceptions.HTTPError):
+            tipo = 'http'
+            status = erro.response.status_code if erro.response is not None else None
+        else:
+            tipo = 'desconhecido'
+        return cls(endpoint, match_id, tipo, str(erro), status=status, tentativas=tentativas)
+
+    def como_dict(self):
+        """Representação serializável (cache JSON)"""
+        return {
+            'endpoint': self.endpoint,
+            'match_id': self.match_id,
+            'tipo': self.tipo,
+            'status': self.status,
+            'tentativas': self.tentativas,
+            'mensagem': self.mensagem
+        }
+
+
+class RegistroErros:
+    """Últimas falhas definitivas por (endpoint, match_id), thread-safe"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._erros = {}
+
+    def registrar(self, erro):
+        with self._lock:
+            self._erros[(erro.endpoint, str(erro.match_id))] = erro
+
+    def limpar(self, endpoint, match_id):
+        """Remove a falha após uma chamada bem-sucedida"""
+        with self._lock:
+            self._erros.pop((endpoint, str(match_id)), None)
+
+    def erros_partida(self, match_id):
+        """Falhas pendentes de uma partida"""
+        with self._lock:
+            return [erro for (endpoint, mid), erro in self._erros.items() if mid == str(match_id)]
+
+    def ids_com_falha(self, endpoints=None):
+        """IDs de partidas com alguma falha pendente (opcionalmente só de certos endpoints)"""
+        with self._lock:
+            return {mid for (endpoint, mid) in self._erros if endpoints is None or endpoint in endpoints}
+
+    def resumo(self):
+        """Contagem de falhas pendentes por endpoint e tipo"""
+        with self._lock:
+            contagem = {}
+            for erro in self._erros.values():
+                chave = f"{erro.endpoint}/{erro.tipo}"
+                contagem[chave] = contagem.get(chave, 0) + 1
+            return contagem
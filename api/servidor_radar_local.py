@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Servidor local que imita a API Radar Esportivo (dailyRadar, prepRadar, goalRadar)
+Para benchmarks e testes sem rede: latência, taxa de erro e tamanho dos
+payloads configuráveis; responde com fixtures gravadas ou dados sintéticos
+
+Uso:
+    python -m api.servidor_radar_local --porta 8765 --partidas 2000 --latencia 0.05
+    RADAR_ESPORTIVO_BASE_URL=http://127.0.0.1:8765 python src/bet_booster_v2.py
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+from api.dados_sinteticos import gerar_daily_radar, gerar_prep_radar, gerar_goal_radar, indexar_partidas
+
+
+class ServidorRadarLocal:
+    """
+    Servidor HTTP em thread própria
+
+    Uso:
+        with ServidorRadarLocal(total_partidas=2000, latencia=0.02) as servidor:
+            api = RadarEsportivoAPI(base_url=servidor.url_base)
+    """
+
+    def __init__(self, porta=0, total_partidas=2000, latencia=0.0, variacao_latencia=0.0,
+                 taxa_erro=0.0, status_erro=503, bytes_extras=0, semente=42, diretorio_fixtures=None):
+        """
+        Args:
+            porta: Porta TCP (0 = escolhida pelo sistema)
+            total_partidas: Partidas por dia no dailyRadar sintético
+            latencia: Atraso fixo de cada resposta em segundos
+            variacao_latencia: Atraso adicional aleatório (0 a este valor)
+            taxa_erro: Fração de respostas com erro (0.0 a 1.0)
+            status_erro: Status HTTP das respostas com erro (ex.: 503, 429)
+            bytes_extras: Bytes de preenchimento adicionados a cada payload
+            semente: Semente dos dados sintéticos
+            diretorio_fixtures: Pasta com respostas gravadas (dailyRadar_<data>.json,
+                                prepRadar_<id>.json, goalRadar_<id>_<field>.json)
+        """
+        self.porta = porta
+        self.total_partidas = total_partidas
+        self.latencia = latencia
+        self.variacao_latencia = variacao_latencia
+        self.taxa_erro = taxa_erro
+        self.status_erro = status_erro
+        self.bytes_extras = bytes_extras
+        self.semente = semente
+        self.diretorio_fixtures = diretorio_fixtures
+
+        self._aleatorio = random.Random(semente)
+        self._lock = threading.Lock()
+        self._dias = {}
+        self._indice_partidas = {}
+        self._servidor = None
+        self._thread = None
+        self.estatisticas = {'requisicoes': {}, 'erros_injetados': 0, 'nao_modificadas': 0}
+
+    @property
+    def url_base(self):
+        return f"http://127.0.0.1:{self.porta}"
+
+    # ------------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------------
+    def iniciar(self):
+        """Inicia o servidor em uma thread daemon e retorna a URL base"""
+        servidor_local = self
+
+        class Manipulador(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Cabeçalhos e corpo no mesmo segmento TCP (evita atrasos de Nagle/ACK atrasado)
+            disable_nagle_algorithm = True
+            wbufsize = 64 * 1024
+
+            def do_GET(self):
+                servidor_local._atender(self)
+
+            def log_message(self, formato, *args):
+                pass
+
+        self._servidor = ThreadingHTTPServer(('127.0.0.1', self.porta), Manipulador)
+        self._servidor.daemon_threads = True
+        self.porta = self._servidor.server_address[1]
+        self._thread = threading.Thread(target=self._servidor.serve_forever, daemon=True)
+        self._thread.start()
+        return self.url_base
+
+    def parar(self):
+        if self._servidor is not None:
+            self._servidor.shutdown()
+            self._servidor.server_close()
+            self._servidor = None
+
+    def __enter__(self):
+        self.iniciar()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.parar()
+
+    # ------------------------------------------------------------------
+    # Payloads
+    # ------------------------------------------------------------------
+    def _fixture(self, nome):
+        if not self.diretorio_fixtures:
+            return None
+        arquivo = os.path.join(self.diretorio_fixtures, nome)
+        if not os.path.exists(arquivo):
+            return None
+        with open(arquivo, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _daily_radar(self, data):
+        with self._lock:
+            if data not in self._dias:
+                documento = self._fixture(f"dailyRadar_{data}.json")
+                if documento is None:
+                    semente_dia = f"{self.semente}-{data}"
+                    documento = gerar_daily_radar(self.total_partidas, semente=semente_dia, data=data)
+                self._dias[data] = documento
+                self._indice_partidas.update(indexar_partidas(documento))
+            return self._dias[data]
+
+    def _payload(self, endpoint, identificador, parametros):
+        """Payload (dict) da rota ou None para 404"""
+        if endpoint == 'dailyRadar':
+            return self._daily_radar(identificador)
+        if endpoint == 'prepRadar':
+            return (self._fixture(f"prepRadar_{identificador}.json") or
+                    gerar_prep_radar(identificador, self._indice_partidas.get(str(identificador)), self.semente))
+        if endpoint == 'goalRadar':
+            field = parametros.get('field', ['home'])[0]
+            return (self._fixture(f"goalRadar_{identificador}_{field}.json") or
+                    gerar_goal_radar(identificador, field, self.semente))
+        return None
+
+    # ------------------------------------------------------------------
+    # Atendimento
+    # ------------------------------------------------------------------
+    def _atender(self, manipulador):
+        partes = urlsplit(manipulador.path)
+        segmentos = [s for s in partes.path.split('/') if s]
+        # Aceita tanto /dailyRadar/<data> quanto /public/dailyRadar/<data>
+        if segmentos and segmentos[0] == 'public':
+            segmentos = segmentos[1:]
+        endpoint = segmentos[0] if segmentos else ''
+        identificador = segmentos[1] if len(segmentos) > 1 else ''
+
+        with self._lock:
+            requisicoes = self.estatisticas['requisicoes']
+            requisicoes[endpoint] = requisicoes.get(endpoint, 0) + 1
+            atraso = self.latencia + self._aleatorio.uniform(0, self.variacao_latencia)
+            com_erro = self._aleatorio.random() < self.taxa_erro
+            if com_erro:
+                self.estatisticas['erros_injetados'] += 1
+
+        if atraso > 0:
+            time.sleep(atraso)
+
+        if com_erro:
+            self._responder(manipulador, self.status_erro, {'error': 'erro injetado'},
+                            {'Retry-After': '1'} if self.status_erro == 429 else None)
+            return
+
+        payload = self._payload(endpoint, identificador, parse_qs(partes.query))
+        if payload is None:
+            self._responder(manipulador, 404, {'error': 'rota desconhecida'})
+            return
+
+        if self.bytes_extras:
+            payload = dict(payload, _preenchimento='x' * self.bytes_extras)
+
+        corpo = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        etag = '"' + hashlib.sha1(corpo).hexdigest() + '"'
+        if manipulador.headers.get('If-None-Match') == etag:
+            with self._lock:
+                self.estatisticas['nao_modificadas'] += 1
+            self._responder(manipulador, 304, None, {'ETag': etag})
+            return
+
+        self._responder(manipulador, 200, corpo, {'ETag': etag})
+
+    def _responder(self, manipulador, status, corpo, cabecalhos=None):
+        if isinstance(corpo, dict):
+            corpo = json.dumps(corpo).encode('utf-8')
+        corpo = corpo or b''
+        manipulador.send_response(status)
+        manipulador.send_header('Content-Type', 'application/json; charset=utf-8')
+        manipulador.send_header('Content-Length', str(len(corpo)))
+        for nome, valor in (cabecalhos or {}).items():
+            manipulador.send_header(nome, valor)
+        manipulador.end_headers()
+        if corpo:
+            manipulador.wfile.write(corpo)
+
+    def resumo(self):
+        with self._lock:
+            return {
+                'requisicoes': dict(self.estatisticas['requisicoes']),
+                'erros_injetados': self.estatisticas['erros_injetados'],
+                'nao_modificadas': self.estatisticas['nao_modificadas']
+            }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor local da API Radar Esportivo")
+    parser.add_argument('--porta', type=int, default=8765)
+    parser.add_argument('--partidas', type=int, default=2000, help="Partidas por dia no dailyRadar")
+    parser.add_argument('--latencia', type=float, default=0.0, help="Atraso fixo por resposta (s)")
+    parser.add_argument('--variacao-latencia', type=float, default=0.0, help="Atraso aleatório adicional (s)")
+    parser.add_argument('--taxa-erro', type=float, default=0.0, help="Fração de respostas com erro")
+    parser.add_argument('--status-erro', type=int, default=503)
+    parser.add_argument('--bytes-extras', type=int, default=0, help="Preenchimento por payload")
+    parser.add_argument('--semente', type=int, default=42)
+    parser.add_argument('--fixtures', default=None, help="Pasta com respostas gravadas")
+    args = parser.parse_args()
+
+    servidor = ServidorRadarLocal(args.porta, args.partidas, args.latencia, args.variacao_latencia,
+                                  args.taxa_erro, args.status_erro, args.bytes_extras, args.semente,
+                                  args.fixtures)
+    servidor.iniciar()
+    print(f"🛰️ Servidor Radar local em {servidor.url_base}")
+    print(f"   Use RADAR_ESPORTIVO_BASE_URL={servidor.url_base} para apontar o cliente")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        print(f"\n📊 {servidor.resumo()}")
+        servidor.parar()
+
+
+if __name__ == '__main__':
+    main()
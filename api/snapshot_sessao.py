@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Snapshot binário da sessão do BetBoosterV2 (abertura instantânea)
+Gravado ao fechar a janela com as apostas hot já ordenadas, o estado dos
+filtros e os dados lidos na inicialização; na próxima abertura a interface é
+montada a partir dele e os dados são revalidados em segundo plano
+"""
+
+import io
+import os
+import pickle
+import time
+
+VERSAO_SNAPSHOT = 1
+
+
+class _LeitorRestrito(pickle.Unpickler):
+    """O snapshot só contém dict/list/str/números: qualquer classe é recusada"""
+
+    def find_class(self, modulo, nome):
+        raise pickle.UnpicklingError(f"Tipo não permitido no snapshot: {modulo}.{nome}")
+
+
+def assinatura_arquivos(caminhos):
+    """
+    (mtime_ns, tamanho) de cada arquivo, para saber se mudou desde o snapshot
+
+    Returns:
+        dict: {caminho absoluto: (mtime_ns, tamanho) ou None se não existe}
+    """
+    assinaturas = {}
+    for caminho in caminhos:
+        caminho = os.path.abspath(caminho)
+        try:
+            info = os.stat(caminho)
+            assinaturas[caminho] = (info.st_mtime_ns, info.st_size)
+        except OSError:
+            assinaturas[caminho] = None
+    return assinaturas
+
+
+def arquivo_inalterado(snapshot, caminho):
+    """Indica se `caminho` está igual ao registrado no snapshot"""
+    caminho = os.path.abspath(caminho)
+    registradas = (snapshot or {}).get('arquivos', {})
+    return caminho in registradas and registradas[caminho] == assinatura_arquivos([caminho])[caminho]
+
+
+def salvar_snapshot(caminho, estado):
+    """
+    Grava o snapshot (pickle binário, troca atômica do arquivo)
+
+    Args:
+        caminho: Arquivo de destino
+        estado: dict só com tipos básicos (dict, list, tuple, str, int, float, bool, None)
+
+    Returns:
+        int: Bytes gravados ou 0 em caso de erro
+    """
+    try:
+        pasta = os.path.dirname(os.path.abspath(caminho))
+        if not os.path.exists(pasta):
+            os.makedirs(pasta)
+        conteudo = pickle.dumps({'versao': VERSAO_SNAPSHOT, 'salvo_em': time.time(), **estado},
+                                protocol=pickle.HIGHEST_PROTOCOL)
+        temporario = caminho + '.tmp'
+        with open(temporario, 'wb') as f:
+            f.write(conteudo)
+        os.replace(temporario, caminho)
+        return len(conteudo)
+    except (OSError, pickle.PicklingError, TypeError) as e:
+        print(f"⚠️ Erro ao gravar snapshot da sessão: {e}")
+        return 0
+
+
+def carregar_snapshot(caminho):
+    """
+    Lê o snapshot gravado por salvar_snapshot()
+
+    Returns:
+        dict com o estado (+ 'versao' e 'salvo_em') ou None se ausente/incompatível
+    """
+    if not os.path.exists(caminho):
+        return None
+    try:
+        with open(caminho, 'rb') as f:
+            estado = _LeitorRestrito(io.BytesIO(f.read())).load()
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError) as e:
+        print(f"⚠️ Snapshot da sessão ignorado: {e}")
+        return None
+    if not isinstance(estado, dict) or estado.get('versao') != VERSAO_SNAPSHOT:
+        print("⚠️ Snapshot da sessão em formato antigo, ignorado")
+        return None
+    return estado
+
+
+def descrever_idade(snapshot):
+    """Idade do snapshot em texto curto (ex.: 'há 12 min')"""
+    segundos = max(0, time.time() - snapshot.get('salvo_em', 0))
+    if segundos < 60:
+        return "há menos de 1 min"
+    if segundos < 3600:
+        return f"há {int(segundos // 60)} min"
+    if segundos < 86400:
+        return f"há {int(segundos // 3600)} h"
+    return f"há {int(segundos // 86400)} dias"
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Transporte HTTP compartilhado para a API Radar Esportivo
+Um único pool de conexões (keep-alive) por cliente, dimensionado pelo número
+de workers, com estatísticas de conexões abertas, reaproveitadas e em espera
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import EmptyPoolError
+
+try:
+    import httpx  # Opcional: necessário apenas para HTTP/2
+except ImportError:
+    httpx = None
+
+# Espera máxima (s) por uma conexão livre quando o pool está cheio (pool_block=True)
+TIMEOUT_POOL_PADRAO = 5.0
+
+
+class EstatisticasPool:
+    """Contadores thread-safe do pool de conexões"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.abertas = 0
+        self.reaproveitadas = 0
+        self.requisicoes = 0
+        self.em_espera = 0
+        self.pico_espera = 0
+
+    def registrar_abertura(self):
+        with self._lock:
+            self.abertas += 1
+
+    def registrar_requisicao(self, reaproveitada=False):
+        with self._lock:
+            self.requisicoes += 1
+            if reaproveitada:
+                self.reaproveitadas += 1
+
+    def entrar_espera(self):
+        with self._lock:
+            self.em_espera += 1
+            self.pico_espera = max(self.pico_espera, self.em_espera)
+
+    def sair_espera(self):
+        with self._lock:
+            self.em_espera -= 1
+
+    def resumo(self):
+        """Retorna uma cópia dos contadores"""
+        with self._lock:
+            return {
+                'requisicoes': self.requisicoes,
+                'conexoes_abertas': self.abertas,
+                'conexoes_reaproveitadas': self.reaproveitadas,
+                'em_espera': self.em_espera,
+                'pico_espera': self.pico_espera
+            }
+
+
+def _criar_classes_pool(estatisticas, timeout_pool):
+    """
+    Subclasses de pool/conexão do urllib3 que alimentam as estatísticas
+    e limitam a espera por conexão livre a `timeout_pool` segundos
+    """
+
+    class ConexaoHTTP(HTTPConnection):
+        def connect(self):
+            estatisticas.registrar_abertura()
+            super().connect()
+
+    class ConexaoHTTPS(HTTPSConnection):
+        def connect(self):
+            estatisticas.registrar_abertura()
+            super().connect()
+
+    def _get_conn_instrumentado(pool, timeout, get_conn_original):
+        # O requests não repassa pool_timeout: sem isto a espera pelo pool seria infinita
+        if timeout is None:
+            timeout = timeout_pool
+        # Fila vazia com pool_block=True significa que todas as conexões estão em uso
+        aguardando = pool.pool is not None and pool.pool.empty()
+        if aguardando:
+            estatisticas.entrar_espera()
+        try:
+            conn = get_conn_original(pool, timeout)
+        finally:
+            if aguardando:
+                estatisticas.sair_espera()
+        estatisticas.registrar_requisicao(reaproveitada=getattr(conn, 'sock', None) is not None)
+        return conn
+
+    class PoolHTTP(HTTPConnectionPool):
+        ConnectionCls = ConexaoHTTP
+
+        def _get_conn(self, timeout=None):
+            return _get_conn_instrumentado(self, timeout, HTTPConnectionPool._get_conn)
+
+    class PoolHTTPS(HTTPSConnectionPool):
+        ConnectionCls = ConexaoHTTPS
+
+        def _get_conn(self, timeout=None):
+            return _get_conn_instrumentado(self, timeout, HTTPSConnectionPool._get_conn)
+
+    return {'http': PoolHTTP, 'https': PoolHTTPS}
+
+
+class AdaptadorInstrumentado(HTTPAdapter):
+    """HTTPAdapter cujo PoolManager usa os pools instrumentados"""
+
+    def __init__(self, estatisticas, timeout_pool=TIMEOUT_POOL_PADRAO, **kwargs):
+        self.estatisticas = estatisticas
+        self.timeout_pool = timeout_pool
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = _criar_classes_pool(self.estatisticas, self.timeout_pool)
+
+
+class _RespostaHTTPX:
+    """Expõe uma resposta httpx com a interface usada de requests.Response"""
+
+    def __init__(self, response):
+        self._response = response
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.content = response.content
+        self.text = response.text
+        self.url = str(response.url)
+
+    def json(self):
+        return self._response.json()
+
+    def iter_content(self, chunk_size=65536):
+        for inicio in range(0, len(self.content), chunk_size):
+            yield self.content[inicio:inicio + chunk_size]
+
+    def close(self):
+        self._response.close()
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} para {self.url}", response=self)
+
+
+class TransporteHTTP:
+    """
+    Transporte único de um cliente da API
+
+    HTTP/1.1 com keep-alive via requests + urllib3 por padrão; HTTP/2 com
+    multiplexação via httpx quando `http2=True` e o pacote estiver instalado
+    """
+
+    def __init__(self, headers=None, max_conexoes=10, http2=False, timeout_pool=TIMEOUT_POOL_PADRAO):
+        """
+        Args:
+            headers: Headers enviados em todas as requisições
+            max_conexoes: Tamanho do pool (use o número de workers que fazem chamadas)
+            http2: Usa HTTP/2 (requer 'httpx[http2]')
+            timeout_pool: Espera máxima (s) por uma conexão livre do pool
+        """
+        self.max_conexoes = max_conexoes
+        self.estatisticas = EstatisticasPool()
+        self.http2 = bool(http2 and httpx is not None)
+
+        if http2 and httpx is None:
+            print("⚠️ HTTP/2 indisponível (instale 'httpx[http2]'); usando HTTP/1.1 com keep-alive")
+
+        if self.http2:
+            self.session = httpx.Client(
+                http2=True,
+                headers=headers or {},
+                limits=httpx.Limits(max_connections=max_conexoes,
+                                    max_keepalive_connections=max_conexoes)
+            )
+        else:
+            self.session = requests.Session()
+            if headers:
+                self.session.headers.update(headers)
+            # pool_block=True: acima do limite a thread aguarda uma conexão livre
+            # em vez de abrir (e descartar) conexões extras, por no máximo timeout_pool
+            adaptador = AdaptadorInstrumentado(self.estatisticas,
+                                               timeout_pool=timeout_pool,
+                                               pool_connections=4,
+                                               pool_maxsize=max_conexoes,
+                                               pool_block=True)
+            self.session.mount('https://', adaptador)
+            self.session.mount('http://', adaptador)
+
+    def get(self, url, params=None, timeout=10, headers=None, stream=False):
+        """
+        GET pelo pool compartilhado
+
+        Args:
+            stream: Não lê o corpo antecipadamente (use iter_content e close)
+
+        Returns:
+            Resposta com status_code, headers, content, json() e raise_for_status()
+
+        Raises:
+            requests.exceptions.RequestException: Em erros de conexão/timeout
+        """
+        if not self.http2:
+            try:
+                return self.session.get(url, params=params, timeout=timeout, headers=headers, stream=stream)
+            except EmptyPoolError as e:
+                # Nenhuma conexão liberada dentro de timeout_pool
+                raise requests.exceptions.ConnectionError(str(e))
+
+        conexao_nova = []
+
+        def rastrear(evento, info):
+            # Trace do httpcore: só há connect_tcp quando uma conexão nova é aberta
+            if evento == 'connection.connect_tcp.complete':
+                self.estatisticas.registrar_abertura()
+                conexao_nova.append(True)
+
+        try:
+            response = self.session.get(url, params=params, timeout=timeout, headers=headers,
+                                        extensions={'trace': rastrear})
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e))
+        except httpx.HTTPError as e:
+            raise requests.exceptions.ConnectionError(str(e))
+        self.estatisticas.registrar_requisicao(reaproveitada=not conexao_nova)
+        return _RespostaHTTPX(response)
+
+    def resumo(self):
+        """Retorna os contadores do pool"""
+        resumo = self.estatisticas.resumo()
+        resumo['max_conexoes'] = self.max_conexoes
+        resumo['protocolo'] = 'HTTP/2' if self.http2 else 'HTTP/1.1'
+        return resumo
+
+    def formatar_resumo(self):
+        """Texto curto com as estatísticas do pool para logs"""
+        r = self.resumo()
+        return (f"{r['protocolo']} pool={r['max_conexoes']}: {r['requisicoes']} requisições, "
+                f"{r['conexoes_abertas']} conexões abertas, {r['conexoes_reaproveitadas']} reaproveitadas, "
+                f"pico de {r['pico_espera']} em espera")
+
+    def fechar(self):
+        """Fecha todas as conexões do pool"""
+        self.session.close()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark de um dia completo contra o servidor Radar local (sem rede)
+
+Busca o dailyRadar, aplica o filtro de elegibilidade e busca odds + estatísticas
+de cada partida elegível, pelo cliente síncrono (threads + broker) ou assíncrono
+
+Uso:
+    python benchmarks/benchmark_dia_local.py --partidas 2000 --latencia 0.02
+    python benchmarks/benchmark_dia_local.py --partidas 2000 --todos --async --sem-limite
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.broker_partidas import BrokerPartidas
+from api.filtro_jogos import FiltroElegibilidade
+from api.radar_esportivo_api import RadarEsportivoAPI
+from api.servidor_radar_local import ServidorRadarLocal
+
+# Orçamentos altos o bastante para medir só o cliente/servidor
+ORCAMENTOS_SEM_LIMITE = {endpoint: (100000, 100000) for endpoint in ('dailyRadar', 'prepRadar', 'goalRadar', 'results')}
+
+
+def executar_sincrono(api, ids, workers):
+    broker = BrokerPartidas(api)
+
+    def buscar(match_id):
+        return broker.buscar_odds_detalhadas(match_id), broker.buscar_estatisticas_detalhadas_time(match_id)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(buscar, ids))
+
+
+def executar_assincrono(base_url, ids, orcamentos, concorrencia):
+    from api.radar_esportivo_async import RadarEsportivoAPISincrona
+
+    fachada = RadarEsportivoAPISincrona(base_url=base_url, max_concorrencia=concorrencia,
+                                        limite_por_host=concorrencia)
+    fachada.cliente.limitador.orcamentos.update(orcamentos)
+    try:
+        return list(fachada.buscar_dados_partidas(ids).values())
+    finally:
+        fachada.fechar()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de um dia contra o servidor Radar local")
+    parser.add_argument('--partidas', type=int, default=2000)
+    parser.add_argument('--latencia', type=float, default=0.02, help="Latência do servidor (s)")
+    parser.add_argument('--taxa-erro', type=float, default=0.0)
+    parser.add_argument('--workers', type=int, default=10, help="Threads / conexões do cliente síncrono")
+    parser.add_argument('--concorrencia', type=int, default=100, help="Requisições simultâneas no modo async")
+    parser.add_argument('--todos', action='store_true', help="Analisa todas as partidas (sem filtro)")
+    parser.add_argument('--async', dest='assincrono', action='store_true', help="Usa o cliente asyncio")
+    parser.add_argument('--sem-limite', action='store_true', help="Desativa os orçamentos do limitador")
+    args = parser.parse_args()
+
+    orcamentos = ORCAMENTOS_SEM_LIMITE if args.sem_limite else {}
+
+    with ServidorRadarLocal(total_partidas=args.partidas, latencia=args.latencia,
+                            taxa_erro=args.taxa_erro) as servidor:
+        api = RadarEsportivoAPI(max_conexoes=args.workers, base_url=servidor.url_base)
+        api.limitador.orcamentos.update(orcamentos)
+
+        inicio = time.perf_counter()
+        jogos = api.buscar_jogos_do_dia('2025-08-26')
+        if not args.todos:
+            jogos, _ = FiltroElegibilidade().separar(jogos)
+        ids = [jogo['id'] for jogo in jogos]
+        meio = time.perf_counter()
+
+        if args.assincrono:
+            resultados = executar_assincrono(servidor.url_base, ids, orcamentos, args.concorrencia)
+        else:
+            resultados = executar_sincrono(api, ids, args.workers)
+        fim = time.perf_counter()
+
+        completos = sum(1 for odds, stats in resultados if odds and stats)
+        print()
+        print(f"Modo: {'async' if args.assincrono else f'threads ({args.workers})'}"
+              f"{' sem limitador' if args.sem_limite else ''}")
+        print(f"dailyRadar + parse: {(meio - inicio) * 1000:.0f} ms")
+        print(f"Partidas analisadas: {len(ids)} ({completos} completas) em {fim - meio:.2f} s "
+              f"({len(ids) / max(fim - meio, 1e-9):.0f} partidas/s)")
+        print(f"Servidor: {servidor.resumo()}")
+        if not args.assincrono:
+            print(f"Conexões: {api.resumo_conexoes()}")
+            print(f"Limitador: {api.resumo_limitador()}")
+
+
+if __name__ == '__main__':
+    main()
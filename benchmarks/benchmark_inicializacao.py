@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark da inicialização do BetBoosterV2 contra o servidor Radar local (sem rede)
+
+Executa as mesmas etapas do carregamento da interface (database, limpeza de
+cache, jogos de hoje e de amanhã) com cache frio (dailyRadar pela API) e com
+cache quente (jogos_<data>.json já gravados), em paralelo e em sequência
+
+Uso:
+    python benchmarks/benchmark_inicializacao.py --partidas 2000 --latencia 0.2
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.cache_jogos import limpar_cache_antigo, salvar_cache_jogos
+from api.inicializacao import GrafoInicializacao, preparar_data
+from api.radar_esportivo_api import RadarEsportivoAPI
+from api.servidor_radar_local import ServidorRadarLocal
+
+DATABASE_PADRAO = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'times_database.json')
+
+# Pausas fixas removidas do carregamento (time.sleep + 0.1 s em cada atualizar_loading, aprox.)
+PAUSAS_ANTIGAS_SEGUNDOS = 4.5 + 14 * 0.1
+
+
+def carregar_database(caminho):
+    if not os.path.exists(caminho):
+        return {}
+    with open(caminho, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def inicializar(base_url, cache_dir, database, datas, paralelo=True):
+    """Mesmo grafo de BetBoosterV2.executar_carregamento; retorna (segundos, grafo)"""
+    api = RadarEsportivoAPI(base_url=base_url)
+    grafo = GrafoInicializacao(max_workers=4 if paralelo else 1)
+    grafo.adicionar('database', lambda r: carregar_database(database))
+    grafo.adicionar('cache_antigo', lambda r: limpar_cache_antigo(cache_dir))
+    for nome, data in zip(('hoje', 'amanha'), datas):
+        grafo.adicionar(nome, lambda r, data=data: preparar_data(api, cache_dir, data))
+
+    inicio = time.perf_counter()
+    grafo.executar()
+    duracao = time.perf_counter() - inicio
+    api.transporte.fechar()
+    return duracao, grafo
+
+
+def medir(rotulo, repeticoes, preparar, executar):
+    tempos = []
+    grafo = None
+    for _ in range(repeticoes):
+        preparar()
+        duracao, grafo = executar()
+        tempos.append(duracao)
+    tempos.sort()
+    print(f"{rotulo}: mediana {tempos[len(tempos) // 2] * 1000:.0f} ms, melhor {tempos[0] * 1000:.0f} ms")
+    print(f"   {grafo.resumo()}")
+    return tempos[len(tempos) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da inicialização contra o servidor Radar local")
+    parser.add_argument('--partidas', type=int, default=2000, help="Partidas por dia no dailyRadar")
+    parser.add_argument('--latencia', type=float, default=0.2, help="Latência do servidor (s)")
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--database', default=DATABASE_PADRAO, help="times_database.json a carregar")
+    args = parser.parse_args()
+
+    hoje = datetime.now()
+    datas = [hoje.strftime('%Y-%m-%d'), (hoje + timedelta(days=1)).strftime('%Y-%m-%d')]
+    cache_dir = tempfile.mkdtemp(prefix='bench_inicializacao_')
+
+    def esvaziar_cache():
+        for arquivo in os.listdir(cache_dir):
+            os.remove(os.path.join(cache_dir, arquivo))
+
+    try:
+        with ServidorRadarLocal(total_partidas=args.partidas, latencia=args.latencia) as servidor:
+            # Gerar os dias sintéticos no servidor antes de medir o cliente
+            aquecimento = RadarEsportivoAPI(base_url=servidor.url_base)
+            jogos_por_data = {data: aquecimento.buscar_jogos_do_dia(data) or [] for data in datas}
+            aquecimento.transporte.fechar()
+
+            def preencher_cache():
+                for data, jogos in jogos_por_data.items():
+                    salvar_cache_jogos(cache_dir, data, jogos, [])
+
+            print(f"\n{args.partidas} partidas/dia, latência {args.latencia * 1000:.0f} ms, "
+                  f"{args.repeticoes} repetições")
+            print(f"Pausas fixas removidas do carregamento antigo: ~{PAUSAS_ANTIGAS_SEGUNDOS:.1f} s\n")
+
+            frio_paralelo = medir("Cache frio, paralelo  ", args.repeticoes, esvaziar_cache,
+                                  lambda: inicializar(servidor.url_base, cache_dir, args.database, datas))
+            frio_sequencial = medir("Cache frio, sequencial", args.repeticoes, esvaziar_cache,
+                                    lambda: inicializar(servidor.url_base, cache_dir, args.database, datas, False))
+            quente = medir("Cache quente, paralelo", args.repeticoes, preencher_cache,
+                           lambda: inicializar(servidor.url_base, cache_dir, args.database, datas))
+
+            print()
+            print(f"Cache frio: {frio_paralelo / max(args.latencia, 1e-9):.1f}x a latência de um dailyRadar "
+                  f"(sequencial: {frio_sequencial / max(args.latencia, 1e-9):.1f}x)")
+            print(f"Cache quente: {'✅' if quente < 1.0 else '⚠️'} {quente * 1000:.0f} ms (meta: < 1 s)")
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
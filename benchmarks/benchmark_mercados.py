@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: varredura de mercados por partida (resultFt + goalsOu25 vs. marketOdds completo)
+
+Para partidas sintéticas (prepRadar de api.dados_sinteticos e estatísticas de
+10 jogos), mede calcular_probabilidades_completas + analisar_apostas_recomendadas
+com o marketOdds reduzido aos dois mercados antigos e com todos os mercados,
+e quantas apostas hot cada varredura gera
+
+Os dois tempos são do código atual. Para comparar com uma revisão anterior,
+rode este mesmo script numa cópia da árvore nessa revisão, ex.:
+    git worktree add /tmp/anterior <commit>
+    cp benchmarks/benchmark_mercados.py /tmp/anterior/benchmarks/
+    python /tmp/anterior/benchmarks/benchmark_mercados.py --partidas 3000
+
+Uso:
+    python benchmarks/benchmark_mercados.py --partidas 3000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.dados_sinteticos import gerar_prep_radar
+from api.motor_analise import MotorAnalise, calcular_probabilidades_completas
+from api.probabilidades import tabelas_poisson
+
+MERCADOS_ANTIGOS = ('resultFt', 'goalsOu25')
+
+
+def gerar_partidas(partidas, semente):
+    """[(jogo, odds_detalhadas, stats)] com médias de 10 jogos (múltiplos de 0.1)"""
+    aleatorio = random.Random(semente)
+
+    def media_10_jogos():
+        return sum(aleatorio.choice((0, 0, 1, 1, 1, 2, 2, 3, 4)) for _ in range(10)) / 10
+
+    lista = []
+    for i in range(partidas):
+        prep = gerar_prep_radar(str(100000 + i), semente=semente)
+        jogo = {'id': str(100000 + i), 'codigo_regiao': 'BR', 'relevancia_liga': 'high'}
+        odds_detalhadas = {'match_id': jogo['id'], 'start_time': '', 'odds': prep['marketOdds'],
+                           'home_team': 'Casa', 'away_team': 'Visitante', 'league': 'Liga'}
+        stats = {'time_casa': {'geral': {'gols_marcados': media_10_jogos(), 'gols_sofridos': media_10_jogos()}},
+                 'time_visitante': {'geral': {'gols_marcados': media_10_jogos(), 'gols_sofridos': media_10_jogos()}}}
+        lista.append((jogo, odds_detalhadas, stats))
+    return lista
+
+
+def varrer(motor, partidas):
+    """Apostas hot geradas para todas as partidas"""
+    apostas = 0
+    for jogo, odds_detalhadas, stats in partidas:
+        probabilidades = calcular_probabilidades_completas(stats)
+        apostas += len(motor.analisar_apostas_recomendadas(jogo, odds_detalhadas, probabilidades, stats))
+    return apostas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da varredura de mercados por partida")
+    parser.add_argument('--partidas', type=int, default=3000)
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+
+    todos = gerar_partidas(args.partidas, args.semente)
+    antigos = [(jogo, dict(odds_detalhadas, odds={chave: valor for chave, valor in odds_detalhadas['odds'].items()
+                                                  if chave in MERCADOS_ANTIGOS}), stats)
+               for jogo, odds_detalhadas, stats in todos]
+
+    motor = MotorAnalise()
+    try:
+        print(f"\n{args.partidas} partidas, melhor de {args.repeticoes} repetições")
+        for rotulo, partidas in (("resultFt + goalsOu25", antigos), ("marketOdds completo", todos)):
+            tabelas_poisson.limpar()
+            tempos = []
+            apostas = 0
+            for _ in range(args.repeticoes):
+                inicio = time.perf_counter()
+                apostas = varrer(motor, partidas)
+                tempos.append(time.perf_counter() - inicio)
+            print(f"{rotulo:<22} {min(tempos) / args.partidas * 1e6:7.1f} µs/partida  "
+                  f"{apostas:6d} apostas hot  (1ª passada: {tempos[0] / args.partidas * 1e6:.1f} µs/partida)")
+        print(f"Tabelas Poisson: {tabelas_poisson.formatar_resumo()}")
+    finally:
+        motor.encerrar()
+
+
+if __name__ == '__main__':
+    main()
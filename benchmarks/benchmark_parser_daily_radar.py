@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: leitura completa vs. incremental do dailyRadar
+
+Compara json.loads + processar_jogos + filtro (fluxo atual) com o parser
+incremental com filtro aplicado na leitura. Mede tempo até a primeira
+partida, tempo total e pico de memória alocada (tracemalloc)
+
+Uso:
+    python benchmarks/benchmark_parser_daily_radar.py [--partidas 6000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.dados_sinteticos import gerar_daily_radar
+from api.filtro_jogos import FiltroElegibilidade
+from api.parser_daily_radar import iterar_jogos
+from api.radar_esportivo_api import RadarEsportivoAPI
+
+
+def pedacos(conteudo, tamanho=65536):
+    for inicio in range(0, len(conteudo), tamanho):
+        yield conteudo[inicio:inicio + tamanho]
+
+
+def medir(nome, funcao):
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    primeira, total = funcao(inicio)
+    duracao = time.perf_counter() - inicio
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{nome:<22} partidas={total:>6}  primeira={primeira * 1000:8.1f} ms  "
+          f"total={duracao * 1000:8.1f} ms  pico={pico / 1024 / 1024:7.2f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do parser dailyRadar")
+    parser.add_argument('--partidas', type=int, default=6000)
+    args = parser.parse_args()
+
+    conteudo = json.dumps(gerar_daily_radar(args.partidas)).encode('utf-8')
+    print(f"Documento: {len(conteudo) / 1024 / 1024:.2f} MB")
+
+    api = RadarEsportivoAPI()
+    filtro = FiltroElegibilidade()
+
+    def completo(inicio):
+        dados = json.loads(conteudo)
+        jogos = api.processar_jogos(dados['dailyRadar'])
+        elegiveis, _ = filtro.separar(jogos)
+        primeira = time.perf_counter() - inicio
+        return primeira, len(elegiveis)
+
+    def incremental(inicio):
+        primeira = None
+        total = 0
+        for _ in iterar_jogos(pedacos(conteudo), api.processar_partida_individual, filtro):
+            if primeira is None:
+                primeira = time.perf_counter() - inicio
+            total += 1
+        return primeira or 0.0, total
+
+    medir('completo + filtro', completo)
+    medir('incremental + filtro', incremental)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: cálculo de probabilidades por partida vs. motor em lote (NumPy)
+
+Gera gols esperados como os do app (médias das últimas 10 partidas, múltiplos
+de 0.05) para um dia inteiro e compara o núcleo api.probabilidades, chamado
+uma vez por partida, com uma única chamada de calcular_probabilidades_lote.
+Também confere a maior diferença entre os dois resultados e mede o
+núcleo com as tabelas PMF/CDF memorizadas vazias e aquecidas
+
+Uso:
+    python benchmarks/benchmark_poisson_lote.py --partidas 5000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.motor_analise import VANTAGEM_CASA, calcular_probabilidades_completas
+from api.poisson_lote import calcular_probabilidades_lote
+from api.probabilidades import calcular_probabilidades, tabelas_poisson
+
+
+def gerar_gols_esperados(partidas, semente):
+    """(casa, visitante) por partida: (marcados + sofridos do adversário) / 2, com médias de 10 jogos"""
+    aleatorio = random.Random(semente)
+
+    def media_10_jogos():
+        return sum(aleatorio.choice((0, 0, 1, 1, 1, 2, 2, 3, 4)) for _ in range(10)) / 10
+
+    casa = [(media_10_jogos() + media_10_jogos()) / 2 for _ in range(partidas)]
+    visitante = [(media_10_jogos() + media_10_jogos()) / 2 for _ in range(partidas)]
+    return casa, visitante
+
+
+def melhor_tempo(repeticoes, funcao):
+    tempos = []
+    resultado = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos), resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do motor de Poisson em lote")
+    parser.add_argument('--partidas', type=int, default=5000, help="Partidas no lote (um dia)")
+    parser.add_argument('--repeticoes', type=int, default=5)
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+
+    casa, visitante = gerar_gols_esperados(args.partidas, args.semente)
+
+    # Primeira passada com as tabelas vazias (tudo é falta no cache), depois as repetições já aquecidas
+    tabelas_poisson.limpar()
+    tempo_frio, _ = melhor_tempo(1, lambda: [calcular_probabilidades(c, v, vantagem_casa=VANTAGEM_CASA).como_dict()
+                                             for c, v in zip(casa, visitante)])
+    resumo_frio = tabelas_poisson.formatar_resumo()
+
+    tempo_por_partida, por_partida = melhor_tempo(
+        args.repeticoes, lambda: [calcular_probabilidades(c, v, vantagem_casa=VANTAGEM_CASA).como_dict()
+                                  for c, v in zip(casa, visitante)])
+    tempo_lote, lote = melhor_tempo(
+        args.repeticoes, lambda: calcular_probabilidades_lote(casa, visitante, vantagem_casa=VANTAGEM_CASA))
+
+    diferenca = max(abs(resultado[chave] - lote[chave][i])
+                    for i, resultado in enumerate(por_partida) for chave in resultado)
+
+    # Custo do wrapper por partida, como chamado pelas threads de análise
+    stats = {'time_casa': {'geral': {'gols_marcados': 1.4, 'gols_sofridos': 1.1}},
+             'time_visitante': {'geral': {'gols_marcados': 0.9, 'gols_sofridos': 1.6}}}
+    tempo_wrapper, _ = melhor_tempo(args.repeticoes, lambda: [calcular_probabilidades_completas(stats)
+                                                               for _ in range(1000)])
+
+    print(f"\n{args.partidas} partidas, melhor de {args.repeticoes} repetições")
+    print(f"Núcleo por partida (Python):   {tempo_por_partida * 1000:8.1f} ms "
+          f"({tempo_por_partida / args.partidas * 1e6:.1f} µs/partida)")
+    print(f"Núcleo, tabelas vazias:        {tempo_frio * 1000:8.1f} ms ({resumo_frio})")
+    print(f"Tabelas Poisson no fim:        {tabelas_poisson.formatar_resumo()}")
+    print(f"Motor em lote (NumPy):         {tempo_lote * 1000:8.1f} ms "
+          f"({tempo_lote / args.partidas * 1e6:.2f} µs/partida)")
+    print(f"Aceleração: {tempo_por_partida / max(tempo_lote, 1e-9):.0f}x")
+    print(f"Maior diferença entre os dois: {diferenca:.2e} pontos percentuais")
+    print(f"calcular_probabilidades_completas: {tempo_wrapper / 1000 * 1e6:.1f} µs/partida")
+
+
+if __name__ == '__main__':
+    main()
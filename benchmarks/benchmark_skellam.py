@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: 1X2 pela grade de placares vs. forma fechada de Skellam
+
+Para pares de gols esperados de 0 a --maximo (inclui jogos de muitos gols) e
+placares ao vivo com diferença de -2 a 2, compara resultado_1x2_grade, em
+várias tolerâncias de truncamento, com resultado_1x2_skellam. A referência é
+a soma exata (math.fsum) da grade de placares até 150 gols por time. Sem o
+cache de tabelas, para medir o custo de cada cálculo.
+
+Uso:
+    python benchmarks/benchmark_skellam.py --pares 2000 --maximo 8
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.probabilidades import resultado_1x2_grade, resultado_1x2_skellam
+
+
+def referencia_1x2(gols_esperados_casa, gols_esperados_visitante, diferenca_atual, gols=150):
+    """(casa, empate, visitante) somando a grade inteira com math.fsum"""
+    def pmf(gols_esperados):
+        termos = [math.exp(-gols_esperados)]
+        for k in range(1, gols):
+            termos.append(termos[-1] * gols_esperados / k)
+        return termos
+
+    casa, empate, visitante = [], [], []
+    pmf_visitante = pmf(gols_esperados_visitante)
+    for i, prob_casa in enumerate(pmf(gols_esperados_casa)):
+        for j, prob_visitante in enumerate(pmf_visitante):
+            saldo = i - j + diferenca_atual
+            (casa if saldo > 0 else empate if saldo == 0 else visitante).append(prob_casa * prob_visitante)
+    return math.fsum(casa), math.fsum(empate), math.fsum(visitante)
+
+
+def medir(funcao, casos, repeticoes):
+    """(melhor tempo por caso em µs, maior erro absoluto em pontos percentuais)"""
+    tempos = []
+    resultados = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultados = [funcao(casa, visitante, diferenca) for casa, visitante, diferenca, _ in casos]
+        tempos.append(time.perf_counter() - inicio)
+    erro = max(abs(obtido - esperado) for resultado, (_, _, _, referencia) in zip(resultados, casos)
+               for obtido, esperado in zip(resultado, referencia))
+    return min(tempos) / len(casos) * 1e6, erro * 100
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do 1X2: grade vs. Skellam")
+    parser.add_argument('--pares', type=int, default=2000, help="Pares (casa, visitante) sorteados")
+    parser.add_argument('--maximo', type=float, default=8.0, help="Maior gol esperado sorteado")
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args()
+
+    aleatorio = random.Random(args.semente)
+    casos = []
+    for _ in range(args.pares):
+        casa = round(aleatorio.uniform(0, args.maximo), 3)
+        visitante = round(aleatorio.uniform(0, args.maximo), 3)
+        diferenca = aleatorio.choice((-2, -1, 0, 0, 0, 1, 2))
+        casos.append((casa, visitante, diferenca, referencia_1x2(casa, visitante, diferenca)))
+
+    print(f"\n{args.pares} pares, gols esperados de 0 a {args.maximo:g}, melhor de {args.repeticoes} repetições")
+    print(f"{'Motor':<28}{'µs/partida':>12}{'Maior erro (pp)':>18}")
+    for tolerancia in (1e-3, 1e-6, 1e-10):
+        tempo, erro = medir(lambda c, v, d: resultado_1x2_grade(c, v, d, tolerancia), casos, args.repeticoes)
+        print(f"{f'Grade (tolerância {tolerancia:g})':<28}{tempo:>12.1f}{erro:>18.2e}")
+    for tolerancia in (1e-6, 1e-10):
+        tempo, erro = medir(lambda c, v, d: resultado_1x2_skellam(c, v, d, tolerancia), casos, args.repeticoes)
+        print(f"{f'Skellam (tolerância {tolerancia:g})':<28}{tempo:>12.1f}{erro:>18.2e}")
+
+
+if __name__ == '__main__':
+    main()
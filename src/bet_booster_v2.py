@@ -9,18 +9,30 @@ import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 from tkcalendar import DateEntry
 import json
-import math
 from datetime import datetime, timedelta
 import os
 import sys
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import requests
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 
 # Importar API Radar Esportivo
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from api.radar_esportivo_api import RadarEsportivoAPI
+from api.filtro_jogos import FiltroElegibilidade
+from api.broker_partidas import BrokerPartidas
+from api.cache_jogos import salvar_cache_jogos, limpar_cache_antigo
+from api.inicializacao import GrafoInicializacao, preparar_data
+from api.barramento_ui import BarramentoUI
+from api.probabilidades import calcular_probabilidades
+from api.snapshot_sessao import (arquivo_inalterado, assinatura_arquivos, carregar_snapshot, descrever_idade,
+                                 salvar_snapshot)
+from api.motor_analise import (MotorAnalise, calcular_prob_over_under, calcular_probabilidades_completas,
+                               formatar_horario, motivo_interrupcao)
+
+# Tique da bomba do barramento: ~20 redesenhos por segundo, independente de quantos eventos chegam
+INTERVALO_BARRAMENTO_MS = 50
 
 class BetBoosterV2:
     def __init__(self, root):
@@ -35,7 +47,8 @@ class BetBoosterV2:
         self.apostas_hot = []
         
         # Variáveis de controle
-        self.modo_analise = tk.StringVar(value="detalhado")  # Modo padrão
+        # Mesmo valor inicial do combo da aba Jogos do Dia, que só é criada no primeiro acesso
+        self.modo_analise = tk.StringVar(value="Dados Gerais")  # Modo padrão
         
         # Modo Escuro - detectar hora do dia para ativar automaticamente
         hora_atual = datetime.now().hour
@@ -48,8 +61,39 @@ class BetBoosterV2:
         # Configurar estilos ttk
         self.configurar_estilos_ttk()
         
-        # API Integration
-        self.api = RadarEsportivoAPI()
+        # API Integration (payloads e validadores ETag/Last-Modified persistidos em cache/http)
+        self.api = RadarEsportivoAPI(
+            diretorio_cache_http=os.path.join(os.path.dirname(os.path.dirname(__file__)), 'cache', 'http'))
+        
+        self.partidas_alteradas = set()
+        
+        # Broker por partida: odds e estatísticas buscadas uma única vez por análise
+        self.broker = BrokerPartidas(self.api)
+        
+        # Filtro pré-busca (região/relevância) aplicado antes das chamadas prepRadar/goalRadar
+        self.filtro_elegibilidade = FiltroElegibilidade()
+        
+        # Pipeline de análise sem Tk (o mesmo usado por 'python -m api.motor_analise')
+        self.motor = MotorAnalise(self.api, self.broker, self.filtro_elegibilidade)
+        # Recomendações por (jogo, modo) com a versão dos payloads usada no cálculo
+        self.recomendacoes_por_jogo = self.motor.recomendacoes_por_jogo
+        
+        # Eventos das threads de trabalho (status, progresso, apostas), drenados pela bomba no root.after
+        self.barramento = BarramentoUI()
+        self.root.after(INTERVALO_BARRAMENTO_MS, self.bombear_barramento)
+        self.analises_pendentes = []
+        
+        # Jogos de hoje/amanhã mantidos atualizados em segundo plano (data -> jogos)
+        self.jogos_monitorados = {}
+        # Prazo/cancelamento da análise da data escolhida no filtro
+        self.varredura_data = None
+        
+        # Snapshot da última sessão: dados inalterados não são relidos e, se for do mesmo
+        # dia, a interface abre direto dele enquanto o carregamento revalida em segundo plano
+        self.snapshot = carregar_snapshot(self.caminho_snapshot())
+        self.restaurando_snapshot = bool(self.snapshot and
+                                         self.snapshot.get('data_hoje') == datetime.now().strftime('%Y-%m-%d'))
+        self.tela_carregamento_ativa = False
         
         # Sistema de Banca Simulada
         self.banca_data = {}
@@ -57,11 +101,17 @@ class BetBoosterV2:
         self.historico_apostas = []
         self.carregar_dados_banca()
         
-        # Mostrar tela de carregamento
-        self.mostrar_tela_carregamento()
-        
         # Configurar interface (será feito após carregamento)
         self.main_widgets_created = False
+        
+        if self.restaurando_snapshot:
+            self.apostas_hot_carregadas = self.snapshot.get('apostas_hot', [])
+            self.jogos_monitorados = self.snapshot.get('jogos_monitorados', {})
+            self.root.after_idle(self.finalizar_carregamento)
+            self.root.after_idle(self.iniciar_carregamento)
+        else:
+            # Mostrar tela de carregamento
+            self.mostrar_tela_carregamento()
     
     def atualizar_cores_tema(self):
         """Define as cores baseado no modo escuro ou claro"""
@@ -230,6 +280,7 @@ class BetBoosterV2:
         # Frame de carregamento
         self.loading_frame = tk.Frame(self.root, bg=self.cores['bg_principal'])
         self.loading_frame.pack(fill='both', expand=True)
+        self.tela_carregamento_ativa = True
         
         # Logo/Título
         title_label = tk.Label(self.loading_frame, text="🎯 BET BOOSTER V2", 
@@ -276,8 +327,8 @@ class BetBoosterV2:
                        borderwidth=0,
                        thickness=20)
         
-        # Iniciar carregamento
-        self.root.after(500, self.iniciar_carregamento)
+        # Iniciar carregamento assim que a tela de carregamento for desenhada
+        self.root.after_idle(self.iniciar_carregamento)
     
     def iniciar_carregamento(self):
         """Inicia o processo de carregamento"""
@@ -296,42 +347,7 @@ class BetBoosterV2:
     
     def limpar_cache_antigo(self):
         """Limpa arquivos de cache com mais de 7 dias de idade"""
-        try:
-            cache_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'cache')
-            if not os.path.exists(cache_dir):
-                return
-            
-            data_hoje = datetime.now()
-            arquivos_removidos = 0
-            
-            # Verificar todos os arquivos de cache
-            for arquivo in os.listdir(cache_dir):
-                if arquivo.startswith('jogos_') and arquivo.endswith('.json'):
-                    # Extrair data do nome do arquivo
-                    try:
-                        data_str = arquivo.replace('jogos_', '').replace('.json', '')
-                        data_arquivo = datetime.strptime(data_str, '%Y-%m-%d')
-                        
-                        # Calcular diferença de dias
-                        diferenca_dias = (data_hoje - data_arquivo).days
-                        
-                        # Remover arquivos com mais de 7 dias
-                        if diferenca_dias > 7:
-                            arquivo_path = os.path.join(cache_dir, arquivo)
-                            os.remove(arquivo_path)
-                            arquivos_removidos += 1
-                            print(f"🗑️ Cache antigo removido (mais de 7 dias): {arquivo}")
-                    except ValueError:
-                        # Nome de arquivo inválido, ignorar
-                        continue
-            
-            if arquivos_removidos > 0:
-                print(f"✅ {arquivos_removidos} arquivos de cache com mais de 7 dias removidos")
-            else:
-                print("✅ Nenhum cache antigo para remover")
-                
-        except Exception as e:
-            print(f"⚠️ Erro ao limpar cache antigo: {e}")
+        limpar_cache_antigo(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'cache'))
     
     def verificar_cache_diario(self):
         """Verifica se precisa atualizar cache diário - só atualiza se não houver dados de hoje ou amanhã"""
@@ -372,19 +388,11 @@ class BetBoosterV2:
     def salvar_jogos_cache(self, data, jogos_dados):
         """Salva jogos e apostas hot no cache JSON"""
         try:
-            cache_file = self.get_cache_file_path(data)
+            cache_dir = os.path.dirname(self.get_cache_file_path(data))
             
-            cache_data = {
-                'data': data,
-                'timestamp': datetime.now().isoformat(),
-                'jogos': jogos_dados.get('jogos', []),
-                'apostas_hot': jogos_dados.get('apostas_hot', []),
-                'total_jogos': len(jogos_dados.get('jogos', [])),
-                'total_apostas_hot': len(jogos_dados.get('apostas_hot', []))
-            }
-            
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
+            cache_data = salvar_cache_jogos(cache_dir, data,
+                                            jogos_dados.get('jogos', []),
+                                            jogos_dados.get('apostas_hot', []))
             
             print(f"✅ Cache salvo: {cache_data['total_jogos']} jogos, {cache_data['total_apostas_hot']} apostas hot")
             return True
@@ -404,7 +412,10 @@ class BetBoosterV2:
             with open(cache_file, 'r', encoding='utf-8') as f:
                 cache_data = json.load(f)
             
-            # Cache sem expiração por tempo - sempre válido se existir
+            # Cache sem expiração por tempo - sempre válido se existir e estiver completo
+            if motivo_interrupcao(cache_data.get('jogos', [])):
+                print(f"⚠️ Cache de {data} gravado por uma análise interrompida, ignorado")
+                return None
             timestamp = datetime.fromisoformat(cache_data['timestamp'])
             
             print(f"✅ Cache válido carregado: {cache_data['total_jogos']} jogos, {cache_data['total_apostas_hot']} apostas hot")
@@ -458,163 +469,63 @@ class BetBoosterV2:
             return False
     
     def executar_carregamento(self):
-        """Executa o carregamento completo"""
+        """
+        Executa o carregamento completo como grafo de dependências: database, limpeza
+        de cache e jogos de hoje/amanhã rodam em paralelo e a barra avança a cada etapa
+        """
         try:
-            # Etapa 1: Carregar database
-            self.atualizar_loading(5, "Inicializando sistema...")
-            time.sleep(0.5)
-            
-            self.atualizar_loading(10, "Carregando database de times...")
-            self.carregar_dados()
-            time.sleep(0.3)
-            
-            # Etapa 2: Configurar estilos
-            self.atualizar_loading(15, "Configurando interface do usuário...")
-            self.setup_styles()
-            time.sleep(0.3)
-            
-            # Etapa 3: Limpar cache antigo
-            self.atualizar_loading(20, "Verificando e limpando cache antigo...")
-            self.limpar_cache_antigo()
-            time.sleep(0.2)
-            
-            # Etapa 4: Buscar jogos de hoje (com cache)
-            self.atualizar_loading(25, "Verificando jogos de hoje na API...")
             data_hoje = datetime.now().strftime('%Y-%m-%d')
-            data_formatada = datetime.now().strftime('%d/%m/%Y')
-            
-            # Tentar carregar do cache primeiro
-            cache_hoje = self.carregar_jogos_cache(data_hoje)
-            if cache_hoje:
-                self.atualizar_loading(30, "Carregando jogos de hoje do cache local...")
-                print(f"📁 Usando cache para hoje: {len(cache_hoje['jogos'])} jogos")
-                jogos_hoje = cache_hoje['jogos']
-                apostas_hot_hoje = cache_hoje['apostas_hot']
-                
-                # Adicionar data_jogo a cada aposta para filtro correto
-                for aposta in apostas_hot_hoje:
-                    aposta['data_jogo'] = data_hoje
-                    # Definir período para a data formatada para exibição no card
-                    aposta['periodo'] = data_formatada
-            else:
-                self.atualizar_loading(30, "Buscando jogos de hoje na API...")
-                jogos_hoje = self.api.buscar_jogos_do_dia(data_hoje)
-                print(f"🌐 {len(jogos_hoje) if jogos_hoje else 0} jogos encontrados hoje")
-                apostas_hot_hoje = []
-            
-            time.sleep(0.3)
-            
-            # Etapa 5: Buscar jogos de amanhã (com cache)
-            self.atualizar_loading(35, "Verificando jogos de amanhã na API...")
             data_amanha = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
-            data_formatada_amanha = (datetime.now() + timedelta(days=1)).strftime('%d/%m/%Y')
-            
-            # Tentar carregar do cache primeiro
-            cache_amanha = self.carregar_jogos_cache(data_amanha)
-            if cache_amanha:
-                self.atualizar_loading(40, "Carregando jogos de amanhã do cache local...")
-                print(f"📁 Usando cache para amanhã: {len(cache_amanha['jogos'])} jogos")
-                jogos_amanha = cache_amanha['jogos']
-                apostas_hot_amanha = cache_amanha['apostas_hot']
-                
-                # Adicionar data_jogo a cada aposta para filtro correto
-                for aposta in apostas_hot_amanha:
-                    aposta['data_jogo'] = data_amanha
-                    # Definir período para a data formatada para exibição no card
-                    aposta['periodo'] = data_formatada_amanha
-            else:
-                self.atualizar_loading(40, "Buscando jogos de amanhã na API...")
-                jogos_amanha = self.api.buscar_jogos_do_dia(data_amanha)
-                print(f"🌐 {len(jogos_amanha) if jogos_amanha else 0} jogos encontrados amanhã")
-                apostas_hot_amanha = []
-            
-            time.sleep(0.3)
-            
-            # Etapa 6: Preparar jogos para análise
-            self.atualizar_loading(45, "Processando e filtrando jogos de hoje...")
-            
-            # Se não há cache, processar todos os jogos
-            if not cache_hoje and jogos_hoje:
-                jogos_validos_hoje = self.processar_todos_jogos(jogos_hoje)
-                print(f"📊 {len(jogos_validos_hoje)} jogos de hoje preparados para análise")
-            else:
-                jogos_validos_hoje = []
-                
-            self.atualizar_loading(50, "Processando e filtrando jogos de amanhã...")
-            if not cache_amanha and jogos_amanha:
-                jogos_validos_amanha = self.processar_todos_jogos(jogos_amanha)
-                print(f"📊 {len(jogos_validos_amanha)} jogos de amanhã preparados para análise")
-            else:
-                jogos_validos_amanha = []
-            
-            total_para_analisar = len(jogos_validos_hoje) + len(jogos_validos_amanha)
+            cache_dir = os.path.dirname(self.get_cache_file_path(data_hoje))
+            
+            # Etapas 1-5 (database, cache antigo, hoje, amanhã) sem dependências entre si;
+            # a limpeza só remove datas com mais de 7 dias, nunca hoje/amanhã
+            grafo = GrafoInicializacao(max_workers=4, ao_progredir=lambda progresso, texto:
+                                       self.atualizar_loading(progresso * 0.9, texto))
+            grafo.adicionar('database', lambda r: self.carregar_dados(),
+                            descricao="Carregando database de times...")
+            grafo.adicionar('cache_antigo', lambda r: self.limpar_cache_antigo(),
+                            descricao="Verificando e limpando cache antigo...")
+            grafo.adicionar('hoje', lambda r: preparar_data(self.api, cache_dir, data_hoje),
+                            descricao="Carregando jogos de hoje...")
+            grafo.adicionar('amanha', lambda r: preparar_data(self.api, cache_dir, data_amanha),
+                            descricao="Carregando jogos de amanhã...")
+            resultados = grafo.executar()
+            print(f"⏱️ Inicialização: {grafo.resumo()}")
+            
+            hoje = resultados.get('hoje') or {'data': data_hoje, 'jogos': [], 'apostas_hot': [], 'do_cache': False,
+                                              'periodo': datetime.now().strftime('%d/%m/%Y')}
+            amanha = resultados.get('amanha') or {'data': data_amanha, 'jogos': [], 'apostas_hot': [], 'do_cache': False,
+                                                  'periodo': (datetime.now() + timedelta(days=1)).strftime('%d/%m/%Y')}
+            
+            # Datas em que o dailyRadar falhou (sem cache): avisar em vez de mostrar um dia vazio
+            self.datas_com_falha = [dia['periodo'] for nome, dia in (('hoje', hoje), ('amanha', amanha))
+                                    if nome in grafo.erros]
+            
+            self.jogos_monitorados = {data_hoje: hoje['jogos'], data_amanha: amanha['jogos']}
+            
+            # Etapa 6: APOSTAS HOT SEM CACHE SÃO ANALISADAS EM SEGUNDO PLANO
+            # A interface abre logo e os cards entram conforme cada jogo é concluído
+            self.analises_pendentes = []
+            for dia in (hoje, amanha):
+                if not dia['do_cache'] and dia['jogos']:
+                    jogos_validos = self.processar_todos_jogos(dia['jogos'])
+                    self.analises_pendentes.append((jogos_validos, dia['data'], dia['periodo']))
+            
+            total_para_analisar = sum(len(pendente[0]) for pendente in self.analises_pendentes)
             if total_para_analisar > 0:
                 print(f"🔥 {total_para_analisar} jogos SELECIONADOS para análise completa")
-            time.sleep(0.5)
-            
-            # Etapa 7: CARREGAR E ANALISAR APOSTAS HOT COMPLETAMENTE
-            apostas_todas = []
-            
-            # Se não há cache, analisar do zero
-            if not cache_hoje and jogos_validos_hoje:
-                self.atualizar_loading(60, "Analisando apostas hot de hoje detalhadamente...")
-                apostas_hot_hoje, jogos_hoje_com_odds = self.analisar_jogos_completo_com_progresso(
-                    jogos_validos_hoje, data_formatada, prog_inicial=60, prog_final=65
-                )
-                
-                # Adicionar data_jogo a cada aposta para filtro correto
-                for aposta in apostas_hot_hoje:
-                    aposta['data_jogo'] = data_hoje
-                
-                self.atualizar_loading(65, "Salvando cache de jogos e apostas de hoje...")
-                # Salvar no cache com jogos enriquecidos com odds
-                dados_cache_hoje = {
-                    'jogos': jogos_hoje_com_odds,
-                    'apostas_hot': apostas_hot_hoje
-                }
-                self.salvar_jogos_cache(data_hoje, dados_cache_hoje)
-            
-            # Se não há cache, analisar do zero
-            if not cache_amanha and jogos_validos_amanha:
-                self.atualizar_loading(70, "Analisando apostas hot de amanhã detalhadamente...")
-                apostas_hot_amanha, jogos_amanha_com_odds = self.analisar_jogos_completo_com_progresso(
-                    jogos_validos_amanha, data_formatada_amanha, prog_inicial=70, prog_final=80
-                )
-                
-                # Adicionar data_jogo a cada aposta para filtro correto
-                for aposta in apostas_hot_amanha:
-                    aposta['data_jogo'] = data_amanha
-                
-                self.atualizar_loading(80, "Salvando cache de jogos e apostas de amanhã...")
-                # Salvar no cache com jogos enriquecidos com odds
-                dados_cache_amanha = {
-                    'jogos': jogos_amanha_com_odds,
-                    'apostas_hot': apostas_hot_amanha
-                }
-                self.salvar_jogos_cache(data_amanha, dados_cache_amanha)
             
             # Para a interface, mostrar apenas os jogos de hoje por padrão
-            self.atualizar_loading(85, "Organizando apostas para exibição...")
-            apostas_todas.extend(apostas_hot_hoje)
-            
-            # Combinar e ordenar apostas por prob. bet booster
-            self.apostas_hot_carregadas = apostas_todas
+            self.apostas_hot_carregadas = list(hoje['apostas_hot'])
             self.apostas_hot_carregadas.sort(key=lambda x: -x.get('nossa_prob', 0))
             
             print(f"✅ {len(self.apostas_hot_carregadas)} apostas hot analisadas e prontas")
             
-            # Etapa 8: Finalizar
-            self.atualizar_loading(90, "Inicializando interface principal...")
-            time.sleep(0.5)
-            
-            self.atualizar_loading(95, "Preparando cards de apostas...")
-            time.sleep(0.3)
-            
             self.atualizar_loading(100, "Finalização concluída! Iniciando aplicação...")
-            time.sleep(0.8)
             
-            # Criar interface principal
-            self.root.after(100, self.finalizar_carregamento)
+            # Criar interface principal (ou só trocar os dados do snapshot pelos atuais)
+            self.agendar_na_interface(self.concluir_revalidacao if self.restaurando_snapshot else self.finalizar_carregamento)
             
         except Exception as e:
             print(f"Erro no carregamento: {e}")
@@ -622,9 +533,44 @@ class BetBoosterV2:
             
             # Mostrar erro na interface de carregamento
             self.atualizar_loading(100, f"Erro ao carregar: {str(e)}")
-            time.sleep(1)
             
-            self.root.after(100, self.finalizar_carregamento)
+            self.agendar_na_interface(self.concluir_revalidacao if self.restaurando_snapshot else self.finalizar_carregamento)
+    
+    def analisar_pendentes_em_segundo_plano(self, pendentes):
+        """
+        Analisa as datas sem cache agendadas na inicialização, publicando as apostas
+        na interface à medida que cada jogo termina e salvando o cache ao final de cada data
+        """
+        for jogos_validos, data_api, data_formatada in pendentes:
+            try:
+                def atualizar_status(texto=f"⏳ Analisando apostas de {data_formatada} em segundo plano..."):
+                    if hasattr(self, 'status_hot'):
+                        self.status_hot.config(text=texto, style='Warning.TLabel')
+                self.agendar_na_interface(atualizar_status)
+                
+                apostas_hot, jogos_com_odds = self.motor.analisar_jogos(
+                    jogos_validos, data_formatada,
+                    publicar=lambda apostas, d=data_api, f=data_formatada: self.publicar_apostas_hot(apostas, d, f))
+                
+                for aposta in apostas_hot:
+                    aposta['data_jogo'] = data_api
+                    aposta['periodo'] = data_formatada
+                
+                if motivo_interrupcao(jogos_com_odds):
+                    # Janela fechada ou prazo esgotado: não gravar um cache incompleto
+                    continue
+                
+                # Salvar no cache com jogos enriquecidos com odds
+                self.salvar_jogos_cache(data_api, {'jogos': jogos_com_odds, 'apostas_hot': apostas_hot})
+                
+                total = len(apostas_hot)
+                self.agendar_na_interface(
+                    lambda total=total, f=data_formatada: self.status_hot.config(
+                        text=f"✅ {total} apostas hot analisadas ({f})", style='Success.TLabel'))
+            except Exception as e:
+                print(f"❌ Erro na análise em segundo plano de {data_formatada}: {e}")
+        
+        self.analises_pendentes = []
     
     def processar_todos_jogos(self, jogos):
         """Processa jogos independente de validade - apenas adiciona ID se necessário"""
@@ -660,75 +606,48 @@ class BetBoosterV2:
         """MANTIDA PARA COMPATIBILIDADE - Mas agora aceita TODOS os jogos"""
         return self.processar_todos_jogos(jogos)
     
-    def analisar_jogos_completo_com_progresso(self, jogos, periodo, progress_callback=None, prog_inicial=60, prog_final=70):
-        """Analisa completamente os primeiros jogos de uma lista - VERSÃO PARALELA COM PROGRESSO"""
-        apostas_analisadas = []
-        jogos_com_odds = []  # Lista para jogos enriquecidos com odds
-
-        print(f"🔥 Iniciando análise completa PARALELA de {len(jogos)} jogos ({periodo})")
-
-        # Usar ThreadPoolExecutor para processamento paralelo
-        max_workers = 10  # Máximo 10 threads simultâneas para não sobrecarregar API
-        
-        # Definir a etapa de processamento atual
+    def analisar_jogos_completo_com_progresso(self, jogos, periodo, progress_callback=None, prog_inicial=60, prog_final=70,
+                                              publicar=None, varredura=None):
+        """
+        Analisa completamente os jogos de uma lista pelo motor de análise, refletindo o progresso na interface
+        `publicar` recebe as apostas de cada jogo assim que ficam prontas (ver publicar_apostas_hot)
+        `varredura` (motor.nova_varredura()) permite interromper a análise pela metade
+        """
         etapa_texto = f"Analisando apostas de {periodo.lower()}"
+        self.motor.modo = self.modo_analise.get()
         
         # Atualizar barra com progresso inicial
-        if hasattr(self, 'atualizar_loading'):
-            self.atualizar_loading(prog_inicial, etapa_texto)
+        self.atualizar_loading(prog_inicial, etapa_texto)
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submeter todas as tarefas
-            futures = []
-            for i, jogo in enumerate(jogos):
-                future = executor.submit(self.processar_jogo_para_hot_paralelo, jogo, periodo)
-                futures.append(future)
+        def progresso(concluidos, total, texto=None):
+            if texto:
+                if progress_callback:
+                    progress_callback(0, texto)
+                return
             
-            # Coletar resultados conforme completam
-            for i, future in enumerate(as_completed(futures)):
-                try:
-                    # Atualizar barra de progresso a cada 10 jogos (ou menos se tiver menos de 100 jogos)
-                    incremento_por_jogo = (prog_final - prog_inicial) / len(jogos)
-                    novo_progresso = prog_inicial + (i + 1) * incremento_por_jogo
-                    
-                    # Atualizar a cada 10 jogos ou na primeira/última jogada
-                    if i % 10 == 0 or i == len(jogos) - 1 or i == 0:
-                        if hasattr(self, 'atualizar_loading'):
-                            status_texto = f"{etapa_texto} - Jogo {i+1} de {len(jogos)}"
-                            self.atualizar_loading(novo_progresso, status_texto)
-                    
-                    # Chamar o callback de progresso se fornecido
-                    if progress_callback:
-                        progresso_atual = (i + 1) / len(jogos) * 100
-                        status_texto = f"Processando jogo {i+1}/{len(jogos)} ({progresso_atual:.0f}%)"
-                        progress_callback(progresso_atual, status_texto)
-                    
-                    # Obter resultado
-                    jogo_completo, recomendacoes = future.result(timeout=5)  # Timeout de 5 segundos por jogo
-                    
-                    # Adicionar resultados
-                    jogos_com_odds.append(jogo_completo)
-                    apostas_analisadas.extend(recomendacoes)
-                    
-                except Exception as e:
-                    print(f"❌ ERRO ao processar jogo {i+1}: {e}")
-                    # Adicionar jogo básico em caso de erro
-                    jogo_erro = {
-                        'id': f'erro_{i}',
-                        'home_team': 'Erro',
-                        'away_team': 'Erro',
-                        'periodo': periodo,
-                        'odds': None
-                    }
-                    jogos_com_odds.append(jogo_erro)
+            # Atualizar a cada 10 jogos ou na primeira/última jogada
+            if concluidos % 10 == 1 or concluidos == total:
+                novo_progresso = prog_inicial + concluidos * (prog_final - prog_inicial) / total
+                self.atualizar_loading(novo_progresso, f"{etapa_texto} - Jogo {concluidos} de {total}")
+            
+            if progress_callback:
+                progresso_atual = concluidos / total * 100
+                progress_callback(progresso_atual, f"Processando jogo {concluidos}/{total} ({progresso_atual:.0f}%)")
+        
+        apostas_analisadas, jogos_com_odds = self.motor.analisar_jogos(jogos, periodo, progresso, publicar, varredura)
         
         # Garantir que chegue ao progresso final
-        if hasattr(self, 'atualizar_loading'):
-            self.atualizar_loading(prog_final, f"Análise de apostas de {periodo.lower()} concluída")
-            
-        print(f"🎯 CONCLUÍDO PARALELO: {len(jogos_com_odds)} jogos processados, {len(apostas_analisadas)} apostas hot geradas ({periodo})")
+        self.atualizar_loading(prog_final, f"Análise de apostas de {periodo.lower()} concluída")
         return apostas_analisadas, jogos_com_odds
 
+    def reprocessar_jogos_com_falha(self, jogos, periodo, jogos_com_odds, apostas_analisadas):
+        """Reprocessa somente os jogos com falha definitiva na API (ver MotorAnalise)"""
+        self.motor.reprocessar_jogos_com_falha(jogos, periodo, jogos_com_odds, apostas_analisadas)
+
+    def separar_jogos_elegiveis(self, jogos, periodo, chamadas_por_jogo=FiltroElegibilidade.CHAMADAS_POR_JOGO_ANALISE):
+        """Aplica o filtro pré-busca e registra quantas chamadas à API foram evitadas"""
+        return self.motor.separar_jogos_elegiveis(jogos, periodo, chamadas_por_jogo)
+
     def analisar_jogos_completo(self, jogos, periodo):
         """Analisa completamente os primeiros jogos de uma lista - redireciona para a versão com progresso"""
         # Esta função é mantida para compatibilidade com código existente
@@ -736,43 +655,158 @@ class BetBoosterV2:
         return self.analisar_jogos_completo_com_progresso(jogos, periodo)
     
     def atualizar_loading(self, progresso, status):
-        """Atualiza barra de progresso e status"""
-        def update():
-            # Atualizar porcentagem
-            self.progress_var.set(progresso)
-            self.progress_percent.config(text=f"{int(progresso)}%")
-            
-            # Atualizar texto da etapa
-            self.loading_etapa.config(text=status)
-            
-            # Atualizar cores baseado no progresso
-            if progresso < 30:
-                cor_etapa = '#1e40af'  # azul escuro
-            elif progresso < 70:
-                cor_etapa = '#2563eb'  # azul médio
-            elif progresso < 100:
-                cor_etapa = '#3b82f6'  # azul claro
-            else:
-                cor_etapa = '#047857'  # verde
-                
-            self.loading_etapa.config(fg=cor_etapa)
+        """Atualiza barra de progresso e status (qualquer thread: só publica no barramento)"""
+        self.barramento.progresso('carregamento', progresso, status)
+    
+    def desenhar_loading(self, progresso, status):
+        """Redesenha a tela de carregamento com o último progresso publicado"""
+        # Tela já fechada (ou aberta direto do snapshot): nada a atualizar
+        if not self.tela_carregamento_ativa:
+            return
+        
+        # Atualizar porcentagem
+        self.progress_var.set(progresso)
+        self.progress_percent.config(text=f"{int(progresso)}%")
+        
+        # Atualizar texto da etapa
+        self.loading_etapa.config(text=status)
+        
+        # Atualizar cores baseado no progresso
+        if progresso < 30:
+            cor_etapa = '#1e40af'  # azul escuro
+        elif progresso < 70:
+            cor_etapa = '#2563eb'  # azul médio
+        elif progresso < 100:
+            cor_etapa = '#3b82f6'  # azul claro
+        else:
+            cor_etapa = '#047857'  # verde
             
-        self.root.after(0, update)
-        self.root.update_idletasks()  # Forçar atualização da interface
-        time.sleep(0.1)  # Pequena pausa para visualizar
+        self.loading_etapa.config(fg=cor_etapa)
     
     def finalizar_carregamento(self):
         """Remove tela de carregamento e mostra interface principal"""
         # Remover frame de carregamento
-        self.loading_frame.destroy()
+        if self.tela_carregamento_ativa:
+            self.tela_carregamento_ativa = False
+            self.loading_frame.destroy()
+        
+        # Estilos ttk são configurados na thread principal (antes rodavam na thread de carregamento)
+        self.setup_styles()
         
         # Criar interface principal
         self.create_widgets()
         self.main_widgets_created = True
         
+        if self.restaurando_snapshot:
+            # Cards do snapshot na hora; concluir_revalidacao troca pelos dados atuais
+            self.agendar_na_interface(self.exibir_snapshot)
+        else:
+            self.concluir_carregamento_dados()
+        
+        # Partidas perto do início são atualizadas com mais frequência que as distantes
+        self.motor.iniciar_atualizacao(self.jogos_para_atualizar)
+    
+    def concluir_carregamento_dados(self):
+        """Exibe as apostas carregadas e dispara a análise das datas sem cache"""
         # Exibir apostas hot já carregadas
+        # (pela fila, para não sobrescrever apostas publicadas pela análise em segundo plano)
         if hasattr(self, 'apostas_hot_carregadas') and self.apostas_hot_carregadas:
-            self.root.after(500, self.exibir_apostas_hot_prontas)
+            self.agendar_na_interface(self.exibir_apostas_hot_prontas)
+        
+        # Datas sem cache: analisar em segundo plano com exibição incremental
+        if self.analises_pendentes:
+            threading.Thread(target=self.analisar_pendentes_em_segundo_plano,
+                             args=(self.analises_pendentes,), daemon=True).start()
+        
+        # dailyRadar indisponível: nada foi gravado no cache, a próxima atualização busca de novo
+        datas_com_falha = getattr(self, 'datas_com_falha', [])
+        if datas_com_falha:
+            self.agendar_na_interface(lambda: self.publicar_status(
+                'hot', f"❌ Radar Esportivo indisponível para {', '.join(datas_com_falha)} - "
+                       f"atualize para buscar os jogos de novo", 'Danger.TLabel'))
+    
+    def concluir_revalidacao(self):
+        """Fim do carregamento iniciado a partir do snapshot: sai do modo desatualizado"""
+        self.restaurando_snapshot = False
+        if not self.apostas_hot_carregadas and not self.analises_pendentes and not getattr(self, 'datas_com_falha', []):
+            self.agendar_na_interface(lambda: self.status_hot.config(
+                text=f"✅ Dados revalidados ({datetime.now().strftime('%d/%m/%Y')})", style='Success.TLabel'))
+        self.concluir_carregamento_dados()
+    
+    def exibir_snapshot(self):
+        """Monta a aba Apostas Hot com as apostas e filtros da última sessão, marcada como desatualizada"""
+        try:
+            filtros = self.snapshot.get('filtros', {})
+            self.filtro_recomendacao.set(filtros.get('recomendacao', 'Todos'))
+            self.filtro_tipo.set(filtros.get('tipo', 'Todos'))
+            self.filtro_ordenacao.set(filtros.get('ordenacao', 'Prob. Média'))
+            
+            data_filtro = filtros.get('data')
+            apostas_exibidas = self.snapshot.get('apostas_exibidas')
+            if data_filtro and data_filtro >= self.snapshot['data_hoje']:
+                self.filtro_data_entry.set_date(datetime.strptime(data_filtro, '%Y-%m-%d'))
+            
+            self.apostas_hot = self.snapshot.get('apostas_hot', [])
+            if apostas_exibidas is not None and data_filtro == self.filtro_data_entry.get_date().strftime('%Y-%m-%d'):
+                # Ordem/filtro já calculados na sessão anterior
+                self.atualizar_apostas_hot_interface(apostas_exibidas)
+            else:
+                self.aplicar_filtros_hot()
+            
+            if self.restaurando_snapshot:
+                salvo_em = datetime.fromtimestamp(self.snapshot['salvo_em']).strftime('%H:%M')
+                self.status_hot.config(
+                    text=f"🕓 {len(self.apostas_hot)} apostas da sessão anterior ({salvo_em}, "
+                         f"{descrever_idade(self.snapshot)}) - revalidando...", style='Warning.TLabel')
+        except Exception as e:
+            print(f"⚠️ Erro ao exibir snapshot: {e}")
+    
+    def caminho_snapshot(self):
+        return os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cache', 'sessao.snapshot')
+    
+    def arquivos_de_dados(self):
+        """Arquivos JSON lidos na inicialização (database e banca), por chave do snapshot"""
+        data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+        return {
+            'times_database': os.path.join(data_dir, 'times_database.json'),
+            'banca_data': os.path.join(data_dir, 'banca_simulada.json'),
+            'apostas_ativas': os.path.join(data_dir, 'apostas_ativas.json'),
+            'historico_apostas': os.path.join(data_dir, 'historico_apostas.json')
+        }
+    
+    def salvar_snapshot_sessao(self):
+        """Grava o snapshot da sessão (chamado ao fechar, depois de salvar_dados)"""
+        if not self.main_widgets_created:
+            return
+        try:
+            arquivos = self.arquivos_de_dados()
+            estado = {
+                'data_hoje': datetime.now().strftime('%Y-%m-%d'),
+                'arquivos': assinatura_arquivos(arquivos.values()),
+                'times_database': self.times_database,
+                'banca_data': self.banca_data,
+                'apostas_ativas': self.apostas_ativas,
+                'historico_apostas': self.historico_apostas,
+                'jogos_monitorados': self.jogos_monitorados,
+                'apostas_hot': sorted(self.apostas_hot, key=lambda x: -x.get('nossa_prob', 0)),
+                'apostas_exibidas': list(getattr(self, 'apostas_hot_exibidas', [])),
+                'filtros': {
+                    'data': self.filtro_data_entry.get_date().strftime('%Y-%m-%d'),
+                    'recomendacao': self.filtro_recomendacao.get(),
+                    'tipo': self.filtro_tipo.get(),
+                    'ordenacao': self.filtro_ordenacao.get()
+                }
+            }
+            tamanho = salvar_snapshot(self.caminho_snapshot(), estado)
+            if tamanho:
+                print(f"💾 Snapshot da sessão salvo: {len(estado['apostas_hot'])} apostas, {tamanho / 1024:.0f} KB")
+        except Exception as e:
+            print(f"⚠️ Erro ao salvar snapshot da sessão: {e}")
+    
+    def jogos_para_atualizar(self):
+        """(jogo, data) de hoje e amanhã para a atualização periódica do motor"""
+        return [(jogo, data) for data, jogos in list(self.jogos_monitorados.items())
+                for jogo in jogos if isinstance(jogo, dict)]
     
     def exibir_apostas_hot_prontas(self):
         """Exibe as apostas hot que já foram carregadas durante a inicialização"""
@@ -809,35 +843,87 @@ class BetBoosterV2:
         style.configure('Live.TLabel', foreground='red', font=('Arial', 9, 'bold'))
     
     def create_widgets(self):
-        """Cria todas as abas da interface"""
+        """
+        Cria o notebook principal; só a aba Apostas Hot é construída agora,
+        as demais (e as sub-abas de Múltiplas) são montadas no primeiro acesso
+        """
+        inicio = time.perf_counter()
+        self.abas_pendentes = {}
+        self.tempos_abas = {}
+        
         # Notebook principal
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill='both', expand=True, padx=10, pady=10)
+        self.notebook.bind('<<NotebookTabChanged>>', self.ao_trocar_aba)
         
         # Aba 1: Apostas Hot (Nova funcionalidade)
-        self.create_apostas_hot_tab()
+        self.registrar_aba(self.notebook, 'tab_apostas_hot', "🔥 Apostas Hot", self.create_apostas_hot_tab)
         
         # Aba 2: Jogos do Dia (Atualizada)
-        self.create_jogos_do_dia_tab()
+        self.registrar_aba(self.notebook, 'tab_jogos_dia', "⚽ Jogos do Dia", self.create_jogos_do_dia_tab)
         
         # Aba 3: Cadastro Manual
-        self.create_cadastro_tab()
+        self.registrar_aba(self.notebook, 'tab_cadastro', "➕ Cadastro Manual", self.create_cadastro_tab)
         
         # Aba 4: Análise de Confrontos
-        self.create_analise_tab()
+        self.registrar_aba(self.notebook, 'tab_analise', "📊 Análise", self.create_analise_tab)
         
         # Aba 5: Múltiplas
-        self.create_multiplas_tab()
+        self.registrar_aba(self.notebook, 'tab_multiplas', "🎯 Múltiplas", self.create_multiplas_tab)
         
-        # Auto-carregar só se não foram carregadas na inicialização
-        if not hasattr(self, 'apostas_hot_carregadas') or not self.apostas_hot_carregadas:
+        # A aba visível é construída já; as outras esperam o <<NotebookTabChanged>>
+        self.construir_aba(self.tab_apostas_hot)
+        self.relatorio_abas((time.perf_counter() - inicio) * 1000)
+        
+        # Auto-carregar só se não foram carregadas na inicialização nem estão sendo analisadas
+        if ((not hasattr(self, 'apostas_hot_carregadas') or not self.apostas_hot_carregadas) and
+                not self.analises_pendentes):
             self.root.after(1000, self.auto_carregar_apostas_hot)
     
+    def registrar_aba(self, notebook, atributo, texto, construtor):
+        """
+        Adiciona uma aba vazia ao notebook e guarda quem a constrói
+        
+        Args:
+            notebook: Notebook que recebe a aba
+            atributo: Nome do atributo do frame (ex.: 'tab_historico')
+            texto: Título da aba
+            construtor: Método create_*_tab que preenche o frame
+        """
+        frame = ttk.Frame(notebook)
+        notebook.add(frame, text=texto)
+        setattr(self, atributo, frame)
+        self.abas_pendentes[str(frame)] = (texto, construtor)
+    
+    def construir_aba(self, frame):
+        """Constrói a aba no primeiro acesso e registra quanto custou (ms)"""
+        pendente = self.abas_pendentes.pop(str(frame), None)
+        if not pendente:
+            return
+        texto, construtor = pendente
+        inicio = time.perf_counter()
+        try:
+            construtor()
+        except Exception as e:
+            print(f"❌ Erro ao construir aba {texto}: {e}")
+        self.tempos_abas[texto] = (time.perf_counter() - inicio) * 1000
+        if self.main_widgets_created:
+            print(f"🧱 Aba {texto} construída em {self.tempos_abas[texto]:.0f} ms")
+    
+    def ao_trocar_aba(self, event):
+        """<<NotebookTabChanged>>: monta a aba selecionada se ainda não existe"""
+        selecionada = event.widget.select()
+        if selecionada:
+            self.construir_aba(selecionada)
+    
+    def relatorio_abas(self, total_ms):
+        """Relatório da abertura: custo de cada aba construída e as que ficaram para depois"""
+        construidas = ', '.join(f"{texto} {ms:.0f} ms" for texto, ms in self.tempos_abas.items())
+        adiadas = ', '.join(texto for texto, _ in self.abas_pendentes.values())
+        print(f"⏱️ Interface pronta em {total_ms:.0f} ms - construídas: {construidas}; adiadas: {adiadas or 'nenhuma'}")
+    
     def create_apostas_hot_tab(self):
         """Nova aba: Apostas Hot - Recomendações automáticas"""
-        self.tab_apostas_hot = ttk.Frame(self.notebook)
-        self.notebook.add(self.tab_apostas_hot, text="🔥 Apostas Hot")
-        
         # Título
         title_frame = ttk.Frame(self.tab_apostas_hot)
         title_frame.pack(fill='x', pady=10)
@@ -977,6 +1063,9 @@ class BetBoosterV2:
         data_api = data_selecionada.strftime('%Y-%m-%d')
         data_formatada = data_selecionada.strftime('%d/%m/%Y')
         
+        # Trocar de data interrompe a análise da data anterior
+        self.cancelar_analise_data(f"data alterada para {data_formatada}")
+        
         # Verificar se a data selecionada é hoje
         data_hoje = datetime.now().strftime('%Y-%m-%d')
         
@@ -1014,7 +1103,6 @@ class BetBoosterV2:
         """Analisa jogos de uma data específica e exibe apostas hot"""
         try:
             self.status_hot.config(text=f"🔄 Analisando jogos da data {data_formatada}...", style='Warning.TLabel')
-            self.root.update()
             
             # Tentar carregar do cache
             cache_path = self.get_cache_file_path(data_api)
@@ -1058,24 +1146,35 @@ class BetBoosterV2:
             print(f"Erro ao analisar jogos da data {data_formatada}: {e}")
             return False
             
+    def cancelar_analise_data(self, motivo):
+        """Interrompe a análise da data selecionada, se houver uma em andamento"""
+        varredura = self.varredura_data
+        if varredura is not None and not varredura.esgotado():
+            print(f"⏹️ Interrompendo análise em andamento: {motivo}")
+            varredura.cancelar(motivo)
+    
     def analisar_jogos_data_especifica_thread(self, data_api, data_formatada):
         """Versão em thread da análise de jogos para data específica"""
+        varredura = self.motor.nova_varredura()
+        self.varredura_data = varredura
         try:
             # Buscar jogos da API
             jogos = self.api.buscar_jogos_do_dia(data_api)
+            if varredura.cancelado():
+                return
             
             if not jogos:
                 def atualizar_status_sem_jogos():
                     self.status_hot.config(text=f"❌ Nenhum jogo encontrado para {data_formatada}", 
                                          style='Warning.TLabel')
-                self.root.after(0, atualizar_status_sem_jogos)
+                self.agendar_na_interface(atualizar_status_sem_jogos)
                 return
             
             # Atualizar status na thread principal
             def atualizar_status_processando():
                 self.status_hot.config(text=f"📊 Processando {len(jogos)} jogos para {data_formatada}...", 
                                      style='Warning.TLabel')
-            self.root.after(0, atualizar_status_processando)
+            self.agendar_na_interface(atualizar_status_processando)
             
             # Usar a mesma abordagem de analisar_jogos_completo
             jogos_validos = self.processar_todos_jogos(jogos)  # Limitar a 100 jogos
@@ -1098,19 +1197,28 @@ class BetBoosterV2:
                 self.progresso_texto = ttk.Label(self.progresso_frame, text="0%")
                 self.progresso_texto.pack()
             
-            self.root.after(0, criar_barra_progresso)
+            self.agendar_na_interface(criar_barra_progresso)
             
-            # Função para atualizar o progresso
-            def atualizar_progresso(valor, texto):
-                def _atualizar():
-                    self.progresso_var.set(valor)
-                    self.progresso_texto.config(text=texto)
-                self.root.after(0, _atualizar)
+            # Progresso coalescido pelo barramento (um redesenho por tique)
+            atualizar_progresso = self.publicar_progresso_hot
             
+            # Cards aparecem conforme cada jogo é concluído
+            self.agendar_na_interface(self.reiniciar_apostas_hot_incrementais)
             apostas_recomendadas, jogos_com_odds = self.analisar_jogos_completo_com_progresso(
-                jogos_validos, data_formatada, atualizar_progresso
+                jogos_validos, data_formatada, atualizar_progresso,
+                publicar=lambda apostas: self.publicar_apostas_hot(apostas, data_api, data_formatada),
+                varredura=varredura
             )
             
+            if varredura.cancelado():
+                # Usuário trocou de data ou fechou a janela: a nova seleção cuida da tela
+                def remover_progresso_interrompido():
+                    if hasattr(self, 'progresso_frame'):
+                        self.progresso_frame.destroy()
+                self.agendar_na_interface(remover_progresso_interrompido)
+                return
+            analise_parcial = motivo_interrupcao(jogos_com_odds)
+            
             # Verificar se retornou apostas
             if not apostas_recomendadas:
                 def mostrar_sem_apostas():
@@ -1120,7 +1228,7 @@ class BetBoosterV2:
                     
                     self.status_hot.config(text=f"❌ Nenhuma aposta recomendada para {data_formatada}", 
                                          style='Warning.TLabel')
-                self.root.after(0, mostrar_sem_apostas)
+                self.agendar_na_interface(mostrar_sem_apostas)
                 return
             
             # Adicionar data_jogo a cada aposta para filtro correto
@@ -1129,17 +1237,27 @@ class BetBoosterV2:
                 # Definir período para a data formatada para exibição no card
                 aposta['periodo'] = data_formatada
             
-            # Exibir apostas na thread principal
+            # Concluir depois que a fila entregar todas as apostas publicadas
             def exibir_apostas():
                 # Remover barra de progresso
                 if hasattr(self, 'progresso_frame'):
                     self.progresso_frame.destroy()
                 
-                self.exibir_apostas_hot(apostas_recomendadas)
-                self.status_hot.config(text=f"✅ {len(apostas_recomendadas)} apostas analisadas para {data_formatada}", 
-                                     style='Success.TLabel')
+                # Cards já inseridos incrementalmente; só reconstruir se algo divergiu
+                if len(self.apostas_hot) != len(apostas_recomendadas):
+                    self.exibir_apostas_hot(apostas_recomendadas)
+                if analise_parcial:
+                    self.status_hot.config(text=f"⚠️ {len(apostas_recomendadas)} apostas (análise parcial: {analise_parcial}) "
+                                                f"para {data_formatada}", style='Warning.TLabel')
+                else:
+                    self.status_hot.config(text=f"✅ {len(apostas_recomendadas)} apostas analisadas para {data_formatada}", 
+                                         style='Success.TLabel')
+            
+            self.agendar_na_interface(exibir_apostas)
             
-            self.root.after(0, exibir_apostas)
+            # Resultado parcial é exibido, mas não vira cache (a data seria considerada completa)
+            if analise_parcial:
+                return
             
             # Salvar apostas no cache
             try:
@@ -1167,7 +1285,7 @@ class BetBoosterV2:
                     self.progresso_frame.destroy()
                     
                 self.status_hot.config(text=f"❌ Erro: {str(e)}", style='Warning.TLabel')
-            self.root.after(0, mostrar_erro)
+            self.agendar_na_interface(mostrar_erro)
             print(f"Erro ao analisar jogos da data {data_formatada}: {e}")
             
     def aplicar_filtros_hot(self, event=None):
@@ -1189,55 +1307,11 @@ class BetBoosterV2:
             filtro_tipo = self.filtro_tipo.get()
             filtro_ordenacao = self.filtro_ordenacao.get()
             
-            # Filtrar apostas
-            apostas_filtradas = []
-            
-            for aposta in self.apostas_hot:
-                # Filtro de data - verificar se a data da aposta coincide com a data selecionada
-                incluir_data = False
-                data_aposta = aposta.get('data_jogo', aposta.get('periodo', ''))
-                if data_aposta == data_selecionada_api:
-                    incluir_data = True
-                
-                # Filtro de Recomendação - usar o campo 'tipo' da aposta
-                incluir_recomendacao = True
-                if filtro_recomendacao == "Fortes":
-                    incluir_recomendacao = aposta.get('tipo') == 'FORTE'
-                elif filtro_recomendacao == "Moderadas":
-                    incluir_recomendacao = aposta.get('tipo') == 'MODERADA'
-                elif filtro_recomendacao == "Arriscadas":
-                    incluir_recomendacao = aposta.get('tipo') == 'ARRISCADA'
-                elif filtro_recomendacao == "Muito Arriscadas":
-                    incluir_recomendacao = aposta.get('tipo') == 'MUITO_ARRISCADA'
-
-                # Filtro de tipo de aposta - verificar se é resultado ou outros
-                incluir_tipo = True
-                if filtro_tipo == "Resultado":
-                    # Apostas de resultado: vitória casa, empate, vitória visitante
-                    tipo_aposta = aposta.get('aposta', '').lower()
-                    incluir_tipo = any(palavra in tipo_aposta for palavra in ['vitória', 'empate', 'casa', 'visitante'])
-                elif filtro_tipo == "Outros":
-                    # Apostas over/under e outras
-                    tipo_aposta = aposta.get('aposta', '').lower()
-                    incluir_tipo = any(palavra in tipo_aposta for palavra in ['over', 'under', 'btts', 'gols']) and not any(palavra in tipo_aposta for palavra in ['vitória', 'empate'])
-
-                if incluir_data and incluir_recomendacao and incluir_tipo:
-                    apostas_filtradas.append(aposta)
-            
-            # Ordenar apostas conforme filtro selecionado
-            if filtro_ordenacao == "Horário":
-                apostas_filtradas.sort(key=lambda x: x.get('horario', '00:00'))
-            elif filtro_ordenacao == "Odd":
-                apostas_filtradas.sort(key=lambda x: float(x.get('odd', 0)))
-            elif filtro_ordenacao == "Value":
-                apostas_filtradas.sort(key=lambda x: float(x.get('value', 0)), reverse=True)
-                # Ordenar pela média das probabilidades (maior para menor)
-            else:  # Prob. média
-                for aposta in apostas_filtradas:
-                    prob_calc = float(aposta.get('prob_calculada', 0))
-                    prob_impl = float(aposta.get('prob_implicita', 0))
-                    aposta['prob_media'] = (prob_calc + prob_impl) / 2
-                apostas_filtradas.sort(key=lambda x: float(x.get('prob_media', 0)), reverse=True)
+            # Filtrar e ordenar apostas (mesma regra usada na inserção incremental)
+            apostas_filtradas = [aposta for aposta in self.apostas_hot
+                                 if self.aposta_passa_filtros_hot(aposta, data_selecionada_api,
+                                                                  filtro_recomendacao, filtro_tipo)]
+            apostas_filtradas.sort(key=lambda aposta: self.chave_ordenacao_hot(aposta, filtro_ordenacao))
             
             # Atualizar interface com apostas filtradas
             self.atualizar_apostas_hot_interface(apostas_filtradas)
@@ -1260,6 +1334,156 @@ class BetBoosterV2:
             self.status_hot.config(text=f"❌ Erro ao aplicar filtros: {str(e)}", style='Warning.TLabel')
             print(f"Erro ao aplicar filtros: {e}")
     
+    def aposta_passa_filtros_hot(self, aposta, data_selecionada_api, filtro_recomendacao, filtro_tipo):
+        """Indica se a aposta atende aos filtros de data, recomendação e tipo da aba Apostas Hot"""
+        # Filtro de data - verificar se a data da aposta coincide com a data selecionada
+        data_aposta = aposta.get('data_jogo', aposta.get('periodo', ''))
+        if data_aposta != data_selecionada_api:
+            return False
+        
+        # Filtro de Recomendação - usar o campo 'tipo' da aposta
+        tipos_recomendacao = {
+            "Fortes": 'FORTE',
+            "Moderadas": 'MODERADA',
+            "Arriscadas": 'ARRISCADA',
+            "Muito Arriscadas": 'MUITO_ARRISCADA'
+        }
+        if filtro_recomendacao in tipos_recomendacao and aposta.get('tipo') != tipos_recomendacao[filtro_recomendacao]:
+            return False
+        
+        # Filtro de tipo de aposta - resultado (vitória casa, empate, vitória visitante, empate anula) ou
+        # outros (over/under, ambos marcam, handicap asiático)
+        tipo_aposta = aposta.get('aposta', '').lower()
+        outros_mercados = ('handicap', 'ambos marcam')
+        if filtro_tipo == "Resultado":
+            return (not tipo_aposta.startswith(outros_mercados) and
+                    any(palavra in tipo_aposta for palavra in ['vitória', 'empate', 'casa', 'visitante']))
+        if filtro_tipo == "Outros":
+            return (tipo_aposta.startswith(outros_mercados) or
+                    (any(palavra in tipo_aposta for palavra in ['over', 'under', 'btts', 'gols']) and
+                     not any(palavra in tipo_aposta for palavra in ['vitória', 'empate'])))
+        return True
+    
+    def chave_ordenacao_hot(self, aposta, filtro_ordenacao):
+        """Chave crescente equivalente à ordenação selecionada no filtro"""
+        if filtro_ordenacao == "Horário":
+            return aposta.get('horario', '00:00')
+        if filtro_ordenacao == "Odd":
+            return float(aposta.get('odd', 0))
+        if filtro_ordenacao == "Value":
+            return -float(aposta.get('value', 0))
+        # Prob. média (maior para menor)
+        aposta['prob_media'] = (float(aposta.get('prob_calculada', 0)) + float(aposta.get('prob_implicita', 0))) / 2
+        return -aposta['prob_media']
+    
+    def publicar_apostas_hot(self, apostas, data_api, data_formatada):
+        """
+        Envia apostas recém-analisadas para a interface (chamado pelas threads de análise)
+        Os cards aparecem na posição ordenada enquanto o restante da análise continua
+        """
+        for aposta in apostas:
+            aposta['data_jogo'] = data_api
+            aposta['periodo'] = data_formatada
+        self.barramento.resultado('apostas_hot', apostas)
+    
+    def agendar_na_interface(self, funcao):
+        """Executa `funcao` na thread da interface depois dos eventos já publicados"""
+        self.barramento.chamar(funcao)
+    
+    def publicar_status(self, chave, texto, estilo='Warning.TLabel'):
+        """Atualiza o label de status 'hot' (status_hot) ou 'jogos' (status_jogos) de qualquer thread"""
+        self.barramento.status(chave, texto, estilo)
+    
+    def publicar_progresso_hot(self, valor, texto):
+        """Atualiza a barra de progresso da aba Apostas Hot de qualquer thread"""
+        self.barramento.progresso('hot', valor, texto)
+    
+    def bombear_barramento(self):
+        """Drena o barramento na thread da interface a cada tique e reagenda a si mesma"""
+        try:
+            for tipo, chave, dados in self.barramento.drenar():
+                try:
+                    self.despachar_evento(tipo, chave, dados)
+                except Exception as e:
+                    print(f"Erro ao aplicar evento '{tipo}' na interface: {e}")
+        finally:
+            self.root.after(INTERVALO_BARRAMENTO_MS, self.bombear_barramento)
+    
+    def despachar_evento(self, tipo, chave, dados):
+        """Aplica um evento do barramento aos widgets (widgets de abas ainda não criadas são ignorados)"""
+        if tipo == 'chamar':
+            dados()
+        elif tipo == 'resultado':
+            if not self.main_widgets_created:
+                # Cards ainda não existem: tentar de novo no próximo tique
+                self.barramento.resultado(chave, dados)
+            elif chave == 'apostas_hot':
+                self.inserir_apostas_hot_ordenadas(dados)
+        elif tipo == 'status':
+            texto, estilo = dados
+            rotulo = getattr(self, {'hot': 'status_hot', 'jogos': 'status_jogos'}[chave], None)
+            if rotulo is not None:
+                if estilo:
+                    rotulo.config(text=texto, style=estilo)
+                else:
+                    rotulo.config(text=texto)
+        elif tipo == 'progresso':
+            valor, texto = dados
+            if chave == 'carregamento':
+                self.desenhar_loading(valor, texto)
+            elif chave == 'hot' and hasattr(self, 'progresso_frame') and self.progresso_frame.winfo_exists():
+                self.progresso_var.set(valor)
+                self.progresso_texto.config(text=texto)
+    
+    def reiniciar_apostas_hot_incrementais(self):
+        """Começa uma nova análise com a lista de apostas hot vazia"""
+        self.apostas_hot = []
+        self.atualizar_apostas_hot_interface([])
+    
+    def inserir_apostas_hot_ordenadas(self, novas):
+        """
+        Adiciona apostas à lista e insere os cards na posição ordenada conforme os filtros atuais
+        Só os cards a partir da primeira posição alterada são recriados
+        """
+        if not hasattr(self, 'apostas_hot') or self.apostas_hot is None:
+            self.apostas_hot = []
+        self.apostas_hot.extend(novas)
+        
+        if not hasattr(self, 'apostas_hot_frame'):
+            return
+        
+        data_selecionada_api = self.filtro_data_entry.get_date().strftime('%Y-%m-%d')
+        filtro_recomendacao = self.filtro_recomendacao.get()
+        filtro_tipo = self.filtro_tipo.get()
+        filtro_ordenacao = self.filtro_ordenacao.get()
+        
+        visiveis = [aposta for aposta in novas
+                    if self.aposta_passa_filtros_hot(aposta, data_selecionada_api, filtro_recomendacao, filtro_tipo)]
+        if not visiveis:
+            return
+        
+        # Layout ainda sem colunas (vazio ou mensagem de "nenhuma aposta"): recriar
+        if not getattr(self, 'colunas_hot', None) or not self.colunas_hot[0].winfo_exists():
+            for widget in self.apostas_hot_frame.winfo_children():
+                widget.destroy()
+            self.criar_colunas_apostas_hot()
+        
+        primeira_posicao = len(self.apostas_hot_exibidas)
+        for aposta in visiveis:
+            chave = self.chave_ordenacao_hot(aposta, filtro_ordenacao)
+            posicao = bisect_right(self.chaves_hot_exibidas, chave)
+            self.chaves_hot_exibidas.insert(posicao, chave)
+            self.apostas_hot_exibidas.insert(posicao, aposta)
+            primeira_posicao = min(primeira_posicao, posicao)
+        
+        # Cards são empacotados em ordem nas duas colunas: recriar apenas a cauda
+        for card in self.cards_hot[primeira_posicao:]:
+            card.destroy()
+        del self.cards_hot[primeira_posicao:]
+        for i in range(primeira_posicao, len(self.apostas_hot_exibidas)):
+            parent_frame = self.colunas_hot[i % 2]
+            self.cards_hot.append(self.criar_card_aposta_hot(self.apostas_hot_exibidas[i], i, parent_frame))
+    
     def carregar_apostas_amanha(self):
         """Carrega as apostas de amanhã do cache"""
         data_amanha = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
@@ -1284,9 +1508,9 @@ class BetBoosterV2:
         """Thread para carregar apostas de uma data específica do cache sem travar a interface"""
         try:
             def atualizar_status(texto):
-                self.status_hot.config(text=texto, style='Warning.TLabel')
+                self.publicar_status('hot', texto)
                 
-            self.root.after(0, lambda: atualizar_status(f"🔄 Verificando cache de apostas para {data_formatada}..."))
+            atualizar_status(f"🔄 Verificando cache de apostas para {data_formatada}...")
             
             # Verificar e carregar do cache
             cache_path = self.get_cache_file_path(data_api)
@@ -1320,16 +1544,16 @@ class BetBoosterV2:
                     self.exibir_apostas_hot(apostas_filtradas)
                     self.status_hot.config(text=f"✅ {len(apostas_filtradas)} apostas carregadas do cache ({data_formatada})", 
                                          style='Success.TLabel')
-                self.root.after(0, exibir_apostas_cache)
+                self.agendar_na_interface(exibir_apostas_cache)
             else:
                 # Se não encontrou no cache, informar ao usuário
-                self.root.after(0, lambda: atualizar_status(f"❌ Nenhuma aposta encontrada para {data_formatada}"))
+                atualizar_status(f"❌ Nenhuma aposta encontrada para {data_formatada}")
                 
         except Exception as e:
             def mostrar_erro():
                 self.status_hot.config(text=f"❌ Erro ao carregar apostas: {str(e)}", 
                                      style='Warning.TLabel')
-            self.root.after(0, mostrar_erro)
+            self.agendar_na_interface(mostrar_erro)
             print(f"Erro ao carregar apostas para {data_formatada} em thread: {e}")
         
     def limpar_filtros_hot(self):
@@ -1402,11 +1626,13 @@ class BetBoosterV2:
             # Verificar se a data selecionada é hoje
             data_hoje = datetime.now().strftime('%Y-%m-%d')
             
+            # Atualização explícita: descartar odds/estatísticas guardadas no broker
+            self.broker.invalidar()
+            
             if data_api == data_hoje:
                 # Data de hoje selecionada - atualizar ambos os caches (hoje e amanhã)
                 self.status_hot.config(text=f"🔄 Atualizando apostas para {data_formatada}...", 
                                      style='Warning.TLabel')
-                self.root.update()
                 
                 # Iniciar uma thread para limpar o cache e recarregar as apostas
                 threading.Thread(
@@ -1429,7 +1655,6 @@ class BetBoosterV2:
                 # Data personalizada selecionada
                 self.status_hot.config(text=f"🔄 Atualizando apostas para {data_formatada}...", 
                                      style='Warning.TLabel')
-                self.root.update()
                 
                 # Iniciar uma thread para limpar o cache e recarregar as apostas
                 threading.Thread(
@@ -1490,7 +1715,7 @@ class BetBoosterV2:
             def mostrar_erro():
                 self.status_hot.config(text=f"❌ Erro ao atualizar apostas: {str(e)}", 
                                      style='Warning.TLabel')
-            self.root.after(0, mostrar_erro)
+            self.agendar_na_interface(mostrar_erro)
             print(f"Erro ao atualizar apostas hot em thread: {e}")
             
     def carregar_apostas_hoje_amanha_thread(self):
@@ -1502,9 +1727,9 @@ class BetBoosterV2:
             data_formatada_amanha = (datetime.now() + timedelta(days=1)).strftime('%d/%m/%Y')
             
             def atualizar_status(texto):
-                self.status_hot.config(text=texto, style='Warning.TLabel')
+                self.publicar_status('hot', texto)
                 
-            self.root.after(0, lambda: atualizar_status("🔄 Verificando cache de apostas para hoje e amanhã..."))
+            atualizar_status("🔄 Verificando cache de apostas para hoje e amanhã...")
             
             # Verificar e carregar do cache
             cache_hoje = self.get_cache_file_path(data_hoje)
@@ -1559,17 +1784,17 @@ class BetBoosterV2:
                     self.exibir_apostas_hot(apostas_todas)
                     self.status_hot.config(text=f"✅ {len(apostas_todas)} apostas carregadas do cache (Hoje/Amanhã)", 
                                          style='Success.TLabel')
-                self.root.after(0, exibir_apostas_cache)
+                self.agendar_na_interface(exibir_apostas_cache)
             else:
                 # Se não encontrou no cache, executar análise completa
-                self.root.after(0, lambda: atualizar_status("🔄 Cache não encontrado, analisando apostas..."))
+                atualizar_status("🔄 Cache não encontrado, analisando apostas...")
                 self.analisar_apostas_thread()
                 
         except Exception as e:
             def mostrar_erro():
                 self.status_hot.config(text=f"❌ Erro ao carregar apostas: {str(e)}", 
                                      style='Warning.TLabel')
-            self.root.after(0, mostrar_erro)
+            self.agendar_na_interface(mostrar_erro)
             print(f"Erro ao carregar apostas hoje/amanhã em thread: {e}")
     
     def atualizar_apostas_data_especifica_thread_silent(self, data_api, data_formatada):
@@ -1628,9 +1853,9 @@ class BetBoosterV2:
             cache_path = self.get_cache_file_path(data_api)
             
             def atualizar_status(texto):
-                self.status_hot.config(text=texto, style='Warning.TLabel')
+                self.publicar_status('hot', texto)
                 
-            self.root.after(0, lambda: atualizar_status(f"🔄 Atualizando apostas para {data_formatada}..."))
+            atualizar_status(f"🔄 Atualizando apostas para {data_formatada}...")
             
             if os.path.exists(cache_path):
                 # Remover apenas as apostas hot do cache
@@ -1657,14 +1882,13 @@ class BetBoosterV2:
             def mostrar_erro():
                 self.status_hot.config(text=f"❌ Erro ao atualizar apostas: {str(e)}", 
                                      style='Warning.TLabel')
-            self.root.after(0, mostrar_erro)
+            self.agendar_na_interface(mostrar_erro)
             print(f"Erro ao atualizar apostas hot em thread: {e}")
 
     def analisar_apostas(self):
         """Analisa todas as apostas do sistema, carregando dados de hoje e amanhã"""
         try:
             self.status_hot.config(text="🔄 Analisando apostas hot...", style='Warning.TLabel')
-            self.root.update()
             
             # Verificar se há cache para hoje e amanhã
             data_hoje = datetime.now().strftime('%Y-%m-%d')
@@ -1710,9 +1934,9 @@ class BetBoosterV2:
         try:
             # Atualizar status na thread principal
             def atualizar_status(texto):
-                self.status_hot.config(text=texto, style='Warning.TLabel')
+                self.publicar_status('hot', texto)
             
-            self.root.after(0, lambda: atualizar_status("🔄 Buscando jogos de hoje e amanhã..."))
+            atualizar_status("🔄 Buscando jogos de hoje e amanhã...")
             
             # Buscar jogos de hoje
             data_hoje = datetime.now().strftime('%Y-%m-%d')
@@ -1723,7 +1947,7 @@ class BetBoosterV2:
             jogos_amanha = self.api.buscar_jogos_do_dia(data_amanha)
             
             if not jogos_hoje and not jogos_amanha:
-                self.root.after(0, lambda: atualizar_status("❌ Nenhum jogo encontrado para hoje e amanhã"))
+                atualizar_status("❌ Nenhum jogo encontrado para hoje e amanhã")
                 return
             
             # Criar e exibir barra de progresso
@@ -1744,21 +1968,17 @@ class BetBoosterV2:
                 self.progresso_texto = ttk.Label(self.progresso_frame, text="0%")
                 self.progresso_texto.pack()
             
-            self.root.after(0, criar_barra_progresso)
+            self.agendar_na_interface(criar_barra_progresso)
             
-            # Função para atualizar o progresso
-            def atualizar_progresso(valor, texto):
-                def _atualizar():
-                    self.progresso_var.set(valor)
-                    self.progresso_texto.config(text=texto)
-                self.root.after(0, _atualizar)
+            # Progresso coalescido pelo barramento (um redesenho por tique)
+            atualizar_progresso = self.publicar_progresso_hot
             
             # Processar jogos e gerar apostas hot
             apostas_todas = []
             
             # Processar jogos de hoje se tiver
             if jogos_hoje:
-                self.root.after(0, lambda: atualizar_status("🔄 Analisando jogos de hoje..."))
+                atualizar_status("🔄 Analisando jogos de hoje...")
                 
                 jogos_validos_hoje = self.processar_todos_jogos(jogos_hoje)  # Limitar a 100 jogos
                 
@@ -1767,8 +1987,10 @@ class BetBoosterV2:
                     progresso_hoje = valor / 2  # Converter para escala 0-50%
                     atualizar_progresso(progresso_hoje, f"Hoje: {texto}")
                 
+                self.agendar_na_interface(self.reiniciar_apostas_hot_incrementais)
                 apostas_hoje, jogos_hoje_com_odds = self.analisar_jogos_completo_com_progresso(
-                    jogos_validos_hoje, 'Hoje', progress_callback_hoje
+                    jogos_validos_hoje, 'Hoje', progress_callback_hoje,
+                    publicar=lambda apostas: self.publicar_apostas_hot(apostas, data_hoje, 'Hoje')
                 )
                 
                 # Adicionar data_jogo às apostas de hoje
@@ -1787,7 +2009,7 @@ class BetBoosterV2:
             
             # Processar jogos de amanhã se tiver
             if jogos_amanha:
-                self.root.after(0, lambda: atualizar_status("🔄 Analisando jogos de amanhã..."))
+                atualizar_status("🔄 Analisando jogos de amanhã...")
                 
                 jogos_validos_amanha = self.processar_todos_jogos(jogos_amanha)  # Limitar a 100 jogos
                 
@@ -1797,7 +2019,8 @@ class BetBoosterV2:
                     atualizar_progresso(progresso_amanha, f"Amanhã: {texto}")
                 
                 apostas_amanha, jogos_amanha_com_odds = self.analisar_jogos_completo_com_progresso(
-                    jogos_validos_amanha, 'Amanhã', progress_callback_amanha
+                    jogos_validos_amanha, 'Amanhã', progress_callback_amanha,
+                    publicar=lambda apostas: self.publicar_apostas_hot(apostas, data_amanha, 'Amanhã')
                 )
                 
                 # Adicionar data_jogo às apostas de amanhã
@@ -1820,16 +2043,17 @@ class BetBoosterV2:
                 if hasattr(self, 'progresso_frame'):
                     self.progresso_frame.destroy()
                 
-                # Exibir apostas
+                # Exibir apostas (já inseridas incrementalmente; só reconstruir se algo divergiu)
                 if apostas_todas:
-                    self.exibir_apostas_hot(apostas_todas)
+                    if len(self.apostas_hot) != len(apostas_todas):
+                        self.exibir_apostas_hot(apostas_todas)
                     self.status_hot.config(text=f"✅ {len(apostas_todas)} apostas analisadas", 
                                          style='Success.TLabel')
                 else:
                     self.status_hot.config(text="❌ Nenhuma aposta encontrada", 
                                          style='Warning.TLabel')
             
-            self.root.after(0, finalizar_processamento)
+            self.agendar_na_interface(finalizar_processamento)
                 
         except Exception as e:
             def mostrar_erro():
@@ -1838,7 +2062,7 @@ class BetBoosterV2:
                     self.progresso_frame.destroy()
                     
                 self.status_hot.config(text=f"❌ Erro: {str(e)}", style='Warning.TLabel')
-            self.root.after(0, mostrar_erro)
+            self.agendar_na_interface(mostrar_erro)
             print(f"Erro ao analisar apostas em thread: {e}")
     
     def atualizar_apostas_hot_interface(self, apostas_lista=None):
@@ -1851,6 +2075,8 @@ class BetBoosterV2:
             # Usar lista fornecida ou lista completa
             apostas_para_mostrar = apostas_lista if apostas_lista is not None else self.apostas_hot
             
+            self.colunas_hot = None
+            
             if not apostas_para_mostrar:
                 ttk.Label(self.apostas_hot_frame, text="🔍 Nenhuma aposta encontrada com os filtros selecionados", 
                          style='Subtitle.TLabel').pack(pady=20)
@@ -1858,36 +2084,45 @@ class BetBoosterV2:
             
             # As apostas já vêm ordenadas do método aplicar_filtros_hot
             apostas_ordenadas = apostas_para_mostrar
-            
-            # Criar container para organizar apostas em duas colunas
-            container_frame = ttk.Frame(self.apostas_hot_frame)
-            container_frame.pack(fill='both', expand=True)
-            
-            # Criar dois frames lado a lado para as colunas
-            col1_frame = ttk.Frame(container_frame)
-            col1_frame.pack(side='left', fill='both', expand=True, padx=5)
-            
-            col2_frame = ttk.Frame(container_frame)
-            col2_frame.pack(side='left', fill='both', expand=True, padx=5)
+            col1_frame, col2_frame = self.criar_colunas_apostas_hot()
             
             # Distribuir apostas entre as duas colunas
+            filtro_ordenacao = self.filtro_ordenacao.get()
             for i, aposta in enumerate(apostas_ordenadas):
                 # Decidir em qual coluna colocar com base no índice (par/ímpar)
                 parent_frame = col1_frame if i % 2 == 0 else col2_frame
                 
                 # Criar o card da aposta no frame da coluna correta
-                self.criar_card_aposta_hot(aposta, i, parent_frame)
+                self.cards_hot.append(self.criar_card_aposta_hot(aposta, i, parent_frame))
+                self.apostas_hot_exibidas.append(aposta)
+                self.chaves_hot_exibidas.append(self.chave_ordenacao_hot(aposta, filtro_ordenacao))
                 
         except Exception as e:
             print(f"Erro ao atualizar interface de apostas hot: {e}")
             ttk.Label(self.apostas_hot_frame, text=f"❌ Erro ao carregar apostas: {str(e)}", 
                      style='Warning.TLabel').pack(pady=20)
     
+    def criar_colunas_apostas_hot(self):
+        """Cria as duas colunas de cards e zera as listas usadas na inserção incremental"""
+        # Criar container para organizar apostas em duas colunas
+        container_frame = ttk.Frame(self.apostas_hot_frame)
+        container_frame.pack(fill='both', expand=True)
+        
+        # Criar dois frames lado a lado para as colunas
+        col1_frame = ttk.Frame(container_frame)
+        col1_frame.pack(side='left', fill='both', expand=True, padx=5)
+        
+        col2_frame = ttk.Frame(container_frame)
+        col2_frame.pack(side='left', fill='both', expand=True, padx=5)
+        
+        self.colunas_hot = (col1_frame, col2_frame)
+        self.cards_hot = []
+        self.apostas_hot_exibidas = []
+        self.chaves_hot_exibidas = []
+        return self.colunas_hot
+    
     def create_jogos_do_dia_tab(self):
         """Aba atualizada: Jogos do Dia com novas funcionalidades"""
-        self.tab_jogos_dia = ttk.Frame(self.notebook)
-        self.notebook.add(self.tab_jogos_dia, text="⚽ Jogos do Dia")
-        
         # Título
         ttk.Label(self.tab_jogos_dia, text="⚽ JOGOS DO DIA - Análise Completa", 
                  style='Title.TLabel').pack(pady=10)
@@ -2004,12 +2239,13 @@ class BetBoosterV2:
                   command=self.aposta_simples_jogo).pack(side='left', padx=5)
         ttk.Button(acoes_buttons, text="📋 Adicionar à Múltipla", 
                   command=self.adicionar_multipla_jogo).pack(side='left', padx=5)
+        
+        # Jogos carregados antes da aba existir
+        if self.jogos_do_dia:
+            self.atualizar_lista_jogos()
     
     def create_cadastro_tab(self):
         """Aba de cadastro manual (mantida)"""
-        self.tab_cadastro = ttk.Frame(self.notebook)
-        self.notebook.add(self.tab_cadastro, text="➕ Cadastro Manual")
-        
         ttk.Label(self.tab_cadastro, text="➕ CADASTRO MANUAL DE TIMES", 
                  style='Title.TLabel').pack(pady=10)
         
@@ -2118,12 +2354,11 @@ class BetBoosterV2:
                   command=self.remover_time_selecionado).pack(side='left', padx=5)
         ttk.Button(mgmt_frame, text="📊 Ver Detalhes", 
                   command=self.ver_detalhes_time).pack(side='left', padx=5)
+        
+        self.atualizar_lista_times()
     
     def create_analise_tab(self):
         """Aba de análise de confrontos (atualizada)"""
-        self.tab_analise = ttk.Frame(self.notebook)
-        self.notebook.add(self.tab_analise, text="📊 Análise")
-        
         ttk.Label(self.tab_analise, text="📊 ANÁLISE DE CONFRONTOS", 
                  style='Title.TLabel').pack(pady=10)
         
@@ -2168,6 +2403,8 @@ class BetBoosterV2:
                                                        fg=self.cores['fg_input'],
                                                        insertbackground=self.cores['fg_input'])
         self.texto_analise.pack(fill='both', expand=True)
+        
+        self.atualizar_combos_times()
     
     # Métodos para cadastro manual
     def cadastrar_time_manual(self):
@@ -2250,6 +2487,10 @@ class BetBoosterV2:
     
     def atualizar_lista_times(self):
         """Atualiza a lista visual de times cadastrados"""
+        # Aba Cadastro Manual ainda não aberta: a lista é preenchida ao construí-la
+        if not hasattr(self, 'tree_times'):
+            return
+        
         # Limpar árvore
         for item in self.tree_times.get_children():
             self.tree_times.delete(item)
@@ -2266,6 +2507,10 @@ class BetBoosterV2:
     
     def atualizar_combos_times(self):
         """Atualiza os comboboxes de seleção de times"""
+        # Aba Análise ainda não aberta
+        if not hasattr(self, 'combo_time_casa'):
+            return
+        
         times_nomes = list(self.times_database.keys())
         times_nomes.sort()
         
@@ -2432,60 +2677,9 @@ class BetBoosterV2:
         # Calcular gols esperados
         gols_esperados_casa = (gols_casa + gols_sofridos_visitante) / 2
         gols_esperados_visitante = (gols_visitante + gols_sofridos_casa) / 2
-        gols_esperados_total = gols_esperados_casa + gols_esperados_visitante
-        
-        # Distribuição de Poisson para probabilidades
-        from math import exp, factorial
         
-        max_gols = 7
-        
-        # Matriz de probabilidades
-        prob_vitoria_casa = 0
-        prob_empate = 0
-        prob_vitoria_visitante = 0
-        
-        for casa in range(max_gols):
-            for visitante in range(max_gols):
-                prob_casa = (gols_esperados_casa ** casa * exp(-gols_esperados_casa)) / factorial(casa)
-                prob_visitante = (gols_esperados_visitante ** visitante * exp(-gols_esperados_visitante)) / factorial(visitante)
-                prob_resultado = prob_casa * prob_visitante
-                
-                if casa > visitante:
-                    prob_vitoria_casa += prob_resultado
-                elif casa == visitante:
-                    prob_empate += prob_resultado
-                else:
-                    prob_vitoria_visitante += prob_resultado
-        
-        # Normalizar
-        total = prob_vitoria_casa + prob_empate + prob_vitoria_visitante
-        if total > 0:
-            prob_vitoria_casa = (prob_vitoria_casa / total) * 100
-            prob_empate = (prob_empate / total) * 100
-            prob_vitoria_visitante = (prob_vitoria_visitante / total) * 100
-        
-        # Calcular probabilidades de over/under
-        over_15 = self.calcular_prob_over_under(gols_esperados_total, 1.5, 'over')
-        under_15 = 100 - over_15
-        over_25 = self.calcular_prob_over_under(gols_esperados_total, 2.5, 'over')
-        under_25 = 100 - over_25
-        over_35 = self.calcular_prob_over_under(gols_esperados_total, 3.5, 'over')
-        under_35 = 100 - over_35
-        
-        return {
-            'vitoria_casa': prob_vitoria_casa,
-            'empate': prob_empate,
-            'vitoria_visitante': prob_vitoria_visitante,
-            'gols_esperados_casa': gols_esperados_casa,
-            'gols_esperados_visitante': gols_esperados_visitante,
-            'gols_esperados_total': gols_esperados_total,
-            'over_15': over_15,
-            'under_15': under_15,
-            'over_25': over_25,
-            'under_25': under_25,
-            'over_35': over_35,
-            'under_35': under_35
-        }
+        # Núcleo compartilhado de probabilidades (sem vantagem de mandante no confronto manual)
+        return calcular_probabilidades(gols_esperados_casa, gols_esperados_visitante).como_dict()
     
     def gerar_recomendacoes_confronto(self, probabilidades, nome_casa, nome_visitante):
         """Gera recomendações baseadas nas probabilidades"""
@@ -2617,9 +2811,6 @@ class BetBoosterV2:
     
     def create_multiplas_tab(self):
         """Nova aba: Gestão de Múltiplas com Banca Simulada"""
-        self.tab_multiplas = ttk.Frame(self.notebook)
-        self.notebook.add(self.tab_multiplas, text="🎯 Múltiplas")
-        
         ttk.Label(self.tab_multiplas, text="🎯 BANCA SIMULADA & MÚLTIPLAS", 
                  style='Title.TLabel').pack(pady=10)
         
@@ -2627,23 +2818,23 @@ class BetBoosterV2:
         self.notebook_multiplas = ttk.Notebook(self.tab_multiplas)
         self.notebook_multiplas.pack(fill='both', expand=True, padx=10, pady=5)
         
+        self.notebook_multiplas.bind('<<NotebookTabChanged>>', self.ao_trocar_aba)
+        
         # Aba 1: Gestão da Banca
-        self.create_banca_tab()
+        self.registrar_aba(self.notebook_multiplas, 'tab_banca', "💰 Banca", self.create_banca_tab)
         
         # Aba 2: Múltipla Atual
-        self.create_multipla_atual_tab()
+        self.registrar_aba(self.notebook_multiplas, 'tab_multipla_atual', "⚽ Múltipla", self.create_multipla_atual_tab)
         
         # Aba 3: Apostas Ativas
-        self.create_apostas_ativas_tab()
+        self.registrar_aba(self.notebook_multiplas, 'tab_apostas_ativas', "🎯 Apostas Ativas",
+                           self.create_apostas_ativas_tab)
         
         # Aba 4: Histórico
-        self.create_historico_tab()
+        self.registrar_aba(self.notebook_multiplas, 'tab_historico', "📊 Histórico", self.create_historico_tab)
     
     def create_banca_tab(self):
         """Aba de gestão da banca simulada"""
-        self.tab_banca = ttk.Frame(self.notebook_multiplas)
-        self.notebook_multiplas.add(self.tab_banca, text="💰 Banca")
-        
         # Informações da banca
         banca_info_frame = ttk.LabelFrame(self.tab_banca, text="Informações da Banca", padding=15)
         banca_info_frame.pack(fill='x', padx=20, pady=10)
@@ -2696,9 +2887,6 @@ class BetBoosterV2:
     
     def create_multipla_atual_tab(self):
         """Aba da múltipla atual"""
-        self.tab_multipla_atual = ttk.Frame(self.notebook_multiplas)
-        self.notebook_multiplas.add(self.tab_multipla_atual, text="⚽ Múltipla")
-        
         # Frame da múltipla atual
         multipla_frame = ttk.LabelFrame(self.tab_multipla_atual, text="Múltipla Atual", padding=15)
         multipla_frame.pack(fill='both', expand=True, padx=20, pady=10)
@@ -2762,12 +2950,12 @@ class BetBoosterV2:
         
         # Bind para calcular retorno em tempo real
         self.entry_valor_aposta.bind('<KeyRelease>', self.calcular_retorno_tempo_real)
+        
+        # Apostas adicionadas (pelas Apostas Hot, por exemplo) antes da aba existir
+        self.atualizar_multipla()
     
     def create_apostas_ativas_tab(self):
         """Aba das apostas ativas"""
-        self.tab_apostas_ativas = ttk.Frame(self.notebook_multiplas)
-        self.notebook_multiplas.add(self.tab_apostas_ativas, text="🎯 Apostas Ativas")
-        
         # Frame das apostas ativas
         ativas_frame = ttk.LabelFrame(self.tab_apostas_ativas, text="Apostas em Andamento", padding=15)
         ativas_frame.pack(fill='both', expand=True, padx=20, pady=10)
@@ -2805,9 +2993,6 @@ class BetBoosterV2:
     
     def create_historico_tab(self):
         """Aba do histórico"""
-        self.tab_historico = ttk.Frame(self.notebook_multiplas)
-        self.notebook_multiplas.add(self.tab_historico, text="📊 Histórico")
-        
         # Frame do histórico
         historico_frame = ttk.LabelFrame(self.tab_historico, text="Histórico de Apostas", padding=15)
         historico_frame.pack(fill='both', expand=True, padx=20, pady=10)
@@ -2850,10 +3035,9 @@ class BetBoosterV2:
             threading.Thread(target=self.carregar_apostas_data_atual, daemon=True).start()
     
     def carregar_apostas_hot(self):
-        """Carrega e analisa as melhores apostas de hoje e amanhã"""
+        """Carrega e analisa as melhores apostas de hoje e amanhã (widgets só pelo barramento)"""
         try:
-            self.status_hot.config(text="🔄 Analisando jogos de hoje e amanhã...", style='Warning.TLabel')
-            self.root.update()
+            self.publicar_status('hot', "🔄 Analisando jogos de hoje e amanhã...")
             
             # Buscar jogos de hoje e amanhã
             data_hoje = datetime.now().strftime('%Y-%m-%d')
@@ -2864,7 +3048,7 @@ class BetBoosterV2:
             jogos_amanha = self.api.buscar_jogos_do_dia(data_amanha)
             
             if not jogos_hoje and not jogos_amanha:
-                self.status_hot.config(text="❌ Nenhum jogo encontrado para hoje e amanhã", style='Warning.TLabel')
+                self.publicar_status('hot', "❌ Nenhum jogo encontrado para hoje e amanhã")
                 return
             
             # Filtrar jogos de hoje que ainda não encerraram
@@ -2917,7 +3101,6 @@ class BetBoosterV2:
                 except Exception as e:
                     print(f"Erro ao analisar recomendações: {e}")
                     continue
-                time.sleep(0.3)  # Pausa entre requisições
             
             # Processar jogos de amanhã
             for jogo in jogos_validos_amanha[:7]:  # Máximo 7 de amanhã
@@ -2928,7 +3111,6 @@ class BetBoosterV2:
                 except Exception as e:
                     print(f"Erro ao analisar recomendações: {e}")
                     continue
-                time.sleep(0.3)  # Pausa entre requisições
             
             # Ordenar pela média de probabilidades (prob_implicita + prob_calculada)
             apostas_recomendadas.sort(key=lambda x: (
@@ -2942,316 +3124,37 @@ class BetBoosterV2:
                 prob_impl = float(aposta.get('prob_implicita', 0))
                 aposta['prob_media'] = (prob_calc + prob_impl) / 2
             
-            # Exibir apostas hot
-            self.exibir_apostas_hot(apostas_recomendadas)
-            
-            # VERIFICAR E ATUALIZAR PERÍODOS antes de exibir
-            self.verificar_e_atualizar_periodos_apostas_hot()
+            def exibir_apostas():
+                # Exibir apostas hot
+                self.exibir_apostas_hot(apostas_recomendadas)
+                
+                # VERIFICAR E ATUALIZAR PERÍODOS antes de exibir
+                self.verificar_e_atualizar_periodos_apostas_hot()
+            self.agendar_na_interface(exibir_apostas)
             
-            self.status_hot.config(text=f"✅ {len(apostas_recomendadas)} apostas analisadas (Hoje e Amanhã)", 
-                                 style='Success.TLabel')
+            self.publicar_status('hot', f"✅ {len(apostas_recomendadas)} apostas analisadas (Hoje e Amanhã)",
+                                 'Success.TLabel')
             
         except Exception as e:
-            self.status_hot.config(text=f"❌ Erro: {str(e)}", style='Warning.TLabel')
+            self.publicar_status('hot', f"❌ Erro: {str(e)}")
     
     def processar_jogo_para_hot_paralelo(self, jogo, periodo):
         """Versão paralela do processamento de jogo para hot"""
-        try:
-            # Extrair dados do jogo
-            if isinstance(jogo, dict):
-                jogo_id = jogo.get('id', 'N/A')
-                time_casa = jogo.get('home_team', jogo.get('time_casa', 'N/A'))
-                time_visitante = jogo.get('away_team', jogo.get('time_visitante', 'N/A'))
-            else:
-                jogo_id = str(jogo)
-                time_casa = 'N/A'
-                time_visitante = 'N/A'
-            
-            # Buscar odds detalhadas
-            odds_detalhadas = None
-            if jogo_id and jogo_id != 'N/A':
-                try:
-                    odds_detalhadas = self.buscar_odds_detalhadas(jogo_id)
-                except Exception as e:
-                    print(f"⚠️ Erro ao buscar odds para {jogo_id}: {e}")
-            
-            # Criar jogo completo sempre (com ou sem odds)
-            if odds_detalhadas:
-                jogo_completo = {**jogo, **odds_detalhadas} if isinstance(jogo, dict) else {**odds_detalhadas, 'id': jogo_id}
-                jogo_completo['periodo'] = periodo
-                print(f"✅ Jogo {time_casa} vs {time_visitante} - COM odds")
-            else:
-                jogo_completo = jogo.copy() if isinstance(jogo, dict) else {'id': jogo_id}
-                jogo_completo.update({
-                    'periodo': periodo,
-                    'odds': None,
-                    'home_team': time_casa,
-                    'away_team': time_visitante,
-                    'start_time': jogo_completo.get('start_time', ''),
-                    'league': jogo_completo.get('league', 'N/A')
-                })
-                print(f"⚠️ Jogo {time_casa} vs {time_visitante} - SEM odds (dados básicos)")
-            
-            # Processar apostas hot se tiver dados válidos
-            recomendacoes = []
-            if isinstance(jogo, dict):
-                jogo['periodo'] = periodo
-                try:
-                    recomendacoes = self.processar_jogo_para_hot(jogo)
-                    print(f"📊 {len(recomendacoes)} apostas hot geradas")
-                except Exception as e:
-                    print(f"⚠️ Erro ao processar apostas hot: {e}")
-            
-            return jogo_completo, recomendacoes
-            
-        except Exception as e:
-            print(f"❌ ERRO no processamento paralelo: {e}")
-            # Retornar jogo básico em caso de erro
-            jogo_erro = {
-                'id': jogo.get('id') if isinstance(jogo, dict) else str(jogo),
-                'home_team': 'Erro',
-                'away_team': 'Erro',
-                'periodo': periodo,
-                'odds': None
-            }
-            return jogo_erro, []
+        return self.motor.processar_jogo_para_hot_paralelo(jogo, periodo)
+
+    def processar_jogo_para_hot(self, jogo, odds_detalhadas=None):
+        """Processa um jogo para gerar recomendações hot (odds_detalhadas já obtidas evitam nova busca)"""
+        modo = self.modo_analise.get() if hasattr(self, 'modo_analise') else "Geral"
+        return self.motor.processar_jogo_para_hot(jogo, odds_detalhadas, modo)
 
-    def processar_jogo_para_hot(self, jogo):
-        """Processa um jogo para gerar recomendações hot"""
-        try:
-            # Verificar se jogo é um dicionário ou apenas ID
-            if isinstance(jogo, str):
-                jogo_id = jogo
-                jogo_dict = {'id': jogo}
-            else:
-                jogo_id = jogo.get('id')
-                jogo_dict = jogo
-            
-            if not jogo_id:
-                return []
-            
-            # Buscar odds detalhadas
-            odds_detalhadas = self.buscar_odds_detalhadas(jogo_id)
-            if not odds_detalhadas:
-                return []
-            
-            # Buscar estatísticas dos times
-            stats = self.api.buscar_estatisticas_detalhadas_time(jogo_id)
-            if not stats:
-                return []
-            
-            # Calcular probabilidades - USAR A MESMA FUNÇÃO DOS JOGOS DO DIA
-            modo = self.modo_analise.get() if hasattr(self, 'modo_analise') else "Geral"
-            probabilidades = self.calcular_probabilidades_completas(stats, modo)
-            
-            # Analisar apostas recomendadas
-            recomendacoes = self.analisar_apostas_recomendadas(
-                jogo_dict, odds_detalhadas, probabilidades, stats)
-            
-            # Adicionar informação do período
-            for rec in recomendacoes:
-                rec['periodo'] = jogo_dict.get('periodo', 'Hoje')
-            
-            return recomendacoes
-            
-        except Exception as e:
-            home_team = jogo_dict.get('home_team', 'Time')
-            away_team = jogo_dict.get('away_team', 'Time')
-            print(f"Erro ao processar jogo {home_team} vs {away_team}: {e}")
-            return []
-    
     def buscar_odds_detalhadas(self, match_id):
-        """Busca odds detalhadas de uma partida"""
-        try:
-            url = f"https://api.radaresportivo.com/public/prepRadar/{match_id}"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if 'marketOdds' in data:
-                return {
-                    'match_id': match_id,
-                    'start_time': data.get('startTime', ''),
-                    'odds': data['marketOdds'],
-                    'home_team': data.get('homeTeam', {}).get('name', ''),
-                    'away_team': data.get('awayTeam', {}).get('name', ''),
-                    'league': data.get('league', {}).get('name', ''),
-                    'status': data.get('status', 'not_started')
-                }
-            
-            return None
-            
-        except Exception as e:
-            print(f"Erro ao buscar odds para match {match_id}: {e}")
-            return None
+        """Busca odds detalhadas de uma partida (via broker, sem requisições duplicadas)"""
+        return self.broker.buscar_odds_detalhadas(match_id)
     
     def analisar_apostas_recomendadas(self, jogo, odds_detalhadas, probabilidades, stats):
         """Analisa e gera recomendações de apostas"""
-        recomendacoes = []
-        
-        try:
-            # Filtrar por código de região permitido
-            codigos_regiao_permitidos = ['ES', 'FR', 'SA', 'BR', 'AR', 'PT', 'IT', 'GB', 'TR', 'DE', '00', '01', '04']
-            codigo_regiao = jogo.get('codigo_regiao', '')
-            
-            # Se o jogo não tem região permitida, retornar lista vazia
-            if codigo_regiao not in codigos_regiao_permitidos:
-                print(f"⚠️ Jogo filtrado por região não permitida: {codigo_regiao}")
-                return []
-            
-            # Filtrar por relevância da liga (apenas high)
-            relevancia_liga = jogo.get('relevancia_liga', '')
-            if relevancia_liga != 'high':
-                print(f"⚠️ Jogo filtrado por relevância da liga: {relevancia_liga}")
-                return []
-            
-            odds = odds_detalhadas['odds']
-            
-            # 1. Analisar Resultado Final (1X2)
-            if 'resultFt' in odds:
-                result_odds = odds['resultFt']
-                
-                # Calcular probabilidades implícitas com margem de 7.5%
-                prob_casa_implicita = (1 / result_odds['home'] * (1 - 0.05)) * 100
-                prob_empate_implicita = (1 / result_odds['draw'] * (1 - 0.05)) * 100
-                prob_fora_implicita = (1 / result_odds['away'] * (1 - 0.05)) * 100
-                
-                # Comparar com probabilidades Bet Booster calculadas
-                prob_casa_calc = probabilidades.get('vitoria_casa', 0)
-                prob_empate_calc = probabilidades.get('empate', 0)
-                prob_fora_calc = probabilidades.get('vitoria_visitante', 0)
-                
-                # Identificar value bets
-                value_casa = (prob_casa_calc / prob_casa_implicita) if prob_casa_implicita > 0 else 0
-                value_empate = (prob_empate_calc / prob_empate_implicita) if prob_empate_implicita > 0 else 0
-                value_fora = (prob_fora_calc / prob_fora_implicita) if prob_fora_implicita > 0 else 0
-                
-                # Recomendações baseadas nos critérios
-                home_team = odds_detalhadas.get('home_team', 'Casa')
-                away_team = odds_detalhadas.get('away_team', 'Visitante')
-                
-                apostas_resultado = [
-                    (f'Vitória {home_team}', 'casa', value_casa, prob_casa_calc, prob_casa_implicita, result_odds['home']),
-                    ('Empate', 'empate', value_empate, prob_empate_calc, prob_empate_implicita, result_odds['draw']),
-                    (f'Vitória {away_team}', 'visitante', value_fora, prob_fora_calc, prob_fora_implicita, result_odds['away'])
-                ]
-                
-                for aposta, tipo_aposta, value, prob_calc, prob_impl, odd in apostas_resultado:
-                    # Converter value para porcentagem
-                    value_percent = (value - 1) * 100
-                    
-                    # Aplicar NOVAS regras para apostas de vencedor:
-                    # Forte: Prob. Bet365 >= 40%, value > 0%
-                    # Moderada: Prob. Booster >= 40%, Prob. Bet365 >= 30%, value > 0%
-                    # Arriscada: Prob. Bet365 >= 40%, Prob. Bet365 >= 15% E < 30%, value > 0%
-                    # Muito Arriscada: Prob. Bet365 >= 40%, Prob. Bet365 >= 5% E < 15%, value > 0%
-                    tipo_recomendacao = None
-
+        return self.motor.analisar_apostas_recomendadas(jogo, odds_detalhadas, probabilidades, stats)
 
-                    if (odd >= 1.5) and (odd < 2) and (prob_calc >= 40):
-                        tipo_recomendacao = "FORTE"
-                    elif (odd >= 2) and (odd < 2.5) and (prob_calc >= 40):
-                        tipo_recomendacao = "MODERADA"
-                    elif (odd >= 2.5) and (odd < 3) and (prob_calc >= 40):
-                        tipo_recomendacao = "ARRISCADA"
-                    elif (odd >= 3) and (odd < 5.5) and (prob_calc >= 40):
-                        tipo_recomendacao = "MUITO_ARRISCADA"
-                    
-                    if tipo_recomendacao:  # Mínimo de confiança na probabilidade Bet Booster
-                        
-                        forca = value * (prob_calc / 100)  # Força baseada em value e probabilidade
-                        recomendacoes.append({
-                            'jogo': f"{odds_detalhadas['home_team']} vs {odds_detalhadas['away_team']}",
-                            'aposta': aposta,
-                            'tipo': tipo_recomendacao,
-                            'odd': odd,
-                            'value': value,
-                            'value_percent': value_percent,
-                            'prob_calculada': prob_calc,
-                            'nossa_prob': prob_calc,  # Adicionar para compatibilidade
-                            'prob_implicita': prob_impl,
-                            'prob_media': (prob_calc + prob_impl) / 2,  # Média de probabilidades
-                            'forca_recomendacao': forca,
-                            'match_id': odds_detalhadas['match_id'],
-                            'liga': odds_detalhadas['league'],
-                            'horario': self.formatar_horario(odds_detalhadas['start_time'])
-                        })
-            
-            # 2. Analisar Over/Under 2.5 gols
-            if 'goalsOu25' in odds:
-                gols_odds = odds['goalsOu25']
-                
-                # Calcular gols esperados
-                gols_esperados = probabilidades.get('gols_esperados_total', 0)
-                
-                # Probabilidades para over/under 2.5
-                prob_over25_calc = self.calcular_prob_over_under(gols_esperados, 2.5, 'over')
-                prob_under25_calc = 100 - prob_over25_calc
-                
-                # Probabilidades implícitas com margem de 7.5%
-                prob_over25_impl = (1 / gols_odds['over'] * (1 - 0.05)) * 100
-                prob_under25_impl = (1 / gols_odds['under'] * (1 - 0.05)) * 100
-                
-                # Value bets
-                value_over = (prob_over25_calc / prob_over25_impl) if prob_over25_impl > 0 else 0
-                value_under = (prob_under25_calc / prob_under25_impl) if prob_under25_impl > 0 else 0
-                
-                apostas_gols = [
-                    ('Mais de 2.5 gols', value_over, prob_over25_calc, prob_over25_impl, gols_odds['over']),
-                    ('Menos de 2.5 gols', value_under, prob_under25_calc, prob_under25_impl, gols_odds['under'])
-                ]
-                
-                for aposta, value, prob_calc, prob_impl, odd in apostas_gols:
-                    # Converter value para porcentagem
-                    value_percent = (value - 1) * 100
-                    
-                    # Filtrar apostas over 2.5 com poucos gols esperados
-                    if aposta == 'Mais de 2.5 gols' and gols_esperados < 4.0:
-                        continue  # Pular apostas over 2.5 quando gols esperados for menor que 4
-                    
-                    # Filtrar apostas under 2.5 com muitos gols esperados
-                    if aposta == 'Menos de 2.5 gols' and gols_esperados > 2.0:
-                        continue  # Pular apostas under 2.5 quando gols esperados for maior que 2
-                    
-                    # Aplicar NOVAS regras para apostas Over/Under:
-                    # Forte: Prob. Booster > 50%, Prob. Bet365 >= 45%, value > 0
-                    # Moderada: Prob. Booster > 50%, Prob. Bet365 >= 35%, value > 0
-                    # Arriscada: Prob. Booster > 50%, Prob. Bet365 >= 20% E < 35%, value > 0
-                    # Muito Arriscada: Prob. Booster > 50%, Prob. Bet365 >= 5% E < 20%, value > 0
-                    tipo_recomendacao = None
-                    
-                    if odd <= 1.8 and prob_calc >= 70:
-                        tipo_recomendacao = "FORTE"
-                    elif (odd <= 2.5 and prob_calc >= 70) or (odd <= 1.8 and prob_calc >= 65):
-                        tipo_recomendacao = "MODERADA"
-                    
-                    if tipo_recomendacao and prob_calc >= 15:  # Mínimo de confiança na probabilidade Bet Booster
-                        
-                        forca = value * (prob_calc / 100)
-                        
-                        recomendacoes.append({
-                            'jogo': f"{odds_detalhadas['home_team']} vs {odds_detalhadas['away_team']}",
-                            'aposta': aposta,
-                            'tipo': tipo_recomendacao,
-                            'odd': odd,
-                            'value': value,
-                            'value_percent': value_percent,
-                            'prob_calculada': prob_calc,
-                            'nossa_prob': prob_calc,  # Adicionar para compatibilidade
-                            'prob_implicita': prob_impl,
-                            'prob_media': (prob_calc + prob_impl) / 2,  # Média de probabilidades
-                            'forca_recomendacao': forca,
-                            'match_id': odds_detalhadas['match_id'],
-                            'liga': odds_detalhadas['league'],
-                            'horario': self.formatar_horario(odds_detalhadas['start_time'])
-                        })
-            
-        except Exception as e:
-            print(f"Erro ao analisar recomendações: {e}")
-        
-        return recomendacoes
-    
     def exibir_apostas_hot(self, apostas):
         """Exibe as apostas hot na interface usando a ordenação selecionada no filtro"""
         # Armazenar as apostas
@@ -3393,13 +3296,14 @@ class BetBoosterV2:
                   command=lambda a=aposta: self.ver_analise_completa(a)).pack(side='left', padx=5)
         ttk.Button(acoes_frame, text="🗑️ Deletar Aposta", 
                   command=lambda a=aposta, cf=card_frame: self.deletar_aposta_hot(a, cf)).pack(side='left', padx=5)
+        
+        return card_frame
     
     # Métodos para Jogos do Dia
     def buscar_jogos_do_dia(self):
         """Busca jogos do dia selecionado com cache inteligente"""
         try:
             self.status_jogos.config(text="🔄 Verificando cache...", style='Warning.TLabel')
-            self.root.update()
             
             # Obter data diretamente do DateEntry
             data_obj = self.entry_data.get_date()
@@ -3409,75 +3313,109 @@ class BetBoosterV2:
             if self.atualizar_jogos_do_dia_com_cache(data_api):
                 return  # Se conseguiu carregar do cache, termina aqui
             
-            # Se não há cache válido, carregar da API
-            self.status_jogos.config(text="🌐 Buscando jogos da API...", style='Warning.TLabel')
-            self.root.update()
-            
-            jogos = self.api.buscar_jogos_do_dia(data_api)
+            # Se não há cache válido, carregar da API fora da thread da interface
+            threading.Thread(target=self.buscar_jogos_do_dia_thread, args=(data_api,), daemon=True).start()
             
-            if not jogos:
-                self.status_jogos.config(text="❌ Nenhum jogo encontrado", style='Warning.TLabel')
+        except Exception as e:
+            self.status_jogos.config(text=f"❌ Erro: {str(e)}", style='Warning.TLabel')
+    
+    def buscar_jogos_do_dia_thread(self, data_api):
+        """Busca jogos e odds da API, salva o cache e entrega a lista para a interface"""
+        try:
+            resultado = self.carregar_jogos_com_odds(data_api)
+            if resultado is None:
                 return
-            
-            # Buscar odds para cada jogo em paralelo
-            self.status_jogos.config(text="📊 Carregando odds (processamento paralelo)...", style='Warning.TLabel')
-            self.root.update()
-            
-            self.jogos_do_dia = []
-            
-            # Usar ThreadPoolExecutor para processamento paralelo
-            max_workers = 10  # Máximo 10 threads simultâneas
-            
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submeter todas as tarefas
-                futures = []
-                for jogo in jogos:
-                    future = executor.submit(self.processar_jogo_odds_paralelo, jogo)  # Só odds, não apostas hot
-                    futures.append((future, jogo))
-                
-                # Coletar resultados conforme completam
-                for i, (future, jogo_original) in enumerate(futures):
-                    try:
-                        # Atualizar progresso
-                        progresso = (i + 1) / len(jogos) * 100
-                        self.status_jogos.config(
-                            text=f"⚽ Processando jogo {i+1}/{len(jogos)} ({progresso:.0f}%) - Paralelo", 
-                            style='Warning.TLabel'
-                        )
-                        self.root.update()
-                        
-                        # Obter resultado com timeout (só jogo com odds)
-                        jogo_completo = future.result(timeout=3)  # Timeout de 3 segundos por jogo
-                        self.jogos_do_dia.append(jogo_completo)
-                        
-                    except Exception as e:
-                        print(f"Erro ao processar jogo {jogo_original.get('id', 'desconhecido')}: {e}")
-                        jogo_original['odds'] = None
-                        self.jogos_do_dia.append(jogo_original)
+            jogos, _ = resultado
             
             # Salvar no cache (SOMENTE OS JOGOS, sem afetar apostas hot)
             dados_cache = {
-                'jogos': self.jogos_do_dia,
+                'jogos': jogos,
                 'apostas_hot': []  # Não salvar apostas hot aqui para não afetar a aba
             }
             self.salvar_jogos_cache(data_api, dados_cache)
             
-            # Atualizar lista visual
-            self.atualizar_lista_jogos()
-            
-            tempo_agora = datetime.now().strftime('%H:%M:%S')
-            self.status_jogos.config(
-                text=f"✅ {len(self.jogos_do_dia)} jogos carregados - Paralelo - {tempo_agora}", 
-                style='Success.TLabel'
-            )
+            def exibir_jogos():
+                self.jogos_do_dia = jogos
+                self.atualizar_lista_jogos()
+                
+                tempo_agora = datetime.now().strftime('%H:%M:%S')
+                self.status_jogos.config(
+                    text=f"✅ {len(self.jogos_do_dia)} jogos carregados - Paralelo - {tempo_agora}", 
+                    style='Success.TLabel'
+                )
+            self.agendar_na_interface(exibir_jogos)
             
         except Exception as e:
-            self.status_jogos.config(text=f"❌ Erro: {str(e)}", style='Warning.TLabel')
+            self.publicar_status('jogos', f"❌ Erro: {str(e)}")
+    
+    def carregar_jogos_com_odds(self, data_api):
+        """
+        Busca os jogos da data e as odds dos elegíveis em paralelo (thread de trabalho)
+        O progresso vai para o status da aba Jogos do Dia pelo barramento
+        
+        Args:
+            data_api: Data no formato YYYY-MM-DD
+            
+        Returns:
+            tuple: (jogos com odds, jogos elegíveis) ou None se a API não retornou jogos
+        """
+        self.publicar_status('jogos', "🌐 Buscando jogos da API...")
+        jogos = self.api.buscar_jogos_do_dia(data_api)
+        
+        if not jogos:
+            self.publicar_status('jogos', "❌ Nenhum jogo encontrado")
+            return None
+        
+        # Buscar odds para cada jogo em paralelo
+        self.publicar_status('jogos', "📊 Carregando odds (processamento paralelo)...")
+        
+        jogos_com_odds = []
+        
+        # Usar ThreadPoolExecutor para processamento paralelo
+        max_workers = self.api.max_conexoes  # Uma thread por conexão do pool compartilhado da API
+        
+        # Filtro pré-busca: só jogos elegíveis consultam o prepRadar
+        jogos_elegiveis, jogos_rejeitados = self.separar_jogos_elegiveis(jogos, data_api, chamadas_por_jogo=1)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Submeter todas as tarefas
+            futures = []
+            for jogo in jogos_elegiveis:
+                future = executor.submit(self.processar_jogo_odds_paralelo, jogo)  # Só odds, não apostas hot
+                futures.append((future, jogo))
+            
+            # Coletar resultados conforme completam
+            for i, (future, jogo_original) in enumerate(futures):
+                try:
+                    # Um status por jogo; o barramento desenha só o mais recente a cada tique
+                    progresso = (i + 1) / len(jogos_elegiveis) * 100
+                    self.publicar_status(
+                        'jogos', f"⚽ Processando jogo {i+1}/{len(jogos_elegiveis)} ({progresso:.0f}%) - Paralelo")
+                    
+                    # Obter resultado com timeout (só jogo com odds)
+                    jogo_completo = future.result(timeout=3)  # Timeout de 3 segundos por jogo
+                    jogos_com_odds.append(jogo_completo)
+                    
+                except Exception as e:
+                    print(f"Erro ao processar jogo {jogo_original.get('id', 'desconhecido')}: {e}")
+                    jogo_original['odds'] = None
+                    jogos_com_odds.append(jogo_original)
+        
+        # Jogos rejeitados pelo filtro entram na lista sem odds
+        for jogo_rejeitado in jogos_rejeitados:
+            jogo_rejeitado['odds'] = None
+            jogos_com_odds.append(jogo_rejeitado)
+        
+        return jogos_com_odds, jogos_elegiveis
     
 
     
     def atualizar_lista_jogos(self):
         """Atualiza a lista visual de jogos preservando filtro ativo"""
+        # Aba Jogos do Dia ainda não aberta
+        if not hasattr(self, 'tree_jogos'):
+            return
+        
         # Verificar se há filtro ativo
         texto_filtro = ""
         if hasattr(self, 'entry_pesquisa_jogos'):
@@ -3611,6 +3549,12 @@ class BetBoosterV2:
         except Exception as e:
             print(f"Erro ao clicar no jogo: {e}")
     
+    def priorizar_jogo(self, jogo):
+        """Jogo aberto pelo usuário passa à frente da fila de análise em andamento"""
+        jogo_id = jogo.get('id') if isinstance(jogo, dict) else jogo
+        if jogo_id:
+            self.motor.priorizar(jogo_id)
+    
     def selecionar_unico_jogo(self, index):
         """Seleciona apenas um jogo, removendo seleções anteriores"""
         # Se o jogo já está selecionado, deselecionar
@@ -3621,6 +3565,7 @@ class BetBoosterV2:
             # Seleção única - apenas um jogo
             self.jogos_selecionados = [index]
             self.jogo_selecionado_index = index
+            self.priorizar_jogo(self.jogos_do_dia[index])
         
         # Atualizar apenas checkboxes sem resetar filtro
         self.atualizar_checkboxes_jogos()
@@ -3725,6 +3670,7 @@ class BetBoosterV2:
                     # Seleção única - substituir seleção anterior
                     self.jogo_selecionado_index = index_real
                     self.jogos_selecionados = [index_real]  # Apenas um jogo selecionado
+                    self.priorizar_jogo(self.jogos_do_dia[index_real])
                     
                     # Atualizar interface preservando filtro
                     self.atualizar_checkboxes_jogos()
@@ -3751,9 +3697,10 @@ class BetBoosterV2:
             if not jogo_id:
                 messagebox.showerror("Erro", "ID do jogo não encontrado")
                 return
+            self.priorizar_jogo(jogo)
             
             # Buscar estatísticas
-            stats = self.api.buscar_estatisticas_detalhadas_time(jogo_id)
+            stats = self.broker.buscar_estatisticas_detalhadas_time(jogo_id)
             if not stats:
                 messagebox.showerror("Erro", "Não foi possível obter estatísticas do jogo")
                 return
@@ -3806,76 +3753,47 @@ class BetBoosterV2:
             
             # Atualizar status
             self.status_jogos.config(text="🔄 Atualizando jogos da aba...", style='Warning.TLabel')
-            self.root.update()
             
-            # Buscar jogos da API sem mexer no cache
-            self.atualizar_jogos_sem_cache(data_api)
+            # Odds novas: descartar as guardadas no broker (a API revalida cada payload com GET condicional)
+            self.broker.invalidar()
+            self.api.iniciar_revalidacao()
+            
+            # Buscar jogos da API sem mexer no cache (fora da thread da interface)
+            threading.Thread(target=self.atualizar_jogos_sem_cache, args=(data_api,), daemon=True).start()
             
         except Exception as e:
             self.status_jogos.config(text=f"❌ Erro na atualização: {str(e)}", style='Warning.TLabel')
             messagebox.showerror("Erro", f"Erro ao atualizar jogos: {str(e)}")
     
     def atualizar_jogos_sem_cache(self, data_api):
-        """Atualiza jogos na interface sem mexer no cache - VERSÃO PARALELA"""
+        """Atualiza jogos na interface sem mexer no cache - VERSÃO PARALELA (thread de trabalho)"""
         try:
-            # Buscar jogos da API
-            self.status_jogos.config(text="🌐 Buscando jogos da API...", style='Warning.TLabel')
-            self.root.update()
-            
-            jogos = self.api.buscar_jogos_do_dia(data_api)
-            
-            if not jogos:
-                self.status_jogos.config(text="❌ Nenhum jogo encontrado", style='Warning.TLabel')
+            resultado = self.carregar_jogos_com_odds(data_api)
+            if resultado is None:
                 return
+            jogos_atualizados, jogos_elegiveis = resultado
             
-            # Buscar odds para cada jogo em paralelo
-            self.status_jogos.config(text="📊 Carregando odds (processamento paralelo)...", style='Warning.TLabel')
-            self.root.update()
-            
-            jogos_atualizados = []
-            
-            # Usar ThreadPoolExecutor para processamento paralelo
-            max_workers = 10  # Máximo 10 threads simultâneas
-            
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                # Submeter todas as tarefas
-                futures = []
-                for jogo in jogos:
-                    future = executor.submit(self.processar_jogo_odds_paralelo, jogo)
-                    futures.append((future, jogo))
-                
-                # Coletar resultados conforme completam
-                for i, (future, jogo_original) in enumerate(futures):
-                    try:
-                        # Atualizar progresso
-                        progresso = (i + 1) / len(jogos) * 100
-                        self.status_jogos.config(
-                            text=f"⚽ Processando jogo {i+1}/{len(jogos)} ({progresso:.0f}%) - Paralelo", 
-                            style='Warning.TLabel'
-                        )
-                        self.root.update()
-                        
-                        # Obter resultado com timeout
-                        jogo_completo = future.result(timeout=3)  # Timeout de 3 segundos por jogo
-                        jogos_atualizados.append(jogo_completo)
-                        
-                    except Exception as e:
-                        print(f"Erro ao processar jogo {jogo_original.get('id', 'desconhecido')}: {e}")
-                        jogo_original['odds'] = None
-                        jogos_atualizados.append(jogo_original)
+            # Partidas cujos payloads realmente mudaram nesta revalidação
+            ids_elegiveis = {str(jogo.get('id')) for jogo in jogos_elegiveis}
+            partidas_alteradas = self.api.partidas_alteradas() & ids_elegiveis
+            print(f"🔄 Revalidação: {len(partidas_alteradas)} de {len(ids_elegiveis)} jogos com odds alteradas")
+            print(f"   {self.api.resumo_revalidacao()}")
             
             # Atualizar apenas os jogos na interface (sem modificar o cache)
-            self.jogos_do_dia = jogos_atualizados
-            self.atualizar_lista_jogos()
-            
-            tempo_agora = datetime.now().strftime('%H:%M:%S')
-            self.status_jogos.config(
-                text=f"🔄 {len(self.jogos_do_dia)} jogos atualizados - {tempo_agora}", 
-                style='Success.TLabel'
-            )
+            def exibir_jogos():
+                self.jogos_do_dia = jogos_atualizados
+                self.partidas_alteradas = partidas_alteradas
+                self.atualizar_lista_jogos()
+                
+                tempo_agora = datetime.now().strftime('%H:%M:%S')
+                self.status_jogos.config(
+                    text=f"🔄 {len(self.jogos_do_dia)} jogos atualizados ({len(self.partidas_alteradas)} alterados) - {tempo_agora}", 
+                    style='Success.TLabel'
+                )
+            self.agendar_na_interface(exibir_jogos)
             
         except Exception as e:
-            self.status_jogos.config(text=f"❌ Erro ao atualizar: {str(e)}", style='Warning.TLabel')
+            self.publicar_status('jogos', f"❌ Erro ao atualizar: {str(e)}")
             print(f"Erro detalhado: {e}")
     
     def processar_jogo_odds_paralelo(self, jogo):
@@ -3903,8 +3821,8 @@ class BetBoosterV2:
             if odds_detalhadas:
                 jogo_completo = {**jogo, **odds_detalhadas}
                 
-                # Analisar apostas hot para este jogo
-                apostas_jogo = self.processar_jogo_para_hot(jogo)
+                # Analisar apostas hot para este jogo (reaproveitando as odds)
+                apostas_jogo = self.processar_jogo_para_hot(jogo, odds_detalhadas)
                 
                 return jogo_completo, apostas_jogo
             else:
@@ -3919,43 +3837,12 @@ class BetBoosterV2:
     # Métodos auxiliares
     def formatar_horario(self, start_time):
         """Formata horário de UTC para local"""
-        if not start_time:
-            return ""
-        
-        try:
-            # Se já estiver no formato HH:MM, retorna direto
-            if isinstance(start_time, str) and len(start_time) == 5 and ':' in start_time:
-                return start_time
-            
-            # Converter de ISO para datetime
-            if isinstance(start_time, str):
-                if 'T' in start_time:
-                    dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-                    dt_local = dt - timedelta(hours=3)  # GMT-3
-                    return dt_local.strftime('%H:%M')
-                else:
-                    return start_time  # Já está em formato simples
-            
-            return ""
-        except Exception as e:
-            print(f"Erro ao formatar horário {start_time}: {e}")
-            return ""
-    
+        return formatar_horario(start_time)
+
     def calcular_prob_over_under(self, gols_esperados, linha, tipo):
         """Calcula probabilidade de over/under usando distribuição de Poisson"""
-        from math import exp, factorial
-        
-        if tipo == 'over':
-            prob_under = 0
-            for k in range(int(linha) + 1):
-                prob_under += (gols_esperados ** k * exp(-gols_esperados)) / factorial(k)
-            return (1 - prob_under) * 100
-        else:
-            prob_under = 0
-            for k in range(int(linha) + 1):
-                prob_under += (gols_esperados ** k * exp(-gols_esperados)) / factorial(k)
-            return prob_under * 100
-    
+        return calcular_prob_over_under(gols_esperados, linha, tipo)
+
     def adicionar_aposta_multipla(self, aposta):
         """Adiciona aposta à múltipla"""
         self.apostas_multipla.append(aposta)
@@ -4002,9 +3889,10 @@ class BetBoosterV2:
             if not match_id:
                 messagebox.showerror("Erro", "ID da partida não encontrado")
                 return
+            self.motor.priorizar(match_id)
             
             # Buscar estatísticas detalhadas
-            stats = self.api.buscar_estatisticas_detalhadas_time(match_id)
+            stats = self.broker.buscar_estatisticas_detalhadas_time(match_id)
             if not stats:
                 messagebox.showerror("Erro", "Não foi possível obter estatísticas da partida")
                 return
@@ -4266,6 +4154,10 @@ Menos de 3.5: {probabilidades['under_35']:.1f}%
     
     def atualizar_multipla(self):
         """Atualiza a visualização da múltipla"""
+        # Sub-aba Múltipla ainda não aberta: create_multipla_atual_tab chama este método
+        if not hasattr(self, 'tree_multipla'):
+            return
+        
         # Limpar árvore
         for item in self.tree_multipla.get_children():
             self.tree_multipla.delete(item)
@@ -4496,7 +4388,12 @@ Menos de 3.5: {probabilidades['under_35']:.1f}%
         """Carrega dados salvos"""
         try:
             database_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'times_database.json')
-            if os.path.exists(database_path):
+            if arquivo_inalterado(self.snapshot, database_path):
+                # Arquivo igual ao do fechamento: usar a cópia do snapshot sem reler o JSON
+                self.times_database = self.snapshot['times_database']
+                print(f"⚡ Database do snapshot: {len(self.times_database)} times")
+                self.root.after(100, self.pos_carregamento_inicial)
+            elif os.path.exists(database_path):
                 with open(database_path, 'r', encoding='utf-8') as f:
                     self.times_database = json.load(f)
                 print(f"✅ Database carregado: {len(self.times_database)} times")
@@ -4517,6 +4414,16 @@ Menos de 3.5: {probabilidades['under_35']:.1f}%
     def carregar_dados_banca(self):
         """Carrega dados da banca simulada"""
         try:
+            # Arquivos iguais aos do fechamento: usar as cópias do snapshot sem reler os JSON
+            arquivos = self.arquivos_de_dados()
+            chaves_banca = ('banca_data', 'apostas_ativas', 'historico_apostas')
+            if self.snapshot and all(arquivo_inalterado(self.snapshot, arquivos[chave]) for chave in chaves_banca):
+                self.banca_data = self.snapshot['banca_data']
+                self.apostas_ativas = self.snapshot['apostas_ativas']
+                self.historico_apostas = self.snapshot['historico_apostas']
+                print(f"⚡ Banca do snapshot - Saldo: R$ {self.banca_data['saldo_atual']:.2f}")
+                return
+            
             data_dir = os.path.join(os.path.dirname(__file__), '..', 'data')
             if not os.path.exists(data_dir):
                 os.makedirs(data_dir)
@@ -5394,7 +5301,7 @@ Status: {aposta['status'].title()}
                 return
             
             # Buscar estatísticas e calcular
-            stats = self.api.buscar_estatisticas_detalhadas_time(jogo['id'])
+            stats = self.broker.buscar_estatisticas_detalhadas_time(jogo['id'])
             if not stats:
                 messagebox.showerror("Erro", "Não foi possível obter estatísticas")
                 return
@@ -5628,7 +5535,7 @@ Status: {aposta['status'].title()}
             else:
                 # Buscar estatísticas automaticamente para este jogo
                 print(f"📊 Buscando estatísticas detalhadas para Match ID: {match_id}")
-                stats = self.api.buscar_estatisticas_detalhadas_time(match_id)
+                stats = self.broker.buscar_estatisticas_detalhadas_time(match_id)
             
             if stats:
                 probabilidades = self.calcular_probabilidades_completas(stats, "Geral")
@@ -5705,110 +5612,8 @@ Status: {aposta['status'].title()}
     
     def calcular_probabilidades_completas(self, stats, modo):
         """Calcula probabilidades completas baseado nas estatísticas - USANDO APENAS ANYFIELD"""
-        try:
-            # SEMPRE USAR ESTATÍSTICAS GERAIS (ANYFIELD) INDEPENDENTE DO MODO
-            # sameField só é usado para cadastrar dados, não para cálculos
-            gols_casa = stats['time_casa']['geral']['gols_marcados']
-            gols_sofridos_casa = stats['time_casa']['geral']['gols_sofridos']
-            gols_visitante = stats['time_visitante']['geral']['gols_marcados']
-            gols_sofridos_visitante = stats['time_visitante']['geral']['gols_sofridos']
-            
-            # Fórmula de Poisson para gols esperados
-            gols_esperados_casa = (gols_casa + gols_sofridos_visitante) / 2
-            gols_esperados_visitante = (gols_visitante + gols_sofridos_casa) / 2
-            
-            # Distribuição de Poisson para probabilidades de resultado
-            from math import exp, factorial
-            
-            max_gols = 7
-            probabilidades_matriz = []
-            
-            for casa in range(max_gols):
-                linha = []
-                for visitante in range(max_gols):
-                    prob_casa = (gols_esperados_casa ** casa * exp(-gols_esperados_casa)) / factorial(casa)
-                    prob_visitante = (gols_esperados_visitante ** visitante * exp(-gols_esperados_visitante)) / factorial(visitante)
-                    prob_resultado = prob_casa * prob_visitante
-                    linha.append(prob_resultado)
-                probabilidades_matriz.append(linha)
-            
-            # Calcular probabilidades finais
-            prob_vitoria_casa = 0
-            prob_empate = 0
-            prob_vitoria_visitante = 0
-            
-            for casa in range(max_gols):
-                for visitante in range(max_gols):
-                    prob = probabilidades_matriz[casa][visitante]
-                    if casa > visitante:
-                        prob_vitoria_casa += prob
-                    elif casa == visitante:
-                        prob_empate += prob
-                    else:
-                        prob_vitoria_visitante += prob
-            
-            # Normalizar para 100%
-            total = prob_vitoria_casa + prob_empate + prob_vitoria_visitante
-            if total > 0:
-                prob_vitoria_casa = (prob_vitoria_casa / total) * 100
-                prob_empate = (prob_empate / total) * 100
-                prob_vitoria_visitante = (prob_vitoria_visitante / total) * 100
+        return calcular_probabilidades_completas(stats, modo)
 
-            # Adicionar 5% de vantagem para o time da casa
-            vantagem_casa = prob_vitoria_casa * 0.05
-            prob_vitoria_casa += vantagem_casa
-            
-            # Re-normalizar as outras probabilidades para que o total seja 100%
-            total_outras = prob_empate + prob_vitoria_visitante
-            if total_outras > 0:
-                fator_ajuste = (100 - prob_vitoria_casa) / total_outras
-                prob_empate *= fator_ajuste
-                prob_vitoria_visitante *= fator_ajuste
-
-            
-            # Calcular gols esperados total
-            gols_esperados_total = gols_esperados_casa + gols_esperados_visitante
-            
-            # Calcular probabilidades over/under para diferentes linhas
-            over_15 = self.calcular_prob_over_under(gols_esperados_total, 1.5, 'over')
-            under_15 = 100 - over_15
-            over_25 = self.calcular_prob_over_under(gols_esperados_total, 2.5, 'over')
-            under_25 = 100 - over_25
-            over_35 = self.calcular_prob_over_under(gols_esperados_total, 3.5, 'over')
-            under_35 = 100 - over_35
-            
-            return {
-                'vitoria_casa': prob_vitoria_casa,
-                'empate': prob_empate,
-                'vitoria_visitante': prob_vitoria_visitante,
-                'gols_esperados_casa': gols_esperados_casa,
-                'gols_esperados_visitante': gols_esperados_visitante,
-                'gols_esperados_total': gols_esperados_total,
-                'over_15': over_15,
-                'under_15': under_15,
-                'over_25': over_25,
-                'under_25': under_25,
-                'over_35': over_35,
-                'under_35': under_35
-            }
-            
-        except Exception as e:
-            print(f"Erro ao calcular probabilidades: {e}")
-            return {
-                'vitoria_casa': 33.33,
-                'empate': 33.33,
-                'vitoria_visitante': 33.33,
-                'gols_esperados_casa': 1.25,
-                'gols_esperados_visitante': 1.25,
-                'gols_esperados_total': 2.5,
-                'over_15': 70.0,
-                'under_15': 30.0,
-                'over_25': 50.0,
-                'under_25': 50.0,
-                'over_35': 30.0,
-                'under_35': 70.0
-            }
-    
     def gerar_relatorio_aposta_simples(self, tipo_aposta, valor, probabilidades, odds_detalhadas, casa, visitante):
         """Gera relatório detalhado da aposta simples"""
         relatorio = f"""
@@ -6620,7 +6425,11 @@ def main():
     
     # Configurar fechamento
     def on_closing():
+        # Varreduras e atualizações param em vez de segurar o fechamento
+        app.motor.encerrar()
+        print(f"📨 Barramento da interface: {app.barramento.resumo()}")
         app.salvar_dados()
+        app.salvar_snapshot_sessao()
         root.destroy()
     
     root.protocol("WM_DELETE_WINDOW", on_closing)
@@ -9,7 +9,6 @@ Integrado com API Radar Esportivo para busca automática de times e estatística
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import json
-import math
 from datetime import datetime
 import os
 import sys
@@ -19,6 +18,7 @@ import time
 # Importar API Radar Esportivo
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from api.radar_esportivo_api import RadarEsportivoAPI
+from api.probabilidades import calcular_probabilidades
 
 class CalculadoraApostasGUI:
     def __init__(self, root):
@@ -1018,30 +1018,13 @@ class CalculadoraApostasGUI:
         
         return forma_texto
     
-    def calcular_probabilidades_poisson(self, gols_esperados_a, gols_esperados_b, max_gols=6):
-        """Calcula probabilidades usando distribuição de Poisson"""
-        prob_vitoria_a = 0
-        prob_empate = 0
-        prob_vitoria_b = 0
-        
-        for gols_a in range(max_gols + 1):
-            for gols_b in range(max_gols + 1):
-                # Fórmula de Poisson: P(X=k) = (λ^k * e^(-λ)) / k!
-                prob_a = (gols_esperados_a ** gols_a * math.exp(-gols_esperados_a)) / math.factorial(gols_a)
-                prob_b = (gols_esperados_b ** gols_b * math.exp(-gols_esperados_b)) / math.factorial(gols_b)
-                prob_combinada = prob_a * prob_b
-                
-                if gols_a > gols_b:
-                    prob_vitoria_a += prob_combinada
-                elif gols_a == gols_b:
-                    prob_empate += prob_combinada
-                else:
-                    prob_vitoria_b += prob_combinada
-        
-        return prob_vitoria_a, prob_empate, prob_vitoria_b
+    def calcular_probabilidades_poisson(self, gols_esperados_a, gols_esperados_b):
+        """Calcula probabilidades usando distribuição de Poisson (núcleo compartilhado)"""
+        resultado = calcular_probabilidades(gols_esperados_a, gols_esperados_b)
+        return resultado.vitoria_casa, resultado.empate, resultado.vitoria_visitante
     
     def calcular_probabilidades_com_placar_ao_vivo(self, gols_esperados_a, gols_esperados_b, 
-                                                  gols_atuais_a, gols_atuais_b, tempo_decorrido, max_gols=6):
+                                                  gols_atuais_a, gols_atuais_b, tempo_decorrido):
         """
         Calcula probabilidades ajustadas considerando placar atual e tempo decorrido
         
@@ -1051,7 +1034,6 @@ class CalculadoraApostasGUI:
             gols_atuais_a: Gols já marcados pelo time A
             gols_atuais_b: Gols já marcados pelo time B
             tempo_decorrido: Minutos já jogados
-            max_gols: Máximo de gols a considerar no tempo restante
         """
         # Ajustar expectativa para o tempo restante
         tempo_restante = max(0, 90 - tempo_decorrido) / 90.0
@@ -1065,34 +1047,10 @@ class CalculadoraApostasGUI:
             else:
                 return 0.0, 0.0, 1.0
         
-        # Ajustar gols esperados para o tempo restante
-        gols_esp_restante_a = gols_esperados_a * tempo_restante
-        gols_esp_restante_b = gols_esperados_b * tempo_restante
-        
-        prob_vitoria_a = 0
-        prob_empate = 0
-        prob_vitoria_b = 0
-        
-        # Calcular probabilidades para gols adicionais no tempo restante
-        for gols_add_a in range(max_gols + 1):
-            for gols_add_b in range(max_gols + 1):
-                # Probabilidade de marcar esses gols adicionais
-                prob_a = (gols_esp_restante_a ** gols_add_a * math.exp(-gols_esp_restante_a)) / math.factorial(gols_add_a)
-                prob_b = (gols_esp_restante_b ** gols_add_b * math.exp(-gols_esp_restante_b)) / math.factorial(gols_add_b)
-                prob_combinada = prob_a * prob_b
-                
-                # Placar final
-                gols_finais_a = gols_atuais_a + gols_add_a
-                gols_finais_b = gols_atuais_b + gols_add_b
-                
-                if gols_finais_a > gols_finais_b:
-                    prob_vitoria_a += prob_combinada
-                elif gols_finais_a == gols_finais_b:
-                    prob_empate += prob_combinada
-                else:
-                    prob_vitoria_b += prob_combinada
-        
-        return prob_vitoria_a, prob_empate, prob_vitoria_b
+        # Gols do tempo restante somados ao placar atual
+        resultado = calcular_probabilidades(gols_esperados_a * tempo_restante, gols_esperados_b * tempo_restante,
+                                            gols_atuais_a, gols_atuais_b)
+        return resultado.vitoria_casa, resultado.empate, resultado.vitoria_visitante
     
     def calcular_confronto(self):
         """Calcula e exibe a análise completa do confronto"""
@@ -2043,44 +2001,16 @@ Estatísticas estimadas:
             media_casa = max(0.1, float(media_casa))
             media_visitante = max(0.1, float(media_visitante))
             
-            # Calcular probabilidades usando Poisson
-            from math import factorial, exp
-            
-            def poisson_prob(k, lam):
-                return (lam**k * exp(-lam)) / factorial(k)
-            
-            # Calcular probabilidades de resultado
-            prob_casa = 0
-            prob_empate = 0
-            prob_visitante = 0
-            
-            for gols_casa in range(6):
-                for gols_visitante in range(6):
-                    prob = poisson_prob(gols_casa, media_casa) * poisson_prob(gols_visitante, media_visitante)
-                    
-                    if gols_casa > gols_visitante:
-                        prob_casa += prob
-                    elif gols_casa == gols_visitante:
-                        prob_empate += prob
-                    else:
-                        prob_visitante += prob
+            # Calcular probabilidades usando Poisson (núcleo compartilhado)
+            resultado = calcular_probabilidades(media_casa, media_visitante)
+            prob_casa = resultado.vitoria_casa
+            prob_empate = resultado.empate
+            prob_visitante = resultado.vitoria_visitante
             
             # Calcular probabilidades de mercados
-            prob_over15 = 0
-            prob_over25 = 0
-            prob_btts = 0
-            
-            for gols_casa in range(8):
-                for gols_visitante in range(8):
-                    prob = poisson_prob(gols_casa, media_casa) * poisson_prob(gols_visitante, media_visitante)
-                    total_gols = gols_casa + gols_visitante
-                    
-                    if total_gols > 1.5:
-                        prob_over15 += prob
-                    if total_gols > 2.5:
-                        prob_over25 += prob
-                    if gols_casa > 0 and gols_visitante > 0:
-                        prob_btts += prob
+            prob_over15 = resultado.over(1.5)
+            prob_over25 = resultado.over(2.5)
+            prob_btts = resultado.ambas_marcam()
             
             return {
                 'media_gols_casa': media_casa,
@@ -2197,12 +2127,6 @@ Estatísticas estimadas:
             stats_casa = self.times_database[time_casa]
             stats_visitante = self.times_database[time_visitante]
             
-            # Calcular probabilidades usando Poisson
-            from math import factorial, exp
-            
-            def poisson_prob(k, lam):
-                return (lam**k * exp(-lam)) / factorial(k)
-            
             # Médias de gols esperadas com verificação de None
             gols_marcados_casa = stats_casa.get('gols_marcados', 0)
             gols_sofridos_visitante = stats_visitante.get('gols_sofridos', 0)
@@ -2227,21 +2151,11 @@ Estatísticas estimadas:
             media_casa = max(0.1, media_casa)
             media_visitante = max(0.1, media_visitante)
             
-            # Calcular probabilidades de vitória
-            prob_casa = 0
-            prob_empate = 0
-            prob_visitante = 0
-            
-            for gols_casa in range(6):
-                for gols_visitante in range(6):
-                    prob = poisson_prob(gols_casa, media_casa) * poisson_prob(gols_visitante, media_visitante)
-                    
-                    if gols_casa > gols_visitante:
-                        prob_casa += prob
-                    elif gols_casa == gols_visitante:
-                        prob_empate += prob
-                    else:
-                        prob_visitante += prob
+            # Calcular probabilidades de vitória (núcleo compartilhado)
+            resultado = calcular_probabilidades(media_casa, media_visitante)
+            prob_casa = resultado.vitoria_casa
+            prob_empate = resultado.empate
+            prob_visitante = resultado.vitoria_visitante
             
             return {
                 'media_gols_casa': media_casa,
@@ -2399,9 +2313,6 @@ Estatísticas estimadas:
                             
                         else:
                             times_com_erro.append(f"{time_casa} vs {time_visitante}")
-                        
-                        # Pausa entre requisições
-                        time.sleep(0.5)
             
             # Atualizar interface na thread principal
             self.root.after(0, self._finalizar_cadastro_times, times_processados, times_com_erro)